@@ -57,25 +57,19 @@ def main(argv):
         sys.exit(1)
 
     # check if Boto3 is installed
-    try:
-        import boto3
-    except:
+    if not xlib.check_installed_module('boto3'):
         print('*** ERROR: The library boto3 is not installed.')
         print('Please, review how to install Boto3 in the manual.')
         sys.exit(1)
 
     # check if Paramiko is installed
-    try:
-        import paramiko
-    except:
+    if not xlib.check_installed_module('paramiko'):
         print('*** ERROR: The library paramiko is not installed.')
         print('Please, review how to install Paramiko in the manual.')
         sys.exit(1)
 
     # check if Plotnine is installed
-    try:
-        import plotnine
-    except:
+    if not xlib.check_installed_module('plotnine'):
         print('*** ERROR: The library plotnine is not installed.')
         print('Please, review how to install Plotnine in the manual.')
         sys.exit(1)
@@ -89,25 +83,19 @@ def main(argv):
     if args.mode == 'gui' or args.mode is None:
 
         # check if the library PIL.Image is installed
-        try:
-            import tkinter
-        except:
+        if not xlib.check_installed_module('tkinter'):
             print('*** ERROR: The library tkinter is not installed.')
             print('Please, review how to install Tkinter in the manual.')
             sys.exit(1)
 
         # check if the library PIL.Image is installed
-        try:
-            import PIL.Image
-        except:
+        if not xlib.check_installed_module('PIL.Image'):
             print('*** ERROR: The library PIL.Image is not installed.')
             print('Please, review how to install PIL.Image in the manual.')
             sys.exit(1)
 
         # check if the library PIL.ImageTk is installed
-        try:
-            import PIL.ImageTk
-        except:
+        if not xlib.check_installed_module('PIL.ImageTk'):
             print('*** ERROR: The library PIL.ImageTk is not installed.')
             print('Please, review how to install PIL.ImageTk in the manual.')
             sys.exit(1)
@@ -138,16 +126,16 @@ def main(argv):
     # -- except:
     # --     pass
 
-    # start the user interface depending on the mode
-    import ccloud
-    import cmenu
-    import gmain
+    # start the user interface depending on the mode (only the modules of that mode are imported)
     if args.mode == 'gui' or args.mode is None:
+        import gmain
         print(f'Starting {xlib.get_project_name()} v{xlib.get_project_version()}...')
         main = gmain.Main()
         print('Please, press [Ctrl] to continue ...')
         main.root.mainloop()
     else:
+        import ccloud
+        import cmenu
         ccloud.form_set_environment()
         cmenu.build_menu_main()
 
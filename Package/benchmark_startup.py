@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#-------------------------------------------------------------------------------
+
+'''
+This software has been developed by:
+
+    GI Sistemas Naturales e Historia Forestal (formerly known as GI Genetica, Fisiologia e Historia Forestal)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+
+#-------------------------------------------------------------------------------
+
+'''
+This source measures the startup time of the NGScloud2 graphical user interface.
+'''
+
+#-------------------------------------------------------------------------------
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+#-------------------------------------------------------------------------------
+
+def main(argv):
+    '''
+    Main line of the program.
+    '''
+
+    # get the arguments
+    parser = build_parser()
+    args = parser.parse_args()
+
+    # run the startup measurements, each one in a new Python interpreter
+    measurement_list = []
+    for _ in range(args.repetitions):
+        completed_process = subprocess.run([sys.executable, '-c', build_measurement_code(args.window)], cwd=os.path.dirname(os.path.abspath(__file__)), stdout=subprocess.PIPE, universal_newlines=True, check=True)
+        measurement_list.append(json.loads(completed_process.stdout.splitlines()[-1]))
+
+    # print the summary of the measurements
+    for key in ['import_time', 'window_time']:
+        value_list = [measurement[key] for measurement in measurement_list if measurement[key] is not None]
+        if value_list != []:
+            print(f'{key}: min {min(value_list):.3f} s - median {statistics.median(value_list):.3f} s - max {max(value_list):.3f} s')
+    print(f'modules loaded after startup: {measurement_list[-1]["module_number"]}')
+
+#-------------------------------------------------------------------------------
+
+def build_measurement_code(window):
+    '''
+    Build the Python code that measures the time to import the main module of the
+    graphical user interface and, optionally, to show the main window.
+    '''
+
+    return f'''
+import json
+import sys
+import time
+start = time.perf_counter()
+import gmain
+import_time = time.perf_counter() - start
+window_time = None
+if {window}:
+    main = gmain.Main()
+    main.root.update()
+    window_time = time.perf_counter() - start
+    main.root.destroy()
+print(json.dumps({{'import_time': import_time, 'window_time': window_time, 'module_number': len(sys.modules)}}))
+'''
+
+#-------------------------------------------------------------------------------
+
+def build_parser():
+    '''
+    Build the parser with the available arguments.
+    '''
+
+    # create the parser and add arguments
+    description = 'Description: This program measures the startup time of the NGScloud2 graphical user interface.'
+    parser = argparse.ArgumentParser(description=description)
+    parser._optionals.title = 'Arguments'
+    parser.add_argument('--repetitions', dest='repetitions', type=int, default=5, help='Number of measurements (default: 5)')
+    parser.add_argument('--window', dest='window', action='store_true', help='Measure also the time to show the main window (a display is required)')
+
+    # return the paser
+    return parser
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------
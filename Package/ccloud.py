@@ -1163,19 +1163,29 @@ def form_add_node():
             print(f'WARNING: The maximum number ({xec2.get_max_node_number()}) of instances is already running.')
             OK = False
 
-    # get the node name
+    # get the node number
+    if OK:
+        node_number = cinputs.input_int('Enter the number of nodes to add', default=1, minimum=1, maximum=xec2.get_max_node_number() - len(xec2.get_cluster_node_list(cluster_name)))
+
+    # get the node names
     if OK:
-        node_name = cinputs.input_node_name(cluster_name, new=True, is_master_valid=False, help=True)
+        node_name_list = []
+        while len(node_name_list) < node_number:
+            node_name = cinputs.input_node_name(cluster_name, new=True, is_master_valid=False, help=True)
+            if node_name in node_name_list:
+                print(f'*** ERROR: {node_name} is already entered.')
+            else:
+                node_name_list.append(node_name)
 
-    # confirm the addition of the node in the cluster
+    # confirm the addition of the nodes in the cluster
     if OK:
         print(xlib.get_separator())
-        OK = clib.confirm_action('The node is going to be added.')
+        OK = clib.confirm_action('The node is going to be added.' if node_number == 1 else 'The nodes are going to be added.')
 
-    # add node in cluster
+    # add nodes in cluster
     if OK:
-        devstdout = xlib.DevStdOut(xnode.add_node.__name__)
-        xnode.add_node(cluster_name, node_name, devstdout, function=None)
+        devstdout = xlib.DevStdOut(xnode.add_node_list.__name__)
+        xnode.add_node_list(cluster_name, node_name_list, devstdout, function=None)
 
     # show continuation message 
     print(xlib.get_separator())
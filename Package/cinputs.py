@@ -32,6 +32,7 @@ import xcluster
 import xddradseqtools
 import xec2
 import xlib
+import xmetadata
 import xssh
 
 #-------------------------------------------------------------------------------
@@ -719,13 +720,9 @@ def input_reference_dataset_id(ssh_client, allowed_none, help):
 
     # get the reference dataset identifications
     if help:
-        command = f'ls {xlib.get_cluster_reference_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    reference_dataset_id_list.append(line)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(ssh_client.get_cluster_name(), 'reference', passed_connection=True, ssh_client=ssh_client)
+        for entry in entry_list:
+            reference_dataset_id_list.append(entry['name'])
 
     # print the reference identifications in the clusters
     if OK and help:
@@ -775,13 +772,13 @@ def input_reference_file(ssh_client, reference_dataset_id, help):
 
     # get the reference files of the reference dataset identification
     if help:
-        command = f'find {xlib.get_cluster_reference_dataset_dir(reference_dataset_id)} -maxdepth 1 -type f'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found' and line.lower().find('gtf') == -1:
-                    file_list.append(os.path.basename(line))
+        command = f'find {xlib.get_cluster_reference_dataset_dir(reference_dataset_id)} -maxdepth 1 -type f -not -name {xlib.get_dataset_manifest_file()}'
+        stderr = []
+        for line in xssh.iterate_cluster_command(ssh_client, command, stderr):
+            line = line.rstrip('\n')
+            if line != 'lost+found' and line.lower().find('gtf') == -1:
+                file_list.append(os.path.basename(line))
+        OK = stderr == []
 
     # print the files in the clusters
     if OK and help:
@@ -826,13 +823,13 @@ def input_transcriptome_file(ssh_client, reference_dataset_id, help):
 
     # get the files of the reference dataset identification
     if help:
-        command = f'find {xlib.get_cluster_reference_dataset_dir(reference_dataset_id)} -maxdepth 1 -type f'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found' and line.lower().find('gtf') == -1:
-                    file_list.append(os.path.basename(line))
+        command = f'find {xlib.get_cluster_reference_dataset_dir(reference_dataset_id)} -maxdepth 1 -type f -not -name {xlib.get_dataset_manifest_file()}'
+        stderr = []
+        for line in xssh.iterate_cluster_command(ssh_client, command, stderr):
+            line = line.rstrip('\n')
+            if line != 'lost+found' and line.lower().find('gtf') == -1:
+                file_list.append(os.path.basename(line))
+        OK = stderr == []
 
     # print the files in the clusters
     if OK and help:
@@ -877,13 +874,13 @@ def input_gtf_file(ssh_client, reference_dataset_id, help):
 
     # get the GTF files of the reference dataset identification
     if help:
-        command = f'find {xlib.get_cluster_reference_dataset_dir(reference_dataset_id)} -maxdepth 1 -type f'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found' and line.lower().find('gtf') > -1:
-                    gtf_file_list.append(os.path.basename(line))
+        command = f'find {xlib.get_cluster_reference_dataset_dir(reference_dataset_id)} -maxdepth 1 -type f -not -name {xlib.get_dataset_manifest_file()}'
+        stderr = []
+        for line in xssh.iterate_cluster_command(ssh_client, command, stderr):
+            line = line.rstrip('\n')
+            if line != 'lost+found' and line.lower().find('gtf') > -1:
+                gtf_file_list.append(os.path.basename(line))
+        OK = stderr == []
 
     # print the GTF files in the clusters
     if OK and help:
@@ -928,13 +925,13 @@ def input_reference_file2(ssh_client, reference_dataset_id, type, allowed_none,
 
     # get the splice site files of the reference dataset identification
     if help:
-        command = f'find {xlib.get_cluster_reference_dataset_dir(reference_dataset_id)} -maxdepth 1 -type f'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    file_list.append(os.path.basename(line))
+        command = f'find {xlib.get_cluster_reference_dataset_dir(reference_dataset_id)} -maxdepth 1 -type f -not -name {xlib.get_dataset_manifest_file()}'
+        stderr = []
+        for line in xssh.iterate_cluster_command(ssh_client, command, stderr):
+            line = line.rstrip('\n')
+            if line != 'lost+found':
+                file_list.append(os.path.basename(line))
+        OK = stderr == []
 
     # print the GTF files in the clusters
     if OK and help:
@@ -987,13 +984,9 @@ def input_database_dataset_id(ssh_client, help):
 
     # get the database dataset identifications
     if help:
-        command = f'ls {xlib.get_cluster_database_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    database_dataset_id_list.append(line)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(ssh_client.get_cluster_name(), 'database', passed_connection=True, ssh_client=ssh_client)
+        for entry in entry_list:
+            database_dataset_id_list.append(entry['name'])
 
     # print the database identifications in the clusters
     if OK and help:
@@ -1039,12 +1032,13 @@ def input_protein_database_name(ssh_client, database_dataset_id, help):
     # get the list of the database file names
     if help:
         command = f'ls {xlib.get_cluster_database_dataset_dir(database_dataset_id)}/*phr'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
+        stderr = []
+        for line in xssh.iterate_cluster_command(ssh_client, command, stderr):
+            line = line.rstrip('\n')
+            if line != 'lost+found':
+                database_file_name_list.append(os.path.basename(line))
+        OK = stderr == []
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    database_file_name_list.append(os.path.basename(line))
             if database_file_name_list == []:
                 OK = False
 
@@ -1098,13 +1092,9 @@ def input_experiment_id(ssh_client, help):
 
     # get the experiment/process identifications
     if help:
-        command = f'ls {xlib.get_cluster_result_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(ssh_client.get_cluster_name(), 'result', passed_connection=True, ssh_client=ssh_client)
+        for entry in entry_list:
+            experiment_id_list.append(entry['name'])
 
     # print the experiment/process identifications in the clusters
     if OK and help:
@@ -1149,11 +1139,9 @@ def input_read_dataset_id(ssh_client, experiment_id, help):
 
     # get the read dataset identifications of the experiment
     if help:
-        command = f'ls {xlib.get_cluster_read_dir()}/{experiment_id}'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            for line in stdout:
-                read_dataset_id_list.append(line.rstrip('\n'))
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(ssh_client.get_cluster_name(), 'read', experiment_id, passed_connection=True, ssh_client=ssh_client)
+        for entry in entry_list:
+            read_dataset_id_list.append(entry['name'])
 
     # print the read dataset identifications in the experiment
     if OK and help:
@@ -1216,17 +1204,18 @@ def input_result_dataset_id(ssh_client, experiment_id, type, app_list, status, h
     # get the result dataset identifications of the experiment
     if help:
         if status == 'uncompressed':
-            command = f'cd {xlib.get_cluster_result_dir()}/{experiment_id}; for list in `ls`; do ls -ld $list | grep -v ^- > /dev/null && echo $list; done;'
+            excluded_type = 'f'
         elif status == 'compressed':
-            command = f'cd {xlib.get_cluster_result_dir()}/{experiment_id}; for list in `ls`; do ls -ld $list | grep -v ^d > /dev/null && echo $list; done;'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
+            excluded_type = 'd'
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(ssh_client.get_cluster_name(), 'result', experiment_id, passed_connection=True, ssh_client=ssh_client)
+        for entry in entry_list:
+            if entry['type'] == excluded_type:
+                continue
+            for app in app_list:
+                if app == xlib.get_all_applications_selected_code() or entry['name'].startswith(app):
+                    result_dataset_id_list.append(entry['name'])
+                    break
         if OK:
-            for line in stdout:
-                for app in app_list:
-                    if app == xlib.get_all_applications_selected_code() or line.startswith(app):
-                        result_dataset_id_list.append(line.rstrip('\n'))
-                      
-                        break
             if result_dataset_id_list != []:
                 result_dataset_id_list.sort()
 
@@ -1271,16 +1260,18 @@ def input_result_dataset_id_list(ssh_client, experiment_id, type, app_list, stat
     # get the result dataset identifications of the experiment
     if help:
         if status == 'uncompressed':
-            command = f'cd {xlib.get_cluster_result_dir()}/{experiment_id}; for list in `ls`; do ls -ld $list | grep -v ^- > /dev/null && echo $list; done;'
+            excluded_type = 'f'
         elif status == 'compressed':
-            command = f'cd {xlib.get_cluster_result_dir()}/{experiment_id}; for list in `ls`; do ls -ld $list | grep -v ^d > /dev/null && echo $list; done;'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
+            excluded_type = 'd'
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(ssh_client.get_cluster_name(), 'result', experiment_id, passed_connection=True, ssh_client=ssh_client)
+        for entry in entry_list:
+            if entry['type'] == excluded_type:
+                continue
+            for app in app_list:
+                if app == xlib.get_all_applications_selected_code() or entry['name'].startswith(app):
+                    all_result_dataset_id_list.append(entry['name'])
+                    break
         if OK:
-            for line in stdout:
-                for app in app_list:
-                    if app == xlib.get_all_applications_selected_code() or line.startswith(app):
-                        all_result_dataset_id_list.append(line.rstrip('\n'))
-                        break
             if all_result_dataset_id_list != []:
                 all_result_dataset_id_list.sort()
 
@@ -1634,6 +1625,27 @@ def input_submission_log_file():
 
 #-------------------------------------------------------------------------------
 
+def input_log_date(text):
+    '''
+    Input a date with the format YYYY-MM-DD to filter the submission logs (an
+    empty date means without limit).
+    '''
+
+    # initialize the date
+    date = None
+
+    # input and check the date
+    while date is None:
+        date = input(f'{text} (YYYY-MM-DD, without limit if empty): ')
+        if date != '' and not xlib.is_date_valid(date):
+            print(f'*** ERROR: {date} is not a valid date.')
+            date = None
+
+    # return the date
+    return date
+
+#-------------------------------------------------------------------------------
+
 if __name__ == '__main__':
     print('This file contains the general functions to data inputs in mode console.')
     sys.exit(0)
@@ -24,11 +24,16 @@ software package used in console mode.
 
 #-------------------------------------------------------------------------------
 
+import codecs
 import os
+import shutil
 import sys
+import time
 
 import xconfiguration
 import xlib
+import xpager
+import xssh
 
 #-------------------------------------------------------------------------------
 
@@ -62,6 +67,182 @@ def view_file(file, text):
 
 #-------------------------------------------------------------------------------
 
+def view_cluster_file(ssh_client, cluster_path, text):
+    '''
+    View the contents of a cluster file printing its lines as they arrive.
+    '''
+
+    # print the header
+    clear_screen()
+    print_headers_with_environment(text)
+
+    # print the lines of the cluster file
+    print('*' * 20 + '   ' + cluster_path + '   ' + '*' * 20)
+    (OK, stderr) = xssh.execute_cluster_command_stream(ssh_client, f'cat {cluster_path}', print)
+    if OK:
+        print('*' * 20 + '*' * (len(cluster_path) + 6) + '*' * 20)
+        print()
+    else:
+        for line in stderr:
+            print(f'*** ERROR: {line}')
+        print(f'*** ERROR: The file {cluster_path} can not be read.')
+
+    # return the control variable
+    return OK
+
+#-------------------------------------------------------------------------------
+
+def page_cluster_file(cluster_name, cluster_path, text):
+    '''
+    View the contents of a cluster file page by page. Only the lines of each page are read
+    from the cluster with ranged SFTP reads.
+    '''
+
+    # initialize the control variable and the SSH transport object
+    OK = True
+    ssh_transport = None
+
+    # create the SSH transport connection
+    (OK, error_list, ssh_transport) = xssh.create_ssh_transport_connection(cluster_name)
+    for error in error_list:
+        print(error)
+
+    # create the pager of the cluster file
+    if OK:
+        sftp_client = xssh.create_sftp_client(ssh_transport)
+        try:
+            pager = xpager.open_cluster_file_pager(sftp_client, cluster_path)
+        except Exception as e:
+            print(f'*** EXCEPTION: "{e}".')
+            print(f'*** ERROR: The file {cluster_path} can not be read.')
+            OK = False
+
+    # view the pages of the cluster file (it can be followed from its current end)
+    if OK:
+        follow_function = lambda: follow_cluster_file(cluster_name, cluster_path, pager.refresh())
+        page_file(pager, cluster_path, text, follow_function)
+        pager.close()
+
+    # close the SSH transport connection
+    if ssh_transport is not None:
+        xssh.close_ssh_transport_connection(ssh_transport)
+
+    # return the control variable
+    return OK
+
+#-------------------------------------------------------------------------------
+
+def page_file(pager, file, text, follow_function=None):
+    '''
+    Show the pages of a file pager and process the commands of the user until quitting.
+    When there is a follow function, the file can also be followed.
+    '''
+
+    # initialize the first line shown, the line of the last text found and the text to search
+    first_line_number = 0
+    found_line_number = None
+    search_text = ''
+
+    # get the number of lines of each page
+    page_line_number = max(10, shutil.get_terminal_size((100, 40)).lines - 12)
+
+    while True:
+
+        # print the header
+        clear_screen()
+        print_headers_with_environment(text)
+
+        # print the lines of the page
+        print('*' * 20 + '   ' + file + '   ' + '*' * 20)
+        line_list = pager.get_lines(first_line_number, page_line_number)
+        for line in line_list:
+            print(line)
+        print('*' * 20 + '*' * (len(file) + 6) + '*' * 20)
+
+        # print the position in the file
+        line_count = pager.get_estimated_line_count()
+        approximate = '' if pager.is_index_complete() else '~'
+        print(f'Lines {min(first_line_number + 1, line_count)}-{first_line_number + len(line_list)} of {approximate}{line_count}')
+        print()
+
+        # get the command
+        follow_text = ' - f: follow' if follow_function is not None else ''
+        command = input(f'[Intro] next page - b: previous page - g: begin - G: end - /text: search - n/N: next/previous{follow_text} - q: quit: ')
+
+        # process the command
+        if command == '':
+            first_line_number += page_line_number
+        elif command == 'b':
+            first_line_number -= page_line_number
+        elif command == 'g':
+            first_line_number = 0
+        elif command == 'G':
+            pager.refresh()
+            first_line_number = pager.get_line_count() - page_line_number
+        elif command == 'q':
+            break
+        elif command == 'f' and follow_function is not None:
+            follow_function()
+            pager.refresh()
+            first_line_number = pager.get_line_count() - page_line_number
+        elif command.startswith('/') or command in ['n', 'N']:
+            if command.startswith('/'):
+                search_text = command[1:]
+                found_line_number = None
+            if search_text != '':
+                backwards = command == 'N'
+                if found_line_number is not None:
+                    line_number = found_line_number
+                else:
+                    line_number = first_line_number if backwards else first_line_number - 1
+                line_number = pager.search(search_text, line_number, backwards=backwards)
+                if line_number is None:
+                    input(f'The text {search_text} is not found. Press [Intro] to continue ...')
+                else:
+                    found_line_number = line_number
+                    first_line_number = line_number
+
+        # keep the page inside the file
+        first_line_number = max(0, first_line_number)
+        if pager.get_line_offset(first_line_number) is None:
+            first_line_number = max(0, pager.get_line_count() - page_line_number)
+
+#-------------------------------------------------------------------------------
+
+def follow_cluster_file(cluster_name, cluster_path, offset):
+    '''
+    Print the bytes appended to a cluster file after an offset until [Ctrl-C] is pressed. The file
+    is followed with a remote tail, so it is not downloaded again and its rotation is survived.
+    '''
+
+    # decode the bytes received by the tail keeping the characters split between two receptions
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    def print_data(data):
+        sys.stdout.write(decoder.decode(data))
+        sys.stdout.flush()
+
+    # start the remote tail of the cluster file
+    tail = xssh.RemoteFileTail(cluster_name, cluster_path, offset, data_function=print_data, message_function=print)
+    (OK, error_list) = tail.start()
+    for error in error_list:
+        print(error)
+
+    # wait until [Ctrl-C] is pressed or the tail has finished
+    if OK:
+        print(f'Following {cluster_path} (press [Ctrl-C] to stop) ...')
+        try:
+            while tail.is_running():
+                time.sleep(xssh.get_tail_poll_interval())
+        except KeyboardInterrupt:
+            pass
+        tail.stop()
+        print()
+
+    # return the control variable
+    return OK
+
+#-------------------------------------------------------------------------------
+
 def clear_screen():
     '''
     Clear the screen depending on the Operating System.
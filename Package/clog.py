@@ -25,15 +25,15 @@ menu items in mode console.
 #-------------------------------------------------------------------------------
 
 import os
-import re
 import sys
 
 import cinputs
 import clib
-import xconfiguration
 import xec2
 import xinstance
 import xlib
+import xlogindex
+import xmetadata
 import xssh
 
 #-------------------------------------------------------------------------------
@@ -65,45 +65,18 @@ def form_view_cluster_start_log():
         for error in error_list:
             print(error)
 
-    # create the SSH transport connection
+    # build the cluster path of the log file
     if OK:
-        (OK, error_list, ssh_transport) = xssh.create_ssh_transport_connection(cluster_name)
-        for error in error_list:
-            print(error)
-
-    # create the SFTP client 
-    if OK:
-        sftp_client = xssh.create_sftp_client(ssh_transport)
-
-    # create the local path
-    if not os.path.exists(xlib.get_temp_dir()):
-        os.makedirs(xlib.get_temp_dir())
-
-    # get the log file name and build local and cluster paths
-    if OK:
-        local_path = f'{xlib.get_temp_dir()}/{os.path.basename(xinstance.get_infrastructure_software_installation_log())}'
         cluster_path = f'/home/ubuntu/{os.path.basename(xinstance.get_infrastructure_software_installation_log())}'
 
-    # download the log file from the cluster
-    if OK:
-        print(xlib.get_separator())
-        print(f'The file {os.path.basename(xinstance.get_infrastructure_software_installation_log())} is being downloaded from {cluster_path} ...')
-        OK = xssh.get_file(sftp_client, cluster_path, local_path)
-        if OK:
-            print('The file has been uploaded.')
-
-    # close the SSH transport connection
+    # view the log file while it is being read from the cluster
     if OK:
-        xssh.close_ssh_transport_connection(ssh_transport)
+        text = 'Logs - View the cluster start log'
+        OK = clib.view_cluster_file(ssh_client, cluster_path, text)
 
     # close the SSH client connection
     if OK:
         xssh.close_ssh_client_connection(ssh_client)
-    
-    # view the log file
-    if OK:
-        text = 'Logs - View the cluster start log'
-        OK = clib.view_file(local_path, text)
 
     # show continuation message 
     input('Press [Intro] to continue ...')
@@ -119,48 +92,49 @@ def form_list_submission_logs():
     clib.clear_screen()
     clib.print_headers_with_environment('Logs - List submission logs')
 
-    # get the submission process dictionary
-    submission_process_dict = xlib.get_submission_process_dict()
-
-    # build the log dictionary
-    log_dict = {}
-    log_file_list = [file for file in os.listdir(xlib.get_log_dir()) if os.path.isfile(os.path.join(xlib.get_log_dir(), file)) and file.startswith(xconfiguration.environment)]
-    for log_file in log_file_list:
-        try:
-            pattern = r'^(.+)\-(.+)\-(.+)\-(.+).txt$'
-            mo = re.search(pattern, log_file)
-            # -- environment = mo.group(1).strip()
-            submission_process_id = mo.group(2).strip()
-            yymmdd = mo.group(3)
-            hhmmss = mo.group(4)
-            submission_process_text = submission_process_dict[submission_process_id]['text']
-            date = f'20{yymmdd[:2]}-{yymmdd[2:4]}-{yymmdd[4:]}'
-            time = f'{hhmmss[:2]}:{hhmmss[2:4]}:{hhmmss[4:]}'
-        except:
-            submission_process_text = 'unknown process'
-            date = '0000-00-00'
-            time = '00:00:00'
-        key = f'{submission_process_text}-{log_file}'
-        log_dict[key] = {'submission_process_text': submission_process_text, 'log_file': log_file, 'date': date, 'time': time}
+    # get the text to search
+    search_text = input('Enter the text to search in the logs (all logs are listed if empty): ')
+
+    # get the status
+    status = cinputs.input_code('Enter the status', xlogindex.get_log_status_code_list(), 'all')
+
+    # get the cluster name
+    cluster_name_list = xlogindex.get_log_index_cluster_name_list()
+    if cluster_name_list != []:
+        cluster_name_list_text = str(cluster_name_list).strip('[]').replace('\'','')
+        print(f'Clusters in the submission logs: {cluster_name_list_text} ...')
+    cluster_name = input('... Enter the cluster name (all clusters if empty): ')
+
+    # get the start date range
+    since = cinputs.input_log_date('Enter the first start date')
+    until = cinputs.input_log_date('Enter the last start date')
+
+    # get the submission logs that match the filters from the log index
+    (OK, error_list, log_list) = xlogindex.search_log_index(text=search_text, status=status, cluster_name=cluster_name, since=since, until=until)
+    for error in error_list:
+        print(error)
 
     # print the submission log list
     print(xlib.get_separator())
-    if log_dict == {}:
+    if OK and log_list == []:
         print('*** WARNING: There is not any submission log.')
-    else:
+    elif OK:
         # set data width
-        submission_process_text_width = 55
+        submission_process_text_width = 45
         log_file_width = 50
         date_width = 10
         time_width = 8
+        status_width = 7
+        cluster_name_width = 15
         # set line
-        line = '{0:' + str(submission_process_text_width) + '}   {1:' + str(log_file_width) + '}   {2:' + str(date_width) + '}   {3:' + str(time_width) + '}'
+        line = '{0:' + str(submission_process_text_width) + '}   {1:' + str(log_file_width) + '}   {2:' + str(date_width) + '}   {3:' + str(time_width) + '}   {4:' + str(status_width) + '}   {5:' + str(cluster_name_width) + '}'
         # print header
-        print(line.format('Process', 'Log file', 'Date', 'Time'))
-        print(line.format('=' * submission_process_text_width, '=' * log_file_width, '=' * date_width, '=' * time_width))
+        print(line.format('Process', 'Log file', 'Date', 'Time', 'Status', 'Cluster'))
+        print(line.format('=' * submission_process_text_width, '=' * log_file_width, '=' * date_width, '=' * time_width, '=' * status_width, '=' * cluster_name_width))
         # print detail lines
-        for key in sorted(log_dict.keys()):
-            print(line.format(log_dict[key]['submission_process_text'], log_dict[key]['log_file'], log_dict[key]['date'], log_dict[key]['time']))
+        for log in sorted(log_list, key=lambda log: (log['process_text'], log['log_file'])):
+            (date, time) = log['start'].split(' ')
+            print(line.format(log['process_text'], log['log_file'], date, time, log['status'], log['cluster_name']))
 
     # show continuation message 
     print(xlib.get_separator())
@@ -231,14 +205,12 @@ def form_list_cluster_experiment_processes():
 
     # get the result dataset list of the experiment
     if OK:
-        command = f'cd  {xlib.get_cluster_result_dir()}/{experiment_id}; for list in `ls`; do ls -ld $list | grep -v ^- > /dev/null && echo $list; done;'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(cluster_name, 'result', experiment_id, passed_connection=True, ssh_client=ssh_client)
         if OK:
             result_dataset_id_list = []
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    result_dataset_id_list.append(line)
+            for entry in entry_list:
+                if entry['type'] != 'f':
+                    result_dataset_id_list.append(entry['name'])
 
     # print the result dataset identification list of the experiment
     if OK:
@@ -258,273 +230,9 @@ def form_list_cluster_experiment_processes():
             # print detail lines
             for result_dataset_id in result_dataset_id_list:
 
-                if result_dataset_id.startswith(xlib.get_bedtools_code()+'-'):
-                    bioinfo_app_name = xlib.get_bedtools_name()
-
-                elif result_dataset_id.startswith(xlib.get_blastplus_code()+'-'):
-                    bioinfo_app_name = xlib.get_blastplus_name()
-
-                elif result_dataset_id.startswith(xlib.get_bcftools_code()+'-'):
-                    bioinfo_app_name = xlib.get_bcftools_name()
-
-                elif result_dataset_id.startswith(xlib.get_bowtie2_code()+'-'):
-                    bioinfo_app_name = xlib.get_bowtie2_name()
-                
-                elif result_dataset_id.startswith(xlib.get_busco_code()+'-'):
-                    bioinfo_app_name = xlib.get_busco_name()
-
-                elif result_dataset_id.startswith(xlib.get_cd_hit_code()+'-'):
-                    bioinfo_app_name = xlib.get_cd_hit_name()
-
-                elif result_dataset_id.startswith(xlib.get_cd_hit_est_code()+'-'):
-                    bioinfo_app_name = xlib.get_cd_hit_est_name()
-
-                elif result_dataset_id.startswith(xlib.get_cuffdiff_code()+'-'):
-                    bioinfo_app_name = xlib.get_cuffdiff_name()
-
-                elif result_dataset_id.startswith(xlib.get_cufflinks_code()+'-'):
-                    bioinfo_app_name = xlib.get_cufflinks_name()
-
-                elif result_dataset_id.startswith(xlib.get_cufflinks_cuffmerge_code()+'-'):
-                    bioinfo_app_name = xlib.get_cufflinks_cuffmerge_name()
-
-                elif result_dataset_id.startswith(xlib.get_cuffnorm_code()+'-'):
-                    bioinfo_app_name = xlib.get_cuffnorm_name()
-
-                elif result_dataset_id.startswith(xlib.get_cuffquant_code()+'-'):
-                    bioinfo_app_name = xlib.get_cuffquant_name()
-
-                elif result_dataset_id.startswith(xlib.get_cutadapt_code()+'-'):
-                    bioinfo_app_name = xlib.get_cutadapt_name()
-
-                elif result_dataset_id.startswith(xlib.get_ddradseq_simulation_code()+'-'):
-                    bioinfo_app_name = xlib.get_ddradseq_simulation_name()
-
-                elif result_dataset_id.startswith(xlib.get_ddradseqtools_code()+'-'):
-                    bioinfo_app_name = xlib.get_ddradseqtools_name()
-
-                elif result_dataset_id.startswith(xlib.get_detonate_code()+'-'):
-                    bioinfo_app_name = xlib.get_detonate_name()
-
-                elif result_dataset_id.startswith(xlib.get_diamond_code()+'-'):
-                    bioinfo_app_name = xlib.get_diamond_name()
-
-                elif result_dataset_id.startswith(xlib.get_emboss_code()+'-'):
-                    bioinfo_app_name = xlib.get_emboss_name()
-
-                elif result_dataset_id.startswith(xlib.get_entrez_direct_code()+'-'):
-                    bioinfo_app_name = xlib.get_entrez_direct_name()
-
-                elif result_dataset_id.startswith(xlib.get_express_code()+'-'):
-                    bioinfo_app_name = xlib.get_express_name()
-
-                elif result_dataset_id.startswith(xlib.get_fastqc_code()+'-'):
-                    bioinfo_app_name = xlib.get_fastqc_name()
-
-                elif result_dataset_id.startswith(xlib.get_ggtrinity_code()+'-'):
-                    bioinfo_app_name = xlib.get_ggtrinity_name()
-
-                elif result_dataset_id.startswith(xlib.get_gmap_gsnap_code()+'-'):
-                    bioinfo_app_name = xlib.get_gmap_gsnap_name()
-
-                elif result_dataset_id.startswith(xlib.get_gmap_code()+'-'):
-                    bioinfo_app_name = xlib.get_gmap_name()
-
-                elif result_dataset_id.startswith(xlib.get_gsnap_code()+'-'):
-                    bioinfo_app_name = xlib.get_gsnap_name()
-
-                elif result_dataset_id.startswith(xlib.get_gzip_code()+'-'):
-                    bioinfo_app_name = xlib.get_gzip_name()
-
-                elif result_dataset_id.startswith(xlib.get_hisat2_code()+'-'):
-                    bioinfo_app_name = xlib.get_hisat2_name()
-
-                elif result_dataset_id.startswith(xlib.get_htseq_code()+'-'):
-                    bioinfo_app_name = xlib.get_htseq_name()
-
-                elif result_dataset_id.startswith(xlib.get_htseq_count_code()+'-'):
-                    bioinfo_app_name = xlib.get_htseq_count_name()
-
-                elif result_dataset_id.startswith(xlib.get_insilico_read_normalization_code()+'-'):
-                    bioinfo_app_name = xlib.get_insilico_read_normalization_name()
-
-                elif result_dataset_id.startswith(xlib.get_ipyrad_code()+'-'):
-                    bioinfo_app_name = xlib.get_ipyrad_name()
-
-                elif result_dataset_id.startswith(xlib.get_kallisto_code()+'-'):
-                    bioinfo_app_name = xlib.get_kallisto_name()
-
-                elif result_dataset_id.startswith(xlib.get_miniconda3_code()+'-'):
-                    bioinfo_app_name = xlib.get_miniconda3_name()
-
-                elif result_dataset_id.startswith(xlib.get_ngshelper_code()+'-'):
-                    bioinfo_app_name = xlib.get_ngshelper_name()
-
-                elif result_dataset_id.startswith(xlib.get_quast_code()+'-'):
-                    bioinfo_app_name = xlib.get_quast_name()
-
-                elif result_dataset_id.startswith(xlib.get_r_code()+'-'):
-                    bioinfo_app_name = xlib.get_r_name()
-
-                elif result_dataset_id.startswith(xlib.get_raddesigner_code()+'-'):
-                    bioinfo_app_name = xlib.get_raddesigner_name()
-
-                elif result_dataset_id.startswith(xlib.get_ref_eval_code()+'-'):
-                    bioinfo_app_name = xlib.get_ref_eval_name()
-
-                elif result_dataset_id.startswith(xlib.get_rnaquast_code()+'-'):
-                    bioinfo_app_name = xlib.get_rnaquast_name()
-
-                elif result_dataset_id.startswith(xlib.get_rsem_code()+'-'):
-                    bioinfo_app_name = xlib.get_rsem_name()
-
-                elif result_dataset_id.startswith(xlib.get_rsem_eval_code()+'-'):
-                    bioinfo_app_name = xlib.get_rsem_eval_name()
-
-                elif result_dataset_id.startswith(xlib.get_rsitesearch_code()+'-'):
-                    bioinfo_app_name = xlib.get_rsitesearch_name()
-
-                elif result_dataset_id.startswith(xlib.get_samtools_code()+'-'):
-                    bioinfo_app_name = xlib.get_samtools_name()
-
-                elif result_dataset_id.startswith(xlib.get_soapdenovo2_code()+'-'):
-                    bioinfo_app_name = xlib.get_soapdenovo2_name()
-
-                elif result_dataset_id.startswith(xlib.get_soapdenovotrans_code()+'-'):
-                    bioinfo_app_name = xlib.get_soapdenovotrans_name()
-
-                elif result_dataset_id.startswith(xlib.get_star_code()+'-'):
-                    bioinfo_app_name = xlib.get_star_name()
-
-                elif result_dataset_id.startswith(xlib.get_starcode_code()+'-'):
-                    bioinfo_app_name = xlib.get_starcode_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_download_basic_data_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_process_download_basic_data_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_download_dicots_04_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_process_download_dicots_04_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_download_gene_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_process_download_gene_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_download_go_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_process_download_go_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_download_gymno_01_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_process_download_gymno_01_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_download_interpro_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_process_download_interpro_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_download_monocots_04_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_process_download_monocots_04_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_download_taxonomy_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_process_download_taxonomy_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_gilist_viridiplantae_nucleotide_gi_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_process_gilist_viridiplantae_nucleotide_gi_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_gilist_viridiplantae_protein_gi_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_process_gilist_viridiplantae_protein_gi_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_load_basic_data_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_process_load_basic_data_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_load_dicots_04_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_process_load_dicots_04_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_load_gene_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_process_load_gene_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_load_go_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_process_load_go_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_load_gymno_01_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_process_load_gymno_01_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_load_interpro_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_process_load_interpro_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_load_monocots_04_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_process_load_monocots_04_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_merge_annotations_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_process_merge_annotations_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_nr_blastplus_db_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_process_nr_blastplus_db_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_nr_diamond_db_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_process_nr_diamond_db_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_nt_blastplus_db_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_process_nt_blastplus_db_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_pipeline_aminoacid_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_process_pipeline_aminoacid_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_pipeline_nucleotide_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_process_pipeline_nucleotide_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_proteome_dicots_04_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_process_proteome_dicots_04_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_proteome_gymno_01_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_process_proteome_gymno_01_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_proteome_monocots_04_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_process_proteome_monocots_04_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_proteome_refseq_plant_code()+'-'):
-                    bioinfo_app_name = xlib.get_toa_process_proteome_refseq_plant_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_rebuild_toa_database_code()+'-'):
-                    bioinfo_app_name = xlib.get_get_toa_process_rebuild_toa_database_name()
-
-                elif result_dataset_id.startswith(xlib.get_toa_process_recreate_toa_database_code()+'-'):
-                    bioinfo_app_name = xlib.get_get_toa_process_recreate_toa_database_name()
-
-                elif result_dataset_id.startswith(xlib.get_tophat_code()+'-'):
-                    bioinfo_app_name = xlib.get_tophat_name()
-
-                elif result_dataset_id.startswith(xlib.get_transabyss_code()+'-'):
-                    bioinfo_app_name = xlib.get_transabyss_name()
-
-                elif result_dataset_id.startswith(xlib.get_transcript_filter_code()+'-'):
-                    bioinfo_app_name = xlib.get_transcript_filter_name()
-
-                elif result_dataset_id.startswith(xlib.get_transcriptome_blastx_code()+'-'):
-                    bioinfo_app_name = xlib.get_transcriptome_blastx_name()
-
-                elif result_dataset_id.startswith(xlib.get_transdecoder_code()+'-'):
-                    bioinfo_app_name = xlib.get_transdecoder_name()
-
-                elif result_dataset_id.startswith(xlib.get_transrate_code()+'-'):
-                    bioinfo_app_name = xlib.get_transrate_name()
-
-                elif result_dataset_id.startswith(xlib.get_trimmomatic_code()+'-'):
-                    bioinfo_app_name = xlib.get_trimmomatic_name()
-
-                elif result_dataset_id.startswith(xlib.get_trinity_code()+'-'):
-                    bioinfo_app_name = xlib.get_trinity_name()
-
-                elif result_dataset_id.startswith(xlib.get_variant_calling_code()+'-'):
-                    bioinfo_app_name = xlib.get_variant_calling_name()
-
-                elif result_dataset_id.startswith(xlib.get_vcftools_code()+'-'):
-                    bioinfo_app_name = xlib.get_vcftools_name()
-
-                elif result_dataset_id.startswith(xlib.get_vcftools_perl_libraries_code()+'-'):
-                    bioinfo_app_name = xlib.get_vcftools_perl_libraries_name()
-
-                elif result_dataset_id.startswith(xlib.get_vsearch_code()+'-'):
-                    bioinfo_app_name = xlib.get_vsearch_name()
-
+                (app, _, _) = xlib.classify_dataset_id(result_dataset_id)
+                if app is not None:
+                    bioinfo_app_name = app['name']
                 else:
                     bioinfo_app_name = 'xxx'
 
@@ -567,16 +275,6 @@ def form_view_cluster_experiment_process_log():
         for error in error_list:
             print(error)
 
-    # create the SSH transport connection
-    if OK:
-        (OK, error_list, ssh_transport) = xssh.create_ssh_transport_connection(cluster_name)
-        for error in error_list:
-            print(error)
-
-    # create the SFTP client 
-    if OK:
-        sftp_client = xssh.create_sftp_client(ssh_transport)
-
     # get the experiment identification
     if OK:
         experiment_id = cinputs.input_experiment_id(ssh_client, help=True)
@@ -591,36 +289,19 @@ def form_view_cluster_experiment_process_log():
             print(f'WARNING: The experiment {experiment_id} does not have result datasets.')
             OK = False
 
-    # create the local path
-    if not os.path.exists(xlib.get_temp_dir()):
-        os.makedirs(xlib.get_temp_dir())
-
-    # get the log file name and build local and cluster paths
+    # get the log file name and build the cluster path
     if OK:
         log_file = xlib.get_cluster_log_file()
-        local_path = f'{xlib.get_temp_dir()}/{log_file}'
         cluster_path = f'{xlib.get_cluster_experiment_result_dir(experiment_id)}/{result_dataset_id}/{log_file}'
 
-    # download the log file from the cluster
+    # view the log file page by page
     if OK:
-        print(xlib.get_separator())
-        print(f'The file {log_file} is being downloaded from {cluster_path} ...')
-        OK = xssh.get_file(sftp_client, cluster_path, local_path)
-        if OK:
-            print('The file has been uploaded.')
-
-    # close the SSH transport connection
-    if OK:
-        xssh.close_ssh_transport_connection(ssh_transport)
+        text = 'Logs - View an experiment process log in the cluster'
+        OK = clib.page_cluster_file(cluster_name, cluster_path, text)
 
     # close the SSH client connection
     if OK:
         xssh.close_ssh_client_connection(ssh_client)
-    
-    # view the log file
-    if OK:
-        text = 'Logs - View an experiment process log in the cluster'
-        OK = clib.view_file(local_path, text)
 
     # show continuation message 
     input('Press [Intro] to continue ...')
@@ -52,6 +52,7 @@ import xhtseq
 import xipyrad
 import xkallisto
 import xlib
+import xmetadata
 import xngshelper
 import xquast
 import xraddesigner
@@ -1056,13 +1057,10 @@ class FormRecreateBowtie2ConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -1629,13 +1627,10 @@ class FormRecreateBuscoConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -2011,13 +2006,10 @@ class FormRecreateCdHitEstConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_result_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'result', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -2420,13 +2412,10 @@ class FormRecreateCuffdiffCuffnormConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -3005,13 +2994,10 @@ class FormRecreateCufflinksCuffmergeConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -3530,13 +3516,10 @@ class FormRecreateCuffquantConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -4023,13 +4006,10 @@ class FormRecreateCutadaptConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -5037,13 +5017,10 @@ class FormRecreateExpressConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -5483,13 +5460,10 @@ class FormRecreateFastQCConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -5879,13 +5853,10 @@ class FormRecreateGgTrinityConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -6296,13 +6267,10 @@ class FormRecreateGmapConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_result_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'result', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -6829,13 +6797,10 @@ class FormRecreateGsnapConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -7527,13 +7492,10 @@ class FormRecreateHisat2ConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -8091,13 +8053,10 @@ class FormRecreateHtseqCountConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -8554,13 +8513,10 @@ class FormRecreateInsilicoReadNormalizationConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -9193,13 +9149,10 @@ class FormRecreateIpyradConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -9943,13 +9896,10 @@ class FormRecreateKallistoConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -10551,13 +10501,10 @@ class FormRecreateQuastConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_result_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'result', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -10951,13 +10898,10 @@ class FormRecreateRADdesignerConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_result_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'result', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -11438,13 +11382,10 @@ class FormRecreateRefEvalConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -12112,13 +12053,10 @@ class FormRecreateRnaQuastConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -12728,13 +12666,10 @@ class FormRecreateRsemEvalConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -13810,13 +13745,10 @@ class FormRecreateSoapdenovo2ConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -14307,13 +14239,10 @@ class FormRecreateSoapdenovoTransConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -14891,13 +14820,10 @@ class FormRecreateSTARConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -15438,13 +15364,10 @@ class FormRecreateStarcodeConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -16023,13 +15946,10 @@ class FormRecreateTopHatConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -16570,13 +16490,10 @@ class FormRecreateTransAbyssConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -17015,13 +16932,10 @@ class FormRecreateTranscriptFilterConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_result_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'result', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -17448,13 +17362,10 @@ class FormRecreateTranscriptomeBlastxConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_result_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'result', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -17980,13 +17891,10 @@ class FormRecreateTransrateConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -18568,13 +18476,10 @@ class FormRecreateTrimmomaticConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -19065,13 +18970,10 @@ class FormRecreateTrinityConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -19597,13 +19499,10 @@ class FormRecreateVariantCallingConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_result_dir()}'
-        (OK, stdout,_) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'result', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -20633,13 +20532,10 @@ class FormRestartBioinfoProcess(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_result_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'result', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
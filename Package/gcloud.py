@@ -34,47 +34,51 @@ import tkinter.filedialog
 import tkinter.ttk
 
 import gdialogs
-import xbowtie2
-import xbusco
-import xcdhit
 import xcluster
 import xconfiguration
-import xcufflinks
-import xcutadapt
-import xdatabase
-import xddradseqtools
-import xdetonate
 import xec2
-import xexpress
-import xfastqc
-import xgmap
-import xgzip
-import xhisat2
-import xhtseq
 import xinstance
-import xipyrad
-import xkallisto
 import xlib
-import xngshelper
 import xnode
-import xquast
-import xraddesigner
-import xrnaquast
-import xsoapdenovo2
-import xsoapdenovotrans
 import xssh
-import xstar
-import xstarcode
-import xread
-import xreference
-import xresult
-import xtoa
-import xtophat
-import xtransabyss
-import xtransrate
-import xtrimmomatic
-import xtrinity
-import xvolume
+
+#-------------------------------------------------------------------------------
+
+# modules loaded the first time they are used by a form
+xbowtie2 = xlib.import_lazy_module('xbowtie2')
+xbusco = xlib.import_lazy_module('xbusco')
+xcdhit = xlib.import_lazy_module('xcdhit')
+xcufflinks = xlib.import_lazy_module('xcufflinks')
+xcutadapt = xlib.import_lazy_module('xcutadapt')
+xdatabase = xlib.import_lazy_module('xdatabase')
+xddradseqtools = xlib.import_lazy_module('xddradseqtools')
+xdetonate = xlib.import_lazy_module('xdetonate')
+xexpress = xlib.import_lazy_module('xexpress')
+xfastqc = xlib.import_lazy_module('xfastqc')
+xgmap = xlib.import_lazy_module('xgmap')
+xgzip = xlib.import_lazy_module('xgzip')
+xhisat2 = xlib.import_lazy_module('xhisat2')
+xhtseq = xlib.import_lazy_module('xhtseq')
+xipyrad = xlib.import_lazy_module('xipyrad')
+xkallisto = xlib.import_lazy_module('xkallisto')
+xngshelper = xlib.import_lazy_module('xngshelper')
+xquast = xlib.import_lazy_module('xquast')
+xraddesigner = xlib.import_lazy_module('xraddesigner')
+xrnaquast = xlib.import_lazy_module('xrnaquast')
+xsoapdenovo2 = xlib.import_lazy_module('xsoapdenovo2')
+xsoapdenovotrans = xlib.import_lazy_module('xsoapdenovotrans')
+xstar = xlib.import_lazy_module('xstar')
+xstarcode = xlib.import_lazy_module('xstarcode')
+xread = xlib.import_lazy_module('xread')
+xreference = xlib.import_lazy_module('xreference')
+xresult = xlib.import_lazy_module('xresult')
+xtoa = xlib.import_lazy_module('xtoa')
+xtophat = xlib.import_lazy_module('xtophat')
+xtransabyss = xlib.import_lazy_module('xtransabyss')
+xtransrate = xlib.import_lazy_module('xtransrate')
+xtrimmomatic = xlib.import_lazy_module('xtrimmomatic')
+xtrinity = xlib.import_lazy_module('xtrinity')
+xvolume = xlib.import_lazy_module('xvolume')
 
 #-------------------------------------------------------------------------------
 
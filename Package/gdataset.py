@@ -33,10 +33,12 @@ import tkinter
 import tkinter.ttk
 
 import gdialogs
+import gtask
 import xdatabase
 import xec2
 import xgzip
 import xlib
+import xmetadata
 import xread
 import xreference
 import xresult
@@ -68,6 +70,9 @@ class FormListDataset(tkinter.Frame):
         # assign the text of the "head"
         self.head = 'Datasets - List dataset'
 
+        # create the group of background tasks
+        self.task_group = gtask.TaskGroup(self.root, f'{xlib.get_project_name()} - {self.head}')
+
         # initialize the SSH client connection and previous cluster name
         self.ssh_client = None
         self.cluster_name_ant = None
@@ -177,29 +182,34 @@ class FormListDataset(tkinter.Frame):
         Populate data in "combobox_dataset_type".
         '''
 
-        # clear the value selected in the combobox
+        # clear the value selected and the values of the combobox
         self.wrapper_dataset_type.set('')
+        self.combobox_dataset_type['values'] = []
 
-        # initialize the dataset type list
-        dataset_type_list = []
+        # load the dataset types in the combobox when the directory has been listed
+        def load_dataset_type_list(result):
 
-        # get the existing dataset in the dataset type directory
-        command = f'ls {xlib.get_cluster_ngscloud_dir()}'
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line in ['references', 'databases', 'reads', 'results']:
-                    dataset_type_list.append(line)
-
-        # check if there is any dataset
-        if dataset_type_list == []:
-            message = 'The cluster does not have any dataset.'
-            tkinter.messagebox.showwarning(f'{xlib.get_project_name()} - {self.head}', message)
-            return
+            # initialize the dataset type list
+            dataset_type_list = []
 
-        # load the names of clusters which are running in the combobox
-        self.combobox_dataset_type['values'] = dataset_type_list
+            # get the existing dataset in the dataset type directory
+            (OK, _, entry_list) = result
+            if OK:
+                for entry in entry_list:
+                    if entry['name'] in ['references', 'databases', 'reads', 'results']:
+                        dataset_type_list.append(entry['name'])
+
+            # check if there is any dataset
+            if dataset_type_list == []:
+                message = 'The cluster does not have any dataset.'
+                tkinter.messagebox.showwarning(f'{xlib.get_project_name()} - {self.head}', message)
+                return
+
+            # load the names of clusters which are running in the combobox
+            self.combobox_dataset_type['values'] = dataset_type_list
+
+        # list the dataset type directory in background
+        self.task_group.submit(xssh.list_cluster_dir, self.ssh_client, xlib.get_cluster_ngscloud_dir(), on_done=load_dataset_type_list, key='dataset_type')
 
     #---------------
 
@@ -215,6 +225,9 @@ class FormListDataset(tkinter.Frame):
         # check if the cluster name selected is different to the previous cluster name
         if self.wrapper_cluster_name.get() != self.cluster_name_ant:
 
+            # cancel the pending background tasks, which use the SSH client connection
+            self.task_group.cancel()
+
             # close SSH client connection
             if self.cluster_name_ant is not None:
                 xssh.close_ssh_client_connection(self.ssh_client)
@@ -283,29 +296,27 @@ class FormListDataset(tkinter.Frame):
             message = 'Some input values are not OK.'
             tkinter.messagebox.showwarning(f'{xlib.get_project_name()} - {self.head}', message)
 
+        # list the dataset type directory in background and then show it
+        if OK:
+            self.button_execute['state'] = 'disabled'
+            self.task_group.submit(xssh.list_cluster_dir, self.ssh_client, f'{xlib.get_cluster_ngscloud_dir()}/{self.wrapper_dataset_type.get()}', on_done=self.show_directory)
+
+    #---------------
+
+    def show_directory(self, result):
+        '''
+        Show the directory listing of the dataset type got in background.
+        '''
+
         # get the directory dictionary of directories in the dataset type directory
+        (OK, _, entry_list) = result
         if OK:
-            command = f'ls -la {xlib.get_cluster_ngscloud_dir()}/{self.wrapper_dataset_type.get()}'
-            (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-            if OK:
-                directory_dict = {}
-                for line in stdout:
-                    line = line.rstrip('\n')
-                    if line.startswith('d') or line.startswith('-'):
-                        directory_data_list = line.split()
-                        file_type = 'directory' if directory_data_list[0][0] == 'd' else 'file'
-                        permissions = directory_data_list[0][1:]
-                        links_number = directory_data_list[1]
-                        owner_name = directory_data_list[2]
-                        owner_group = directory_data_list[3]
-                        file_size = directory_data_list[4]
-                        modification_month = directory_data_list[5]
-                        modification_day = directory_data_list[6]
-                        modification_time = directory_data_list[7]
-                        file_name = directory_data_list[8]
-                        if file_name not in ['.', '..', 'lost+found']:
-                            key = '{0}-{1}'.format(file_type, file_name)
-                            directory_dict[key] = {'file_type': file_type, 'permissions': permissions, 'links_number': links_number, 'owner_name': owner_name, 'owner_group': owner_group, 'file_size': file_size, 'modification_month': modification_month, 'modification_day': modification_day, 'modification_time': modification_time, 'file_name': file_name}
+            directory_dict = {}
+            for entry in entry_list:
+                if entry['type'] in ['d', 'f']:
+                    file_type = 'directory' if entry['type'] == 'd' else 'file'
+                    key = '{0}-{1}'.format(file_type, entry['name'])
+                    directory_dict[key] = {'file_type': file_type, 'file_size': entry['size'], 'modification_time': entry['mtime'], 'file_name': entry['name']}
 
         # check if there are any nodes running
         if OK:
@@ -331,6 +342,8 @@ class FormListDataset(tkinter.Frame):
         # close the form
         if OK:
             self.close()
+        else:
+            self.check_inputs()
 
     #---------------
 
@@ -339,6 +352,9 @@ class FormListDataset(tkinter.Frame):
         Close "FormListDataset".
         '''
 
+        # cancel the pending background tasks
+        self.task_group.cancel()
+
         # close SSH client connection
         if self.cluster_name_ant is not None:
             xssh.close_ssh_client_connection(self.ssh_client)
@@ -2073,13 +2089,10 @@ class FormRecreateResultTransferConfigFile(tkinter.Frame):
         experiment_ids_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_result_dir()}'
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'result', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_ids_list.append(line)
+            for entry in entry_list:
+                experiment_ids_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_ids_list == []:
@@ -2118,13 +2131,14 @@ class FormRecreateResultTransferConfigFile(tkinter.Frame):
 
         # get the result dataset list of the experiments
         if self.wrapper_status.get() == 'uncompressed':
-            command = 'cd  {0}/{1}; for list in `ls`; do ls -ld $list | grep -v ^- > /dev/null && echo $list; done;'.format(xlib.get_cluster_result_dir(), self.wrapper_experiment_id.get())
+            excluded_type = 'f'
         elif self.wrapper_status.get() == 'compressed':
-            command = 'cd {0}/{1}; for list in `ls`; do ls -ld $list | grep -v ^d > /dev/null && echo $list; done;'.format(xlib.get_cluster_result_dir(), self.wrapper_experiment_id.get())
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
+            excluded_type = 'd'
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'result', self.wrapper_experiment_id.get(), passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                result_dataset_list.append(line.rstrip('\n'))
+            for entry in entry_list:
+                if entry['type'] != excluded_type:
+                    result_dataset_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if result_dataset_list == []:
@@ -3583,13 +3597,10 @@ class FormRecreateReadGzipConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = 'ls {0}'.format(self.cluster_read_dir)
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -4066,13 +4077,10 @@ class FormRecreateResultGzipConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = 'ls {0}'.format(self.cluster_result_dir)
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'result', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -5270,13 +5278,10 @@ class FormRemoveReadDataSet(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = 'ls {0}'.format(self.cluster_read_dir)
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -5608,13 +5613,10 @@ class FormRemoveResultDataSet(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = 'ls {0}'.format(self.cluster_result_dir)
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'result', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -5933,13 +5935,10 @@ class FormRemoveExperiment(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = 'ls {0}'.format(self.cluster_read_dir)
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -27,14 +27,19 @@ the NGScloud2 software package.
 import os
 import PIL.Image
 import PIL.ImageTk
+import queue
+import sys
+import tempfile
+import threading
 import tkinter
 import tkinter.font
 import tkinter.ttk
-import sys
 
 import datetime
 import os
+import gtask
 import xlib
+import xpager
 import xssh
 
 #-------------------------------------------------------------------------------
@@ -229,9 +234,9 @@ class DialogTable(tkinter.Toplevel):
         log_file = xlib.get_cluster_log_file()
         cluster_file_path = '{0}/{1}/{2}'.format(xlib.get_cluster_experiment_result_dir(experiment_id), run_id, log_file)
 
-        # create and show a instance "DialogViewer" to view the log file
-        dialog_viewer = DialogViewer(self, cluster_file_path, cluster_name)
-        self.wait_window(dialog_viewer)
+        # create and show a instance "DialogViewer" to view the log file (it is not waited for,
+        # so the logs of several running processes can be viewed and followed at once)
+        DialogViewer(self, cluster_file_path, cluster_name)
 
     #---------------
 
@@ -247,27 +252,14 @@ class DialogTable(tkinter.Toplevel):
         ssh_client = self.params[1]
 
         # get the directory dictionary of directories in the volume
-        command = 'ls -la {0}/{1}'.format(parent_directory, directory_name)
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
+        (OK, _, entry_list) = xssh.list_cluster_dir(ssh_client, '{0}/{1}'.format(parent_directory, directory_name))
         if OK:
             directory_dict = {}
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line.startswith('d') or line.startswith('-'):
-                    file_data_list = line.split()
-                    file_type = 'directory' if file_data_list[0][0] == 'd' else 'file'
-                    permissions = file_data_list[0][1:]
-                    links_number = file_data_list[1]
-                    owner_name = file_data_list[2]
-                    owner_group = file_data_list[3]
-                    file_size = file_data_list[4]
-                    modification_month = file_data_list[5]
-                    modification_day = file_data_list[6]
-                    modification_time = file_data_list[7]
-                    file_name = file_data_list[8]
-                    if file_name not in ['.', '..', 'lost+found']:
-                        key = '{0}-{1}'.format(file_type, file_name)
-                        directory_dict[key] = {'file_type': file_type, 'permissions': permissions, 'links_number': links_number, 'owner_name': owner_name, 'owner_group': owner_group, 'file_size': file_size, 'modification_month': modification_month, 'modification_day': modification_day, 'modification_time': modification_time, 'file_name': file_name}
+            for entry in entry_list:
+                if entry['type'] in ['d', 'f']:
+                    file_type = 'directory' if entry['type'] == 'd' else 'file'
+                    key = '{0}-{1}'.format(file_type, entry['name'])
+                    directory_dict[key] = {'file_type': file_type, 'file_size': entry['size'], 'modification_time': entry['mtime'], 'file_name': entry['name']}
 
         # check if there are any nodes running
         if OK:
@@ -304,39 +296,19 @@ class DialogTable(tkinter.Toplevel):
         ssh_client = self.params[1]
 
         # get the directory dictionary of directories in the volume
-        command = 'ls -la {0}/{1}'.format(parent_directory, file_name)
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
+        (OK, _, entry) = xssh.get_cluster_entry(ssh_client, '{0}/{1}'.format(parent_directory, file_name), detailed=True)
         if OK:
             file_detail_dict = {}
-            for line in stdout:
-                line = line.rstrip('\n')
-                file_data_list = line.split()
-                # -- permissions = file_data_list[0][1:]
-                # -- links_number = file_data_list[1]
-                # -- owner_name = file_data_list[2]
-                # -- owner_group = file_data_list[3]
-                day = int(file_data_list[6])
-                try:
-                    month = 1 + ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Sep', 'Oct', 'Nov', 'Dec'].index(file_data_list[5])
-                except:
-                    month = 0
-                if file_data_list[7].find(':') > -1:
-                    year = datetime.datetime.now().year
-                    modification_date = '{0:4}-{1:02d}-{2:02d}'.format(year, month, day)
-                    modification_time = file_data_list[7]
-                else:
-                    year = int(file_data_list[7])
-                    modification_date = '{0:4}-{1:02}-{2:02}'.format(year, month, day)
-                    modification_time = ' '
-                file_name = file_data_list[8]
-                file_detail_dict[0] = {'data': 'directory', 'value': os.path.dirname(file_name)}
-                file_detail_dict[1] = {'data': 'name', 'value': os.path.basename(file_name)}
-                file_detail_dict[2] = {'data': 'size', 'value': file_data_list[4]}
-                file_detail_dict[3] = {'data': 'permissions', 'value': file_data_list[0][1:]}
-                file_detail_dict[4] = {'data': 'modification date', 'value': modification_date}
-                file_detail_dict[5] = {'data': 'modification time', 'value': modification_time}
-                file_detail_dict[6] = {'data': 'owner group', 'value': file_data_list[3]}
-                file_detail_dict[7] = {'data': 'owner name', 'value': file_data_list[2]}
+            if entry is not None:
+                modification_datetime = datetime.datetime.fromtimestamp(entry['mtime'])
+                file_detail_dict[0] = {'data': 'directory', 'value': parent_directory}
+                file_detail_dict[1] = {'data': 'name', 'value': entry['name']}
+                file_detail_dict[2] = {'data': 'size', 'value': entry['size']}
+                file_detail_dict[3] = {'data': 'permissions', 'value': entry['permissions']}
+                file_detail_dict[4] = {'data': 'modification date', 'value': modification_datetime.strftime('%Y-%m-%d')}
+                file_detail_dict[5] = {'data': 'modification time', 'value': modification_datetime.strftime('%H:%M')}
+                file_detail_dict[6] = {'data': 'owner group', 'value': entry['owner_group']}
+                file_detail_dict[7] = {'data': 'owner name', 'value': entry['owner_name']}
 
         # check if there are any nodes running
         if OK:
@@ -686,6 +658,18 @@ class DialogLog(tkinter.Toplevel):
     WINDOW_MIN_HEIGHT = 680
     WINDOW_MIN_WIDTH = 680
 
+    # interval (in milliseconds) between two refreshes of the widget "text" (25 frames per second)
+    REFRESH_INTERVAL = 40
+
+    # maximum number of records queued (the worker threads wait while the queue is full)
+    RECORD_QUEUE_SIZE = 5000
+
+    # maximum number of records shown in each refresh of the widget "text"
+    REFRESH_RECORD_NUMBER = 1000
+
+    # maximum number of lines kept in the widget "text" (the complete log is in the log file)
+    SCROLLBACK_LINES = 20000
+
     #---------------
 
     def __init__(self, parent, head='', calling_function=None):
@@ -720,14 +704,17 @@ class DialogLog(tkinter.Toplevel):
 
         # open the local log file
         try:
-            if not os.path.exists(os.path.dirname(self.log_file)):
-                os.makedirs(os.path.dirname(self.log_file))
-            self.log_file_id = open(self.log_file, mode='w', encoding='iso-8859-1', newline='\n')
+            self.log_writer = xlib.LogWriter(self.log_file)
         except Exception as e:
             message = '*** ERROR: The file {0} can not be created'.format(self.log_file)
             tkinter.messagebox.showwarning(f'{xlib.get_project_name()} - {self.head}', message)
             # delete all widgets and terminate the mainloop
             self.destroy()
+            return
+
+        # create the queue of the records pending to be shown and start the refresh of "text"
+        self.record_queue = queue.Queue(maxsize=self.RECORD_QUEUE_SIZE)
+        self.refresh_id = self.after(self.REFRESH_INTERVAL, self.refresh_text)
 
     #---------------
 
@@ -795,9 +782,18 @@ class DialogLog(tkinter.Toplevel):
 
     def enable_button_close(self):
         '''
-        Enable "button_close".
+        Enable "button_close". When it is called from a worker thread, the request is
+        queued after the pending messages and it is done by the Tk main thread.
         '''
 
+        # queue the request when it is called from a worker thread
+        if threading.current_thread() is not threading.main_thread():
+            self.record_queue.put(('enable_button_close', None))
+            return
+
+        # show the pending messages
+        self.refresh_text(reschedule=False)
+
         # set cursor to show normal status
         self.config(cursor='')
         self.update()
@@ -815,25 +811,69 @@ class DialogLog(tkinter.Toplevel):
         Add a message in the widget "text" and in the log file.
         '''
 
-        # write the message in widget "text" 
-        self.text.configure(state='normal')
-        self.text.insert('end', message)
-        self.text.see('end')
-        self.text.update()
-        self.text.configure(state='disabled')
-
         # write in the log file
-        self.log_file_id.write(message)
-        self.log_file_id.flush()
-        os.fsync(self.log_file_id.fileno())
+        self.log_writer.write(message)
+
+        # queue the message to be shown in widget "text"; a worker thread waits while the queue
+        # is full and the Tk main thread shows the pending messages to make room
+        if threading.current_thread() is not threading.main_thread():
+            self.record_queue.put(('message', message))
+        else:
+            while True:
+                try:
+                    self.record_queue.put_nowait(('message', message))
+                    break
+                except queue.Full:
+                    self.refresh_text(reschedule=False)
+
+    #---------------
+
+    def refresh_text(self, reschedule=True):
+        '''
+        Show a batch of the queued messages in the widget "text" with only one insertion
+        and do the queued requests (it runs in the Tk main thread).
+        '''
+
+        # get a batch of the queued records
+        message_list = []
+        is_button_close_to_enable = False
+        for _ in range(self.REFRESH_RECORD_NUMBER):
+            try:
+                (kind, message) = self.record_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'message':
+                message_list.append(message)
+            elif kind == 'enable_button_close':
+                is_button_close_to_enable = True
+                break
+
+        # insert the messages in widget "text" and remove the oldest lines over the scrollback limit
+        if message_list != []:
+            self.text.configure(state='normal')
+            self.text.insert('end', ''.join(message_list))
+            line_number = int(self.text.index('end-1c').split('.')[0])
+            if line_number > self.SCROLLBACK_LINES:
+                self.text.delete('1.0', f'{line_number - self.SCROLLBACK_LINES + 1}.0')
+            self.text.see('end')
+            self.text.configure(state='disabled')
+
+        # enable "button_close"
+        if is_button_close_to_enable:
+            self.enable_button_close()
+
+        # schedule the next refresh
+        if reschedule:
+            self.refresh_id = self.after(self.REFRESH_INTERVAL, self.refresh_text)
 
     #---------------
 
     def get_log_file(self):
         '''
-        Get the current log file name
+        Get the current log file name (the pending messages are written before).
         '''
 
+        self.log_writer.flush()
         return self.log_file
 
     #---------------
@@ -843,11 +883,11 @@ class DialogLog(tkinter.Toplevel):
         Close "DialogLog".
         '''
 
-        # close the local log file
-        self.log_file_id.close()
-
-        # delete all widgets and terminate the mainloop
+        # when "button_close" is enabled (the worker has finished writing), close the local log file,
+        # stop the refresh of "text" and delete all widgets and terminate the mainloop
         if self.is_enabled_button_close:
+            self.log_writer.close()
+            self.after_cancel(self.refresh_id)
             self.destroy()
 
     #---------------
@@ -861,6 +901,15 @@ class DialogViewer(tkinter.Toplevel):
     WINDOW_MIN_HEIGHT = 650
     WINDOW_MIN_WIDTH = 800
 
+    # interval (in milliseconds) between two steps of the construction of the line index
+    INDEX_STEP_INTERVAL = 20
+
+    # number of lines moved by each step of the mouse wheel
+    WHEEL_LINES = 3
+
+    # interval (in milliseconds) between two refreshes of a followed file
+    FOLLOW_INTERVAL = 250
+
     #---------------
 
     def __init__(self, parent, file_path, cluster_name=None):
@@ -879,6 +928,29 @@ class DialogViewer(tkinter.Toplevel):
         # create the window of the Dialog Viewer.
         self.create_window()
 
+        # create the group of background tasks
+        self.task_group = gtask.TaskGroup(self, self.title())
+
+        # initialize the pager of the file, the first line shown, the line of the last text found
+        # and the identification of the next step of the line index construction
+        self.pager = None
+        self.first_line_number = 0
+        self.found_line_number = None
+        self.index_step_id = None
+
+        # initialize the local path of the file, the path of the local copy of a cluster file, the
+        # remote tail of a cluster file, the queue of the data received by the tail and the
+        # identification of the next refresh of the followed file
+        self.local_file_path = None
+        self.download_file_path = None
+        self.tail = None
+        self.tail_queue = queue.Queue()
+        self.follow_id = None
+
+        # create the wrappers of the text to search and of the follow mode
+        self.wrapper_search_text = tkinter.StringVar()
+        self.wrapper_follow = tkinter.BooleanVar(value=False)
+
         # build the graphical user interface
         self.build_gui()
 
@@ -942,22 +1014,67 @@ class DialogViewer(tkinter.Toplevel):
         self.button_refresh.image = imagetk_refresh
         self.button_refresh.pack(side='left', padx=2, pady=5)
 
+        # create "separator_2" and register it with the pack geometry manager
+        self.separator_2 = tkinter.ttk.Separator(self.frame_toolbar, orient='vertical')
+        self.separator_2.pack(side='left', fill='y', padx=2, pady=2)
+
+        # create "button_begin" and register it with the pack geometry manager
+        self.button_begin = tkinter.ttk.Button(self.frame_toolbar, text='Begin', command=self.go_to_begin, width=6)
+        self.button_begin.pack(side='left', padx=2, pady=5)
+
+        # create "button_end" and register it with the pack geometry manager
+        self.button_end = tkinter.ttk.Button(self.frame_toolbar, text='End', command=self.go_to_end, width=6)
+        self.button_end.pack(side='left', padx=2, pady=5)
+
+        # create "entry_search_text" and register it with the pack geometry manager
+        self.entry_search_text = tkinter.ttk.Entry(self.frame_toolbar, textvariable=self.wrapper_search_text, width=30)
+        self.entry_search_text.pack(side='left', padx=(10,2), pady=5)
+
+        # create "button_search_previous" and register it with the pack geometry manager
+        self.button_search_previous = tkinter.ttk.Button(self.frame_toolbar, text='Previous', command=self.search_previous, width=9)
+        self.button_search_previous.pack(side='left', padx=2, pady=5)
+
+        # create "button_search_next" and register it with the pack geometry manager
+        self.button_search_next = tkinter.ttk.Button(self.frame_toolbar, text='Next', command=self.search_next, width=6)
+        self.button_search_next.pack(side='left', padx=2, pady=5)
+
+        # create "checkbutton_follow" and register it with the pack geometry manager
+        self.checkbutton_follow = tkinter.ttk.Checkbutton(self.frame_toolbar, text='Follow', variable=self.wrapper_follow, command=self.toggle_follow)
+        self.checkbutton_follow.pack(side='left', padx=(10,2), pady=5)
+
+        # create "label_position" and register it with the pack geometry manager
+        self.label_position = tkinter.Label(self.frame_toolbar, text='')
+        self.label_position.pack(side='right', padx=5, pady=5)
+
         # create "text" and register it with the grid geometry manager
         self.text = tkinter.Text(self, font='Courier 10', wrap='none', state='disabled')
         self.text.pack(expand='yes', fill='both')
+        self.text.tag_configure('found', background='yellow')
+        self.text_font = tkinter.font.Font(font=self.text['font'])
 
         # create "scrollbar_x" and register it with the pack geometry manager
         self.scrollbar_x = tkinter.Scrollbar(self.text, orient='horizontal', command=self.text.xview)
         self.scrollbar_x.pack(side='bottom', fill='x')
         self.text.configure(xscrollcommand=self.scrollbar_x.set)
         
-        # create "scrollbar_y" and register it with the pack geometry manager
-        self.scrollbar_y = tkinter.Scrollbar(self.text, orient='vertical', command=self.text.yview)
+        # create "scrollbar_y" and register it with the pack geometry manager (it moves the page
+        # of lines shown because "text" only has the visible lines of the file)
+        self.scrollbar_y = tkinter.Scrollbar(self.text, orient='vertical', command=self.scroll_y)
         self.scrollbar_y.pack(side='right', fill='y')
-        self.text.configure(yscrollcommand=self.scrollbar_y.set)
 
         # link a handler to events
         self.bind('<Alt-F4>', self.close)
+        self.text.bind('<Configure>', lambda event: self.show_page())
+        self.text.bind('<MouseWheel>', self.scroll_wheel)
+        self.text.bind('<Button-4>', self.scroll_wheel)
+        self.text.bind('<Button-5>', self.scroll_wheel)
+        self.text.bind('<Up>', lambda event: self.move_to(self.first_line_number - 1))
+        self.text.bind('<Down>', lambda event: self.move_to(self.first_line_number + 1))
+        self.text.bind('<Prior>', lambda event: self.move_to(self.first_line_number - self.get_visible_line_number()))
+        self.text.bind('<Next>', lambda event: self.move_to(self.first_line_number + self.get_visible_line_number()))
+        self.text.bind('<Control-Home>', lambda event: self.go_to_begin())
+        self.text.bind('<Control-End>', lambda event: self.go_to_end())
+        self.entry_search_text.bind('<Return>', lambda event: self.search_next())
 
         # link a handler to interactions between the application and the window manager
         self.protocol('WM_DELETE_WINDOW', self.close)
@@ -966,75 +1083,406 @@ class DialogViewer(tkinter.Toplevel):
 
     def open_file(self):
         '''
-        Open a config file in "DialogViewer".
+        Open a file in "DialogViewer". A cluster file is downloaded in background.
         '''
 
-        # set cursor to show busy status
-        self.config(cursor='watch')
-        self.update()
-        self.text.config(cursor='watch')
-        self.text.update()
-
-        # initialize the control variable
-        OK = True
+        # stop following the file
+        self.stop_follow()
 
         # when the file is in the local computer
         if self.cluster_name == None:
-
-            local_file_path = self.file_path
+            self.view_file(self.file_path)
 
         # when the file is in a cluster
-        else:
-
-            # create the SSH transport connection
-            if OK:
-                (OK, error_list, ssh_transport) = xssh.create_ssh_transport_connection(self.cluster_name)
-                if not OK:
+        elif not self.task_group.is_busy():
+
+            # close the pager, so the file that is memory-mapped is not replaced while it is read
+            self.close_pager()
+
+            # build the local path of the copy of this viewer (it is unique, so viewers of files
+            # with the same name do not share it)
+            if self.download_file_path is None:
+                if not os.path.exists(xlib.get_temp_dir()):
+                    os.makedirs(xlib.get_temp_dir())
+                (file_id, self.download_file_path) = tempfile.mkstemp(prefix=f'{self.cluster_name}-', suffix=f'-{os.path.basename(self.file_path)}', dir=xlib.get_temp_dir())
+                os.close(file_id)
+            local_file_path = self.download_file_path
+
+            # load the file content when it has been downloaded
+            def load_downloaded_file(result):
+                self.title(title)
+                (OK, error_list) = result
+                if OK:
+                    self.view_file(local_file_path)
+                else:
                     message = ''
                     for error in error_list:
                         message = f'{message}{error}\n'
                     tkinter.messagebox.showerror(self.title(), message)
 
-            # create the SFTP client 
-            if OK:
-                sftp_client = xssh.create_sftp_client(ssh_transport)
+            # show the download progress in the title
+            def show_progress(message):
+                self.title(f'{title} ({message})')
 
-            # create the local path
-            if not os.path.exists(xlib.get_temp_dir()):
-                os.makedirs(xlib.get_temp_dir())
+            # download the log file from the cluster
+            title = self.title()
+            self.task_group.submit(self.download_file, local_file_path, on_done=load_downloaded_file, on_progress=show_progress, with_task=True)
 
-            # get the log file name and build local and cluster paths
-            if OK:
-                local_file_path = '{0}/{1}'.format(xlib.get_temp_dir(), os.path.basename(self.file_path))
+    #---------------
 
-            # download the log file from the cluster
-            if OK:
-                OK = xssh.get_file(sftp_client, self.file_path, local_file_path)
-                if not OK:
-                    message = 'The log file {0} could not be downloaded.'.format(self.file_path)
-                    tkinter.messagebox.showerror(self.title(), message)
+    def download_file(self, local_file_path, task):
+        '''
+        Download the cluster file to the local computer reporting the progress to the task
+        (it runs in a background thread).
+        '''
 
-            # close the SSH transport connection
-            xssh.close_ssh_transport_connection(ssh_transport)
+        return xssh.download_cluster_file(self.cluster_name, self.file_path, local_file_path, progress_function=task.report_progress)
 
+    #---------------
 
-        # load the file content in "text"
-        if OK:
-            self.text.configure(state='normal')
-            self.text.delete('1.0', 'end')
-            try:
-                with open(local_file_path, encoding='iso-8859-1') as local_file_id:
-                    self.text.insert('1.0', local_file_id.read())
-            except Exception as e:
-                tkinter.messagebox.showerror('{0} - Open'.format(xlib.get_project_name()), 'The file {0} can not be opened.'.format(local_file_path))
-            else:
-                self.text.configure(state='disable')
+    def view_file(self, local_file_path):
+        '''
+        View a local file paging it: only the visible lines are read from the memory-mapped file.
+        '''
+
+        # close the pager of the previous version of the file (the position is kept)
+        self.close_pager()
+
+        # create the pager of the file
+        try:
+            self.pager = xpager.open_local_file_pager(local_file_path)
+        except Exception as e:
+            tkinter.messagebox.showerror('{0} - Open'.format(xlib.get_project_name()), 'The file {0} can not be opened.'.format(local_file_path))
+            return
+
+        # save the local path of the file
+        self.local_file_path = local_file_path
+
+        # show the page of lines
+        self.show_page()
+
+        # build the line index in background steps
+        self.index_step_id = self.after(self.INDEX_STEP_INTERVAL, self.build_index_step)
+
+    #---------------
+
+    def build_index_step(self):
+        '''
+        Extend the line index a chunk and update the scroll bar.
+        '''
+
+        self.index_step_id = None
+        if self.pager is not None and not self.pager.is_index_complete():
+            self.pager.extend_index(max_length=xpager.get_pager_chunk_size())
+            self.update_position()
+            self.index_step_id = self.after(self.INDEX_STEP_INTERVAL, self.build_index_step)
+
+    #---------------
+
+    def get_visible_line_number(self):
+        '''
+        Get the number of lines that fit in "text".
+        '''
+
+        return max(1, self.text.winfo_height() // self.text_font.metrics('linespace') - 1)
+
+    #---------------
+
+    def show_page(self):
+        '''
+        Load the visible lines in "text".
+        '''
+
+        # check if there is a file
+        if self.pager is None:
+            return
+
+        # get the visible lines
+        line_list = self.pager.get_lines(self.first_line_number, self.get_visible_line_number())
+
+        # load the lines in "text" and highlight the line of the last text found
+        self.text.configure(state='normal')
+        self.text.delete('1.0', 'end')
+        self.text.insert('1.0', '\n'.join(line_list))
+        if self.found_line_number is not None and self.first_line_number <= self.found_line_number < self.first_line_number + len(line_list):
+            text_line_number = self.found_line_number - self.first_line_number + 1
+            self.text.tag_add('found', f'{text_line_number}.0', f'{text_line_number}.end')
+        self.text.configure(state='disabled')
+
+        # update the scroll bar and the position
+        self.update_position()
+
+    #---------------
+
+    def update_position(self):
+        '''
+        Update "scrollbar_y" and "label_position" with the position of the page in the file.
+        '''
+
+        # get the number of lines of the file (estimated while the line index is built)
+        line_count = self.pager.get_estimated_line_count()
+        last_line_number = min(self.first_line_number + self.get_visible_line_number(), line_count)
+
+        # update the scroll bar and the position
+        self.scrollbar_y.set(self.first_line_number / max(line_count, 1), last_line_number / max(line_count, 1))
+        approximate = '' if self.pager.is_index_complete() else '~'
+        self.label_position['text'] = f'Lines {min(self.first_line_number + 1, line_count)}-{last_line_number} of {approximate}{line_count}'
+
+    #---------------
+
+    def move_to(self, line_number):
+        '''
+        Show the page of lines that begins in a line number.
+        '''
+
+        # check if there is a file
+        if self.pager is None:
+            return 'break'
+
+        # keep the page full at the end of the file
+        visible_line_number = self.get_visible_line_number()
+        line_number = max(0, line_number)
+        if self.pager.get_line_offset(line_number + visible_line_number - 1) is None:
+            line_number = max(0, self.pager.get_line_count() - visible_line_number)
+
+        # show the page
+        self.first_line_number = line_number
+        self.show_page()
+
+        return 'break'
+
+    #---------------
+
+    def scroll_y(self, *args):
+        '''
+        Move the page of lines when "scrollbar_y" is used.
+        '''
+
+        # check if there is a file
+        if self.pager is None:
+            return
+
+        # move the page
+        if args[0] == 'moveto':
+            self.move_to(int(float(args[1]) * self.pager.get_estimated_line_count()))
+        elif args[0] == 'scroll':
+            step = self.get_visible_line_number() if args[2] == 'pages' else 1
+            self.move_to(self.first_line_number + int(args[1]) * step)
+
+    #---------------
+
+    def scroll_wheel(self, event):
+        '''
+        Move the page of lines when the mouse wheel is used.
+        '''
+
+        if event.num == 4 or (event.num != 5 and event.delta > 0):
+            return self.move_to(self.first_line_number - self.WHEEL_LINES)
+        else:
+            return self.move_to(self.first_line_number + self.WHEEL_LINES)
+
+    #---------------
+
+    def go_to_begin(self):
+        '''
+        Show the first page of lines.
+        '''
+
+        return self.move_to(0)
+
+    #---------------
+
+    def go_to_end(self):
+        '''
+        Show the last page of lines (the whole line index is built).
+        '''
+
+        if self.pager is not None:
+            self.pager.refresh()
+            return self.move_to(self.pager.get_line_count())
+
+    #---------------
+
+    def search_next(self):
+        '''
+        Search the text after the last text found or from the first line shown.
+        '''
+
+        line_number = self.found_line_number if self.found_line_number is not None else self.first_line_number - 1
+        self.search(line_number, backwards=False)
+
+    #---------------
+
+    def search_previous(self):
+        '''
+        Search the text before the last text found or before the first line shown.
+        '''
+
+        line_number = self.found_line_number if self.found_line_number is not None else self.first_line_number
+        self.search(line_number, backwards=True)
+
+    #---------------
+
+    def search(self, line_number, backwards):
+        '''
+        Search the text (case insensitive) and show the page of the line where it is found.
+        '''
+
+        # check if there is a file and a text to search
+        if self.pager is None or self.wrapper_search_text.get() == '':
+            return
+
+        # set cursor to show busy status
+        self.config(cursor='watch')
+        self.update()
+
+        # search the text
+        found_line_number = self.pager.search(self.wrapper_search_text.get(), line_number, backwards=backwards)
 
         # set cursor to show normal status
         self.config(cursor='')
-        self.update()
-        self.text.config(cursor='')
-        self.text.update()
+
+        # show the page of the line found
+        if found_line_number is None:
+            tkinter.messagebox.showinfo(self.title(), 'The text {0} is not found.'.format(self.wrapper_search_text.get()))
+        else:
+            self.found_line_number = found_line_number
+            self.move_to(found_line_number - self.get_visible_line_number() // 3)
+
+    #---------------
+
+    def toggle_follow(self):
+        '''
+        Start or stop following the file when "checkbutton_follow" is changed.
+        '''
+
+        if self.wrapper_follow.get():
+            self.start_follow()
+        else:
+            self.stop_follow()
+
+    #---------------
+
+    def start_follow(self):
+        '''
+        Start following the file. The bytes appended to a cluster file are received through a
+        remote tail and added to the local copy, so the file is not downloaded again.
+        '''
+
+        # check if there is a file
+        if self.pager is None:
+            self.wrapper_follow.set(False)
+            return
+
+        # start the remote tail of a cluster file from the end of the local copy
+        if self.cluster_name is not None:
+            if xpager.is_gzip_file(self.local_file_path):
+                tkinter.messagebox.showwarning(self.title(), 'A compressed file can not be followed.')
+                self.wrapper_follow.set(False)
+                return
+            offset = os.path.getsize(self.local_file_path)
+            self.tail = xssh.RemoteFileTail(self.cluster_name, self.file_path, offset, data_function=self.tail_queue.put, message_function=self.tail_queue.put)
+            (OK, error_list) = self.tail.start()
+            if not OK:
+                message = ''
+                for error in error_list:
+                    message = f'{message}{error}\n'
+                tkinter.messagebox.showerror(self.title(), message)
+                self.tail = None
+                self.wrapper_follow.set(False)
+                return
+
+        # show the last page of lines and refresh it periodically
+        self.go_to_end()
+        self.follow_id = self.after(self.FOLLOW_INTERVAL, self.refresh_follow)
+
+    #---------------
+
+    def refresh_follow(self):
+        '''
+        Append the data received by the remote tail to the local copy and show the new lines
+        when the last page of lines is shown.
+        '''
+
+        self.follow_id = None
+
+        # check if the last page of lines is shown
+        at_end = self.pager.get_line_offset(self.first_line_number + self.get_visible_line_number()) is None
+
+        # append the data received to the local copy and show the messages of "tail"
+        self.write_tail_data()
+
+        # show the new lines of the file
+        size = self.pager.source.get_size()
+        if self.pager.refresh() != size:
+            if at_end:
+                self.move_to(self.pager.get_line_count())
+            else:
+                self.update_position()
+
+        # stop following the file when the remote tail has finished
+        if self.tail is not None and not self.tail.is_running():
+            self.stop_follow()
+        else:
+            self.follow_id = self.after(self.FOLLOW_INTERVAL, self.refresh_follow)
+
+    #---------------
+
+    def write_tail_data(self):
+        '''
+        Append the data in the queue of the remote tail to the local copy of the file.
+        '''
+
+        # get the data and the messages of the queue
+        data_list = []
+        while True:
+            try:
+                item = self.tail_queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, bytes):
+                data_list.append(item)
+            else:
+                self.label_position['text'] = item
+
+        # append the data to the local copy
+        if data_list != []:
+            with open(self.local_file_path, mode='ab') as file_id:
+                file_id.write(b''.join(data_list))
+
+    #---------------
+
+    def stop_follow(self):
+        '''
+        Stop following the file.
+        '''
+
+        # stop the refresh of the followed file
+        if self.follow_id is not None:
+            self.after_cancel(self.follow_id)
+            self.follow_id = None
+
+        # stop the remote tail and keep the data already received
+        if self.tail is not None:
+            self.tail.stop()
+            self.tail = None
+            self.write_tail_data()
+
+        self.wrapper_follow.set(False)
+
+    #---------------
+
+    def close_pager(self):
+        '''
+        Stop the construction of the line index and close the pager.
+        '''
+
+        if self.index_step_id is not None:
+            self.after_cancel(self.index_step_id)
+            self.index_step_id = None
+        if self.pager is not None:
+            self.pager.close()
+            self.pager = None
 
     #---------------
 
@@ -1043,6 +1491,23 @@ class DialogViewer(tkinter.Toplevel):
         Close "DialogViewer".
         '''
 
+        # cancel the pending background tasks
+        self.task_group.cancel()
+
+        # stop following the file
+        self.stop_follow()
+
+        # close the pager of the file
+        self.close_pager()
+
+        # delete the local copy of a cluster file, its partial file and its decompressed cache file
+        if self.download_file_path is not None:
+            for file_path in [self.download_file_path, f'{self.download_file_path}.part', xpager.get_cache_file(os.path.abspath(self.download_file_path))]:
+                try:
+                    os.remove(file_path)
+                except OSError:
+                    pass
+
         # deletes all widgets and terminate the mainloop
         self.destroy()
 
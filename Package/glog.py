@@ -31,7 +31,6 @@ import sys
 import threading
 import tkinter
 import tkinter.ttk
-import subprocess
 
 import gdialogs
 import xconfiguration
@@ -39,6 +38,8 @@ import xec2
 import xgzip
 import xinstance
 import xlib
+import xlogindex
+import xmetadata
 import xread
 import xreference
 import xresult
@@ -298,6 +299,15 @@ class FormViewSubmissionLogs(tkinter.Frame):
         # create the wrappers to track changes in the inputs
         self.wrapper_local_process_text = tkinter.StringVar()
         self.wrapper_local_process_text.trace('w', self.check_inputs)
+        self.wrapper_search_text = tkinter.StringVar()
+        self.wrapper_status = tkinter.StringVar()
+        self.wrapper_status.trace('w', self.check_inputs)
+        self.wrapper_cluster_name = tkinter.StringVar()
+        self.wrapper_cluster_name.trace('w', self.check_inputs)
+        self.wrapper_since = tkinter.StringVar()
+        self.wrapper_since.trace('w', self.check_inputs)
+        self.wrapper_until = tkinter.StringVar()
+        self.wrapper_until.trace('w', self.check_inputs)
 
         # build the graphical user interface
         self.build_gui()
@@ -330,17 +340,65 @@ class FormViewSubmissionLogs(tkinter.Frame):
         self.combobox_local_process_text = tkinter.ttk.Combobox(self, width=50, height=4, state='readonly', textvariable=self.wrapper_local_process_text)
         self.combobox_local_process_text.grid(row=0, column=1, padx=(5,5), pady=(75,5), sticky='w')
 
+        # create "label_search_text" and register it with the grid geometry manager
+        self.label_search_text = tkinter.Label(self, text='Text to search')
+        self.label_search_text.grid(row=1, column=0, padx=(15,5), pady=(15,5), sticky='e')
+
+        # create "entry_search_text" and register it with the grid geometry manager
+        self.entry_search_text = tkinter.ttk.Entry(self, textvariable=self.wrapper_search_text, width=53)
+        self.entry_search_text.grid(row=1, column=1, padx=(5,5), pady=(15,5), sticky='w')
+
+        # create "label_status" and register it with the grid geometry manager
+        self.label_status = tkinter.Label(self, text='Status')
+        self.label_status.grid(row=2, column=0, padx=(15,5), pady=(15,5), sticky='e')
+
+        # create "combobox_status" and register it with the grid geometry manager
+        self.combobox_status = tkinter.ttk.Combobox(self, width=15, height=4, state='readonly', textvariable=self.wrapper_status)
+        self.combobox_status.grid(row=2, column=1, padx=(5,5), pady=(15,5), sticky='w')
+
+        # create "label_cluster_name" and register it with the grid geometry manager
+        self.label_cluster_name = tkinter.Label(self, text='Cluster name')
+        self.label_cluster_name.grid(row=3, column=0, padx=(15,5), pady=(15,5), sticky='e')
+
+        # create "combobox_cluster_name" and register it with the grid geometry manager
+        self.combobox_cluster_name = tkinter.ttk.Combobox(self, width=30, height=4, state='readonly', textvariable=self.wrapper_cluster_name)
+        self.combobox_cluster_name.grid(row=3, column=1, padx=(5,5), pady=(15,5), sticky='w')
+
+        # create "label_since" and register it with the grid geometry manager
+        self.label_since = tkinter.Label(self, text='First start date')
+        self.label_since.grid(row=4, column=0, padx=(15,5), pady=(15,5), sticky='e')
+
+        # create "entry_since" and register it with the grid geometry manager
+        self.entry_since = tkinter.ttk.Entry(self, textvariable=self.wrapper_since, width=15)
+        self.entry_since.grid(row=4, column=1, padx=(5,5), pady=(15,5), sticky='w')
+
+        # create "label_since_format" and register it with the grid geometry manager
+        self.label_since_format = tkinter.Label(self, text='YYYY-MM-DD (without limit if empty)')
+        self.label_since_format.grid(row=4, column=1, padx=(140,0), pady=(15,5), sticky='w')
+
+        # create "label_until" and register it with the grid geometry manager
+        self.label_until = tkinter.Label(self, text='Last start date')
+        self.label_until.grid(row=5, column=0, padx=(15,5), pady=(15,5), sticky='e')
+
+        # create "entry_until" and register it with the grid geometry manager
+        self.entry_until = tkinter.ttk.Entry(self, textvariable=self.wrapper_until, width=15)
+        self.entry_until.grid(row=5, column=1, padx=(5,5), pady=(15,5), sticky='w')
+
+        # create "label_until_format" and register it with the grid geometry manager
+        self.label_until_format = tkinter.Label(self, text='YYYY-MM-DD (without limit if empty)')
+        self.label_until_format.grid(row=5, column=1, padx=(140,0), pady=(15,5), sticky='w')
+
         # create "label_fit" and register it with the grid geometry manager
         self.label_fit = tkinter.Label(self, text=' '*45)
-        self.label_fit.grid(row=2, column=2, padx=(0,0), pady=(45,5), sticky='e')
+        self.label_fit.grid(row=6, column=2, padx=(0,0), pady=(45,5), sticky='e')
 
         # create "button_execute" and register it with the grid geometry manager
         self.button_execute = tkinter.ttk.Button(self, text='Execute', command=self.execute, state='disabled')
-        self.button_execute.grid(row=2, column=3, padx=(5,5), pady=(45,5), sticky='e')
+        self.button_execute.grid(row=6, column=3, padx=(5,5), pady=(45,5), sticky='e')
 
         # create "button_close" and register it with the grid geometry manager
         self.button_close = tkinter.ttk.Button(self, text='Close', command=self.close)
-        self.button_close.grid(row=2, column=4, padx=(5,5), pady=(45,5), sticky='w')
+        self.button_close.grid(row=6, column=4, padx=(5,5), pady=(45,5), sticky='w')
 
         # link a handler to events
         self.combobox_local_process_text.bind('<<ComboboxSelected>>', self.combobox_local_process_text_selected_item)
@@ -355,9 +413,13 @@ class FormViewSubmissionLogs(tkinter.Frame):
 
         # load initial data in inputs
         self.local_process_id = None
+        self.wrapper_since.set('')
+        self.wrapper_until.set('')
 
         # populate data in comboboxes
         self.populate_combobox_local_process_text()
+        self.populate_combobox_status()
+        self.populate_combobox_cluster_name()
 
     #---------------
 
@@ -385,6 +447,28 @@ class FormViewSubmissionLogs(tkinter.Frame):
 
     #---------------
 
+    def populate_combobox_status(self):
+        '''
+        Populate data in "combobox_status".
+        '''
+
+        # load the status codes and select all of them
+        self.combobox_status['values'] = xlogindex.get_log_status_code_list()
+        self.wrapper_status.set('all')
+
+    #---------------
+
+    def populate_combobox_cluster_name(self):
+        '''
+        Populate data in "combobox_cluster_name".
+        '''
+
+        # load the names of the clusters mentioned in the submission logs and select all of them
+        self.combobox_cluster_name['values'] = ['all'] + xlogindex.get_log_index_cluster_name_list()
+        self.wrapper_cluster_name.set('all')
+
+    #---------------
+
     def combobox_local_process_text_selected_item(self, event=None):
         '''
         Process the event when an item of "combobox_local_process_text" has been selected
@@ -403,8 +487,14 @@ class FormViewSubmissionLogs(tkinter.Frame):
         # initialize the control variable
         OK = True
 
+        # check the start dates
+        if self.wrapper_since.get() != '' and not xlib.is_date_valid(self.wrapper_since.get()):
+            OK = False
+        if self.wrapper_until.get() != '' and not xlib.is_date_valid(self.wrapper_until.get()):
+            OK = False
+
         # check if "button_execute" has to be enabled or disabled
-        if self.wrapper_local_process_text.get() != '':
+        if OK and self.wrapper_local_process_text.get() != '' and self.wrapper_status.get() != '' and self.wrapper_cluster_name.get() != '':
             self.button_execute['state'] = 'enable'
         else:
             self.button_execute['state'] = 'disabled'
@@ -429,37 +519,24 @@ class FormViewSubmissionLogs(tkinter.Frame):
             message = 'Some input values are not OK.'
             tkinter.messagebox.showwarning(f'{xlib.get_project_name()} - {self.head}', message)
 
-        # get the local process dictionary
-        local_process_dict = xlib.get_submission_process_dict()
+        # get the submission logs that match the filters from the log index
+        if OK:
+            process_id = 'all' if self.wrapper_local_process_text.get() == 'all' else self.local_process_id
+            cluster_name = '' if self.wrapper_cluster_name.get() == 'all' else self.wrapper_cluster_name.get()
+            (OK, error_list, log_list) = xlogindex.search_log_index(process_id=process_id, text=self.wrapper_search_text.get(), status=self.wrapper_status.get(), cluster_name=cluster_name, since=self.wrapper_since.get(), until=self.wrapper_until.get())
+            if not OK:
+                message = ''
+                for error in error_list:
+                    message = f'{message}{error}\n'
+                tkinter.messagebox.showerror(f'{xlib.get_project_name()} - {self.head}', message)
 
         # build the log dictionary
         if OK:
             log_dict = {}
-            if self.wrapper_local_process_text.get() == 'all':
-                command = xlib.list_log_files_command('all')
-            else:
-                command = xlib.list_log_files_command(self.local_process_id)
-            output = subprocess.run(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
-            for line in output.stdout.split('\n'):
-                if line != '':
-                    line = os.path.basename(line)
-                    run_id = line
-                    try:
-                        pattern = r'^(.+)\-(.+)\-(.+)\-(.+).txt$'
-                        mo = re.search(pattern, line)
-                        # -- environment = mo.group(1)
-                        local_process_id = mo.group(2).strip()
-                        yymmdd = mo.group(3)
-                        hhmmss = mo.group(4)
-                        process_text = local_process_dict[local_process_id]['text']
-                        date = '20{0}-{1}-{2}'.format(yymmdd[:2], yymmdd[2:4], yymmdd[4:])
-                        time = '{0}:{1}:{2}'.format(hhmmss[:2], hhmmss[2:4], hhmmss[4:])
-                    except:
-                        process_text = 'unknown process'
-                        date = '0000-00-00'
-                        time = '00:00:00'
-                    key = '{0}-{1}'.format(process_text, run_id)
-                    log_dict[key] = {'process_text': process_text, 'run_id': run_id, 'date': date, 'time': time}
+            for log in log_list:
+                (date, time) = log['start'].split(' ')
+                key = '{0}-{1}'.format(log['process_text'], log['log_file'])
+                log_dict[key] = {'process_text': log['process_text'], 'run_id': log['log_file'], 'date': date, 'time': time, 'status': log['status'], 'cluster_name': log['cluster_name']}
 
         # check if there are any submission logs
         if OK:
@@ -470,15 +547,17 @@ class FormViewSubmissionLogs(tkinter.Frame):
 
         # build the data list
         if OK:
-            data_list = ['process_text', 'run_id', 'date', 'time']
+            data_list = ['process_text', 'run_id', 'date', 'time', 'status', 'cluster_name']
 
         # build the data dictionary
         if OK:
             data_dict = {}
-            data_dict['process_text'] = {'text': 'Process', 'width': 400, 'alignment': 'left'}
-            data_dict['run_id'] = {'text': 'Run id', 'width': 400, 'alignment': 'left'}
+            data_dict['process_text'] = {'text': 'Process', 'width': 310, 'alignment': 'left'}
+            data_dict['run_id'] = {'text': 'Run id', 'width': 330, 'alignment': 'left'}
             data_dict['date'] = {'text': 'Date', 'width': 85, 'alignment': 'right'}
-            data_dict['time'] = {'text': 'Time', 'width': 85, 'alignment': 'right'}
+            data_dict['time'] = {'text': 'Time', 'width': 70, 'alignment': 'right'}
+            data_dict['status'] = {'text': 'Status', 'width': 70, 'alignment': 'left'}
+            data_dict['cluster_name'] = {'text': 'Cluster', 'width': 120, 'alignment': 'left'}
 
         # create the dialog Table to list the local process logs
         if OK:
@@ -646,13 +725,10 @@ class FormViewResultLogs(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_result_dir()}'
-        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'result', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -751,321 +827,42 @@ class FormViewResultLogs(tkinter.Frame):
 
         # get the run dictionary of the experiment
         if OK:
-            # -- command = 'ls {0}/{1}'.format(xlib.get_cluster_result_dir(), self.wrapper_experiment_id.get())
-            command = 'cd  {0}/{1}; for list in `ls`; do ls -ld $list | grep -v ^- > /dev/null && echo $list; done;'.format(xlib.get_cluster_result_dir(), self.wrapper_experiment_id.get())
-            (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
+            (OK, _, dataset_catalog) = xmetadata.get_dataset_catalog(self.wrapper_cluster_name.get(), passed_connection=True, ssh_client=self.ssh_client, refresh=True)
             if OK:
                 result_dataset_dict = {}
-                for line in stdout:
-                    line = line.rstrip('\n')
-                    if line != 'lost+found':
-                        result_dataset_id = line
-                        try:
-                            pattern = r'^(.+)\-(.+)\-(.+)$'
-                            mo = re.search(pattern, result_dataset_id)
-                            # -- bioinfo_app_code = mo.group(1).strip()
-                            yymmdd = mo.group(2)
-                            hhmmss = mo.group(3)
-                            date = '20{0}-{1}-{2}'.format(yymmdd[:2], yymmdd[2:4], yymmdd[4:])
-                            time = '{0}:{1}:{2}'.format(hhmmss[:2], hhmmss[2:4], hhmmss[4:])
-                        except:
-                            date = '0000-00-00'
-                            time = '00:00:00'
-
-                        if result_dataset_id.startswith(xlib.get_bedtools_code()+'-'):
-                            bioinfo_app_name = xlib.get_bedtools_name()
-
-                        elif result_dataset_id.startswith(xlib.get_bcftools_code()+'-'):
-                            bioinfo_app_name = xlib.get_bcftools_name()
-
-                        elif result_dataset_id.startswith(xlib.get_blastplus_code()+'-'):
-                            bioinfo_app_name = xlib.get_blastplus_name()
-
-                        elif result_dataset_id.startswith(xlib.get_bowtie2_code()+'-'):
-                            bioinfo_app_name = xlib.get_bowtie2_name()
-
-                        elif result_dataset_id.startswith(xlib.get_busco_code()+'-'):
-                            bioinfo_app_name = xlib.get_busco_name()
-
-                        elif result_dataset_id.startswith(xlib.get_cd_hit_code()+'-'):
-                            bioinfo_app_name = xlib.get_cd_hit_name()
-
-                        elif result_dataset_id.startswith(xlib.get_cd_hit_est_code()+'-'):
-                            bioinfo_app_name = xlib.get_cd_hit_est_name()
-
-                        elif result_dataset_id.startswith(xlib.get_cuffdiff_code()+'-'):
-                            bioinfo_app_name = xlib.get_cuffdiff_name()
-
-                        elif result_dataset_id.startswith(xlib.get_cufflinks_code()+'-'):
-                            bioinfo_app_name = xlib.get_cufflinks_name()
-
-                        elif result_dataset_id.startswith(xlib.get_cufflinks_cuffmerge_code()+'-'):
-                            bioinfo_app_name = xlib.get_cufflinks_cuffmerge_name()
-
-                        elif result_dataset_id.startswith(xlib.get_cuffnorm_code()+'-'):
-                            bioinfo_app_name = xlib.get_cuffnorm_name()
-
-                        elif result_dataset_id.startswith(xlib.get_cuffquant_code()+'-'):
-                            bioinfo_app_name = xlib.get_cuffquant_name()
-
-                        elif result_dataset_id.startswith(xlib.get_cutadapt_code()+'-'):
-                            bioinfo_app_name = xlib.get_cutadapt_name()
-
-                        elif result_dataset_id.startswith(xlib.get_ddradseq_simulation_code()+'-'):
-                            bioinfo_app_name = xlib.get_ddradseq_simulation_name()
-
-                        elif result_dataset_id.startswith(xlib.get_ddradseqtools_code()+'-'):
-                            bioinfo_app_name = xlib.get_ddradseqtools_name()
-
-                        elif result_dataset_id.startswith(xlib.get_detonate_code()+'-'):
-                            bioinfo_app_name = xlib.get_detonate_name()
-
-                        elif result_dataset_id.startswith(xlib.get_diamond_code()+'-'):
-                            bioinfo_app_name = xlib.get_diamond_name()
-
-                        elif result_dataset_id.startswith(xlib.get_emboss_code()+'-'):
-                            bioinfo_app_name = xlib.get_emboss_name()
-
-                        elif result_dataset_id.startswith(xlib.get_entrez_direct_code()+'-'):
-                            bioinfo_app_name = xlib.get_entrez_direct_name()
-
-                        elif result_dataset_id.startswith(xlib.get_express_code()+'-'):
-                            bioinfo_app_name = xlib.get_express_name()
-
-                        elif result_dataset_id.startswith(xlib.get_fastqc_code()+'-'):
-                            bioinfo_app_name = xlib.get_fastqc_name()
-
-                        elif result_dataset_id.startswith(xlib.get_ggtrinity_code()+'-'):
-                            bioinfo_app_name = xlib.get_ggtrinity_name()
-
-                        elif result_dataset_id.startswith(xlib.get_gmap_gsnap_code()+'-'):
-                            bioinfo_app_name = xlib.get_gmap_gsnap_name()
-
-                        elif result_dataset_id.startswith(xlib.get_gmap_code()+'-'):
-                            bioinfo_app_name = xlib.get_gmap_name()
-
-                        elif result_dataset_id.startswith(xlib.get_gsnap_code()+'-'):
-                            bioinfo_app_name = xlib.get_gsnap_name()
-
-                        elif result_dataset_id.startswith(xlib.get_gzip_code()+'-'):
-                            bioinfo_app_name = xlib.get_gzip_name()
-
-                        elif result_dataset_id.startswith(xlib.get_hisat2_code()+'-'):
-                            bioinfo_app_name = xlib.get_hisat2_name()
-
-                        elif result_dataset_id.startswith(xlib.get_htseq_code()+'-'):
-                            bioinfo_app_name = xlib.get_htseq_name()
-
-                        elif result_dataset_id.startswith(xlib.get_htseq_count_code()+'-'):
-                            bioinfo_app_name = xlib.get_htseq_count_name()
-
-                        elif result_dataset_id.startswith(xlib.get_insilico_read_normalization_code()+'-'):
-                            bioinfo_app_name = xlib.get_insilico_read_normalization_name()
-
-                        elif result_dataset_id.startswith(xlib.get_ipyrad_code()+'-'):
-                            bioinfo_app_name = xlib.get_ipyrad_name()
-
-                        elif result_dataset_id.startswith(xlib.get_kallisto_code()+'-'):
-                            bioinfo_app_name = xlib.get_kallisto_name()
-
-                        elif result_dataset_id.startswith(xlib.get_miniconda3_code()+'-'):
-                            bioinfo_app_name = xlib.get_miniconda3_name()
-
-                        elif result_dataset_id.startswith(xlib.get_ngshelper_code()+'-'):
-                            bioinfo_app_name = xlib.get_ngshelper_name()
-
-                        elif result_dataset_id.startswith(xlib.get_quast_code()+'-'):
-                            bioinfo_app_name = xlib.get_quast_name()
-
-                        elif result_dataset_id.startswith(xlib.get_r_code()+'-'):
-                            bioinfo_app_name = xlib.get_r_name()
-
-                        elif result_dataset_id.startswith(xlib.get_raddesigner_code()+'-'):
-                            bioinfo_app_name = xlib.get_raddesigner_name()
-
-                        elif result_dataset_id.startswith(xlib.get_ref_eval_code()+'-'):
-                            bioinfo_app_name = xlib.get_ref_eval_name()
-
-                        elif result_dataset_id.startswith(xlib.get_rnaquast_code()+'-'):
-                            bioinfo_app_name = xlib.get_rnaquast_name()
-
-                        elif result_dataset_id.startswith(xlib.get_rsem_code()+'-'):
-                            bioinfo_app_name = xlib.get_rsem_name()
-
-                        elif result_dataset_id.startswith(xlib.get_rsem_eval_code()+'-'):
-                            bioinfo_app_name = xlib.get_rsem_eval_name()
-
-                        elif result_dataset_id.startswith(xlib.get_rsitesearch_code()+'-'):
-                            bioinfo_app_name = xlib.get_rsitesearch_name()
-
-                        elif result_dataset_id.startswith(xlib.get_samtools_code()+'-'):
-                            bioinfo_app_name = xlib.get_samtools_name()
-
-                        elif result_dataset_id.startswith(xlib.get_soapdenovo2_code()+'-'):
-                            bioinfo_app_name = xlib.get_soapdenovo2_name()
-
-                        elif result_dataset_id.startswith(xlib.get_soapdenovotrans_code()+'-'):
-                            bioinfo_app_name = xlib.get_soapdenovotrans_name()
-
-                        elif result_dataset_id.startswith(xlib.get_star_code()+'-'):
-                            bioinfo_app_name = xlib.get_star_name()
-
-                        elif result_dataset_id.startswith(xlib.get_starcode_code()+'-'):
-                            bioinfo_app_name = xlib.get_starcode_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_download_basic_data_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_process_download_basic_data_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_download_dicots_04_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_process_download_dicots_04_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_download_gene_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_process_download_gene_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_download_go_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_process_download_go_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_download_gymno_01_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_process_download_gymno_01_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_download_interpro_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_process_download_interpro_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_download_monocots_04_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_process_download_monocots_04_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_download_taxonomy_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_process_download_taxonomy_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_gilist_viridiplantae_nucleotide_gi_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_process_gilist_viridiplantae_nucleotide_gi_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_gilist_viridiplantae_protein_gi_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_process_gilist_viridiplantae_protein_gi_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_load_basic_data_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_process_load_basic_data_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_load_dicots_04_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_process_load_dicots_04_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_load_gene_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_process_load_gene_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_load_go_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_process_load_go_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_load_gymno_01_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_process_load_gymno_01_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_load_interpro_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_process_load_interpro_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_load_monocots_04_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_process_load_monocots_04_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_merge_annotations_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_process_merge_annotations_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_nr_blastplus_db_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_process_nr_blastplus_db_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_nr_diamond_db_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_process_nr_diamond_db_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_nt_blastplus_db_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_process_nt_blastplus_db_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_pipeline_aminoacid_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_process_pipeline_aminoacid_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_pipeline_nucleotide_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_process_pipeline_nucleotide_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_proteome_dicots_04_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_process_proteome_dicots_04_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_proteome_gymno_01_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_process_proteome_gymno_01_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_proteome_monocots_04_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_process_proteome_monocots_04_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_proteome_refseq_plant_code()+'-'):
-                            bioinfo_app_name = xlib.get_toa_process_proteome_refseq_plant_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_rebuild_toa_database_code()+'-'):
-                            bioinfo_app_name = xlib.get_get_toa_process_rebuild_toa_database_name()
-
-                        elif result_dataset_id.startswith(xlib.get_toa_process_recreate_toa_database_code()+'-'):
-                            bioinfo_app_name = xlib.get_get_toa_process_recreate_toa_database_name()
-
-                        elif result_dataset_id.startswith(xlib.get_tophat_code()+'-'):
-                            bioinfo_app_name = xlib.get_tophat_name()
-
-                        elif result_dataset_id.startswith(xlib.get_transabyss_code()+'-'):
-                            bioinfo_app_name = xlib.get_transabyss_name()
-
-                        elif result_dataset_id.startswith(xlib.get_transcript_filter_code()+'-'):
-                            bioinfo_app_name = xlib.get_transcript_filter_name()
-
-                        elif result_dataset_id.startswith(xlib.get_transcriptome_blastx_code()+'-'):
-                            bioinfo_app_name = xlib.get_transcriptome_blastx_name()
-
-                        elif result_dataset_id.startswith(xlib.get_transdecoder_code()+'-'):
-                            bioinfo_app_name = xlib.get_transdecoder_name()
-
-                        elif result_dataset_id.startswith(xlib.get_transrate_code()+'-'):
-                            bioinfo_app_name = xlib.get_transrate_name()
-
-                        elif result_dataset_id.startswith(xlib.get_trimmomatic_code()+'-'):
-                            bioinfo_app_name = xlib.get_trimmomatic_name()
-
-                        elif result_dataset_id.startswith(xlib.get_trinity_code()+'-'):
-                            bioinfo_app_name = xlib.get_trinity_name()
-
-                        elif result_dataset_id.startswith(xlib.get_variant_calling_code()+'-'):
-                            bioinfo_app_name = xlib.get_variant_calling_name()
-
-                        elif result_dataset_id.startswith(xlib.get_vcftools_code()+'-'):
-                            bioinfo_app_name = xlib.get_vcftools_name()
-
-                        elif result_dataset_id.startswith(xlib.get_vcftools_perl_libraries_code()+'-'):
-                            bioinfo_app_name = xlib.get_vcftools_perl_libraries_name()
-
-                        elif result_dataset_id.startswith(xlib.get_vsearch_code()+'-'):
-                            bioinfo_app_name = xlib.get_vsearch_name()
-
-                        else:
-                            bioinfo_app_name = 'xxx'
+                experiment_dataset_dict = xmetadata.get_child_dict(dataset_catalog, 'result', self.wrapper_experiment_id.get())
+                for result_dataset_id in sorted(experiment_dataset_dict.keys()):
+                    if experiment_dataset_dict[result_dataset_id]['type'] == 'f':
+                        continue
+                    try:
+                        pattern = r'^(.+)\-(.+)\-(.+)$'
+                        mo = re.search(pattern, result_dataset_id)
+                        # -- bioinfo_app_code = mo.group(1).strip()
+                        yymmdd = mo.group(2)
+                        hhmmss = mo.group(3)
+                        date = '20{0}-{1}-{2}'.format(yymmdd[:2], yymmdd[2:4], yymmdd[4:])
+                        time = '{0}:{1}:{2}'.format(hhmmss[:2], hhmmss[2:4], hhmmss[4:])
+                    except:
+                        date = '0000-00-00'
+                        time = '00:00:00'
 
-                        status_ok_file = xlib.get_status_ok('{0}/{1}/{2}'.format(xlib.get_cluster_result_dir(), self.wrapper_experiment_id.get(), result_dataset_id))
-                        command = '[ -f {0} ] && echo RC=0 || echo RC=1'.format(status_ok_file)
-                        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
-                        if stdout[len(stdout) - 1] == 'RC=0':
-                            status_ok = True
-                        else:
-                            status_ok = False
-                        status_wrong_file = xlib.get_status_wrong('{0}/{1}/{2}'.format(xlib.get_cluster_result_dir(), self.wrapper_experiment_id.get(), result_dataset_id))
-                        command = '[ -f {0} ] && echo RC=0 || echo RC=1'.format(status_wrong_file)
-                        (OK, stdout, _) = xssh.execute_cluster_command(self.ssh_client, command)
-                        if stdout[len(stdout) - 1] == 'RC=0':
-                            status_wrong = True
-                        else:
-                            status_wrong = False
-                        if status_ok and not status_wrong:
-                            status = 'OK'
-                        elif not status_ok and status_wrong:
-                            status = 'wrong'
-                        elif not status_ok and not status_wrong:
-                            status = 'not finished'
-                        elif status_ok and status_wrong:
-                            status = 'undetermined'
-                        key = '{0}-{1}'.format(bioinfo_app_name, result_dataset_id)
-                        result_dataset_dict[key] = {'experiment_id': self.wrapper_experiment_id.get(), 'bioinfo_app': bioinfo_app_name, 'result_dataset_id': result_dataset_id, 'date': date, 'time': time, 'status': status}
+                    (app, _, _) = xlib.classify_dataset_id(result_dataset_id)
+                    if app is not None:
+                        bioinfo_app_name = app['name']
+                    else:
+                        bioinfo_app_name = 'xxx'
+
+                    catalog_status = experiment_dataset_dict[result_dataset_id]['status']
+                    if catalog_status == 'ok':
+                        status = 'OK'
+                    elif catalog_status == 'wrong':
+                        status = 'wrong'
+                    elif catalog_status == '':
+                        status = 'not finished'
+                    else:
+                        status = 'undetermined'
+                    key = '{0}-{1}'.format(bioinfo_app_name, result_dataset_id)
+                    result_dataset_dict[key] = {'experiment_id': self.wrapper_experiment_id.get(), 'bioinfo_app': bioinfo_app_name, 'result_dataset_id': result_dataset_id, 'date': date, 'time': time, 'status': status}
 
         # check if there are any run
         if OK:
@@ -35,51 +35,56 @@ import tkinter.ttk
 import tkinter.messagebox
 import webbrowser
 
-import gbioinfoapp
 import gcloud
-import gdataset
 import gdialogs
-import glog
-import gtoa
-import xbowtie2
-import xbusco
-import xcdhit
-import xcluster
-import xconfiguration
-import xcufflinks
-import xcutadapt
-import xdatabase
-import xddradseqtools
-import xdetonate
-import xec2
-import xexpress
-import xfastqc
-import xgmap
-import xgzip
-import xhisat2
-import xhtseq
-import xinstance
-import xipyrad
-import xkallisto
+import gtask
 import xlib
-import xngshelper
-import xquast
-import xraddesigner
-import xsoapdenovo2
-import xsoapdenovotrans
-import xstar
-import xstarcode
-import xread
-import xreference
-import xresult
-import xrnaquast
-import xtoa
-import xtophat
-import xtransabyss
-import xtransrate
-import xtrimmomatic
-import xtrinity
-import xvolume
+
+#-------------------------------------------------------------------------------
+
+# modules loaded the first time they are used by a menu item
+gbioinfoapp = xlib.import_lazy_module('gbioinfoapp')
+gdataset = xlib.import_lazy_module('gdataset')
+glog = xlib.import_lazy_module('glog')
+gtoa = xlib.import_lazy_module('gtoa')
+xbowtie2 = xlib.import_lazy_module('xbowtie2')
+xbusco = xlib.import_lazy_module('xbusco')
+xcdhit = xlib.import_lazy_module('xcdhit')
+xcluster = xlib.import_lazy_module('xcluster')
+xconfiguration = xlib.import_lazy_module('xconfiguration')
+xcufflinks = xlib.import_lazy_module('xcufflinks')
+xcutadapt = xlib.import_lazy_module('xcutadapt')
+xdatabase = xlib.import_lazy_module('xdatabase')
+xddradseqtools = xlib.import_lazy_module('xddradseqtools')
+xdetonate = xlib.import_lazy_module('xdetonate')
+xec2 = xlib.import_lazy_module('xec2')
+xexpress = xlib.import_lazy_module('xexpress')
+xfastqc = xlib.import_lazy_module('xfastqc')
+xgmap = xlib.import_lazy_module('xgmap')
+xgzip = xlib.import_lazy_module('xgzip')
+xhisat2 = xlib.import_lazy_module('xhisat2')
+xhtseq = xlib.import_lazy_module('xhtseq')
+xinstance = xlib.import_lazy_module('xinstance')
+xipyrad = xlib.import_lazy_module('xipyrad')
+xkallisto = xlib.import_lazy_module('xkallisto')
+xngshelper = xlib.import_lazy_module('xngshelper')
+xquast = xlib.import_lazy_module('xquast')
+xraddesigner = xlib.import_lazy_module('xraddesigner')
+xsoapdenovo2 = xlib.import_lazy_module('xsoapdenovo2')
+xsoapdenovotrans = xlib.import_lazy_module('xsoapdenovotrans')
+xstar = xlib.import_lazy_module('xstar')
+xstarcode = xlib.import_lazy_module('xstarcode')
+xread = xlib.import_lazy_module('xread')
+xreference = xlib.import_lazy_module('xreference')
+xresult = xlib.import_lazy_module('xresult')
+xrnaquast = xlib.import_lazy_module('xrnaquast')
+xtoa = xlib.import_lazy_module('xtoa')
+xtophat = xlib.import_lazy_module('xtophat')
+xtransabyss = xlib.import_lazy_module('xtransabyss')
+xtransrate = xlib.import_lazy_module('xtransrate')
+xtrimmomatic = xlib.import_lazy_module('xtrimmomatic')
+xtrinity = xlib.import_lazy_module('xtrinity')
+xvolume = xlib.import_lazy_module('xvolume')
 
 #-------------------------------------------------------------------------------
 
@@ -8672,6 +8677,7 @@ class Main():
         message = f'Are you sure to exit {xlib.get_project_name()}?'
         if tkinter.messagebox.askyesno(f'{xlib.get_project_name()} - Exit', message):
             self.close_current_form()
+            gtask.shutdown_task_executor()
             self.root.quit()
             self.root.destroy()
             exit()
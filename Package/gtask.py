@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#-------------------------------------------------------------------------------
+
+'''
+This software has been developed by:
+
+    GI Sistemas Naturales e Historia Forestal (formerly known as GI Genetica, Fisiologia e Historia Forestal)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+
+#-------------------------------------------------------------------------------
+
+'''
+This source contains the background task executor used by the graphical user interface
+of the NGScloud2 software package to run remote fetches without blocking the Tk event
+loop.
+'''
+
+#-------------------------------------------------------------------------------
+
+import concurrent.futures
+import queue
+import sys
+import threading
+import tkinter
+import tkinter.messagebox
+
+import xlib
+
+#-------------------------------------------------------------------------------
+
+# global executor of background tasks and its lock
+task_executor = None
+task_executor_lock = threading.Lock()
+
+#-------------------------------------------------------------------------------
+
+class Task():
+    '''
+    Task running a function in a worker thread. A function submitted with "with_task" receives
+    the task in the keyword argument "task" so that it can report progress and check whether it
+    has been cancelled. The callbacks are always run in the Tk main thread.
+    '''
+
+    #---------------
+
+    def __init__(self, executor, on_done=None, on_error=None, on_progress=None):
+        '''
+        Execute actions correspending to the creation of a "Task" instance.
+        '''
+
+        # save initial parameters in instance variables
+        self.executor = executor
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+
+        # initialize the future and the cancellation event
+        self.future = None
+        self.cancel_event = threading.Event()
+
+    #---------------
+
+    def cancel(self):
+        '''
+        Cancel the task: it is not started if it is still queued and its callbacks are not run.
+        '''
+
+        self.cancel_event.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    #---------------
+
+    def is_cancelled(self):
+        '''
+        Check if the task has been cancelled.
+        '''
+
+        return self.cancel_event.is_set()
+
+    #---------------
+
+    def is_done(self):
+        '''
+        Check if the function of the task has finished.
+        '''
+
+        return self.future is not None and self.future.done()
+
+    #---------------
+
+    def report_progress(self, *progress):
+        '''
+        Report the progress of the task from the worker thread.
+        '''
+
+        if not self.is_cancelled() and self.on_progress is not None:
+            self.executor.event_queue.put((self, 'progress', progress))
+
+    #---------------
+
+    def deliver(self, event, value):
+        '''
+        Run the callback corresponding to an event of the task in the Tk main thread.
+        '''
+
+        # skip the events of a cancelled task
+        if self.is_cancelled():
+            return
+
+        # run the callback
+        if event == 'progress':
+            self.on_progress(*value)
+        elif event == 'done':
+            if self.on_done is not None:
+                self.on_done(value)
+        elif event == 'error':
+            if self.on_error is not None:
+                self.on_error(value)
+            else:
+                raise value
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+class TaskExecutor():
+    '''
+    Executor of background tasks integrated with the Tk event loop. The results, errors and
+    progress reported by the worker threads are queued and delivered with "after" while
+    there are pending tasks.
+    '''
+
+    #---------------
+
+    def __init__(self, root, max_workers=None):
+        '''
+        Execute actions correspending to the creation of a "TaskExecutor" instance.
+        '''
+
+        # save initial parameters in instance variables
+        self.root = root
+
+        # create the pool of worker threads
+        self.thread_pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers if max_workers is not None else get_task_worker_number(), thread_name_prefix='task')
+
+        # initialize the event queue, the pending task set and the polling status
+        self.event_queue = queue.Queue()
+        self.pending_task_set = set()
+        self.polling = False
+
+    #---------------
+
+    def submit(self, function, *args, on_done=None, on_error=None, on_progress=None, with_task=False, **kwargs):
+        '''
+        Run a function in a worker thread and return its task. It has to be called from
+        the Tk main thread.
+        '''
+
+        # create the task
+        task = Task(self, on_done=on_done, on_error=on_error, on_progress=on_progress)
+
+        # submit the function to the pool of worker threads
+        if with_task:
+            kwargs['task'] = task
+        task.future = self.thread_pool.submit(self.run, task, function, args, kwargs)
+        self.pending_task_set.add(task)
+
+        # start to poll the events of the tasks
+        if not self.polling:
+            self.polling = True
+            self.root.after(get_task_poll_interval(), self.poll)
+
+        # return the task
+        return task
+
+    #---------------
+
+    def run(self, task, function, args, kwargs):
+        '''
+        Run the function of a task in a worker thread and queue its result or error.
+        '''
+
+        # skip a task cancelled before it starts
+        if task.is_cancelled():
+            self.event_queue.put((task, 'cancelled', None))
+            return
+
+        # run the function and queue the result or the exception
+        try:
+            result = function(*args, **kwargs)
+        except Exception as e:
+            self.event_queue.put((task, 'error', e))
+        else:
+            self.event_queue.put((task, 'done', result))
+
+    #---------------
+
+    def poll(self):
+        '''
+        Deliver the queued events of the tasks in the Tk main thread.
+        '''
+
+        # deliver the queued events
+        while True:
+            try:
+                (task, event, value) = self.event_queue.get_nowait()
+            except queue.Empty:
+                break
+            if event != 'progress':
+                self.pending_task_set.discard(task)
+            try:
+                task.deliver(event, value)
+            except Exception as e:
+                self.root.report_callback_exception(type(e), e, e.__traceback__)
+
+        # forget the tasks cancelled before they were started
+        self.pending_task_set = {task for task in self.pending_task_set if not task.future.cancelled()}
+
+        # poll again while there are pending tasks
+        if self.pending_task_set != set():
+            self.root.after(get_task_poll_interval(), self.poll)
+        else:
+            self.polling = False
+
+    #---------------
+
+    def shutdown(self):
+        '''
+        Cancel the pending tasks and release the worker threads without waiting for the running ones.
+        '''
+
+        for task in list(self.pending_task_set):
+            task.cancel()
+        self.thread_pool.shutdown(wait=False)
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+class TaskGroup():
+    '''
+    Group of the background tasks of a form or dialog. Its window shows busy status while
+    some task is pending, the errors of the tasks are shown in a message box and the
+    pending tasks are cancelled when the window is closed.
+    '''
+
+    #---------------
+
+    def __init__(self, window, title):
+        '''
+        Execute actions correspending to the creation of a "TaskGroup" instance.
+        '''
+
+        # save initial parameters in instance variables
+        self.window = window
+        self.title = title
+
+        # initialize the pending task list, the pending tasks by key and the identification of the
+        # scheduled busy status
+        self.task_list = []
+        self.task_key_dict = {}
+        self.busy_status_id = None
+
+    #---------------
+
+    def submit(self, function, *args, on_done=None, on_progress=None, with_task=False, key=None, **kwargs):
+        '''
+        Run a function in background and return its task. When a key is passed, the pending
+        task with the same key is superseded: it is cancelled and its late result is discarded.
+        '''
+
+        # cancel the pending task with the same key
+        if key is not None and key in self.task_key_dict:
+            previous_task = self.task_key_dict.pop(key)
+            previous_task.cancel()
+            if previous_task in self.task_list:
+                self.task_list.remove(previous_task)
+
+        # submit the function to the executor of background tasks
+        task = get_task_executor(self.window).submit(function, *args, on_done=lambda result: self.deliver(task, on_done, result), on_error=lambda exception: self.fail(task, exception), on_progress=on_progress, with_task=with_task, **kwargs)
+        self.task_list.append(task)
+        if key is not None:
+            self.task_key_dict[key] = task
+
+        # set cursor to show busy status once the running event handler has finished
+        if self.busy_status_id is None:
+            self.busy_status_id = self.window.after_idle(self.show_busy_status)
+
+        # return the task
+        return task
+
+    #---------------
+
+    def show_busy_status(self):
+        '''
+        Set cursor to show busy status while there are pending tasks.
+        '''
+
+        self.busy_status_id = None
+        if self.task_list != []:
+            self.window.config(cursor='watch')
+
+    #---------------
+
+    def deliver(self, task, on_done, result):
+        '''
+        Deliver the result of a task.
+        '''
+
+        self.forget(task)
+        if on_done is not None:
+            on_done(result)
+
+    #---------------
+
+    def fail(self, task, exception):
+        '''
+        Show the error of a task.
+        '''
+
+        self.forget(task)
+        tkinter.messagebox.showerror(self.title, f'*** ERROR: {exception}')
+
+    #---------------
+
+    def forget(self, task):
+        '''
+        Forget a finished task and set cursor to show normal status when there are not pending tasks.
+        '''
+
+        if task in self.task_list:
+            self.task_list.remove(task)
+        for key in [key for key, key_task in self.task_key_dict.items() if key_task is task]:
+            del self.task_key_dict[key]
+        if self.task_list == []:
+            self.window.config(cursor='')
+
+    #---------------
+
+    def cancel(self):
+        '''
+        Cancel the pending tasks.
+        '''
+
+        for task in self.task_list:
+            task.cancel()
+        self.task_list = []
+        self.task_key_dict = {}
+        if self.busy_status_id is not None:
+            self.window.after_cancel(self.busy_status_id)
+            self.busy_status_id = None
+        self.window.config(cursor='')
+
+    #---------------
+
+    def is_busy(self):
+        '''
+        Check if there are pending tasks.
+        '''
+
+        return self.task_list != []
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+def get_task_executor(window):
+    '''
+    Get the executor of background tasks of the graphical user interface.
+    '''
+
+    # global variables
+    global task_executor
+
+    # create the executor the first time
+    with task_executor_lock:
+        if task_executor is None:
+            task_executor = TaskExecutor(window.nametowidget('.'))
+
+    # return the executor
+    return task_executor
+
+#-------------------------------------------------------------------------------
+
+def shutdown_task_executor():
+    '''
+    Shutdown the executor of background tasks of the graphical user interface.
+    '''
+
+    # global variables
+    global task_executor
+
+    # shutdown the executor
+    with task_executor_lock:
+        if task_executor is not None:
+            task_executor.shutdown()
+            task_executor = None
+
+#-------------------------------------------------------------------------------
+
+def get_task_worker_number():
+    '''
+    Get the number of worker threads that run background tasks.
+    '''
+
+    return 4
+
+#-------------------------------------------------------------------------------
+
+def get_task_poll_interval():
+    '''
+    Get the interval (in milliseconds) between two deliveries of the events of the background tasks.
+    '''
+
+    return 50
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    print(f'This source contains the background task executor used by the graphical user interface of the {xlib.get_project_name()} software package.')
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------
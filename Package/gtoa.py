@@ -25,12 +25,9 @@ menu items in gui mode.
 #-------------------------------------------------------------------------------
 
 import gzip
-import matplotlib
 import os
-import pandas
 import PIL.Image
 import PIL.ImageTk
-import plotnine
 import sys
 import threading
 import tkinter
@@ -39,8 +36,10 @@ import tkinter.ttk
 import webbrowser
 
 import gdialogs
+import gtask
 import xec2
 import xlib
+import xmetadata
 import xtoa
 import xreference
 import xresult
@@ -929,13 +928,10 @@ class FormRecreatePipelineConfigFile(tkinter.Frame):
         experiment_id_list = []
 
         # get the experiment identifications
-        command = f'ls {xlib.get_cluster_read_dir()}'
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
+        (OK, _, entry_list) = xmetadata.get_catalog_entry_list(self.wrapper_cluster_name.get(), 'read', passed_connection=True, ssh_client=self.ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
+            for entry in entry_list:
+                experiment_id_list.append(entry['name'])
 
         # check if there are any experimment identifications
         if experiment_id_list == []:
@@ -2508,6 +2504,9 @@ class FormViewStats(tkinter.Frame):
         # assign the text of the "head"
         self.head = f'Statistics - {self.name} data'
 
+        # create the group of background tasks
+        self.task_group = gtask.TaskGroup(self.root, f'{xlib.get_project_name()} - {self.head}')
+
         # initialize the SSH client connection and previous cluster name
         self.ssh_client = None
         self.cluster_name_ant = None
@@ -2648,15 +2647,18 @@ class FormViewStats(tkinter.Frame):
         Populate data in "combobox_pipeline_dataset".
         '''
 
-        # clear the value selected in the combobox
+        # clear the value selected and the values of the combobox
         self.wrapper_pipeline_dataset.set('')
+        self.combobox_pipeline_dataset['values'] = []
 
-        # get the list of the assembly dataset names
-        app_list = [xlib.get_all_applications_selected_code()]
-        (OK, error_list, pipeline_dataset_name_list) = xresult.get_result_dataset_name_list(self.wrapper_cluster_name.get(), self.wrapper_experiment_id.get(), 'uncompressed', app_list, passed_connection=True, ssh_client=self.ssh_client)
+        # load the pipeline dataset names in the combobox when they have been got
+        def load_pipeline_dataset_name_list(result):
+            (OK, error_list, pipeline_dataset_name_list) = result
+            self.combobox_pipeline_dataset['values'] = sorted(pipeline_dataset_name_list)
 
-        # load the assembly dataset names in the combobox
-        self.combobox_pipeline_dataset['values'] = sorted(pipeline_dataset_name_list)
+        # get the list of the assembly dataset names in background
+        app_list = [xlib.get_all_applications_selected_code()]
+        self.task_group.submit(xresult.get_result_dataset_name_list, self.wrapper_cluster_name.get(), self.wrapper_experiment_id.get(), 'uncompressed', app_list, passed_connection=True, ssh_client=self.ssh_client, on_done=load_pipeline_dataset_name_list, key='pipeline_dataset')
 
     #---------------
 
@@ -2672,6 +2674,9 @@ class FormViewStats(tkinter.Frame):
         # check if the cluster name selected is different to the previous cluster name
         if self.wrapper_cluster_name.get() != self.cluster_name_ant:
 
+            # cancel the pending background tasks, which use the SSH client connection
+            self.task_group.cancel()
+
             # close SSH client connection
             if self.cluster_name_ant is not None:
                 xssh.close_ssh_client_connection(self.ssh_client)
@@ -2706,17 +2711,9 @@ class FormViewStats(tkinter.Frame):
         Process the event when an item of "combobox_experiment_id" has been selected
         '''
 
-        # set cursor to show busy status
-        self.root.config(cursor='watch')
-        self.root.update()
-
         # load data in "combobox_pipeline_dataset"
         self.populate_combobox_pipeline_dataset()
 
-        # set cursor to show normal status
-        self.root.config(cursor='')
-        self.root.update()
-
     #---------------
 
     def combobox_pipeline_dataset_selected_item(self, event=None):
@@ -2763,72 +2760,65 @@ class FormViewStats(tkinter.Frame):
             message = 'Some input values are not OK.'
             tkinter.messagebox.showwarning(f'{xlib.get_project_name()} - {self.head}', message)
 
-        # execute the corresponding process
+        # download the statistics file in background and then execute the corresponding process
         if OK:
             if self.stats_code in ['hit_per_hsp', 'seq_per_go', 'seq_per_ec', 'seq_per_interpro', 'seq_per_kegg', 'seq_per_mapman', 'seq_per_metacyc']:
-                self.execute_x_per_y_data()
+                self.download_stats_file(self.execute_x_per_y_data)
             elif self.stats_code == 'dataset':
-                self.execute_dataset_data_frecuency()
+                self.download_stats_file(self.execute_dataset_data_frecuency)
             elif self.stats_code in ['namespace', 'species', 'family', 'phylum']:
-                self.execute_phylogenic_data_frecuency()
+                self.download_stats_file(self.execute_phylogenic_data_frecuency)
             elif self.stats_code in ['interpro', 'mapman', 'ec', 'kegg', 'metacyc']:
-                self.execute_ontologic_data_frecuency()
+                self.download_stats_file(self.execute_ontologic_data_frecuency)
             elif self.stats_code == 'go':
-                self.execute_go_data_frecuency()
-
-        # close the form
-        if OK:
-            self.close()
+                self.download_stats_file(self.execute_go_data_frecuency)
 
     #---------------
 
-    def execute_x_per_y_data(self):
+    def download_stats_file(self, function):
         '''
-        Run TOA process to write x per y data.
+        Download the statistics file from the cluster in background, then run the function
+        that processes it and close the form.
         '''
 
-        # initialize the control variable
-        OK = True
-
         # get the dictionary of TOA configuration
         toa_config_dict = xtoa.get_toa_config_dict()
 
-        # initialize the distribution dictionary
-        distribution_dict = {}
+        # get the statistics file path in the cluster and in the local computer
+        cluster_stats_file = f'{xlib.get_cluster_experiment_result_dir(self.wrapper_experiment_id.get())}/{self.pipeline_dataset_id}/{toa_config_dict["STATS_SUBDIR_NAME"]}/{self.stats_code}-{toa_config_dict["STATS_BASE_NAME"]}.csv'
+        stats_file = f'{xlib.get_temp_dir()}/{os.path.basename(cluster_stats_file)}'
 
-        # create the SSH transport connection
-        (OK, error_list, ssh_transport) = xssh.create_ssh_transport_connection(self.wrapper_cluster_name.get())
-        if not OK:
-            message = ''
-            for error in error_list:
-                message = f'{message}{error}\n'
-            tkinter.messagebox.showwarning(f'{xlib.get_project_name()} - {self.head}', message)
+        # process the statistics file when it has been downloaded
+        def process_stats_file(result):
+            (OK, error_list) = result
+            if not OK:
+                message = ''
+                for error in error_list:
+                    message = f'{message}{error}\n'
+                tkinter.messagebox.showwarning(f'{xlib.get_project_name()} - {self.head}', message)
+                self.check_inputs()
+                return
+            function(stats_file)
+            self.close()
 
-        # create the SFTP client 
-        if OK:
-            sftp_client = xssh.create_sftp_client(ssh_transport)
+        # disable "button_execute" while the statistics file is downloaded
+        self.button_execute['state'] = 'disabled'
 
-        # create the local path
-        if OK:
-            if not os.path.exists(xlib.get_temp_dir()):
-                os.makedirs(xlib.get_temp_dir())
+        # download the statistics file
+        self.task_group.submit(xssh.download_cluster_file, self.wrapper_cluster_name.get(), cluster_stats_file, stats_file, on_done=process_stats_file)
 
-        # get the statistics file path in the cluster
-        cluster_stats_file = f'{xlib.get_cluster_experiment_result_dir(self.wrapper_experiment_id.get())}/{self.pipeline_dataset_id}/{toa_config_dict["STATS_SUBDIR_NAME"]}/{self.stats_code}-{toa_config_dict["STATS_BASE_NAME"]}.csv'
+    #---------------
 
-        # get the statistics file path in the local computer
-        if OK:
-            stats_file = f'{xlib.get_temp_dir()}/{os.path.basename(cluster_stats_file)}'
+    def execute_x_per_y_data(self, stats_file):
+        '''
+        Run TOA process to write x per y data.
+        '''
 
-        # download the log file from the cluster
-        if OK:
-            OK = xssh.get_file(sftp_client, cluster_stats_file, stats_file)
-            if not OK:
-                message = f'The log file {cluster_stats_file} could not be downloaded.'
-                tkinter.messagebox.showwarning(f'{xlib.get_project_name()} - {self.head}', message)
+        # initialize the control variable
+        OK = True
 
-        # close the SSH transport connection
-        xssh.close_ssh_transport_connection(ssh_transport)
+        # initialize the distribution dictionary
+        distribution_dict = {}
 
         # view statistics
         if OK:
@@ -2929,7 +2919,7 @@ class FormViewStats(tkinter.Frame):
 
     #---------------
 
-    def execute_dataset_data_frecuency(self):
+    def execute_dataset_data_frecuency(self, stats_file):
         '''
         Run TOA process to write dataset data frecuency.
         '''
@@ -2937,46 +2927,9 @@ class FormViewStats(tkinter.Frame):
         # initialize the control variable
         OK = True
 
-        # get the dictionary of TOA configuration
-        toa_config_dict = xtoa.get_toa_config_dict()
-
         # initialize the distribution dictionary
         distribution_dict = {}
 
-        # create the SSH transport connection
-        (OK, error_list, ssh_transport) = xssh.create_ssh_transport_connection(self.wrapper_cluster_name.get())
-        if not OK:
-            message = ''
-            for error in error_list:
-                message = f'{message}{error}\n'
-            tkinter.messagebox.showwarning(f'{xlib.get_project_name()} - {self.head}', message)
-
-        # create the SFTP client 
-        if OK:
-            sftp_client = xssh.create_sftp_client(ssh_transport)
-
-        # create the local path
-        if OK:
-            if not os.path.exists(xlib.get_temp_dir()):
-                os.makedirs(xlib.get_temp_dir())
-
-        # get the statistics file path in the cluster
-        cluster_stats_file = f'{xlib.get_cluster_experiment_result_dir(self.wrapper_experiment_id.get())}/{self.pipeline_dataset_id}/{toa_config_dict["STATS_SUBDIR_NAME"]}/{self.stats_code}-{toa_config_dict["STATS_BASE_NAME"]}.csv'
-
-        # get the statistics file path in the local computer
-        if OK:
-            stats_file = f'{xlib.get_temp_dir()}/{os.path.basename(cluster_stats_file)}'
-
-        # download the log file from the cluster
-        if OK:
-            OK = xssh.get_file(sftp_client, cluster_stats_file, stats_file)
-            if not OK:
-                message = f'The log file {cluster_stats_file} could not be downloaded.'
-                tkinter.messagebox.showwarning(f'{xlib.get_project_name()} - {self.head}', message)
-
-        # close the SSH transport connection
-        xssh.close_ssh_transport_connection(ssh_transport)
-
         # view statistics
         if OK:
 
@@ -3059,7 +3012,7 @@ class FormViewStats(tkinter.Frame):
 
     #---------------
 
-    def execute_phylogenic_data_frecuency(self):
+    def execute_phylogenic_data_frecuency(self, stats_file):
         '''
         Run TOA process to write phylogenic data frecuency.
         '''
@@ -3067,46 +3020,9 @@ class FormViewStats(tkinter.Frame):
         # initialize the control variable
         OK = True
 
-        # get the dictionary of TOA configuration
-        toa_config_dict = xtoa.get_toa_config_dict()
-
         # initialize the distribution dictionary
         distribution_dict = {}
 
-        # create the SSH transport connection
-        (OK, error_list, ssh_transport) = xssh.create_ssh_transport_connection(self.wrapper_cluster_name.get())
-        if not OK:
-            message = ''
-            for error in error_list:
-                message = f'{message}{error}\n'
-            tkinter.messagebox.showwarning(f'{xlib.get_project_name()} - {self.head}', message)
-
-        # create the SFTP client 
-        if OK:
-            sftp_client = xssh.create_sftp_client(ssh_transport)
-
-        # create the local path
-        if OK:
-            if not os.path.exists(xlib.get_temp_dir()):
-                os.makedirs(xlib.get_temp_dir())
-
-        # get the statistics file path in the cluster
-        cluster_stats_file = f'{xlib.get_cluster_experiment_result_dir(self.wrapper_experiment_id.get())}/{self.pipeline_dataset_id}/{toa_config_dict["STATS_SUBDIR_NAME"]}/{self.stats_code}-{toa_config_dict["STATS_BASE_NAME"]}.csv'
-
-        # get the statistics file path in the local computer
-        if OK:
-            stats_file = f'{xlib.get_temp_dir()}/{os.path.basename(cluster_stats_file)}'
-
-        # download the log file from the cluster
-        if OK:
-            OK = xssh.get_file(sftp_client, cluster_stats_file, stats_file)
-            if not OK:
-                message = f'The log file {cluster_stats_file} could not be downloaded.'
-                tkinter.messagebox.showwarning(f'{xlib.get_project_name()} - {self.head}', message)
-
-        # close the SSH transport connection
-        xssh.close_ssh_transport_connection(ssh_transport)
-
         # view statistics
         if OK:
 
@@ -3191,7 +3107,7 @@ class FormViewStats(tkinter.Frame):
 
     #---------------
 
-    def execute_ontologic_data_frecuency(self):
+    def execute_ontologic_data_frecuency(self, stats_file):
         '''
         Run TOA process to write ontologic data frecuency.
         '''
@@ -3199,46 +3115,9 @@ class FormViewStats(tkinter.Frame):
         # initialize the control variable
         OK = True
 
-        # get the dictionary of TOA configuration
-        toa_config_dict = xtoa.get_toa_config_dict()
-
         # initialize the distribution dictionary
         distribution_dict = {}
 
-        # create the SSH transport connection
-        (OK, error_list, ssh_transport) = xssh.create_ssh_transport_connection(self.wrapper_cluster_name.get())
-        if not OK:
-            message = ''
-            for error in error_list:
-                message = f'{message}{error}\n'
-            tkinter.messagebox.showwarning(f'{xlib.get_project_name()} - {self.head}', message)
-
-        # create the SFTP client 
-        if OK:
-            sftp_client = xssh.create_sftp_client(ssh_transport)
-
-        # create the local path
-        if OK:
-            if not os.path.exists(xlib.get_temp_dir()):
-                os.makedirs(xlib.get_temp_dir())
-
-        # get the statistics file path in the cluster
-        cluster_stats_file = f'{xlib.get_cluster_experiment_result_dir(self.wrapper_experiment_id.get())}/{self.pipeline_dataset_id}/{toa_config_dict["STATS_SUBDIR_NAME"]}/{self.stats_code}-{toa_config_dict["STATS_BASE_NAME"]}.csv'
-
-        # get the statistics file path in the local computer
-        if OK:
-            stats_file = '{xlib.get_temp_dir()}/{os.path.basename(cluster_stats_file)}'
-
-        # download the log file from the cluster
-        if OK:
-            OK = xssh.get_file(sftp_client, cluster_stats_file, stats_file)
-            if not OK:
-                message = f'The log file {cluster_stats_file} could not be downloaded.'
-                tkinter.messagebox.showwarning(f'{xlib.get_project_name()} - {self.head}', message)
-
-        # close the SSH transport connection
-        xssh.close_ssh_transport_connection(ssh_transport)
-
         # view statistics
         if OK:
 
@@ -3325,7 +3204,7 @@ class FormViewStats(tkinter.Frame):
 
     #---------------
 
-    def execute_go_data_frecuency(self):
+    def execute_go_data_frecuency(self, stats_file):
         '''
         Run TOA process to write Gene Ontology data frecuency.
         '''
@@ -3333,46 +3212,9 @@ class FormViewStats(tkinter.Frame):
         # initialize the control variable
         OK = True
 
-        # get the dictionary of TOA configuration
-        toa_config_dict = xtoa.get_toa_config_dict()
-
         # initialize the distribution dictionary
         distribution_dict = {}
 
-        # create the SSH transport connection
-        (OK, error_list, ssh_transport) = xssh.create_ssh_transport_connection(self.wrapper_cluster_name.get())
-        if not OK:
-            message = ''
-            for error in error_list:
-                message = f'{message}{error}\n'
-            tkinter.messagebox.showwarning(f'{xlib.get_project_name()} - {self.head}', message)
-
-        # create the SFTP client 
-        if OK:
-            sftp_client = xssh.create_sftp_client(ssh_transport)
-
-        # create the local path
-        if OK:
-            if not os.path.exists(xlib.get_temp_dir()):
-                os.makedirs(xlib.get_temp_dir())
-
-        # get the statistics file path in the cluster
-        cluster_stats_file = f'{xlib.get_cluster_experiment_result_dir(self.wrapper_experiment_id.get())}/{self.pipeline_dataset_id}/{toa_config_dict["STATS_SUBDIR_NAME"]}/{self.stats_code}-{toa_config_dict["STATS_BASE_NAME"]}.csv'
-
-        # get the statistics file path in the local computer
-        if OK:
-            stats_file = f'{xlib.get_temp_dir()}/{os.path.basename(cluster_stats_file)}'
-
-        # download the log file from the cluster
-        if OK:
-            OK = xssh.get_file(sftp_client, cluster_stats_file, stats_file)
-            if not OK:
-                message = f'The log file {cluster_stats_file} could not be downloaded.'
-                tkinter.messagebox.showwarning(f'{xlib.get_project_name()} - {self.head}', message)
-
-        # close the SSH transport connection
-        xssh.close_ssh_transport_connection(ssh_transport)
-
         # view statistics
         if OK:
 
@@ -3466,6 +3308,9 @@ class FormViewStats(tkinter.Frame):
         Close "FormViewStats".
         '''
 
+        # cancel the pending background tasks
+        self.task_group.cancel()
+
         # close SSH client connection
         if self.cluster_name_ant is not None:
             xssh.close_ssh_client_connection(self.ssh_client)
@@ -3546,6 +3391,9 @@ class FormPlotStats(tkinter.Frame):
         # assign the text of the "head"
         self.head = f'Statistics - {self.name} plot'
 
+        # create the group of background tasks
+        self.task_group = gtask.TaskGroup(self.root, f'{xlib.get_project_name()} - {self.head}')
+
         # initialize the SSH client connection and previous cluster name
         self.ssh_client = None
         self.cluster_name_ant = None
@@ -3784,18 +3632,18 @@ class FormPlotStats(tkinter.Frame):
         Populate data in "combobox_pipeline_dataset".
         '''
 
-        # clear the value selected in the combobox
+        # clear the value selected and the values of the combobox
         self.wrapper_pipeline_dataset.set('')
+        self.combobox_pipeline_dataset['values'] = []
 
-        # initialize the pipeline dataset name list
-        pipeline_dataset_name_list = []
+        # load the pipeline dataset names in the combobox when they have been got
+        def load_pipeline_dataset_name_list(result):
+            (OK, error_list, pipeline_dataset_name_list) = result
+            self.combobox_pipeline_dataset['values'] = sorted(pipeline_dataset_name_list)
 
-        # get the list of the assembly dataset names
+        # get the list of the assembly dataset names in background
         app_list = [xlib.get_all_applications_selected_code()]
-        (OK, error_list, pipeline_dataset_name_list) = xresult.get_result_dataset_name_list(self.wrapper_cluster_name.get(), self.wrapper_experiment_id.get(), 'uncompressed', app_list, passed_connection=True, ssh_client=self.ssh_client)
-
-        # load the pipeline dataset names in the combobox
-        self.combobox_pipeline_dataset['values'] = sorted(pipeline_dataset_name_list)
+        self.task_group.submit(xresult.get_result_dataset_name_list, self.wrapper_cluster_name.get(), self.wrapper_experiment_id.get(), 'uncompressed', app_list, passed_connection=True, ssh_client=self.ssh_client, on_done=load_pipeline_dataset_name_list, key='pipeline_dataset')
 
     #---------------
 
@@ -3864,6 +3712,9 @@ class FormPlotStats(tkinter.Frame):
         # check if the cluster name selected is different to the previous cluster name
         if self.wrapper_cluster_name.get() != self.cluster_name_ant:
 
+            # cancel the pending background tasks, which use the SSH client connection
+            self.task_group.cancel()
+
             # close SSH client connection
             if self.cluster_name_ant is not None:
                 xssh.close_ssh_client_connection(self.ssh_client)
@@ -3898,17 +3749,9 @@ class FormPlotStats(tkinter.Frame):
         Process the event when an item of "combobox_experiment_id" has been selected
         '''
 
-        # set cursor to show busy status
-        self.root.config(cursor='watch')
-        self.root.update()
-
         # load data in "combobox_pipeline_dataset"
         self.populate_combobox_pipeline_dataset()
 
-        # set cursor to show normal status
-        self.root.config(cursor='')
-        self.root.update()
-
     #---------------
 
     def combobox_pipeline_dataset_selected_item(self, event=None):
@@ -4055,24 +3898,58 @@ class FormPlotStats(tkinter.Frame):
                 if not tkinter.messagebox.askyesno(f'{xlib.get_project_name()} - Plot statistics', message):
                     OK = False
 
-        # execute the corresponding process
+        # download the statistics file in background and then execute the corresponding process
         if OK:
             if self.stats_code in ['hit_per_hsp', 'seq_per_go', 'seq_per_ec', 'seq_per_interpro', 'seq_per_kegg', 'seq_per_mapman', 'seq_per_metacyc']:
-                self.plot_x_per_y()
+                self.download_stats_file(self.plot_x_per_y)
             elif self.stats_code in ['dataset', 'species', 'family', 'phylum', 'go', 'namespace', 'interpro', 'mapman', 'ec', 'kegg', 'metacyc']:
-                self.plot_frecuency_distribution()
+                self.download_stats_file(self.plot_frecuency_distribution)
 
-        # close the form
-        if OK:
+    #---------------
+
+    def download_stats_file(self, function):
+        '''
+        Download the statistics file from the cluster in background, then run the function
+        that processes it and close the form.
+        '''
+
+        # get the dictionary of TOA configuration
+        toa_config_dict = xtoa.get_toa_config_dict()
+
+        # get the statistics file path in the cluster and in the local computer
+        cluster_stats_file = f'{xlib.get_cluster_experiment_result_dir(self.wrapper_experiment_id.get())}/{self.pipeline_dataset_id}/{toa_config_dict["STATS_SUBDIR_NAME"]}/{self.stats_code}-{toa_config_dict["STATS_BASE_NAME"]}.csv'
+        stats_file = f'{xlib.get_temp_dir()}/{os.path.basename(cluster_stats_file)}'
+
+        # process the statistics file when it has been downloaded
+        def process_stats_file(result):
+            (OK, error_list) = result
+            if not OK:
+                message = ''
+                for error in error_list:
+                    message = f'{message}{error}\n'
+                tkinter.messagebox.showwarning(f'{xlib.get_project_name()} - {self.head}', message)
+                self.check_inputs()
+                return
+            function(stats_file)
             self.close()
 
+        # disable "button_execute" while the statistics file is downloaded
+        self.button_execute['state'] = 'disabled'
+
+        # download the statistics file
+        self.task_group.submit(xssh.download_cluster_file, self.wrapper_cluster_name.get(), cluster_stats_file, stats_file, on_done=process_stats_file)
+
     #---------------
 
-    def plot_x_per_y(self):
+    def plot_x_per_y(self, stats_file):
         '''
         Plot x count per y count.
         '''
 
+        # import the plotting libraries (they are only loaded when a plot is requested)
+        import pandas
+        import plotnine
+
         # set cursor to show busy status
         self.root.config(cursor='watch')
         self.root.update()
@@ -4080,46 +3957,9 @@ class FormPlotStats(tkinter.Frame):
         # initialize the control variable
         OK = True
 
-        # get the dictionary of TOA configuration
-        toa_config_dict = xtoa.get_toa_config_dict()
-
         # initialize the distribution dictionary
         distribution_dict = {}
 
-        # create the SSH transport connection
-        (OK, error_list, ssh_transport) = xssh.create_ssh_transport_connection(self.wrapper_cluster_name.get())
-        if not OK:
-            message = ''
-            for error in error_list:
-                message = f'{message}{error}\n'
-            tkinter.messagebox.showwarning(f'{xlib.get_project_name()} - {self.head}', message)
-
-        # create the SFTP client 
-        if OK:
-            sftp_client = xssh.create_sftp_client(ssh_transport)
-
-        # create the local path
-        if OK:
-            if not os.path.exists(xlib.get_temp_dir()):
-                os.makedirs(xlib.get_temp_dir())
-
-        # get the statistics file path in the cluster
-        cluster_stats_file = f'{xlib.get_cluster_experiment_result_dir(self.wrapper_experiment_id.get())}/{self.pipeline_dataset_id}/{toa_config_dict["STATS_SUBDIR_NAME"]}/{self.stats_code}-{toa_config_dict["STATS_BASE_NAME"]}.csv'
-
-        # get the statistics file path in the local computer
-        if OK:
-            stats_file = f'{xlib.get_temp_dir()}/{os.path.basename(cluster_stats_file)}'
-
-        # download the log file from the cluster
-        if OK:
-            OK = xssh.get_file(sftp_client, cluster_stats_file, stats_file)
-            if not OK:
-                message = f'The log file {cluster_stats_file} could not be downloaded.'
-                tkinter.messagebox.showwarning(f'{xlib.get_project_name()} - {self.head}', message)
-
-        # close the SSH transport connection
-        xssh.close_ssh_transport_connection(ssh_transport)
-
         # set the graphics file path
         if OK:
             image_file = f'{self.wrapper_image_dir.get()}/{self.wrapper_image_name.get()}'
@@ -4243,11 +4083,16 @@ class FormPlotStats(tkinter.Frame):
 
     #---------------
 
-    def plot_frecuency_distribution(self):
+    def plot_frecuency_distribution(self, stats_file):
         '''
         Plot a bar plot when x is a interger number and y is a literal.
         '''
 
+        # import the plotting libraries (they are only loaded when a plot is requested)
+        import matplotlib.pyplot
+        import pandas
+        import plotnine
+
         # set cursor to show busy status
         self.root.config(cursor='watch')
         self.root.update()
@@ -4255,43 +4100,6 @@ class FormPlotStats(tkinter.Frame):
         # initialize the control variable
         OK = True
 
-        # get the dictionary of TOA configuration
-        toa_config_dict = xtoa.get_toa_config_dict()
-
-        # create the SSH transport connection
-        (OK, error_list, ssh_transport) = xssh.create_ssh_transport_connection(self.wrapper_cluster_name.get())
-        if not OK:
-            message = ''
-            for error in error_list:
-                message = f'{message}{error}\n'
-            tkinter.messagebox.showwarning(f'{xlib.get_project_name()} - {self.head}', message)
-
-        # create the SFTP client 
-        if OK:
-            sftp_client = xssh.create_sftp_client(ssh_transport)
-
-        # create the local path
-        if OK:
-            if not os.path.exists(xlib.get_temp_dir()):
-                os.makedirs(xlib.get_temp_dir())
-
-        # get the statistics file path in the cluster
-        cluster_stats_file = f'{xlib.get_cluster_experiment_result_dir(self.wrapper_experiment_id.get())}/{self.pipeline_dataset_id}/{toa_config_dict["STATS_SUBDIR_NAME"]}/{self.stats_code}-{toa_config_dict["STATS_BASE_NAME"]}.csv'
-
-        # get the statistics file path in the local computer
-        if OK:
-            stats_file = f'{xlib.get_temp_dir()}/{os.path.basename(cluster_stats_file)}'
-
-        # download the log file from the cluster
-        if OK:
-            OK = xssh.get_file(sftp_client, cluster_stats_file, stats_file)
-            if not OK:
-                message = f'The log file {cluster_stats_file} could not be downloaded.'
-                tkinter.messagebox.showwarning(f'{xlib.get_project_name()} - {self.head}', message)
-
-        # close the SSH transport connection
-        xssh.close_ssh_transport_connection(ssh_transport)
-
         # set the graphics file path
         if OK:
             image_file = f'{self.wrapper_image_dir.get()}/{self.wrapper_image_name.get()}'
@@ -4504,6 +4312,9 @@ class FormPlotStats(tkinter.Frame):
         Close "FormPlotStats".
         '''
 
+        # cancel the pending background tasks
+        self.task_group.cancel()
+
         # close SSH client connection
         if self.cluster_name_ant is not None:
             xssh.close_ssh_client_connection(self.ssh_client)
@@ -167,17 +167,6 @@ def install_miniconda3(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the Miniconda3 installation script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_miniconda3_installation_script())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_miniconda3_installation_script())}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the Miniconda3 installation starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -200,22 +189,11 @@ def install_miniconda3(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the Miniconda3 installation starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_miniconda3_installation_starter())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_miniconda3_installation_starter())}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the Miniconda3 installation
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(get_miniconda3_installation_starter())} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_miniconda3_installation_starter()), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_miniconda3_installation_starter()), log, run_permission_list=[os.path.basename(get_miniconda3_installation_script()), os.path.basename(get_miniconda3_installation_starter())])
 
     # close the SSH transport connection
     if OK:
@@ -689,17 +667,6 @@ def install_anaconda_package_list(app_code, app_name, package_list, cluster_name
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the Anaconda package installation script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_anaconda_package_installation_script())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_anaconda_package_installation_script())}'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the Anaconda package installation starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -722,22 +689,11 @@ def install_anaconda_package_list(app_code, app_name, package_list, cluster_name
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the Anaconda package installation starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_anaconda_package_installation_starter())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_anaconda_package_installation_starter())}'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the Anaconda package installation
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(get_anaconda_package_installation_starter())} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_anaconda_package_installation_starter()), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_anaconda_package_installation_starter()), log, run_permission_list=[os.path.basename(get_anaconda_package_installation_script()), os.path.basename(get_anaconda_package_installation_starter())])
 
     # close the SSH transport connection
     if OK:
@@ -1141,17 +1097,6 @@ def install_r(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the R installation script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_r_installation_script())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_r_installation_script())}'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the R installation starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -1174,22 +1119,11 @@ def install_r(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the R installation starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_r_installation_starter())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_r_installation_starter())}'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the R installation
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(get_r_installation_starter())} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_r_installation_starter()), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_r_installation_starter()), log, run_permission_list=[os.path.basename(get_r_installation_script()), os.path.basename(get_r_installation_starter())])
 
     # close the SSH transport connection
     if OK:
@@ -203,6 +203,7 @@ def create_cluster(template_name, cluster_name, log, function=None, is_menu_call
         else:
             command = '{0} --region={1} start --availability-zone={2} --cluster-template={3} {4}'.format(xlib.get_starcluster(), region_name, zone_name, template_name, cluster_name)
         rc = xlib.run_command(command, log)
+        xec2.invalidate_inventory()
         log.write('\n')
         if rc == 0:
             (master_state_code, master_state_name) = xec2.get_node_state(cluster_name, node_name='master')
@@ -221,8 +222,7 @@ def create_cluster(template_name, cluster_name, log, function=None, is_menu_call
     if OK:
         if cluster_name != xlib.get_volume_creator_name():
             cluster_node_list = xec2.get_cluster_node_list(cluster_name)
-            for node_name in cluster_node_list:
-                OK = xnode.install_node_infrastructure_software(cluster_name, node_name, log)
+            OK = xnode.install_node_list_infrastructure_software(cluster_name, cluster_node_list, log)
 
     # warn that the log window can be closed
     if not isinstance(log, xlib.DevStdOut) and is_menu_call:
@@ -276,11 +276,13 @@ def terminate_cluster(cluster_name, force, log, function=None, is_menu_call=True
         else:
             log.write('Terminating the cluster {0} using StarCluster ...\n'.format(cluster_name))
         log.write('\n')
+        xssh.invalidate_ssh_sessions(cluster_name)
         if not force:
             command = '{0} --region={1} terminate --confirm {2}'.format(xlib.get_starcluster(), region_name, cluster_name)
         else:
             command = '{0} --region={1} terminate --force --confirm {2}'.format(xlib.get_starcluster(), region_name, cluster_name)
         rc = xlib.run_command(command, log)
+        xec2.invalidate_inventory()
         log.write('\n')
         if rc == 0:
             if cluster_name == xlib.get_volume_creator_name():
@@ -787,6 +787,10 @@ def create_ngscloud_config_file(user_id, access_key_id, secret_access_key, email
             error_list.append(f'*** ERROR: The file {ngscloud_config_file} can not be created')
             OK = False
 
+    # update the cache of the NGScloud config file
+    if OK:
+        xlib.update_config_cache(ngscloud_config_file)
+
     # return the control variable and the error list
     return (OK, error_list)
 
@@ -1128,15 +1132,20 @@ def save_ngscloud_config_file(ngscloud_options_dict):
             for k, v in ngscloud_options_dict[section].items():
                 config[section][k] = v
 
-    # write the NGScloud config file
+    # write the NGScloud config file in a temporal file and replace the old one atomically
     try:
-        with open(ngscloud_config_file, mode='w', encoding='iso-8859-1', newline='\n') as file_id:
+        with open(f'{ngscloud_config_file}.tmp', mode='w', encoding='iso-8859-1', newline='\n') as file_id:
             config.write(file_id)
+        os.replace(f'{ngscloud_config_file}.tmp', ngscloud_config_file)
     except Exception as e:
         error_list.append(f'*** EXCEPTION: "{e}".')
         error_list.append(f'*** ERROR: The file {ngscloud_config_file} can not be written')
         OK = False
 
+    # update the cache of the NGScloud config file
+    if OK:
+        xlib.update_config_cache(ngscloud_config_file)
+
     # return the control variable and the error list
     return (OK, error_list)
 
@@ -1166,12 +1175,9 @@ def get_basic_aws_data():
     identification and the secret access key from NGScloud config file.
     '''
 
-    # create class to parse the config file
-    config = configparser.ConfigParser()
-
     # read the NGScloud config file
     ngscloud_config_file = get_ngscloud_config_file()
-    config.read(ngscloud_config_file)
+    config = xlib.get_config(ngscloud_config_file)
 
     # get the connection data from NGScloud config file
     user_id= config.get('aws info', 'aws_user_id', fallback='')
@@ -1188,12 +1194,9 @@ def get_contact_data():
     Get the access the contact e-mail from NGScloud config file.
     '''
 
-    # create class to parse the config file
-    config = configparser.ConfigParser()
-
     # read the NGScloud config file
     ngscloud_config_file = get_ngscloud_config_file()
-    config.read(ngscloud_config_file)
+    config = xlib.get_config(ngscloud_config_file)
 
     # get the contact e-mail data from the NGScloud config file
     email = config.get('contact info', 'email', fallback='')
@@ -1212,12 +1215,9 @@ def get_key_sections_dict():
     # initialize the key sections data dictionary
     key_sections_dict = {}
     
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
     # read the NGScloud config file
     ngscloud_config_file = get_ngscloud_config_file()
-    config.read(ngscloud_config_file)
+    config = xlib.get_config(ngscloud_config_file)
 
     # get the sections list
     sections_list = []
@@ -1248,12 +1248,9 @@ def get_template_dict():
     # initialize the key sections data dictionary
     template_dict = {}
     
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
     # read the NGScloud config file
     ngscloud_config_file = get_ngscloud_config_file()
-    config.read(ngscloud_config_file)
+    config = xlib.get_config(ngscloud_config_file)
 
     # get the sections list
     sections_list = []
@@ -1292,14 +1289,11 @@ def get_template_name_list():
     instance_type_key_list = list(instance_type_dict.keys())
     instance_type_key_list.sort()
     
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
     # get the NGScloud config file
     ngscloud_config_file = get_ngscloud_config_file()
 
     # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    config = xlib.get_config(ngscloud_config_file)
 
     # build the template name list ordered
     for instance_type_key in instance_type_key_list:
@@ -1322,12 +1316,9 @@ def get_volumes_dict():
     # initialize the key sections data dictionary
     volumes_dict = {}
     
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
     # read the NGScloud config file
     ngscloud_config_file = get_ngscloud_config_file()
-    config.read(ngscloud_config_file)
+    config = xlib.get_config(ngscloud_config_file)
 
     # get the sections list
     sections_list = []
@@ -1369,14 +1360,11 @@ def get_current_region_name():
     to the environment.
     '''
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
     # get the NGScloud config file
     ngscloud_config_file = get_ngscloud_config_file()
 
     # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    config = xlib.get_config(ngscloud_config_file)
 
     # get the current region name
     current_region_name = config.get('global', 'current_region', fallback='')
@@ -1392,14 +1380,11 @@ def get_current_zone_name():
     the environment.
     '''
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
     # get the NGScloud config file
     ngscloud_config_file = get_ngscloud_config_file()
 
     # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    config = xlib.get_config(ngscloud_config_file)
 
     # get the current zone name
     current_zone_name = config.get('global', 'current_zone', fallback='')
@@ -1435,14 +1420,11 @@ def get_bioinfo_app_data(bioinfo_app_name):
     config file corresponding to the environment.
     '''
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
     # get the NGScloud config file
     ngscloud_config_file = get_ngscloud_config_file()
 
     # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    config = xlib.get_config(ngscloud_config_file)
 
     # get the data
     bioinfo_app_version = config.get(f'bioinfoapp {bioinfo_app_name}', 'version', fallback='')
@@ -1463,12 +1445,9 @@ def get_r_software_dict():
     # initialize the key sections data dictionary
     r_software_dict = {}
     
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
     # read the NGScloud config file
     ngscloud_config_file = get_ngscloud_config_file()
-    config.read(ngscloud_config_file)
+    config = xlib.get_config(ngscloud_config_file)
 
     # get the sections list
     sections_list = []
@@ -1496,14 +1475,11 @@ def get_r_software_data(r_software_name):
     config file corresponding to the environment.
     '''
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
     # get the NGScloud config file
     ngscloud_config_file = get_ngscloud_config_file()
 
     # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    config = xlib.get_config(ngscloud_config_file)
 
     # get the data
     r_software_version = config.get(f'rsoftware {r_software_name}', 'version', fallback='')
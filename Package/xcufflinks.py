@@ -235,17 +235,6 @@ def run_cufflinks_cuffmerge_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the Cufflinks-Cuffmerge process script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_cufflinks_cuffmerge_process_script())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_cufflinks_cuffmerge_process_script())}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the Cufflinks-Cuffmerge process starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -268,22 +257,11 @@ def run_cufflinks_cuffmerge_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the Cufflinks-Cuffmerge process starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_cufflinks_cuffmerge_process_starter())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_cufflinks_cuffmerge_process_starter())}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the Cufflinks-Cuffmerge process
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(get_cufflinks_cuffmerge_process_starter())} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_cufflinks_cuffmerge_process_starter()), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_cufflinks_cuffmerge_process_starter()), log, run_permission_list=[os.path.basename(get_cufflinks_cuffmerge_process_script()), os.path.basename(get_cufflinks_cuffmerge_process_starter())])
 
     # close the SSH transport connection
     if OK:
@@ -1025,17 +1003,6 @@ def run_cuffquant_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the Cuffquant process script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_cuffquant_process_script())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_cuffquant_process_script())}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the Cuffquant process starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -1058,22 +1025,11 @@ def run_cuffquant_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the Cuffquant process starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_cuffquant_process_starter())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_cuffquant_process_starter())}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the Cuffquant process
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(get_cuffquant_process_starter())} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_cuffquant_process_starter()), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_cuffquant_process_starter()), log, run_permission_list=[os.path.basename(get_cuffquant_process_script()), os.path.basename(get_cuffquant_process_starter())])
 
     # close the SSH transport connection
     if OK:
@@ -1785,17 +1741,6 @@ def run_cuffdiff_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the Cuffdiff process script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_cuffdiff_process_script())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_cuffdiff_process_script())}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the Cuffdiff process starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -1818,22 +1763,11 @@ def run_cuffdiff_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the Cuffdiff process starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_cuffdiff_process_starter())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_cuffdiff_process_starter())}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the Cuffdiff process
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(get_cuffdiff_process_starter())} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_cuffdiff_process_starter()), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_cuffdiff_process_starter()), log, run_permission_list=[os.path.basename(get_cuffdiff_process_script()), os.path.basename(get_cuffdiff_process_starter())])
 
     # close the SSH transport connection
     if OK:
@@ -2575,17 +2509,6 @@ def run_cuffnorm_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the Cuffnorm process script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_cuffnorm_process_script())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_cuffnorm_process_script())}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the Cuffnorm process starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -2608,22 +2531,11 @@ def run_cuffnorm_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the Cuffnorm process starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_cuffnorm_process_starter())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_cuffnorm_process_starter())}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the Cuffnorm process
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(get_cuffnorm_process_starter())} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_cuffnorm_process_starter()), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_cuffnorm_process_starter()), log, run_permission_list=[os.path.basename(get_cuffnorm_process_script()), os.path.basename(get_cuffnorm_process_starter())])
 
     # close the SSH transport connection
     if OK:
@@ -232,17 +232,6 @@ def run_cutadapt_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the cutadapt process script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_cutadapt_process_script())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_cutadapt_process_script())}'
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the cutadapt process starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -265,22 +254,11 @@ def run_cutadapt_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the cutadapt process starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_cutadapt_process_starter())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_cutadapt_process_starter())}'
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the cutadapt process
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(get_cutadapt_process_starter())} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_cutadapt_process_starter()), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_cutadapt_process_starter()), log, run_permission_list=[os.path.basename(get_cutadapt_process_script()), os.path.basename(get_cutadapt_process_starter())])
 
     # close the SSH transport connection
     if OK:
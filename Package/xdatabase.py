@@ -32,6 +32,7 @@ import sys
 import xconfiguration
 import xec2
 import xlib
+import xmetadata
 import xssh
 
 #-------------------------------------------------------------------------------
@@ -58,6 +59,8 @@ def create_database_transfer_config_file(local_dir='./data', selected_file_list=
             file_id.write( '[identification]\n')
             file_id.write( '{0:<50} {1}\n'.format('database_dataset_id = {0}'.format(database_dataset_id), '# database dataset identification'))
             file_id.write( '{0:<50} {1}\n'.format('local_dir = {0}'.format(local_dir), '# local directory of database files'))
+            file_id.write( '{0:<50} {1}\n'.format(f'upload_streams = {xssh.get_upload_stream_number()}', '# number of files uploaded concurrently'))
+            file_id.write( '{0:<50} {1}\n'.format('sync_mode = none', '# none (upload all files), update (upload new and changed files) or mirror (update and remove the other cluster files)'))
             for i in range(len(selected_file_list)):
                 file_id.write( '\n')
                 if i == 0:
@@ -105,16 +108,6 @@ def upload_database_dataset(cluster_name, log, function=None):
         for error in error_list:
             log.write(f'{error}\n')
 
-    # create the SSH transport connection
-    if OK:
-        (OK, error_list, ssh_transport) = xssh.create_ssh_transport_connection(cluster_name)
-        for error in error_list:
-            log.write(f'{error}\n')
-
-    # create the SFTP client 
-    if OK:
-        sftp_client = xssh.create_sftp_client(ssh_transport)
-
     # upload the database dataset
     if OK:
 
@@ -144,7 +137,8 @@ def upload_database_dataset(cluster_name, log, function=None):
             sections_list.append(section)
         sections_list.sort()
 
-        # for each section "file-n"
+        # build the list of local paths and cluster paths of sections "file-n"
+        path_pair_list = []
         for section in sections_list:
 
             # check than the section identification is like file-n 
@@ -156,21 +150,23 @@ def upload_database_dataset(cluster_name, log, function=None):
                 # set the local path and cluster path
                 local_path = '{0}/{1}'.format(local_dir, file_name)
                 cluster_path = '{0}/{1}'.format(cluster_database_dir, file_name)
+                path_pair_list.append((local_path, cluster_path))
 
-                # upload the database file to the cluster
-                log.write(f'{xlib.get_separator()}\n')
-                log.write('The file {0} is being uploaded to {1} ...\n'.format(file_name, cluster_database_dir))
-                (OK, error_list) = xssh.put_file(sftp_client, local_path, cluster_path)
-                if OK:
-                    log.write('The file has been uploaded.\n')
-                else:
-                    for error in error_list:
-                        log.write(f'{error}\n')
-                    break
+        # upload the database files to the cluster
+        if OK:
+            log.write(f'{xlib.get_separator()}\n')
+            log.write('The database files are being uploaded to {0} ...\n'.format(cluster_database_dir))
+            upload_streams = database_transfer_options_dict['identification'].get('upload_streams', xssh.get_upload_stream_number())
+            sync_mode = database_transfer_options_dict['identification'].get('sync_mode', 'none').lower()
+            if sync_mode == 'none':
+                (OK, error_list) = xssh.put_file_list(cluster_name, path_pair_list, log, stream_number=upload_streams)
+            else:
+                (OK, error_list) = xssh.sync_file_list(cluster_name, path_pair_list, log, stream_number=upload_streams, delete=(sync_mode == 'mirror'))
+            if OK:
+                log.write('The files have been uploaded.\n')
 
-    # close the SSH transport connection
-    if OK:
-        xssh.close_ssh_transport_connection(ssh_transport)
+    # refresh the dataset catalog of the cluster in the next query
+    xmetadata.invalidate_dataset_catalog(cluster_name)
 
     # close the SSH client connection
     if OK:
@@ -239,6 +235,18 @@ def check_database_transfer_config_file(strict):
                     error_list.append('*** ERROR: {0} is not a directory or does not exist.'.format(local_dir))
                     OK = False
 
+            # check section "identification" - key "upload_streams" (optional)
+            upload_streams = database_transfer_options_dict.get('identification', {}).get('upload_streams', not_found)
+            if upload_streams != not_found and not xlib.check_int(upload_streams, minimum=1, maximum=16):
+                error_list.append('*** ERROR: the key "upload_streams" has to be an integer number between 1 and 16.')
+                OK = False
+
+            # check section "identification" - key "sync_mode" (optional)
+            sync_mode = database_transfer_options_dict.get('identification', {}).get('sync_mode', not_found)
+            if sync_mode != not_found and sync_mode.lower() not in ['none', 'update', 'mirror']:
+                error_list.append('*** ERROR: the key "sync_mode" has to be none, update or mirror.')
+                OK = False
+
         # check section "file-1"
         if 'file-1' not in sections_list:
             error_list.append('*** ERROR: the section "file-1" is not found.')
@@ -287,34 +295,21 @@ def get_database_dataset_dict(cluster_name, passed_connection=False, ssh_client=
     # initialize the dictionary of the database datasets
     database_dataset_dict = {}
 
-    # create the SSH client connection
-    if not passed_connection:
-        (OK, error_list, ssh_client) = xssh.create_ssh_client_connection(cluster_name)
+    # get the dataset catalog of the cluster
+    (OK, error_list, dataset_catalog) = xmetadata.get_dataset_catalog(cluster_name, passed_connection, ssh_client)
 
     # check the database directory is created
     if OK:
-        command = '[ -d {0} ] && echo RC=0 || echo RC=1'.format(xlib.get_cluster_database_dir())
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
-        if stdout[len(stdout) - 1] != 'RC=0':
+        if 'database' not in dataset_catalog['root_list']:
             error_list.append('*** ERROR: There is not any volume mounted in the database directory.\n')
             error_list.append('You have to link a volume in the mounting point {0} for the cluster {1}.\n'.format(xlib.get_cluster_database_dir(), cluster_name))
             OK = False
 
     # build the dictionary of the database datasets
     if OK:
-        command = 'ls {0}'.format(xlib.get_cluster_database_dir())
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    database_dataset_id = line
-                    database_dataset_name = database_dataset_id
-                    database_dataset_dict[database_dataset_id] = {'database_dataset_id': database_dataset_id, 'database_dataset_name': database_dataset_name}
-
-    # close the SSH client connection
-    if OK and not passed_connection:
-        xssh.close_ssh_client_connection(ssh_client)
+        for database_dataset_id in sorted(dataset_catalog['entry_dict']['database'].keys()):
+            database_dataset_name = database_dataset_id
+            database_dataset_dict[database_dataset_id] = {'database_dataset_id': database_dataset_id, 'database_dataset_name': database_dataset_name}
 
     # return the control variable, error list and dictionary of the database datasets
     return (OK, error_list, database_dataset_dict)
@@ -380,35 +375,21 @@ def get_database_file_name_list(cluster_name, database_dataset_id, file_type, pa
     # initialize the dictionary of the database datasets
     database_file_name_list = []
 
-    # create the SSH client connection
-    if not passed_connection:
-        (OK, error_list, ssh_client) = xssh.create_ssh_client_connection(cluster_name)
+    # get the dataset catalog of the cluster
+    (OK, error_list, dataset_catalog) = xmetadata.get_dataset_catalog(cluster_name, passed_connection, ssh_client)
 
     # check the app directory is created
     if OK:
-        command = '[ -d {0} ] && echo RC=0 || echo RC=1'.format(xlib.get_cluster_database_dir())
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
-        if stdout[len(stdout) - 1] != 'RC=0':
+        if 'database' not in dataset_catalog['root_list']:
             error_list.append('*** ERROR: There is not any volume mounted in the database directory.\n')
             error_list.append('You have to link a volume in the mounting point {0} for the cluster {1}.\n'.format(xlib.get_cluster_database_dir(), cluster_name))
             OK = False
 
     # build the list of the database file name of the database dataset
     if OK:
-        if file_type == 'all':
-            command = 'ls {0}'.format(xlib.get_cluster_database_dataset_dir(database_dataset_id))
-        else:
-            command = 'ls {0}/*{1}'.format(xlib.get_cluster_database_dataset_dir(database_dataset_id), file_type)
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    database_file_name_list.append(os.path.basename(line))
-
-    # close the SSH client connection
-    if OK and not passed_connection:
-        xssh.close_ssh_client_connection(ssh_client)
+        for file_name in sorted(xmetadata.get_child_dict(dataset_catalog, 'database', database_dataset_id).keys()):
+            if file_type == 'all' or file_name.endswith(file_type):
+                database_file_name_list.append(file_name)
 
     # return the control variable, error list and list of the database file names
     return (OK, error_list, database_file_name_list)
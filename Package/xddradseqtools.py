@@ -176,17 +176,6 @@ def install_ddradseqtools(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the ddRADseqTools installation script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_ddradseqtools_installation_script())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_ddradseqtools_installation_script())}'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the ddRADseqTools installation starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -209,22 +198,11 @@ def install_ddradseqtools(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the ddRADseqTools installation starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_ddradseqtools_installation_starter())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_ddradseqtools_installation_starter())}'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the ddRADseqTools installation
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(get_ddradseqtools_installation_starter())} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_ddradseqtools_installation_starter()), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_ddradseqtools_installation_starter()), log, run_permission_list=[os.path.basename(get_ddradseqtools_installation_script()), os.path.basename(get_ddradseqtools_installation_starter())])
 
     # close the SSH client connection
     if OK:
@@ -1445,17 +1423,6 @@ def run_rsitesearch_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the rsitesearch process script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_rsitesearch_process_script())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_rsitesearch_process_script())}'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the rsitesearch process starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -1479,22 +1446,11 @@ def run_rsitesearch_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the rsitesearch process starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_rsitesearch_process_starter())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_rsitesearch_process_starter())}'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the rsitesearch process
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(get_rsitesearch_process_starter())} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_rsitesearch_process_starter()), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_rsitesearch_process_starter()), log, run_permission_list=[os.path.basename(get_rsitesearch_process_script()), os.path.basename(get_rsitesearch_process_starter())])
 
     # close the SSH transport connection
     if OK:
@@ -2128,17 +2084,6 @@ def run_ddradseq_simulation_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the ddRADseq simulation process script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_ddradseq_simulation_process_script())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_ddradseq_simulation_process_script())}'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the ddRADseq simulation process starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -2162,22 +2107,11 @@ def run_ddradseq_simulation_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the ddRADseq simulation process starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_ddradseq_simulation_process_starter())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_ddradseq_simulation_process_starter())}'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the ddRADseq simulation process
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(get_ddradseq_simulation_process_starter())} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_ddradseq_simulation_process_starter()), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_ddradseq_simulation_process_starter()), log, run_permission_list=[os.path.basename(get_ddradseq_simulation_process_script()), os.path.basename(get_ddradseq_simulation_process_starter())])
 
     # close the SSH transport connection
     if OK:
@@ -3446,17 +3380,6 @@ def run_variant_calling_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the Variant calling process script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_variant_calling_process_script())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_variant_calling_process_script())}'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the Variant calling process starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -3480,22 +3403,11 @@ def run_variant_calling_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the Variant calling process starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_variant_calling_process_starter())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_variant_calling_process_starter())}'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the Variant calling process
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(get_variant_calling_process_starter())} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_variant_calling_process_starter()), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_variant_calling_process_starter()), log, run_permission_list=[os.path.basename(get_variant_calling_process_script()), os.path.basename(get_variant_calling_process_starter())])
 
     # close the SSH transport connection
     if OK:
@@ -235,17 +235,6 @@ def run_rsem_eval_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the RSEM-EVAL process script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_rsem_eval_process_script())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_rsem_eval_process_script())}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the RSEM-EVAL process starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -268,22 +257,11 @@ def run_rsem_eval_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the RSEM-EVAL process starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_rsem_eval_process_starter())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_rsem_eval_process_starter())}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the RSEM-EVAL process
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(get_rsem_eval_process_starter())} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_rsem_eval_process_starter()), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_rsem_eval_process_starter()), log, run_permission_list=[os.path.basename(get_rsem_eval_process_script()), os.path.basename(get_rsem_eval_process_starter())])
 
     # close the SSH transport connection
     if OK:
@@ -939,17 +917,6 @@ def run_ref_eval_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the REF-EVAL process script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_ref_eval_process_script())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_ref_eval_process_script())}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the REF-EVAL process starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -972,22 +939,11 @@ def run_ref_eval_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the REF-EVAL process starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_ref_eval_process_starter())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_ref_eval_process_starter())}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the REF-EVAL process
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(get_ref_eval_process_starter())} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_ref_eval_process_starter()), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_ref_eval_process_starter()), log, run_permission_list=[os.path.basename(get_ref_eval_process_script()), os.path.basename(get_ref_eval_process_starter())])
 
     # close the SSH transport connection
     if OK:
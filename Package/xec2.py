@@ -22,10 +22,13 @@ This file contains the functions related to EC2 objetcs used in both console mod
 '''
 #-------------------------------------------------------------------------------
 
-import configparser
+import concurrent.futures
+import json
 import os
 import stat
 import sys
+import threading
+import time
 
 import boto3
 
@@ -34,6 +37,19 @@ import xlib
 
 #-------------------------------------------------------------------------------
 
+# snapshots of the inventory of the instances of the current region by query filters
+inventory_dict = {}
+inventory_lock = threading.RLock()
+
+# data of the discovered regions, zones and AMIs
+discovery = None
+discovery_lock = threading.Lock()
+
+# AWS credentials (access key identification and secret access key) already checked in this session
+checked_aws_credentials_set = set()
+
+#-------------------------------------------------------------------------------
+
 def check_aws_credentials(aws_access_key_id, aws_secret_access_key):
     '''
     Check an AWS access key identification and an AWS secret access key
@@ -59,47 +75,152 @@ def get_available_region_list():
     Get a list of the available region names.
     '''
 
-    # initialize the control variable
-    OK = True
+    # get the region names of the discovery data
+    region_names_list = sorted(get_discovery()['region_dict'].keys())
 
-    # initialize the region names list
-    region_names_list = []
+    # return available region names list
+    return region_names_list
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
+#-------------------------------------------------------------------------------
 
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
+def get_discovery(refresh=False):
+    '''
+    Get the data of the available regions with their zones and the AMIs that
+    are not known in advance. The regions are queried concurrently and the data
+    are cached in a local file during a TTL; the regions whose discovery failed
+    are retried after a short time without discovering the rest again.
+    '''
 
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    global discovery
 
-    # get the AWS access key identification and the AWS secret access key
-    aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
-    aws_secret_access_key = config.get('aws info', 'aws_secret_access_key', fallback='')
+    with discovery_lock:
 
-    # create a low-level service client
-    try: 
-        client = boto3.client('ec2', aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key, region_name='us-east-1')
-    except:
-        OK = False
-    
-    # get the region that are currently avaiable
-    if OK:
-        response = client.describe_regions()
+        # get the NGScloud config file
+        ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
 
-    # add each region name to the region names list
-    if OK:
-        for region in response['Regions']:
-            region_names_list.append(region['RegionName'])
+        # read the NGScloud config file
+        config = xlib.get_config(ngscloud_config_file)
 
-    # sort the region names list
-    if OK:
+        # get the AWS access key identification and the AWS secret access key
+        aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
+        aws_secret_access_key = config.get('aws info', 'aws_secret_access_key', fallback='')
+
+        # read the cache file when the data are not in memory
+        cache_file = xlib.get_aws_discovery_cache_file()
+        if discovery is None and not refresh:
+            try:
+                with open(cache_file, mode='r', encoding='utf-8') as file_id:
+                    discovery = json.load(file_id)
+            except Exception:
+                discovery = None
+
+        # check if the data in memory are valid and get the regions whose discovery failed
+        now = time.time()
+        is_valid = not refresh and discovery is not None and discovery['aws_access_key_id'] == aws_access_key_id and now < discovery['time'] + get_discovery_ttl()
+        failed_region_names_list = sorted([region_name for region_name, region_data in discovery['region_dict'].items() if region_data['zone_names_list'] == []]) if is_valid else []
+
+        # return the data when they are valid and there is not any failed region to retry
+        if is_valid and (now < discovery.get('retry_time', 0) or (discovery['region_dict'] != {} and failed_region_names_list == [])):
+            return discovery
+
+        # when the data are valid, only the failed regions are discovered again
+        if is_valid and discovery['region_dict'] != {}:
+            region_names_list = failed_region_names_list
+            region_dict = dict(discovery['region_dict'])
+            discovery_time = discovery['time']
+
+        # otherwise, get the region names that are currently available
+        else:
+            region_names_list = []
+            region_dict = {}
+            discovery_time = now
+            try:
+                client = boto3.client('ec2', aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key, region_name='us-east-1')
+                response = client.describe_regions()
+                region_names_list = [region['RegionName'] for region in response['Regions']]
+            except Exception:
+                pass
+
+        # discover the data of the regions concurrently
         if region_names_list != []:
-            region_names_list.sort()
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(region_names_list)) as executor:
+                future_dict = {executor.submit(discover_region, aws_access_key_id, aws_secret_access_key, region_name): region_name for region_name in region_names_list}
+                for future in concurrent.futures.as_completed(future_dict):
+                    region_dict[future_dict[future]] = future.result()
 
-    # return available region names list
-    return region_names_list
+        # keep the data of the regions discovered during the TTL; the failed regions (or the region
+        # list when it can not be got) are retried after a short time
+        discovery = {'aws_access_key_id': aws_access_key_id, 'time': discovery_time, 'retry_time': now + get_discovery_retry_interval(), 'region_dict': region_dict}
+
+        # save the data in the cache file
+        if region_dict != {}:
+            try:
+                if not os.path.exists(os.path.dirname(cache_file)):
+                    os.makedirs(os.path.dirname(cache_file))
+                with open(cache_file, mode='w', encoding='utf-8') as file_id:
+                    json.dump(discovery, file_id)
+            except Exception:
+                pass
+
+    # return the data
+    return discovery
+
+#-------------------------------------------------------------------------------
+
+def discover_region(aws_access_key_id, aws_secret_access_key, region_name):
+    '''
+    Get the data of a region: the available zones and the identifications of
+    the AMIs that are not known in advance.
+    '''
+
+    # initialize the region data
+    region_data = {'zone_names_list': [], 'ubuntu_ami_id': get_unknown_ami_id(), 'starcluster_ami_id': get_unknown_ami_id()}
+
+    try:
+
+        # create a low-level service client
+        client = boto3.client('ec2', aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key, region_name=region_name)
+
+        # get the zones that are currently available in the region
+        response = client.describe_availability_zones()
+        region_data['zone_names_list'] = sorted([zone['ZoneName'] for zone in response['AvailabilityZones']])
+
+        # find the Ubuntu AMI when it is not known (the newest image, which has the last patches)
+        if get_known_ubuntu_ami_id(region_name) == get_unknown_ami_id():
+            response = client.describe_images(Owners=[get_ubuntu_ami_owner()], Filters=[{'Name': 'name', 'Values': [f'ubuntu/images/hvm-ssd/{get_ubuntu_ami_name()}*']}])
+            image_list = sorted(response['Images'], key=lambda image: image['CreationDate'], reverse=True)
+            if image_list != []:
+                region_data['ubuntu_ami_id'] = image_list[0]['ImageId']
+
+        # find the StarCluster AMI when it is not known
+        if get_known_starcluster_ami_id(region_name) == get_unknown_ami_id():
+            response = client.describe_images(Filters=[{'Name': 'name', 'Values': [get_starcluster_ami_name()]}, {'Name': 'is-public', 'Values': ['true']}])
+            if response['Images'] != []:
+                region_data['starcluster_ami_id'] = response['Images'][0]['ImageId']
+
+    except Exception:
+        pass
+
+    # return the region data
+    return region_data
+
+#-------------------------------------------------------------------------------
+
+def get_discovery_ttl():
+    '''
+    Get the time (in seconds) that the data of the discovered regions are valid.
+    '''
+
+    return 86400
+
+#-------------------------------------------------------------------------------
+
+def get_discovery_retry_interval():
+    '''
+    Get the time (in seconds) after which the regions whose discovery failed are discovered again.
+    '''
+
+    return 300
 
 #-------------------------------------------------------------------------------
 
@@ -127,44 +248,8 @@ def get_available_zone_list(region_name):
     Get a list of the available zone names of a region
     '''
 
-    # initialize the control variable
-    OK = True
-
-    # initialize the zone names list
-    zone_names_list = []
-
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
-
-    # get the AWS access key identification and the AWS secret access key
-    aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
-    aws_secret_access_key = config.get('aws info', 'aws_secret_access_key', fallback='')
-
-    # create a low-level service client
-    try:
-        client = boto3.client('ec2', aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key, region_name=region_name)
-    except:
-        OK = False
-
-    # get the region that are currently available in the region name
-    if OK:
-        response = client.describe_availability_zones()
-
-    # add each zone name to the zone names list
-    if OK:
-        for zone in response['AvailabilityZones']:
-            zone_names_list.append(zone['ZoneName'])
-
-    # sort the zone names list
-    if OK:
-        if zone_names_list != []:
-            zone_names_list.sort()
+    # get the zone names of the region from the discovery data
+    zone_names_list = get_discovery()['region_dict'].get(region_name, {}).get('zone_names_list', [])
 
     # return available zone names list
     return zone_names_list
@@ -201,14 +286,11 @@ def get_keypair_dict(region_name):
     # initialize the key pairs dictionary
     keypairs_dict = {}
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
     # get the NGScloud config file
     ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
 
     # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    config = xlib.get_config(ngscloud_config_file)
 
     # get the AWS access key identification and the AWS secret access key
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -280,14 +362,11 @@ def create_keypair(keypair_file, keypair_name, region_name):
     OK = True
     error_list = []
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
     # get the NGScloud config file
     ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
 
     # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    config = xlib.get_config(ngscloud_config_file)
 
     # get the AWS access key identification and the AWS secret access key
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -361,14 +440,11 @@ def delete_keypair(keypair_file, keypair_name, region_name):
     OK = True
     error_list = []
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
     # get the NGScloud config file
     ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
 
     # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    config = xlib.get_config(ngscloud_config_file)
 
     # get the AWS access key identification and the AWS secret access key
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -431,14 +507,11 @@ def create_security_group(name):
     # initialize the security group identification
     security_group_id = None
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
     # get the NGScloud config file
     ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
 
     # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    config = xlib.get_config(ngscloud_config_file)
 
     # get the AWS access key identification, the AWS secret access key and the current region name
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -496,14 +569,11 @@ def get_security_group_id(name):
     # initialize the security group identification
     security_group_id = None
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
     # get the NGScloud config file
     ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
 
     # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    config = xlib.get_config(ngscloud_config_file)
 
     # get the AWS access key identification, the AWS secret access key and the current region name
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -542,14 +612,11 @@ def delete_security_group(security_group_id):
     OK = True
     error_list = []
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
     # get the NGScloud config file
     ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
 
     # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    config = xlib.get_config(ngscloud_config_file)
 
     # get the AWS access key identification, the AWS secret access key and the current region name
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -644,14 +711,11 @@ def create_instance(instance_type, instance_name, security_group_id, root_volume
     # initialize the instance identification
     instance_id = None
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
     # get the NGScloud config file
     ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
 
     # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    config = xlib.get_config(ngscloud_config_file)
 
     # get the AWS access key identification, the AWS secret access key and the current region name
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -766,6 +830,9 @@ def create_instance(instance_type, instance_name, security_group_id, root_volume
     if OK:
         instance_id = response['Instances'][0]['InstanceId']
 
+    # invalidate the inventory
+    invalidate_inventory()
+
     # return the control variable and the instance identification
     return (OK, error_list, instance_id)
 
@@ -780,14 +847,11 @@ def terminate_instance(instance_id):
     OK = True
     error_list = []
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
     # get the NGScloud config file
     ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
 
     # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    config = xlib.get_config(ngscloud_config_file)
 
     # get the AWS access key identification, the AWS secret access key and the current region and zone names
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -810,548 +874,605 @@ def terminate_instance(instance_id):
         except:
             OK = False
 
+    # invalidate the inventory
+    invalidate_inventory()
+
     # return the control variable
     return (OK, error_list)
 
 #-------------------------------------------------------------------------------
 
-def get_instance_type(instance_name):
+def wait_instance_state(instance_id, state_code=16, timeout=None):
     '''
-    Get the instance type from the instance name.
+    Wait until an instance reaches a state. The instance is described with an
+    exponential backoff and the waiting finishes as soon as it reaches the
+    state or it reaches other stable state.
     '''
 
-    return instance_name[instance_name.find('-') + 1:]
+    # initialize the control variable and the error list
+    OK = True
+    error_list = []
 
-#-------------------------------------------------------------------------------
+    # initialize the instance state
+    instance_state_code = -1
+    instance_state_name = 'non-existent'
 
-def get_cluster_mode(cluster_name):
-    '''
-    Get the mode of a cluster.
-    '''
+    # set the timeout
+    if timeout is None:
+        timeout = get_instance_wait_timeout()
 
-    # initialize the control variable
-    OK = True
+    # create a low-level service client
+    client = get_ec2_client()
 
-    # initialize of the cluster mode
-    cluster_mode = None
+    # describe the instance until it reaches the state
+    delay = get_wait_initial_delay()
+    end_time = time.monotonic() + timeout
+    while True:
+        try:
+            response = client.describe_instances(InstanceIds=[instance_id])
+            instance_state_code = response['Reservations'][0]['Instances'][0]['State']['Code']
+            instance_state_name = response['Reservations'][0]['Instances'][0]['State']['Name']
+        except Exception as e:
+            # the instance may be not visible yet just after its creation
+            if 'InvalidInstanceID' not in str(e):
+                error_list.append(f'*** ERROR: Boto3 - {e}')
+                OK = False
+                break
+        if instance_state_code == state_code:
+            break
+        if instance_state_code != -1 and instance_state_code not in get_transitional_state_code_list():
+            OK = False
+            break
+        if time.monotonic() + delay > end_time:
+            error_list.append(f'*** ERROR: The instance {instance_id} has not reached the state {state_code} after {timeout} s.')
+            OK = False
+            break
+        time.sleep(delay)
+        delay = min(delay * 2, xlib.get_wait_max_delay())
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
+    # invalidate the inventory
+    invalidate_inventory()
 
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
+    # return the control variable, the error list and the instance state
+    return (OK, error_list, instance_state_code, instance_state_name)
 
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+#-------------------------------------------------------------------------------
 
-    # get the AWS access key identification, the AWS secret access key and the current region name
-    aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
-    aws_secret_access_key = config.get('aws info', 'aws_secret_access_key', fallback='')
-    current_region_name = config.get('global', 'current_region', fallback='')
+def wait_volume_attached(volume_id, node_id, timeout=None):
+    '''
+    Wait until the attachment of a volume to a node is attached. The volume is
+    described with an exponential backoff.
+    '''
 
-    # check the AWS access key identification and the AWS secret access key
-    OK = check_aws_credentials(aws_access_key_id, aws_secret_access_key)
+    # initialize the control variable and the error list
+    OK = True
+    error_list = []
 
-    # create a resource service client
-    if OK:
-        resource = boto3.resource('ec2', aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key, region_name=current_region_name)
+    # set the timeout
+    if timeout is None:
+        timeout = get_volume_wait_timeout()
 
-    # find the clusters that they are running
-    if OK:
+    # create a low-level service client
+    client = get_ec2_client()
+
+    # describe the volume until its attachment is attached
+    delay = get_wait_initial_delay() / 2
+    end_time = time.monotonic() + timeout
+    while True:
         try:
-            for inst in resource.instances.all():
-                # if the instance is not terminated
-                if  inst.state['Code'] != 48:
-                    # if the instance has a security group corresponding to the cluster
-                    if inst.security_groups is not None:
-                        for security_group in inst.security_groups:
-                            if security_group['GroupName'] == f'@sc-{cluster_name}':
-                                # check that the instance is the master or the instance
-                                if inst.tags is not None:
-                                    for tag in inst.tags:
-                                        if tag['Key'] == 'Name' and tag['Value']=='instance':
-                                            cluster_mode = xconfiguration.get_cluster_mode_native()
-                                            raise xlib.BreakAllLoops
-                                        elif tag['Key'] == 'Name' and tag['Value']=='master':
-                                            cluster_mode = xconfiguration.get_cluster_mode_starcluster()
-                                            raise xlib.BreakAllLoops
-        except xlib.BreakAllLoops:
-            pass
+            response = client.describe_volumes(VolumeIds=[volume_id])
+            attachment_state_list = [attachment['State'] for attachment in response['Volumes'][0]['Attachments'] if attachment['InstanceId'] == node_id]
+        except Exception as e:
+            error_list.append(f'*** ERROR: Boto3 - {e}')
+            OK = False
+            break
+        if attachment_state_list == ['attached']:
+            break
+        if time.monotonic() + delay > end_time:
+            error_list.append(f'*** ERROR: The volume {volume_id} is not attached after {timeout} s.')
+            OK = False
+            break
+        time.sleep(delay)
+        delay = min(delay * 2, xlib.get_wait_max_delay())
 
-    # return the cluster mode
-    return cluster_mode
+    # return the control variable and the error list
+    return (OK, error_list)
 
 #-------------------------------------------------------------------------------
 
-def get_running_cluster_list(only_environment_cluster=True, volume_creator_included=False):
+def get_ec2_client():
     '''
-    Get the running cluster list.
+    Get a low-level EC2 service client of the current region.
     '''
 
-    # initialize the control variable
-    OK = True
-
-    # initialize of the running cluster list
-    running_cluster_list = []
-
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
     # get the NGScloud config file
     ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
 
     # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    config = xlib.get_config(ngscloud_config_file)
 
     # get the AWS access key identification, the AWS secret access key and the current region name
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
     aws_secret_access_key = config.get('aws info', 'aws_secret_access_key', fallback='')
     current_region_name = config.get('global', 'current_region', fallback='')
 
-    # check the AWS access key identification and the AWS secret access key   
-    OK = check_aws_credentials(aws_access_key_id, aws_secret_access_key)
-
-    # create a resource service client
-    if OK:
-        resource = boto3.resource('ec2', aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key, region_name=current_region_name)
-
-    # find the clusters that they are running
-    if OK:
-        for inst in resource.instances.all():
-            # check that the current instance is running
-            if inst.state['Code'] != 48:
-                # check that the instance is the master node
-                if inst.tags is not None:
-                    for tag in inst.tags:
-                        if tag['Key'] == 'Name' and tag['Value'] in ['master', 'instance']:
-                            # if the instance has a security group created by StarCluster
-                            if inst.security_groups is not None:
-                                for security_group in inst.security_groups:
-                                    if not only_environment_cluster or only_environment_cluster and security_group['GroupName'].startswith(f'@sc-{xconfiguration.environment}-'):
-                                        # add the cluster_name to the running cluster list
-                                        cluster_name = security_group['GroupName'][4:]
-                                        if volume_creator_included or (not volume_creator_included and cluster_name != xlib.get_volume_creator_name()):
-                                            running_cluster_list.append(cluster_name)
-
-    # sort the running cluster list
-    if OK:
-        if running_cluster_list != []:
-            running_cluster_list.sort()
-
-    # return the running cluster list
-    return running_cluster_list
+    # return the low-level service client
+    return boto3.client('ec2', aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key, region_name=current_region_name)
 
 #-------------------------------------------------------------------------------
 
-def get_node_dict():
+def get_wait_initial_delay():
     '''
-    Get a dictionary of node data: node id, node_name, security group name,
-    zone name, state code, state name, security group list, public IP address,
-    public DNS name, launch time and image identification.
+    Get the initial delay (in seconds) between the checks of the waits.
     '''
 
-    # initialize the control variable
-    OK = True
+    return 2
 
-    # initialize the node dictionary
-    node_dict = {}
+#-------------------------------------------------------------------------------
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
+def get_instance_wait_timeout():
+    '''
+    Get the timeout (in seconds) of the wait of an instance state.
+    '''
 
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
+    return 900
 
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+#-------------------------------------------------------------------------------
 
-    # get the AWS access key identification, the AWS secret access key and the current region name
-    aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
-    aws_secret_access_key = config.get('aws info', 'aws_secret_access_key', fallback='')
-    current_region_name = config.get('global', 'current_region', fallback='')
+def get_volume_wait_timeout():
+    '''
+    Get the timeout (in seconds) of the wait of a volume attachment.
+    '''
 
-    # check the AWS access key identification and the AWS secret access key   
-    OK = check_aws_credentials(aws_access_key_id, aws_secret_access_key)
+    return 120
 
-    # create a resource service client
-    if OK:
-        resource = boto3.resource('ec2', aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key, region_name=current_region_name)
+#-------------------------------------------------------------------------------
 
-    # get data of instances running
-    if OK:
-        for inst in resource.instances.all():
-            security_group_name = inst.security_groups[0]['GroupName'] if inst.security_groups != [] else ' '
-            zone_name = inst.placement['AvailabilityZone']
-            try:
-                for tag in inst.tags:
-                    if tag['Key'] == 'Name':
-                        node_name = tag['Value']
-                node_id = inst.instance_id
-                instance_type = inst.instance_type
-                state_code = inst.state['Code']
-                state_name = inst.state['Name']
-                state = f'{state_code} ({state_name})'
-                security_group_list = inst.security_groups
-                public_ip_address = inst.public_ip_address
-                public_dns_name = inst.public_dns_name
-                launch_time = inst.launch_time
-                image_id = inst.image_id
-                node_key = f'{security_group_name}-{zone_name}-{node_name}-{node_id}'
-                node_dict[node_key] = {'security_group_name': security_group_name, 'zone_name': zone_name, 'node_name': node_name, 'node_id': node_id, 'instance_type': instance_type, 'state_code': state_code, 'state_name': state_name, 'state': state, 'security_group_list': security_group_list, 'public_ip_address': public_ip_address, 'public_dns_name': public_dns_name, 'launch_time': launch_time, 'image_id': image_id}
-            except:
-                pass
+def get_instance_type(instance_name):
+    '''
+    Get the instance type from the instance name.
+    '''
 
-    # return the node dictionary
-    return node_dict
+    return instance_name[instance_name.find('-') + 1:]
 
 #-------------------------------------------------------------------------------
 
-def get_node_data_dict(cluster_name, node_name):
+def get_inventory(filter_list=[], refresh=False):
     '''
-    Get the dictionary of node data.
+    Get the inventory of the instances of the current region that match a list
+    of query filters: a snapshot of the node data fetched with only one filtered
+    query and indexed by node identification and by cluster name and node name.
+    Each snapshot is kept during a TTL, which is shorter when any instance is
+    changing its state, and they are invalidated by the operations that change
+    the instances.
     '''
 
-    # initialize the data dictionary
-    data_dict = {}
+    with inventory_lock:
 
-    # get the instance type dictionary
-    node_dict = get_node_dict()
+        # get the current region name
+        current_region_name = get_current_region_name()
 
-    for key in node_dict.keys():
-        if node_dict[key]['security_group_name'] == f'@sc-{cluster_name}' and node_dict[key]['node_name'] == node_name:
-            data_dict = node_dict[key]
-            break
+        # return the snapshot when it is valid
+        inventory_key = f'{current_region_name}:{sorted([(filter["Name"], sorted(filter["Values"])) for filter in filter_list])}'
+        inventory = inventory_dict.get(inventory_key)
+        if not refresh and inventory is not None and time.monotonic() < inventory['expiration_time']:
+            return inventory
 
-    # return the data dictionary
-    return data_dict
+        # get the data of the instances
+        node_list = []
+        for instance in get_ec2_item_list('describe_instances', 'Reservations[].Instances[]', filter_list):
+            node_data = build_node_data(instance)
+            if node_data is not None:
+                node_list.append(node_data)
+
+        # build the snapshot
+        inventory = build_inventory(current_region_name, node_list)
+        inventory_dict[inventory_key] = inventory
+
+    # return the snapshot
+    return inventory
 
 #-------------------------------------------------------------------------------
 
-def get_cluster_node_list(cluster_name):
+def get_ec2_item_list(operation_name, item_expression, filter_list=[]):
     '''
-    Get the node name list of a cluster.
+    Get the items (instances, volumes) of the current region returned by a
+    describe operation of EC2. The items are filtered in the server side and
+    the pages of the response are projected to the item list.
     '''
 
-    # initialize the control variable
-    OK = True
-
-    # initialize of the cluster node list
-    cluster_node_list = []
-
-    # create class to parse the config files
-    config = configparser.ConfigParser()
+    # initialize the item list
+    item_list = []
 
     # get the NGScloud config file
     ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
 
     # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    config = xlib.get_config(ngscloud_config_file)
 
     # get the AWS access key identification, the AWS secret access key and the current region name
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
     aws_secret_access_key = config.get('aws info', 'aws_secret_access_key', fallback='')
     current_region_name = config.get('global', 'current_region', fallback='')
 
-    # check the AWS access key identification and the AWS secret access key   
-    OK = check_aws_credentials(aws_access_key_id, aws_secret_access_key)
-
-    # create a resource service client
-    if OK:
-        resource = boto3.resource('ec2', aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key, region_name=current_region_name)
-
-    # find the node between the running instances
-    if OK:
-        for inst in resource.instances.all():
-            # if the instance is not terminated
-            if  inst.state['Code'] != 48:
-                # check than the current instance belongs to the cluster
-                security_group_found = False
-                if inst.security_groups is not None:
-                    for security_group in inst.security_groups:
-                        if security_group['GroupName'] == f'@sc-{cluster_name}':
-                            security_group_found = True
-                # if verification is OK, add node name to cluster node list
-                if security_group_found:
-                    if inst.tags is not None:
-                        for tag in inst.tags:
-                            if tag['Key'] == 'Name':
-                                cluster_node_list.append(tag['Value'])
-                                break
+    # check the AWS access key identification and the AWS secret access key only once per session
+    OK = True
+    if (aws_access_key_id, aws_secret_access_key) not in checked_aws_credentials_set:
+        OK = check_aws_credentials(aws_access_key_id, aws_secret_access_key)
+        checked_aws_credentials_set.add((aws_access_key_id, aws_secret_access_key))
 
-    # sort the cluster node list
+    # get the items of all pages
     if OK:
-        if cluster_node_list != []:
-            cluster_node_list.sort()
+        client = boto3.client('ec2', aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key, region_name=current_region_name)
+        paginator = client.get_paginator(operation_name)
+        item_list = [item for item in paginator.paginate(Filters=filter_list).search(item_expression) if item is not None]
 
-    # return the cluster node list
-    return cluster_node_list
+    # return the item list
+    return item_list
 
 #-------------------------------------------------------------------------------
 
-def get_node_id(cluster_name, node_name=None):
+def get_current_region_name():
     '''
-    Get the node identification. All instances with the node name corresponding
-    to the cluster_name are analized until one of them is not terminated.
+    Get the current region name from the NGScloud config file.
     '''
 
-    # initialize the control variable
-    OK = True
+    # read the NGScloud config file
+    config = xlib.get_config(xconfiguration.get_ngscloud_config_file())
 
-    # initialize of the node identification
-    node_id = None
+    # return the current region name
+    return config.get('global', 'current_region', fallback='')
 
-    # set the node name when it is None
-    if node_name is None:
-        if get_cluster_mode(cluster_name) == xconfiguration.get_cluster_mode_native():
-            node_name = 'instance'
-        elif get_cluster_mode(cluster_name) == xconfiguration.get_cluster_mode_starcluster():
-            node_name = 'master'
+#-------------------------------------------------------------------------------
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
+def get_cluster_filter_list(cluster_name):
+    '''
+    Get the query filters of the instances not terminated of a cluster.
+    '''
 
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
+    return [{'Name': 'instance.group-name', 'Values': [f'@sc-{cluster_name}']}, {'Name': 'instance-state-code', 'Values': get_not_terminated_state_code_list()}]
 
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+#-------------------------------------------------------------------------------
 
-    # get the AWS access key identification, the AWS secret access key and the current region name
-    aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
-    aws_secret_access_key = config.get('aws info', 'aws_secret_access_key', fallback='')
-    current_region_name = config.get('global', 'current_region', fallback='')
+def get_not_terminated_state_code_list():
+    '''
+    Get the code list of the instance states except terminated: pending,
+    running, shutting-down, stopping and stopped.
+    '''
 
-    # check the AWS access key identification and the AWS secret access key   
-    OK = check_aws_credentials(aws_access_key_id, aws_secret_access_key)
+    return ['0', '16', '32', '64', '80']
 
-    # create a resource service client
-    if OK:
-        resource = boto3.resource('ec2', aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key, region_name=current_region_name)
+#-------------------------------------------------------------------------------
 
-    # find the node between the running instances
-    if OK:
-        for inst in resource.instances.all():
-            # if the instance is not terminated
-            if  inst.state['Code'] != 48:
-                # check than the current instance belongs to the cluster
-                security_group_found = False
-                if inst.security_groups is not None:
-                    for security_group in inst.security_groups:
-                        if security_group['GroupName'] == f'@sc-{cluster_name}':
-                            security_group_found = True
-                # check that the current instance has the node name
-                node_name_found = False
-                if inst.tags is not None:
-                    for tag in inst.tags:
-                        if tag['Key'] == 'Name' and tag['Value'] == node_name:
-                            node_name_found = True
-                # if verifications are OK, get the node identification
-                if security_group_found and node_name_found:
-                    node_id = inst.instance_id
-                    break
+def build_node_data(instance):
+    '''
+    Build the data of a node from the description of an instance. None is
+    returned when the instance has no name.
+    '''
 
-    # return the node identification
-    return node_id
+    # get the node name
+    node_name = None
+    for tag in instance.get('Tags', []):
+        if tag['Key'] == 'Name':
+            node_name = tag['Value']
+    if node_name is None:
+        return None
+
+    # get the node data
+    security_group_list = instance.get('SecurityGroups', [])
+    state_code = instance['State']['Code']
+    state_name = instance['State']['Name']
+    node_data = {
+        'security_group_name': security_group_list[0]['GroupName'] if security_group_list != [] else ' ',
+        'zone_name': instance['Placement']['AvailabilityZone'],
+        'node_name': node_name,
+        'node_id': instance['InstanceId'],
+        'instance_type': instance['InstanceType'],
+        'state_code': state_code,
+        'state_name': state_name,
+        'state': f'{state_code} ({state_name})',
+        'security_group_list': security_group_list,
+        'public_ip_address': instance.get('PublicIpAddress'),
+        'public_dns_name': instance.get('PublicDnsName', ''),
+        'launch_time': instance['LaunchTime'],
+        'image_id': instance['ImageId']
+        }
+
+    # return the node data
+    return node_data
 
 #-------------------------------------------------------------------------------
 
-def get_node_state(cluster_name, node_name=None):
+def build_inventory(region_name, node_list):
     '''
-    Get the state of a node. All instances with the node name corresponding
-    to the cluster name are analized until one of them is not terminated.
+    Build a snapshot of the inventory with the indexes of a node data list.
     '''
 
-    # initialize the control variable
-    OK = True
+    # index the nodes by node identification and by cluster name and node name
+    node_id_dict = {}
+    cluster_dict = {}
+    for node_data in node_list:
+        node_id_dict[node_data['node_id']] = node_data
+        for security_group in node_data['security_group_list']:
+            if security_group['GroupName'].startswith('@sc-'):
+                cluster_dict.setdefault(security_group['GroupName'][4:], {}).setdefault(node_data['node_name'], []).append(node_data)
 
-    # initialize of the node state
-    node_state_code = -1
-    node_state_name = 'non-existent'
+    # set the expiration time
+    if any([node_data['state_code'] in get_transitional_state_code_list() for node_data in node_list]):
+        expiration_time = time.monotonic() + get_inventory_transition_ttl()
+    else:
+        expiration_time = time.monotonic() + get_inventory_ttl()
 
-    # set the node name when it is None
-    if node_name is None:
-        if get_cluster_mode(cluster_name) == xconfiguration.get_cluster_mode_native():
-            node_name = 'instance'
-        elif get_cluster_mode(cluster_name) == xconfiguration.get_cluster_mode_starcluster():
-            node_name = 'master'
+    # return the snapshot
+    return {'region_name': region_name, 'expiration_time': expiration_time, 'node_list': node_list, 'node_id_dict': node_id_dict, 'cluster_dict': cluster_dict}
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
+#-------------------------------------------------------------------------------
 
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
+def invalidate_inventory():
+    '''
+    Invalidate the snapshots of the inventory. It has to be called after any
+    operation that changes the instances.
+    '''
 
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    with inventory_lock:
+        inventory_dict.clear()
 
-    # get the AWS access key identification, the AWS secret access key and the current region name
-    aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
-    aws_secret_access_key = config.get('aws info', 'aws_secret_access_key', fallback='')
-    current_region_name = config.get('global', 'current_region', fallback='')
+#-------------------------------------------------------------------------------
 
-    # check the AWS access key identification and the AWS secret access key   
-    OK = check_aws_credentials(aws_access_key_id, aws_secret_access_key)
+def get_inventory_ttl():
+    '''
+    Get the time (in seconds) that a snapshot of the inventory is valid.
+    '''
 
-    # create a resource service client
-    if OK:
-        resource = boto3.resource('ec2', aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key, region_name=current_region_name)
+    return 30
 
-    # find the node between the running instances
-    if OK:
-        for inst in resource.instances.all():
-            # if the instance is not terminated
-            if  inst.state['Code'] != 48:
-                # check than the current instance belongs to the cluster
-                security_group_found = False
-                if inst.security_groups is not None:
-                    for security_group in inst.security_groups:
-                        if security_group['GroupName'] == f'@sc-{cluster_name}':
-                            security_group_found = True
-                # check that the current instance has the node name
-                node_name_found = False
-                if inst.tags is not None:
-                    for tag in inst.tags:
-                        if tag['Key'] == 'Name' and tag['Value'] == node_name:
-                            node_name_found = True
-                # if verifications are OK, get the node state
-                if security_group_found and node_name_found:
-                    node_state_code = inst.state['Code']
-                    node_state_name = inst.state['Name']
-                    break
+#-------------------------------------------------------------------------------
 
-    # return the node state
-    return (node_state_code, node_state_name)
+def get_inventory_transition_ttl():
+    '''
+    Get the time (in seconds) that a snapshot of the inventory is valid when
+    any instance is changing its state.
+    '''
+
+    return 5
 
 #-------------------------------------------------------------------------------
 
-def get_node_zone_name(cluster_name, node_name=None):
+def get_transitional_state_code_list():
     '''
-    Get the zone name of a node. All instances with the node name corresponding
-    to the cluster name are analized until one of them is not terminated.
+    Get the code list of the transitional instance states: pending,
+    shutting-down and stopping.
     '''
 
-    # initialize the control variable
-    OK = True
+    return [0, 32, 64]
 
-    # initialize of the node zone name
-    node_zone_name = ''
+#-------------------------------------------------------------------------------
 
-    # set the node name when it is None
-    if node_name is None:
-        if get_cluster_mode(cluster_name) == xconfiguration.get_cluster_mode_native():
-            node_name = 'instance'
-        elif get_cluster_mode(cluster_name) == xconfiguration.get_cluster_mode_starcluster():
-            node_name = 'master'
+def get_cluster_node_data(cluster_name, node_name):
+    '''
+    Get the data of a node of a cluster from the inventory. All instances with
+    the node name corresponding to the cluster name are analized until one of
+    them is not terminated. None is returned when it is not found.
+    '''
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
+    # find the first node not terminated
+    for node_data in get_inventory(get_cluster_filter_list(cluster_name))['cluster_dict'].get(cluster_name, {}).get(node_name, []):
+        if node_data['state_code'] != 48:
+            return node_data
 
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
+    # return None when the node is not found
+    return None
 
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+#-------------------------------------------------------------------------------
 
-    # get the AWS access key identification, the AWS secret access key and the current region name
-    aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
-    aws_secret_access_key = config.get('aws info', 'aws_secret_access_key', fallback='')
-    current_region_name = config.get('global', 'current_region', fallback='')
+def get_default_node_name(cluster_name):
+    '''
+    Get the node name of the master node of a cluster depending on its mode.
+    '''
 
-    # check the AWS access key identification and the AWS secret access key   
-    OK = check_aws_credentials(aws_access_key_id, aws_secret_access_key)
+    # initialize the node name
+    node_name = None
 
-    # create a resource service client
-    if OK:
-        resource = boto3.resource('ec2', aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key, region_name=current_region_name)
+    # get the node name depending on the cluster mode
+    cluster_mode = get_cluster_mode(cluster_name)
+    if cluster_mode == xconfiguration.get_cluster_mode_native():
+        node_name = 'instance'
+    elif cluster_mode == xconfiguration.get_cluster_mode_starcluster():
+        node_name = 'master'
 
-    # find the node between the running instances
-    if OK:
-        for inst in resource.instances.all():
-            # if the instance is not terminated
-            if  inst.state['Code'] != 48:
-                # check than the current instance belongs to the cluster
-                security_group_found = False
-                if inst.security_groups is not None:
-                    for security_group in inst.security_groups:
-                        if security_group['GroupName'] == ('@sc-'+cluster_name):
-                            security_group_found = True
-                # check that the current instance has the node name
-                node_name_found = False
-                if inst.tags is not None:
-                    for tag in inst.tags:
-                        if tag['Key'] == 'Name' and tag['Value'] == node_name:
-                            node_name_found = True
-                # if verifications are OK, get node zone name
-                if  security_group_found and node_name_found:
-                    node_zone_name = inst.placement['AvailabilityZone']
-                    break
+    # return the node name
+    return node_name
 
-    # return the node zone name
-    return node_zone_name
+#-------------------------------------------------------------------------------
+
+def get_cluster_mode(cluster_name):
+    '''
+    Get the mode of a cluster.
+    '''
+
+    # initialize of the cluster mode
+    cluster_mode = None
+
+    # find a node not terminated that is the master or the instance
+    for node_name, node_data_list in get_inventory(get_cluster_filter_list(cluster_name))['cluster_dict'].get(cluster_name, {}).items():
+        if any([node_data['state_code'] != 48 for node_data in node_data_list]):
+            if node_name == 'instance':
+                cluster_mode = xconfiguration.get_cluster_mode_native()
+                break
+            elif node_name == 'master':
+                cluster_mode = xconfiguration.get_cluster_mode_starcluster()
+                break
+
+    # return the cluster mode
+    return cluster_mode
 
 #-------------------------------------------------------------------------------
 
-def get_node_public_dns_name(cluster_name, node_name=None):
+def get_running_cluster_list(only_environment_cluster=True, volume_creator_included=False):
     '''
-    Get the public DNS name of a node. All instances with the node name corresponding
+    Get the running cluster list.
+    '''
+
+    # initialize of the running cluster list
+    running_cluster_list = []
+
+    # set the query filters of the master nodes not terminated
+    filter_list = [{'Name': 'tag:Name', 'Values': ['master', 'instance']}, {'Name': 'instance-state-code', 'Values': get_not_terminated_state_code_list()}]
+    if only_environment_cluster:
+        filter_list.append({'Name': 'instance.group-name', 'Values': [f'@sc-{xconfiguration.environment}-*']})
+
+    # find the clusters that they are running
+    for node_data in get_inventory(filter_list)['node_list']:
+        # check that the current instance is running and it is the master node
+        if node_data['state_code'] != 48 and node_data['node_name'] in ['master', 'instance']:
+            # if the instance has a security group created by StarCluster
+            for security_group in node_data['security_group_list']:
+                if not only_environment_cluster or only_environment_cluster and security_group['GroupName'].startswith(f'@sc-{xconfiguration.environment}-'):
+                    # add the cluster_name to the running cluster list
+                    cluster_name = security_group['GroupName'][4:]
+                    if volume_creator_included or (not volume_creator_included and cluster_name != xlib.get_volume_creator_name()):
+                        running_cluster_list.append(cluster_name)
+
+    # sort the running cluster list
+    if running_cluster_list != []:
+        running_cluster_list.sort()
+
+    # return the running cluster list
+    return running_cluster_list
+
+#-------------------------------------------------------------------------------
+
+def get_node_dict():
+    '''
+    Get a dictionary of node data: node id, node_name, security group name,
+    zone name, state code, state name, security group list, public IP address,
+    public DNS name, launch time and image identification.
+    '''
+
+    # initialize the node dictionary
+    node_dict = {}
+
+    # get data of instances
+    for node_data in get_inventory()['node_list']:
+        node_key = f'{node_data["security_group_name"]}-{node_data["zone_name"]}-{node_data["node_name"]}-{node_data["node_id"]}'
+        node_dict[node_key] = node_data
+
+    # return the node dictionary
+    return node_dict
+
+#-------------------------------------------------------------------------------
+
+def get_node_data_dict(cluster_name, node_name):
+    '''
+    Get the dictionary of node data.
+    '''
+
+    # get the node of the cluster with the node name (the inventory of a cluster has not terminated instances)
+    data_dict = get_cluster_node_data(cluster_name, node_name) or {}
+
+    # return the data dictionary
+    return data_dict
+
+#-------------------------------------------------------------------------------
+
+def get_cluster_node_list(cluster_name):
+    '''
+    Get the node name list of a cluster.
+    '''
+
+    # initialize of the cluster node list
+    cluster_node_list = []
+
+    # find the nodes not terminated of the cluster
+    for node_name, node_data_list in get_inventory(get_cluster_filter_list(cluster_name))['cluster_dict'].get(cluster_name, {}).items():
+        for node_data in node_data_list:
+            if node_data['state_code'] != 48:
+                cluster_node_list.append(node_name)
+
+    # sort the cluster node list
+    if cluster_node_list != []:
+        cluster_node_list.sort()
+
+    # return the cluster node list
+    return cluster_node_list
+
+#-------------------------------------------------------------------------------
+
+def get_node_id(cluster_name, node_name=None):
+    '''
+    Get the node identification. All instances with the node name corresponding
     to the cluster_name are analized until one of them is not terminated.
     '''
 
-    # initialize the control variable
-    OK = True
+    # set the node name when it is None
+    if node_name is None:
+        node_name = get_default_node_name(cluster_name)
+
+    # get the node identification
+    node_data = get_cluster_node_data(cluster_name, node_name)
+    node_id = node_data['node_id'] if node_data is not None else None
+
+    # return the node identification
+    return node_id
 
-    # initialize of the public DNS name
-    public_dns_name = ''
+#-------------------------------------------------------------------------------
+
+def get_node_state(cluster_name, node_name=None):
+    '''
+    Get the state of a node. All instances with the node name corresponding
+    to the cluster name are analized until one of them is not terminated.
+    '''
 
     # set the node name when it is None
     if node_name is None:
-        if get_cluster_mode(cluster_name) == xconfiguration.get_cluster_mode_native():
-            node_name = 'instance'
-        elif get_cluster_mode(cluster_name) == xconfiguration.get_cluster_mode_starcluster():
-            node_name = 'master'
+        node_name = get_default_node_name(cluster_name)
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
+    # get the node state
+    node_data = get_cluster_node_data(cluster_name, node_name)
+    if node_data is not None:
+        node_state_code = node_data['state_code']
+        node_state_name = node_data['state_name']
+    else:
+        node_state_code = -1
+        node_state_name = 'non-existent'
 
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
+    # return the node state
+    return (node_state_code, node_state_name)
 
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+#-------------------------------------------------------------------------------
 
-    # get the AWS access key identification, the AWS secret access key and the current region name
-    aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
-    aws_secret_access_key = config.get('aws info', 'aws_secret_access_key', fallback='')
-    current_region_name = config.get('global', 'current_region', fallback='')
+def get_node_zone_name(cluster_name, node_name=None):
+    '''
+    Get the zone name of a node. All instances with the node name corresponding
+    to the cluster name are analized until one of them is not terminated.
+    '''
 
-    # check the AWS access key identification and the AWS secret access key   
-    OK = check_aws_credentials(aws_access_key_id, aws_secret_access_key)
+    # set the node name when it is None
+    if node_name is None:
+        node_name = get_default_node_name(cluster_name)
 
-    # create a resource service client
-    if OK:
-        resource = boto3.resource('ec2', aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key, region_name=current_region_name)
+    # get the node zone name
+    node_data = get_cluster_node_data(cluster_name, node_name)
+    node_zone_name = node_data['zone_name'] if node_data is not None else ''
 
-    # find the node between the running instances
-    if OK:
-        for inst in resource.instances.all():
-            # if the instance is not terminated
-            if  inst.state['Code'] != 48:
-                # check than the current instance belongs to the cluster
-                security_group_found = False
-                if inst.security_groups is not None:
-                    for security_group in inst.security_groups:
-                        if security_group['GroupName'] == ('@sc-'+cluster_name):
-                            security_group_found = True
-                # check that the current instance has the node name
-                node_name_found = False
-                if inst.tags is not None:
-                    for tag in inst.tags:
-                        if tag['Key'] == 'Name' and tag['Value'] == node_name:
-                            node_name_found = True
-                # if verifications are OK and the instance is not terminate, get the public DNS name
-                if security_group_found and node_name_found:
-                    public_dns_name = inst.public_dns_name
-                    break
+    # return the node zone name
+    return node_zone_name
+
+#-------------------------------------------------------------------------------
+
+def get_node_public_dns_name(cluster_name, node_name=None):
+    '''
+    Get the public DNS name of a node. All instances with the node name corresponding
+    to the cluster_name are analized until one of them is not terminated.
+    '''
+
+    # set the node name when it is None
+    if node_name is None:
+        node_name = get_default_node_name(cluster_name)
+
+    # get the public DNS name
+    node_data = get_cluster_node_data(cluster_name, node_name)
+    public_dns_name = node_data['public_dns_name'] if node_data is not None else ''
 
     # return the public DNS name
     return public_dns_name
@@ -1460,14 +1581,11 @@ def create_volume(volume_name, volume_type, volume_size, iops=0):
     # initialize the volume identificacion
     volume_id = None
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
     # get the NGScloud config file
     ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
 
     # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    config = xlib.get_config(ngscloud_config_file)
 
     # get the AWS access key identification, the AWS secret access key and the current region and zone names
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -1521,14 +1639,11 @@ def delete_volume(volume_name):
     # initialize the control variable
     OK = True
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
     # get the NGScloud config file
     ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
 
     # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    config = xlib.get_config(ngscloud_config_file)
 
     # get the AWS access key identification, the AWS secret access key and the current region and zone names
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -1568,97 +1683,66 @@ def get_volume_dict():
     volume size, volume state, attachments and attchments number.
     '''
 
-    # initialize the control variable
-    OK = True
-
     # initialize the node dictionary
     volumes_dict = {}
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
-
-    # get the AWS access key identification, the AWS secret access key and the current region name
-    aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
-    aws_secret_access_key = config.get('aws info', 'aws_secret_access_key', fallback='')
-    current_region_name = config.get('global', 'current_region', fallback='')
-
-    # check the AWS access key identification and the AWS secret access key   
-    OK = check_aws_credentials(aws_access_key_id, aws_secret_access_key)
-
-    # create a resource service client
-    if OK:
-        resource = boto3.resource('ec2', aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key, region_name=current_region_name)
-
     # get data of volumes created
-    if OK:
-        for vol in resource.volumes.all():
-            volume_id = vol.volume_id
-            zone_name = vol.availability_zone
-            if vol.tags is None:
-                volume_name = ' '
-            else:
-                for tag in vol.tags:
-                    if tag['Key'] == 'Name':
-                        volume_name = tag['Value']
-            volume_type = vol.volume_type
-            size = vol.size
-            state = vol.state
-            attachments = vol.attachments
-            attachments_number = len(attachments)
-            volume_key = f'{zone_name}-{volume_name}-{volume_id}'
-            volumes_dict[volume_key] = {'zone_name': zone_name, 'volume_name': volume_name, 'volume_id': volume_id, 'volume_type': volume_type, 'size': size, 'state': state, 'attachments': attachments, 'attachments_number': attachments_number}
+    for volume in get_ec2_item_list('describe_volumes', 'Volumes[]'):
+        volume_id = volume['VolumeId']
+        zone_name = volume['AvailabilityZone']
+        volume_name = get_volume_name(volume) or ' '
+        volume_type = volume['VolumeType']
+        size = volume['Size']
+        state = volume['State']
+        attachments = volume['Attachments']
+        attachments_number = len(attachments)
+        volume_key = f'{zone_name}-{volume_name}-{volume_id}'
+        volumes_dict[volume_key] = {'zone_name': zone_name, 'volume_name': volume_name, 'volume_id': volume_id, 'volume_type': volume_type, 'size': size, 'state': state, 'attachments': attachments, 'attachments_number': attachments_number}
 
     # return the volumes dictionary
     return volumes_dict
 
 #-------------------------------------------------------------------------------
 
-def get_created_volume_dict(zone_name):
+def get_volume_name(volume):
     '''
-    Get the dictionary of volumes created in a zone.
+    Get the name of a volume from its description. None is returned when the
+    volume has no name.
     '''
 
-    # initialize the control variable
-    OK = True
+    # initialize the volume name
+    volume_name = None
 
-    # initialize the volumes dictionary
-    created_volume_dict = {}
+    # get the value of the tag "Name"
+    for tag in volume.get('Tags', []):
+        if tag['Key'] == 'Name':
+            volume_name = tag['Value']
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
+    # return the volume name
+    return volume_name
 
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
+#-------------------------------------------------------------------------------
 
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+def get_named_volume_list(volume_name, zone_name, filter_list=[]):
+    '''
+    Get the descriptions of the volumes with a name in a zone.
+    '''
 
-    # get the AWS access key identification, the AWS secret access key and the current region name
-    aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
-    aws_secret_access_key = config.get('aws info', 'aws_secret_access_key', fallback='')
-    current_region_name = config.get('global', 'current_region', fallback='')
+    return get_ec2_item_list('describe_volumes', 'Volumes[]', [{'Name': 'tag:Name', 'Values': [volume_name]}, {'Name': 'availability-zone', 'Values': [zone_name]}] + filter_list)
 
-    # check the AWS access key identification and the AWS secret access key   
-    OK = check_aws_credentials(aws_access_key_id, aws_secret_access_key)
+#-------------------------------------------------------------------------------
 
-    # create a resource service client
-    if OK:
-        resource = boto3.resource('ec2', aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key, region_name=current_region_name)
+def get_created_volume_dict(zone_name):
+    '''
+    Get the dictionary of volumes created in a zone.
+    '''
+
+    # initialize the volumes dictionary
+    created_volume_dict = {}
 
     # find the volume identification
-    if OK:
-        for vol in resource.volumes.all():
-            if vol.availability_zone==zone_name and vol.tags is not None:
-                for tag in vol.tags:
-                    if tag['Key'] == 'Name':
-                        created_volume_dict[tag['Value']] = {'Id': vol.volume_id}
-                        break
+    for volume in get_ec2_item_list('describe_volumes', 'Volumes[]', [{'Name': 'availability-zone', 'Values': [zone_name]}, {'Name': 'tag-key', 'Values': ['Name']}]):
+        created_volume_dict[get_volume_name(volume)] = {'Id': volume['VolumeId']}
 
     # return the volumes dictionary
     return created_volume_dict
@@ -1670,45 +1754,17 @@ def get_created_volume_name_list(zone_name):
     Get a created volume name list in a zone.
     '''
 
-    # initialize the control variable
-    OK = True
-
     # initialize the available volume names list
     available_volume_names_list = []
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
-
-    # get the AWS access key identification, the AWS secret access key and the current region name
-    aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
-    aws_secret_access_key = config.get('aws info', 'aws_secret_access_key', fallback='')
-    current_region_name = config.get('global', 'current_region', fallback='')
-
-    # check the AWS access key identification and the AWS secret access key   
-    OK = check_aws_credentials(aws_access_key_id, aws_secret_access_key)
-
-    # create a resource service client
-    if OK:
-        resource = boto3.resource('ec2', aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key, region_name=current_region_name)
-
     # find the available volumes
-    if OK:
-        for vol in resource.volumes.all():
-            if vol.tags is not None:
-                for tag in vol.tags:
-                    if tag['Key'] == 'Name':
-                        if tag['Value'] != '' and vol.availability_zone==zone_name:
-                            available_volume_names_list.append(tag['Value'])
+    for volume in get_ec2_item_list('describe_volumes', 'Volumes[]', [{'Name': 'availability-zone', 'Values': [zone_name]}, {'Name': 'tag-key', 'Values': ['Name']}]):
+        volume_name = get_volume_name(volume)
+        if volume_name != '':
+            available_volume_names_list.append(volume_name)
 
     # sort the available volume names list
-    if OK:
-        available_volume_names_list.sort()
+    available_volume_names_list.sort()
 
     # return the available volume names list
     return available_volume_names_list
@@ -1720,50 +1776,21 @@ def get_volume_attached_to_node_dict(cluster_name, node_name):
     Get a dictionary of volumes attached to a node of a cluster.
     '''
 
-    # initialize the control variable
-    OK = True
-
     # initialize the attached volume dictionary
     attached_volume_dict = {}
     
     # get the identification of the node
     node_id = get_node_id(cluster_name, node_name)
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
-
-    # get the AWS access key identification, the AWS secret access key and the current region name
-    aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
-    aws_secret_access_key = config.get('aws info', 'aws_secret_access_key', fallback='')
-    current_region_name = config.get('global', 'current_region', fallback='')
-
-    # check the AWS access key identification and the AWS secret access key   
-    OK = check_aws_credentials(aws_access_key_id, aws_secret_access_key)
-
-    # create a resource service client
-    if OK:
-        resource = boto3.resource('ec2', aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key, region_name=current_region_name)
-
     # build the attached volume dictionary
-    if OK:
-        for vol in resource.volumes.all():
-            if vol.attachments != [] and vol.attachments[0]['InstanceId'] == node_id:
-                volume_id = vol.attachments[0]['VolumeId']
-                if vol.tags is None:
-                    volume_name = ' '
-                else:
-                    for tag in vol.tags:
-                        if tag['Key'] == 'Name':
-                            volume_name = tag['Value']
-                aws_device_file = vol.attachments[0]['Device']
-                volume_type = vol.volume_type
-                size = vol.size
+    if node_id is not None:
+        for volume in get_ec2_item_list('describe_volumes', 'Volumes[]', [{'Name': 'attachment.instance-id', 'Values': [node_id]}]):
+            if volume['Attachments'] != [] and volume['Attachments'][0]['InstanceId'] == node_id:
+                volume_id = volume['Attachments'][0]['VolumeId']
+                volume_name = get_volume_name(volume) or ' '
+                aws_device_file = volume['Attachments'][0]['Device']
+                volume_type = volume['VolumeType']
+                size = volume['Size']
                 attached_volume_dict[volume_id] = {'volume_id': volume_id, 'volume_name': volume_name, 'aws_device_file': aws_device_file, 'volume_type': volume_type, 'size': size}
 
     # return the attached volume dictionary
@@ -1776,45 +1803,17 @@ def get_noattached_volume_name_list(zone_name):
     Get a available volume name list in a zone, not attached to any node.
     '''
 
-    # initialize the control variable
-    OK = True
-
     # initialize the available volume names list
     available_volume_names_list = []
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
-
-    # get the AWS access key identification, the AWS secret access key and the current region name
-    aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
-    aws_secret_access_key = config.get('aws info', 'aws_secret_access_key', fallback='')
-    current_region_name = config.get('global', 'current_region', fallback='')
-
-    # check the AWS access key identification and the AWS secret access key   
-    OK = check_aws_credentials(aws_access_key_id, aws_secret_access_key)
-
-    # create a resource service client
-    if OK:
-        resource = boto3.resource('ec2', aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key, region_name=current_region_name)
-
     # find the available volumes
-    if OK:
-        for vol in resource.volumes.all():
-            if vol.tags is not None:
-                for tag in vol.tags:
-                    if tag['Key'] == 'Name':
-                        if tag['Value'] != '' and vol.availability_zone==zone_name and vol.attachments == []:
-                            available_volume_names_list.append(tag['Value'])
+    for volume in get_ec2_item_list('describe_volumes', 'Volumes[]', [{'Name': 'availability-zone', 'Values': [zone_name]}, {'Name': 'tag-key', 'Values': ['Name']}]):
+        volume_name = get_volume_name(volume)
+        if volume_name != '' and volume['Attachments'] == []:
+            available_volume_names_list.append(volume_name)
 
     # sort the available volume names list
-    if OK:
-        available_volume_names_list.sort()
+    available_volume_names_list.sort()
 
     # return the available volume names list
     return available_volume_names_list
@@ -1826,44 +1825,8 @@ def is_volume_created(volume_name, zone_name):
     Check if a volume is created in a zone.
     '''
 
-    # initialize the control variable
-    OK = True
-
-    # initialize the found variable
-    found = False
-
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
-
-    # get the AWS access key identification, the AWS secret access key and the current region name
-    aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
-    aws_secret_access_key = config.get('aws info', 'aws_secret_access_key', fallback='')
-    current_region_name = config.get('global', 'current_region', fallback='')
-
-    # check the AWS access key identification and the AWS secret access key   
-    OK = check_aws_credentials(aws_access_key_id, aws_secret_access_key)
-
-    # create a resource service client
-    if OK:
-        resource = boto3.resource('ec2', aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key, region_name=current_region_name)
-
     # find the volume
-    if OK:
-        try:
-            for vol in resource.volumes.all():
-                if vol.tags is not None:
-                    for tag in vol.tags:
-                        if tag['Key'] == 'Name' and tag['Value'] == volume_name and vol.availability_zone==zone_name:
-                            found = True
-                            raise xlib.BreakAllLoops
-        except xlib.BreakAllLoops:
-            pass
+    found = get_named_volume_list(volume_name, zone_name) != []
 
     # return the control variable
     return found
@@ -1875,45 +1838,9 @@ def get_volume_id(volume_name, zone_name):
     Get the volume identitation in a zone.
     '''
 
-    # initialize the control variable
-    OK = True
-
-    # initialize volume identification
-    volume_id = ''
-
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
-
-    # get the AWS access key identification, the AWS secret access key and the current region name
-    aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
-    aws_secret_access_key = config.get('aws info', 'aws_secret_access_key', fallback='')
-    current_region_name = config.get('global', 'current_region', fallback='')
-
-    # check the AWS access key identification and the AWS secret access key   
-    OK = check_aws_credentials(aws_access_key_id, aws_secret_access_key)
-
-    # create a resource service client
-    if OK:
-        resource = boto3.resource('ec2', aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key, region_name=current_region_name)
-
     # find the volume identification
-    if OK:
-        try:
-            for vol in resource.volumes.all():
-              if vol.tags is not None:
-                  for tag in vol.tags:
-                        if tag['Key'] == 'Name':
-                            if tag['Value'] == volume_name and vol.availability_zone==zone_name:
-                                volume_id = vol.volume_id
-                                raise xlib.BreakAllLoops
-        except xlib.BreakAllLoops:
-            pass
+    volume_list = get_named_volume_list(volume_name, zone_name)
+    volume_id = volume_list[0]['VolumeId'] if volume_list != [] else ''
 
     # return the volume identification
     return volume_id
@@ -1925,45 +1852,9 @@ def get_volume_state(volume_name, zone_name):
     Get the volume state in a zone.
     '''
 
-    # initialize the control variable
-    OK = True
-
-    # initialize volume state
-    volume_state = ''
-
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
-
-    # get the AWS access key identification, the AWS secret access key and the current region name
-    aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
-    aws_secret_access_key = config.get('aws info', 'aws_secret_access_key', fallback='')
-    current_region_name = config.get('global', 'current_region', fallback='')
-
-    # check the AWS access key identification and the AWS secret access key   
-    OK = check_aws_credentials(aws_access_key_id, aws_secret_access_key)
-
-    # create a resource service client
-    if OK:
-        resource = boto3.resource('ec2', aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key, region_name=current_region_name)
-
     # find the volume state
-    if OK:
-        try:
-            for volume in resource.volumes.all():
-              if volume.tags is not None:
-                  for tag in volume.tags:
-                        if tag['Key'] == 'Name':
-                            if tag['Value'] == volume_name and volume.availability_zone==zone_name:
-                                volume_state = volume.state
-                                raise xlib.BreakAllLoops
-        except xlib.BreakAllLoops:
-            pass
+    volume_list = get_named_volume_list(volume_name, zone_name)
+    volume_state = volume_list[0]['State'] if volume_list != [] else ''
 
     # return the volume state
     return volume_state
@@ -1975,45 +1866,9 @@ def get_volume_attachments(volume_name, zone_name):
     Get the volume attachments in a zone.
     '''
 
-    # initialize the control variable
-    OK = True
-
-    # initialize volume identification
-    volume_attachments = []
-
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
-
-    # get the AWS access key identification, the AWS secret access key and the current region name
-    aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
-    aws_secret_access_key = config.get('aws info', 'aws_secret_access_key', fallback='')
-    current_region_name = config.get('global', 'current_region', fallback='')
-
-    # check the AWS access key identification and the AWS secret access key   
-    OK = check_aws_credentials(aws_access_key_id, aws_secret_access_key)
-
-    # create a resource service client
-    if OK:
-        resource = boto3.resource('ec2', aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key, region_name=current_region_name)
-
-    # find the volume
-    if OK:
-        try:
-            for vol in resource.volumes.all():
-              if vol.tags is not None:
-                  for tag in vol.tags:
-                        if tag['Key'] == 'Name':
-                            if tag['Value'] == volume_name and vol.availability_zone==zone_name:
-                                volume_attachments = vol.attachments
-                                raise xlib.BreakAllLoops
-        except xlib.BreakAllLoops:
-            pass
+    # find the volume attachments
+    volume_list = get_named_volume_list(volume_name, zone_name)
+    volume_attachments = volume_list[0]['Attachments'] if volume_list != [] else []
 
     # return the volume attachments
     return volume_attachments
@@ -2025,57 +1880,20 @@ def get_volume_device_file(cluster_name, node_name, volume_name):
     Get the device file where a volume is attached a cluster node.
     '''
 
-    # initialize the control variable
-    OK = True
-
     # initialize the device file
     aws_device_file = ''
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
-
-    # get the AWS access key identification, the AWS secret access key and the current region name
-    aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
-    aws_secret_access_key = config.get('aws info', 'aws_secret_access_key', fallback='')
-    current_region_name = config.get('global', 'current_region', fallback='')
-
-    # check the AWS access key identification and the AWS secret access key   
-    OK = check_aws_credentials(aws_access_key_id, aws_secret_access_key)
-
-    # create a resource service client
-    if OK:
-        resource = boto3.resource('ec2', aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key, region_name=current_region_name)
-
-    # get node identification
-    if OK:
-        node_id = get_node_id(cluster_name, node_name)
-
-    # get the zone name of the node
-    if OK:
-        node_zone_name = get_node_zone_name(cluster_name, node_name)
+    # get node identification and the zone name of the node
+    node_id = get_node_id(cluster_name, node_name)
+    node_zone_name = get_node_zone_name(cluster_name, node_name)
 
     # find the device file
-    if OK:
-        try:
-            for vol in resource.volumes.all():
-              if vol.tags is not None:
-                  for tag in vol.tags:
-                        if tag['Key'] == 'Name':
-                            if tag['Value'] == volume_name and vol.availability_zone==node_zone_name:
-                                volume_attachments = vol.attachments
-                                if volume_attachments is not None:
-                                    for volume_attachment in volume_attachments:
-                                        if volume_attachment['InstanceId'] == node_id:
-                                            aws_device_file = volume_attachment['Device']
-                                            raise xlib.BreakAllLoops
-        except xlib.BreakAllLoops:
-            pass
+    if node_id is not None:
+        for volume in get_named_volume_list(volume_name, node_zone_name, [{'Name': 'attachment.instance-id', 'Values': [node_id]}]):
+            for volume_attachment in volume['Attachments']:
+                if volume_attachment['InstanceId'] == node_id:
+                    aws_device_file = volume_attachment['Device']
+                    break
 
     # return the device file
     return aws_device_file
@@ -2090,14 +1908,11 @@ def attach_volume(node_id, volume_id, aws_device_file):
     # initialize the control variable
     OK = True
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
     # get the NGScloud config file
     ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
 
     # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    config = xlib.get_config(ngscloud_config_file)
 
     # get the AWS access key identification, the AWS secret access key and the current region name
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -2135,14 +1950,11 @@ def detach_volume(node_id, volume_id, aws_device_file):
     # initialize the control variable
     OK = True
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
     # get the NGScloud config file
     ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
 
     # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    config = xlib.get_config(ngscloud_config_file)
 
     # get the AWS access key identification, the AWS secret access key and the current region name
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -2184,6 +1996,24 @@ def get_ubuntu_ami_name():
 def get_ubuntu_ami_id(region_name):
     '''
     Get the AMI identification of Ubuntu 18.04 release 20200131 corresponding to a region.
+    When it is not known in advance, it is got from the discovery data.
+    '''
+
+    # get the known Ubuntu AMI identification
+    ubuntu_ami_id = get_known_ubuntu_ami_id(region_name)
+
+    # get the Ubuntu AMI identification from the discovery data when it is not known
+    if ubuntu_ami_id == get_unknown_ami_id():
+        ubuntu_ami_id = get_discovery()['region_dict'].get(region_name, {}).get('ubuntu_ami_id', get_unknown_ami_id())
+
+    # return the Ubuntu AMI identification
+    return ubuntu_ami_id
+
+#-------------------------------------------------------------------------------
+
+def get_known_ubuntu_ami_id(region_name):
+    '''
+    Get the known AMI identification of Ubuntu 18.04 release 20200131 corresponding to a region.
     '''
 
     # build the Ubuntu AMI dictionary
@@ -2218,6 +2048,15 @@ def get_ubuntu_ami_id(region_name):
 
 #-------------------------------------------------------------------------------
 
+def get_ubuntu_ami_owner():
+    '''
+    Get the owner identification of the Ubuntu AMIs (Canonical).
+    '''
+
+    return '099720109477'
+
+#-------------------------------------------------------------------------------
+
 def get_starcluster_ami_name():
     '''
     Get the name of the StarCluster AMI.
@@ -2229,7 +2068,25 @@ def get_starcluster_ami_name():
 
 def get_starcluster_ami_id(region_name):
     '''
-    Get the StarCluster AMI identification corresponding to a region.
+    Get the StarCluster AMI identification corresponding to a region. When it is
+    not known in advance, it is got from the discovery data.
+    '''
+
+    # get the known StarCluster AMI identification
+    starcluster_ami_id = get_known_starcluster_ami_id(region_name)
+
+    # get the StarCluster AMI identification from the discovery data when it is not known
+    if starcluster_ami_id == get_unknown_ami_id():
+        starcluster_ami_id = get_discovery()['region_dict'].get(region_name, {}).get('starcluster_ami_id', get_unknown_ami_id())
+
+    # return the starcluster AMI identification
+    return starcluster_ami_id
+
+#-------------------------------------------------------------------------------
+
+def get_known_starcluster_ami_id(region_name):
+    '''
+    Get the known StarCluster AMI identification corresponding to a region.
     '''
 
     # build the StarCluster AMI dictionary
@@ -224,17 +224,6 @@ def run_gzip_process(cluster_name, dataset_type, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the gzip process script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write('Setting on the run permision of {0}/{1} ...\n'.format(current_run_dir, os.path.basename(gzip_process_script)))
-        command = 'chmod u+x {0}/{1}'.format(current_run_dir, os.path.basename(gzip_process_script))
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the gzip process starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -257,22 +246,11 @@ def run_gzip_process(cluster_name, dataset_type, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the gzip process starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write('Setting on the run permision of {0}/{1} ...\n'.format(current_run_dir, os.path.basename(gzip_process_starter)))
-        command = 'chmod u+x {0}/{1}'.format(current_run_dir, os.path.basename(gzip_process_starter))
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the gzip process
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write('Submitting the process script {0}/{1} ...\n'.format(current_run_dir, os.path.basename(gzip_process_starter)))
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(gzip_process_starter), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(gzip_process_starter), log, run_permission_list=[os.path.basename(gzip_process_script), os.path.basename(gzip_process_starter)])
 
     # close the SSH transport connection
     if OK:
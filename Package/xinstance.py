@@ -23,7 +23,6 @@ both console mode and gui mode.
 '''
 #-------------------------------------------------------------------------------
 
-import configparser
 import os
 import re
 import subprocess
@@ -54,15 +53,6 @@ def create_instance(instance_type, log, root_volume_type, root_volumen_size, pur
     region_name = xconfiguration.get_current_region_name()
     zone_name = xconfiguration.get_current_zone_name()
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
-
     # get the instance type dictionary
     instance_type_data_dict = xconfiguration.get_instance_type_data_dict(instance_type)
 
@@ -124,28 +114,23 @@ def create_instance(instance_type, log, root_volume_type, root_volumen_size, pur
                 for error in error_list:
                     log.write(f'{error}\n')
         else:
-            while True:
-                time.sleep(10)
-                instance_state = xec2.get_node_state(cluster_name, node_name)
-                instance_state_code = instance_state[0]
-                instance_state_name = instance_state[1]
-                # state 0 (pending)
-                if instance_state_code == 0:
-                    pass
-                # state 16 (running)
-                elif instance_state_code == 16:
-                    time.sleep(60)
+            # wait for the state 16 (running)
+            (OK, error_list, instance_state_code, instance_state_name) = xec2.wait_instance_state(instance_id, state_code=16)
+            for error in error_list:
+                log.write(f'{error}\n')
+            # state 32 (shutting-down) or 48 (terminated) or 64 (stopping) or 80 (stopped)
+            if not OK and instance_state_code in [32, 48, 64, 80]:
+                log.write(f'*** ERROR: The instance has status {instance_state_code} ({instance_state_name}).\n')
+            elif not OK and instance_state_code not in [-1, 0]:
+                log.write(f'*** ERROR: The instance status {instance_state_code} ({instance_state_name}) is not controled.\n')
+            # wait for the SSH server to accept connections
+            if OK:
+                (OK, error_list) = xssh.wait_ssh_ready(cluster_name, user='ubuntu')
+                if OK:
                     log.write(f'The instance {instance_id} is created.\n')
-                    break
-                # state 32 (shutting-down) or 48 (terminated) or 64 (stopping) or 80 (stopped)
-                elif instance_state_code in [32, 48, 64, 80]:
-                    log.write(f'*** ERROR: The instance has status {instance_state_code} ({instance_state_name}).\n')
-                    OK = False
-                    break
                 else:
-                    log.write(f'*** ERROR: The instance status {instance_state_code} ({instance_state_name}) is not controled.\n')
-                    OK = False
-                    break
+                    for error in error_list:
+                        log.write(f'{error}\n')
 
     # create the SSH client connection
     if OK:
@@ -231,9 +216,12 @@ def create_instance(instance_type, log, root_volume_type, root_volumen_size, pur
             if OK:
                 log.write(f'Attaching the volume in the device {aws_device_file} ({machine_device_file}) ...\n')
                 OK = xec2.attach_volume(instance_id, volume_id, aws_device_file)
+                if OK:
+                    (OK, error_list) = xec2.wait_volume_attached(volume_id, instance_id)
+                    if OK:
+                        OK = xssh.wait_cluster_device(ssh_client, machine_device_file)
                 if OK:
                     log.write('The volume is attached.\n')
-                    time.sleep(10)
                 else:
                     log.write('*** ERROR: The volume is not attached.\n')
             # mount the device
@@ -865,6 +853,7 @@ def terminate_instance(cluster_name, log, function=None, is_menu_call=True):
     log.write(f'{xlib.get_separator()}\n')
     log.write(f'Terminating the instance {instance_id} ...\n')
     if instance_id is not None:
+        xssh.invalidate_ssh_sessions(cluster_name)
         (OK, error_list) = xec2.terminate_instance(instance_id)
         if OK:
             while True:
@@ -987,28 +976,23 @@ def create_volume_creator(log, function=None, is_menu_call=True):
                 for error in error_list:
                     log.write(f'{error}\n')
         else:
-            while True:
-                time.sleep(10)
-                instance_state = xec2.get_node_state(cluster_name, node_name)
-                instance_state_code = instance_state[0]
-                instance_state_name = instance_state[1]
-                # state 0 (pending)
-                if instance_state_code == 0:
-                    pass
-                # state 16 (running)
-                elif instance_state_code == 16:
-                    time.sleep(60)
+            # wait for the state 16 (running)
+            (OK, error_list, instance_state_code, instance_state_name) = xec2.wait_instance_state(instance_id, state_code=16)
+            for error in error_list:
+                log.write(f'{error}\n')
+            # state 32 (shutting-down) or 48 (terminated) or 64 (stopping) or 80 (stopped)
+            if not OK and instance_state_code in [32, 48, 64, 80]:
+                log.write(f'*** ERROR: The volume creator has status {instance_state_code} ({instance_state_name}).\n')
+            elif not OK and instance_state_code not in [-1, 0]:
+                log.write(f'*** ERROR: The volume creator status {instance_state_code} ({instance_state_name}) is not controled.\n')
+            # wait for the SSH server to accept connections
+            if OK:
+                (OK, error_list) = xssh.wait_ssh_ready(cluster_name, user='ubuntu')
+                if OK:
                     log.write(f'The volume creator is created.\n')
-                    break
-                # state 32 (shutting-down) or 48 (terminated) or 64 (stopping) or 80 (stopped)
-                elif instance_state_code in [32, 48, 64, 80]:
-                    log.write(f'*** ERROR: The volume creator has status {instance_state_code} ({instance_state_name}).\n')
-                    OK = False
-                    break
                 else:
-                    log.write(f'*** ERROR: The volume creator status {instance_state_code} ({instance_state_name}) is not controled.\n')
-                    OK = False
-                    break
+                    for error in error_list:
+                        log.write(f'{error}\n')
 
     # create the SSH client connection
     if OK:
@@ -1095,6 +1079,7 @@ def terminate_volume_creator(log, function=None, is_menu_call=True):
     log.write(f'{xlib.get_separator()}\n')
     log.write(f'Terminating the volume creator {instance_id} ...\n')
     if instance_id is not None:
+        xssh.invalidate_ssh_sessions(cluster_name)
         (OK, error_list) = xec2.terminate_instance(instance_id)
         if OK:
             while True:
@@ -249,17 +249,6 @@ def run_ipyrad_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the ipyrad process script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write('Setting on the run permision of {0}/{1} ...\n'.format(current_run_dir, os.path.basename(get_ipyrad_process_script())))
-        command = 'chmod u+x {0}/{1}'.format(current_run_dir, os.path.basename(get_ipyrad_process_script()))
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the ipyrad process starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -282,22 +271,11 @@ def run_ipyrad_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the ipyrad process starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write('Setting on the run permision of {0}/{1} ...\n'.format(current_run_dir, os.path.basename(get_ipyrad_process_starter())))
-        command = 'chmod u+x {0}/{1}'.format(current_run_dir, os.path.basename(get_ipyrad_process_starter()))
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the ipyrad process
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write('Submitting the process script {0}/{1} ...\n'.format(current_run_dir, os.path.basename(get_ipyrad_process_starter())))
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_ipyrad_process_starter()), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_ipyrad_process_starter()), log, run_permission_list=[os.path.basename(get_ipyrad_process_script()), os.path.basename(get_ipyrad_process_starter())])
 
     # close the SSH transport connection
     if OK:
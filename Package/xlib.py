@@ -24,18 +24,37 @@ software package used in both console mode and gui mode.
 
 #-------------------------------------------------------------------------------
 
+import atexit
 import collections
 import configparser
 import datetime
+import importlib.util
 import os
+import queue
 import re
 import requests
 import subprocess
 import sys
+import threading
+import time
 import tkinter
+import weakref
 
 import xconfiguration
 
+#-------------------------------------------------------------------------------
+
+# parsed configuration files by path: (file signature, config, option dictionary)
+config_cache_dict = {}
+config_cache_lock = threading.RLock()
+
+# application registry and compiled pattern of the dataset identifications
+app_registry = None
+dataset_id_pattern = None
+
+# log writers whose files have not been closed yet
+log_writer_set = weakref.WeakSet()
+
 #-------------------------------------------------------------------------------
     
 def get_project_code():
@@ -153,6 +172,167 @@ def get_all_applications_selected_code():
 
 #-------------------------------------------------------------------------------
 
+def get_app_registry():
+    '''
+    Get the application registry: a dictionary keyed by application code with
+    the name, the kind and the dataset types produced by its runs ("read" and
+    "result" datasets or "log" when the run directory only keeps the process log).
+    '''
+
+    global app_registry
+
+    # build the registry the first time
+    if app_registry is None:
+        registry = {}
+        for (code, name, kind, dataset_type_list) in get_app_registry_data_list():
+            registry[code] = {'code': code, 'name': name, 'kind': kind, 'dataset_type_list': dataset_type_list}
+        app_registry = registry
+
+    # return the application registry
+    return app_registry
+
+#-------------------------------------------------------------------------------
+
+def get_app_registry_data_list():
+    '''
+    Get the data of the applications of the registry: code, name, kind and dataset types.
+    '''
+
+    return [
+        (get_bedtools_code(), get_bedtools_name(), 'bioinfo app', ['log']),
+        (get_blastplus_code(), get_blastplus_name(), 'bioinfo app', ['log']),
+        (get_bcftools_code(), get_bcftools_name(), 'bioinfo app', ['log']),
+        (get_bowtie2_code(), get_bowtie2_name(), 'bioinfo app', ['result']),
+        (get_busco_code(), get_busco_name(), 'bioinfo app', ['result']),
+        (get_cd_hit_code(), get_cd_hit_name(), 'bioinfo app', ['log']),
+        (get_cd_hit_est_code(), get_cd_hit_est_name(), 'bioinfo app', ['result']),
+        (get_cuffdiff_code(), get_cuffdiff_name(), 'bioinfo app', ['result']),
+        (get_cufflinks_code(), get_cufflinks_name(), 'bioinfo app', ['log']),
+        (get_cufflinks_cuffmerge_code(), get_cufflinks_cuffmerge_name(), 'bioinfo app', ['result']),
+        (get_cuffnorm_code(), get_cuffnorm_name(), 'bioinfo app', ['result']),
+        (get_cuffquant_code(), get_cuffquant_name(), 'bioinfo app', ['result']),
+        (get_cutadapt_code(), get_cutadapt_name(), 'bioinfo app', ['read', 'result']),
+        (get_ddradseq_simulation_code(), get_ddradseq_simulation_name(), 'bioinfo app', ['result']),
+        (get_ddradseqtools_code(), get_ddradseqtools_name(), 'bioinfo app', ['log']),
+        (get_detonate_code(), get_detonate_name(), 'bioinfo app', ['log']),
+        (get_diamond_code(), get_diamond_name(), 'bioinfo app', ['log']),
+        (get_emboss_code(), get_emboss_name(), 'bioinfo app', ['log']),
+        (get_entrez_direct_code(), get_entrez_direct_name(), 'bioinfo app', ['log']),
+        (get_express_code(), get_express_name(), 'bioinfo app', ['log']),
+        (get_fastqc_code(), get_fastqc_name(), 'bioinfo app', ['result']),
+        (get_ggtrinity_code(), get_ggtrinity_name(), 'bioinfo app', ['result']),
+        (get_gmap_gsnap_code(), get_gmap_gsnap_name(), 'bioinfo app', ['log']),
+        (get_gmap_code(), get_gmap_name(), 'bioinfo app', ['result']),
+        (get_gsnap_code(), get_gsnap_name(), 'bioinfo app', ['result']),
+        (get_gzip_code(), get_gzip_name(), 'bioinfo app', ['result']),
+        (get_hisat2_code(), get_hisat2_name(), 'bioinfo app', ['result']),
+        (get_htseq_code(), get_htseq_name(), 'bioinfo app', ['log']),
+        (get_htseq_count_code(), get_htseq_count_name(), 'bioinfo app', ['result']),
+        (get_insilico_read_normalization_code(), get_insilico_read_normalization_name(), 'bioinfo app', ['read', 'result']),
+        (get_ipyrad_code(), get_ipyrad_name(), 'bioinfo app', ['result']),
+        (get_kallisto_code(), get_kallisto_name(), 'bioinfo app', ['result']),
+        (get_miniconda3_code(), get_miniconda3_name(), 'bioinfo app', ['log']),
+        (get_ngshelper_code(), get_ngshelper_name(), 'bioinfo app', ['log']),
+        (get_quast_code(), get_quast_name(), 'bioinfo app', ['result']),
+        (get_r_code(), get_r_name(), 'bioinfo app', ['log']),
+        (get_raddesigner_code(), get_raddesigner_name(), 'bioinfo app', ['log']),
+        (get_ref_eval_code(), get_ref_eval_name(), 'bioinfo app', ['result']),
+        (get_rnaquast_code(), get_rnaquast_name(), 'bioinfo app', ['result']),
+        (get_rsem_code(), get_rsem_name(), 'bioinfo app', ['log']),
+        (get_rsem_eval_code(), get_rsem_eval_name(), 'bioinfo app', ['result']),
+        (get_rsitesearch_code(), get_rsitesearch_name(), 'bioinfo app', ['result']),
+        (get_samtools_code(), get_samtools_name(), 'bioinfo app', ['log']),
+        (get_soapdenovo2_code(), get_soapdenovo2_name(), 'bioinfo app', ['result']),
+        (get_soapdenovotrans_code(), get_soapdenovotrans_name(), 'bioinfo app', ['result']),
+        (get_star_code(), get_star_name(), 'bioinfo app', ['result']),
+        (get_starcode_code(), get_starcode_name(), 'bioinfo app', ['result']),
+        (get_toa_code(), get_toa_name(), 'bioinfo app', ['log']),
+        (get_toa_process_download_basic_data_code(), get_toa_process_download_basic_data_name(), 'toa process', ['log']),
+        (get_toa_process_download_dicots_04_code(), get_toa_process_download_dicots_04_name(), 'toa process', ['log']),
+        (get_toa_process_download_gene_code(), get_toa_process_download_gene_name(), 'toa process', ['log']),
+        (get_toa_process_download_go_code(), get_toa_process_download_go_name(), 'toa process', ['log']),
+        (get_toa_process_download_gymno_01_code(), get_toa_process_download_gymno_01_name(), 'toa process', ['log']),
+        (get_toa_process_download_interpro_code(), get_toa_process_download_interpro_name(), 'toa process', ['log']),
+        (get_toa_process_download_monocots_04_code(), get_toa_process_download_monocots_04_name(), 'toa process', ['log']),
+        (get_toa_process_download_taxonomy_code(), get_toa_process_download_taxonomy_name(), 'toa process', ['log']),
+        (get_toa_process_gilist_viridiplantae_nucleotide_gi_code(), get_toa_process_gilist_viridiplantae_nucleotide_gi_name(), 'toa process', ['log']),
+        (get_toa_process_gilist_viridiplantae_protein_gi_code(), get_toa_process_gilist_viridiplantae_protein_gi_name(), 'toa process', ['log']),
+        (get_toa_process_load_basic_data_code(), get_toa_process_load_basic_data_name(), 'toa process', ['log']),
+        (get_toa_process_load_dicots_04_code(), get_toa_process_load_dicots_04_name(), 'toa process', ['log']),
+        (get_toa_process_load_gene_code(), get_toa_process_load_gene_name(), 'toa process', ['log']),
+        (get_toa_process_load_go_code(), get_toa_process_load_go_name(), 'toa process', ['log']),
+        (get_toa_process_load_gymno_01_code(), get_toa_process_load_gymno_01_name(), 'toa process', ['log']),
+        (get_toa_process_load_interpro_code(), get_toa_process_load_interpro_name(), 'toa process', ['log']),
+        (get_toa_process_load_monocots_04_code(), get_toa_process_load_monocots_04_name(), 'toa process', ['log']),
+        (get_toa_process_merge_annotations_code(), get_toa_process_merge_annotations_name(), 'toa process', ['log']),
+        (get_toa_process_nr_blastplus_db_code(), get_toa_process_nr_blastplus_db_name(), 'toa process', ['log']),
+        (get_toa_process_nr_diamond_db_code(), get_toa_process_nr_diamond_db_name(), 'toa process', ['log']),
+        (get_toa_process_nt_blastplus_db_code(), get_toa_process_nt_blastplus_db_name(), 'toa process', ['log']),
+        (get_toa_process_pipeline_aminoacid_code(), get_toa_process_pipeline_aminoacid_name(), 'toa process', ['result']),
+        (get_toa_process_pipeline_nucleotide_code(), get_toa_process_pipeline_nucleotide_name(), 'toa process', ['result']),
+        (get_toa_process_proteome_dicots_04_code(), get_toa_process_proteome_dicots_04_name(), 'toa process', ['log']),
+        (get_toa_process_proteome_gymno_01_code(), get_toa_process_proteome_gymno_01_name(), 'toa process', ['log']),
+        (get_toa_process_proteome_monocots_04_code(), get_toa_process_proteome_monocots_04_name(), 'toa process', ['log']),
+        (get_toa_process_proteome_refseq_plant_code(), get_toa_process_proteome_refseq_plant_name(), 'toa process', ['log']),
+        (get_toa_process_rebuild_toa_database_code(), get_get_toa_process_rebuild_toa_database_name(), 'toa process', ['log']),
+        (get_toa_process_recreate_toa_database_code(), get_get_toa_process_recreate_toa_database_name(), 'toa process', ['log']),
+        (get_tophat_code(), get_tophat_name(), 'bioinfo app', ['result']),
+        (get_transabyss_code(), get_transabyss_name(), 'bioinfo app', ['result']),
+        (get_transcript_filter_code(), get_transcript_filter_name(), 'bioinfo app', ['result']),
+        (get_transcriptome_blastx_code(), get_transcriptome_blastx_name(), 'bioinfo app', ['result']),
+        (get_transdecoder_code(), get_transdecoder_name(), 'bioinfo app', ['log']),
+        (get_transrate_code(), get_transrate_name(), 'bioinfo app', ['result']),
+        (get_trimmomatic_code(), get_trimmomatic_name(), 'bioinfo app', ['read', 'result']),
+        (get_trinity_code(), get_trinity_name(), 'bioinfo app', ['result']),
+        (get_variant_calling_code(), get_variant_calling_name(), 'bioinfo app', ['log']),
+        (get_vcftools_code(), get_vcftools_name(), 'bioinfo app', ['log']),
+        (get_vcftools_perl_libraries_code(), get_vcftools_perl_libraries_name(), 'bioinfo app', ['log']),
+        (get_vsearch_code(), get_vsearch_name(), 'bioinfo app', ['log']),
+        ]
+
+#-------------------------------------------------------------------------------
+
+def get_dataset_id_pattern():
+    '''
+    Get the compiled pattern of the dataset identifications (code-yymmdd-hhmmss
+    with an optional ".tar.gz" extension) of every application of the registry.
+    '''
+
+    global dataset_id_pattern
+
+    # compile the pattern the first time with the longest codes first
+    if dataset_id_pattern is None:
+        code_list = sorted(get_app_registry().keys(), key=len, reverse=True)
+        dataset_id_pattern = re.compile(r'^({0})-(.+)-(.+?)(?:\.tar\.gz)?$'.format('|'.join([re.escape(code) for code in code_list])))
+
+    # return the pattern
+    return dataset_id_pattern
+
+#-------------------------------------------------------------------------------
+
+def classify_dataset_id(dataset_id, dataset_type=None):
+    '''
+    Get the registry data of the application that produced a dataset and the
+    date and time of the run. When a dataset type is passed, only the
+    applications that produce it are considered. (None, None, None) is returned
+    if the dataset identification does not match any application.
+    '''
+
+    # match the dataset identification
+    mo = get_dataset_id_pattern().match(dataset_id)
+
+    # get the application data, date and time
+    if mo is None:
+        return (None, None, None)
+    app = get_app_registry()[mo.group(1)]
+    if dataset_type is not None and dataset_type not in app['dataset_type_list']:
+        return (None, None, None)
+
+    # return the application data, date and time
+    return (app, mo.group(2), mo.group(3))
+
+#-------------------------------------------------------------------------------
+
 def get_awscli_name():
     '''
     Get the AWS CLI 2 name used to title.
@@ -2680,6 +2860,51 @@ def get_log_dir():
 
 #-------------------------------------------------------------------------------
 
+def get_transfer_journal_dir():
+    '''
+    Get the directory of the journals of resumable transfers in the local computer.
+    '''
+
+    return f'{get_temp_dir()}/transfer-journals'
+
+#-------------------------------------------------------------------------------
+
+def get_cluster_metadata_db_file(cluster_name):
+    '''
+    Get the local SQLite database with the metadata cache of the datasets of a cluster.
+    '''
+
+    return f'{get_temp_dir()}/{cluster_name}-metadata.db'
+
+#-------------------------------------------------------------------------------
+
+def get_log_index_db_file():
+    '''
+    Get the local SQLite database with the index of the submission logs of the current environment.
+    '''
+
+    return f'{get_log_dir()}/log-index-{xconfiguration.environment}.db'
+
+#-------------------------------------------------------------------------------
+
+def get_aws_discovery_cache_file():
+    '''
+    Get the cache file of the discovered AWS regions, zones and AMIs in the local computer.
+    '''
+
+    return f'{get_temp_dir()}/aws-discovery.json'
+
+#-------------------------------------------------------------------------------
+
+def get_wait_max_delay():
+    '''
+    Get the maximum delay (in seconds) between the checks of the waits with exponential backoff.
+    '''
+
+    return 15
+
+#-------------------------------------------------------------------------------
+
 def get_log_file(function_name=None):
     '''
     Get the log file name of in the local computer.
@@ -2698,31 +2923,6 @@ def get_log_file(function_name=None):
 
 #-------------------------------------------------------------------------------
 
-def list_log_files_command(local_process_id):
-    '''
-    Get the command to list log files in the local computer depending on the Operating System.
-    '''
-    # get log dir
-    log_dir = get_log_dir()
-
-    # assign the command
-    if sys.platform.startswith('linux') or sys.platform.startswith('darwin'):
-        if local_process_id == 'all':
-            command = 'ls {0}/{1}-*.txt'.format(log_dir, xconfiguration.environment)
-        else:
-            command = 'ls {0}/{1}-{2}-*.txt'.format(log_dir, xconfiguration.environment, local_process_id)
-    elif sys.platform.startswith('win32') or sys.platform.startswith('cygwin'):
-        log_dir = log_dir.replace('/','\\')
-        if local_process_id == 'all':
-            command = r'dir /B {0}\{1}-*.txt'.format(log_dir, xconfiguration.environment)
-        else:
-            command = r'dir /B {0}\{1}-{2}-*.txt'.format(log_dir, xconfiguration.environment, local_process_id)
-
-    # return the command
-    return command
-
-#-------------------------------------------------------------------------------
-
 def get_submission_process_dict():
     '''
     Get the submission process dictionary.
@@ -3142,6 +3342,15 @@ def get_status_wrong(current_run_dir):
 
 #-------------------------------------------------------------------------------
 
+def get_dataset_manifest_file():
+    '''
+    Get the name of the manifest file with the checksums of a dataset directory in the cluster.
+    '''
+
+    return '.ngscloud-manifest.json'
+
+#-------------------------------------------------------------------------------
+
 def get_mounting_point_list():
     '''
     Get the available mounting point list
@@ -3307,16 +3516,118 @@ def is_email_address_valid(email):
 
 #-------------------------------------------------------------------------------
 
+def is_date_valid(date):
+    '''
+    Check if a date with the format YYYY-MM-DD is valid.
+    '''
+
+    # initialize control variable
+    valid = True
+
+    # check if the date is valid
+    try:
+        datetime.datetime.strptime(date, '%Y-%m-%d')
+    except ValueError:
+        valid = False
+
+    # return control variable
+    return valid
+
+#-------------------------------------------------------------------------------
+
 def get_option_dict(config_file):
     '''
     Get a dictionary with the options retrieved from a configuration file.
     '''
 
+    # get the cached option dictionary of the configuration file
+    (_, cached_option_dict) = get_config_cache_entry(config_file)
+
+    # copy the option dictionary because the callers can modify it
+    option_dict = {section: dict(keys_dict) for section, keys_dict in cached_option_dict.items()}
+
+    # return the option dictionary
+    return option_dict
+
+#-------------------------------------------------------------------------------
+
+def get_config(config_file):
+    '''
+    Get a read-only parser of a configuration file, which is shared among the
+    callers while the file does not change.
+    '''
+
+    # get the cached parser of the configuration file
+    (config, _) = get_config_cache_entry(config_file)
+
+    # return the parser
+    return config
+
+#-------------------------------------------------------------------------------
+
+def get_config_cache_entry(config_file):
+    '''
+    Get the parser and the option dictionary of a configuration file from the
+    cache. The file is parsed again when its modification time, inode or size
+    changes.
+    '''
+
+    # get the signature of the configuration file
+    file_signature = get_config_file_signature(config_file)
+
+    with config_cache_lock:
+
+        # get the cache entry of the configuration file
+        cache_entry = config_cache_dict.get(config_file)
+
+        # parse the configuration file when it is not cached or it has changed
+        if cache_entry is None or cache_entry[0] != file_signature or file_signature is None:
+            cache_entry = parse_config_file(config_file, file_signature)
+            config_cache_dict[config_file] = cache_entry
+
+    # return the parser and the option dictionary
+    return (cache_entry[1], cache_entry[2])
+
+#-------------------------------------------------------------------------------
+
+def update_config_cache(config_file):
+    '''
+    Update the cache entry of a configuration file after it is written.
+    '''
+
+    with config_cache_lock:
+        config_cache_dict[config_file] = parse_config_file(config_file, get_config_file_signature(config_file))
+
+#-------------------------------------------------------------------------------
+
+def get_config_file_signature(config_file):
+    '''
+    Get the signature (modification time, inode and size) of a configuration
+    file or None if it does not exist.
+    '''
+
+    try:
+        file_stat = os.stat(config_file)
+        file_signature = (file_stat.st_mtime_ns, file_stat.st_ino, file_stat.st_size)
+    except OSError:
+        file_signature = None
+
+    # return the file signature
+    return file_signature
+
+#-------------------------------------------------------------------------------
+
+def parse_config_file(config_file, file_signature):
+    '''
+    Parse a configuration file and build the cache entry with its signature,
+    its read-only parser and its option dictionary.
+    '''
+
     # initialize the option dictionary
     option_dict = {}
 
     # create class to parse the configuration files
-    config = configparser.ConfigParser()
+    config = ReadOnlyConfigParser()
 
     # read the configuration file
     config.read(config_file)
@@ -3334,8 +3645,11 @@ def get_option_dict(config_file):
         # update the section with its keys dictionary
         option_dict[section] = keys_dict
 
-    # return the option dictionary
-    return option_dict
+    # protect the parser against modifications
+    config.read_only = True
+
+    # return the cache entry
+    return (file_signature, config, option_dict)
 
 #-------------------------------------------------------------------------------
 
@@ -3698,6 +4012,45 @@ def run_command(command, log):
 
 #-------------------------------------------------------------------------------
 
+def import_lazy_module(module_name):
+    '''
+    Import a module whose code is executed the first time one of its attributes is
+    accessed. A module already imported is returned as is.
+    '''
+
+    # return the module if it is already imported
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+
+    # find the module specification
+    spec = importlib.util.find_spec(module_name)
+    if spec is None:
+        raise ModuleNotFoundError(f'No module named {module_name}', name=module_name)
+
+    # create the module with a loader that defers its execution
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+
+    # return the module
+    return module
+
+#-------------------------------------------------------------------------------
+
+def check_installed_module(module_name):
+    '''
+    Check if a module is installed without importing it.
+    '''
+
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+#-------------------------------------------------------------------------------
+
 def get_nucleotide_dict():
     '''
     Get a dictionary with nucleotide data.
@@ -3991,6 +4344,200 @@ def get_mail_message_wrong(process_name, cluster_name):
 
 #-------------------------------------------------------------------------------
 
+class LogWriter(object):
+    '''
+    This class writes the messages of a log file from a background thread. The messages
+    are queued in a bounded queue and written in group commits when the commit interval
+    has elapsed or the commit size has been reached. The file is synchronized with the
+    disk depending on the durability: "always" in every commit, "phase" at the separators
+    between process steps, at the error messages and when the file is closed, and "none"
+    only when the file is closed.
+    '''
+
+    #---------------
+
+    def __init__(self, log_file, durability=None):
+        '''
+        Execute actions correspending to the creation of a "LogWriter" instance.
+        '''
+
+        # save initial parameters in instance variables
+        self.log_file = log_file
+        self.durability = durability if durability is not None else get_log_durability()
+
+        # open the log file
+        if not os.path.exists(os.path.dirname(self.log_file)):
+            os.makedirs(os.path.dirname(self.log_file))
+        self.log_file_id = open(self.log_file, mode='w', encoding='iso-8859-1', newline='\n')
+
+        # create the message queue and start the writer thread
+        self.message_queue = queue.Queue(maxsize=get_log_queue_size())
+        self.closed = False
+        self.writer_thread = threading.Thread(target=self.run, name='log-writer', daemon=True)
+        self.writer_thread.start()
+        log_writer_set.add(self)
+
+    #---------------
+
+    def write(self, message):
+        '''
+        Queue a message (the caller waits while the queue is full).
+        '''
+
+        if not self.closed:
+            self.message_queue.put(('message', message, self.durability == 'phase' and is_log_phase_boundary(message)))
+
+    #---------------
+
+    def flush(self, durable=False):
+        '''
+        Write the queued messages in the log file and wait until they have been written.
+        '''
+
+        if not self.closed:
+            event = threading.Event()
+            self.message_queue.put(('flush', event, durable))
+            event.wait()
+
+    #---------------
+
+    def close(self):
+        '''
+        Write the queued messages, synchronize the log file with the disk and close it.
+        '''
+
+        if not self.closed:
+            event = threading.Event()
+            self.message_queue.put(('close', event, True))
+            self.closed = True
+            event.wait()
+            log_writer_set.discard(self)
+
+    #---------------
+
+    def run(self):
+        '''
+        Write the queued messages in group commits (it runs in the writer thread).
+        '''
+
+        # initialize the pending messages of the next commit
+        message_list = []
+        message_size = 0
+        durable = False
+        deadline = None
+
+        while True:
+
+            # get the next request or wait until the commit interval elapses
+            timeout = None if message_list == [] else max(0, deadline - time.monotonic())
+            try:
+                (kind, value, is_durable) = self.message_queue.get(timeout=timeout)
+            except queue.Empty:
+                (kind, value, is_durable) = ('timeout', None, False)
+
+            # add a message to the pending messages
+            if kind == 'message':
+                if message_list == []:
+                    deadline = time.monotonic() + get_log_commit_interval()
+                message_list.append(value)
+                message_size += len(value)
+            durable = durable or is_durable
+
+            # commit the pending messages when it is required
+            if kind != 'message' or durable or message_size >= get_log_commit_size():
+                self.commit(message_list, durable or self.durability == 'always')
+                message_list = []
+                message_size = 0
+                durable = False
+
+            # wake up the waiting caller and finish when the file is closed
+            if kind in ['flush', 'close']:
+                if kind == 'close':
+                    self.log_file_id.close()
+                value.set()
+                if kind == 'close':
+                    break
+
+    #---------------
+
+    def commit(self, message_list, durable):
+        '''
+        Write the pending messages in the log file and synchronize it with the disk when
+        it has to be durable.
+        '''
+
+        try:
+            if message_list != []:
+                self.log_file_id.write(''.join(message_list))
+            self.log_file_id.flush()
+            if durable:
+                os.fsync(self.log_file_id.fileno())
+        except Exception as e:
+            sys.stderr.write(f'*** ERROR: The file {self.log_file} can not be written: {e}\n')
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+def is_log_phase_boundary(message):
+    '''
+    Check if a log message is a separator between process steps or an error message.
+    '''
+
+    return message.startswith(get_separator()) or '*** ERROR' in message
+
+#-------------------------------------------------------------------------------
+
+def close_log_writers():
+    '''
+    Close the log files that are still open when the program ends.
+    '''
+
+    for log_writer in list(log_writer_set):
+        log_writer.close()
+
+#-------------------------------------------------------------------------------
+
+atexit.register(close_log_writers)
+
+#-------------------------------------------------------------------------------
+
+def get_log_durability():
+    '''
+    Get when the log files are synchronized with the disk: always, phase or none.
+    '''
+
+    return 'phase'
+
+#-------------------------------------------------------------------------------
+
+def get_log_commit_interval():
+    '''
+    Get the maximum time (in seconds) that a log message waits before being written.
+    '''
+
+    return 0.2
+
+#-------------------------------------------------------------------------------
+
+def get_log_commit_size():
+    '''
+    Get the size of the pending log messages that triggers a commit.
+    '''
+
+    return 65536
+
+#-------------------------------------------------------------------------------
+
+def get_log_queue_size():
+    '''
+    Get the maximum number of log messages queued before the writer is waited.
+    '''
+
+    return 10000
+
+#-------------------------------------------------------------------------------
+
 class DevStdOut(object):
     '''
     This class is used when it is necessary write in sys.stdout and in a log file
@@ -4012,9 +4559,7 @@ class DevStdOut(object):
 
         # open the local log file
         try:
-            if not os.path.exists(os.path.dirname(self.log_file)):
-                os.makedirs(os.path.dirname(self.log_file))
-            self.log_file_id = open(self.log_file, mode='w', encoding='iso-8859-1', newline='\n')
+            self.log_writer = LogWriter(self.log_file)
         except:
             print('*** ERROR: The file {0} can not be created'.format(self.log_file))
 
@@ -4030,17 +4575,25 @@ class DevStdOut(object):
             sys.stdout.write(message)
 
         # write in the log file
-        self.log_file_id.write(message)
-        self.log_file_id.flush()
-        os.fsync(self.log_file_id.fileno())
+        self.log_writer.write(message)
+
+    #---------------
+
+    def flush(self):
+        '''
+        Write the pending messages in the log file.
+        '''
+
+        self.log_writer.flush()
 
     #---------------
 
     def get_log_file(self):
         '''
-        Get the current log file name
+        Get the current log file name (the pending messages are written before).
         '''
 
+        self.log_writer.flush()
         return self.log_file
 
     #---------------
@@ -4051,7 +4604,7 @@ class DevStdOut(object):
         '''
 
         # close the local log file
-        self.log_file_id.close()
+        self.log_writer.close()
 
     #---------------
 
@@ -4128,6 +4681,86 @@ class NestedDefaultDict(collections.defaultdict):
 
 #-------------------------------------------------------------------------------
 
+class ReadOnlyConfigParser(configparser.ConfigParser):
+    '''
+    This class is a configuration parser that can not be modified once it is
+    marked as read-only, so it can be shared among the callers.
+    '''
+
+    #---------------
+
+    def __init__(self, *args, **kwargs):
+        '''
+        Execute actions correspending to the creation of a "ReadOnlyConfigParser" instance.
+        '''
+
+        self.read_only = False
+        super(ReadOnlyConfigParser, self).__init__(*args, **kwargs)
+
+    #---------------
+
+    def check_writable(self):
+        '''
+        Raise an exception if the parser is read-only.
+        '''
+
+        if self.read_only:
+            raise TypeError('The configuration parser is read-only.')
+
+    #---------------
+
+    def read(self, *args, **kwargs):
+        '''
+        Read configuration files when the parser is not read-only.
+        '''
+
+        self.check_writable()
+        return super(ReadOnlyConfigParser, self).read(*args, **kwargs)
+
+    #---------------
+
+    def add_section(self, *args, **kwargs):
+        '''
+        Add a section when the parser is not read-only.
+        '''
+
+        self.check_writable()
+        return super(ReadOnlyConfigParser, self).add_section(*args, **kwargs)
+
+    #---------------
+
+    def set(self, *args, **kwargs):
+        '''
+        Set an option value when the parser is not read-only.
+        '''
+
+        self.check_writable()
+        return super(ReadOnlyConfigParser, self).set(*args, **kwargs)
+
+    #---------------
+
+    def remove_section(self, *args, **kwargs):
+        '''
+        Remove a section when the parser is not read-only.
+        '''
+
+        self.check_writable()
+        return super(ReadOnlyConfigParser, self).remove_section(*args, **kwargs)
+
+    #---------------
+
+    def remove_option(self, *args, **kwargs):
+        '''
+        Remove an option when the parser is not read-only.
+        '''
+
+        self.check_writable()
+        return super(ReadOnlyConfigParser, self).remove_option(*args, **kwargs)
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
 class BreakAllLoops(Exception):
     '''
     This class is used to break out of nested loops
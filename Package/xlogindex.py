@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#-------------------------------------------------------------------------------
+
+'''
+This software has been developed by:
+
+    GI Sistemas Naturales e Historia Forestal (formerly known as GI Genetica, Fisiologia e Historia Forestal)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+'''
+This file contains the functions related to the local index of the submission
+logs used in both console mode and gui mode.
+'''
+
+#-------------------------------------------------------------------------------
+
+import datetime
+import os
+import re
+import sqlite3
+import sys
+import threading
+
+import xconfiguration
+import xlib
+
+#-------------------------------------------------------------------------------
+
+# the lock of the updates of the submission log index
+log_index_lock = threading.Lock()
+
+#-------------------------------------------------------------------------------
+
+def update_log_index():
+    '''
+    Update incrementally the index of the submission logs: only the log files
+    that are new or have changed since the previous update are read and parsed,
+    and the log files removed are deleted from the index.
+    '''
+
+    # initialize the control variable and the error list
+    OK = True
+    error_list = []
+
+    # get the size and modification time of the submission log files
+    log_dir = xlib.get_log_dir()
+    file_dict = {}
+    if os.path.isdir(log_dir):
+        with os.scandir(log_dir) as entry_list:
+            for entry in entry_list:
+                if entry.is_file() and parse_log_file_name(entry.name) is not None:
+                    stat = entry.stat()
+                    file_dict[entry.name] = (stat.st_size, stat.st_mtime)
+
+    with log_index_lock:
+        try:
+            conn = connect_log_index()
+            try:
+
+                # get the log files in the index
+                indexed_dict = {}
+                for (log_file, size, mtime) in conn.execute('SELECT log_file, size, mtime FROM logs'):
+                    indexed_dict[log_file] = (size, mtime)
+
+                # index the new and changed log files and delete the removed ones in a transaction
+                with conn:
+                    for log_file in indexed_dict.keys() - file_dict.keys():
+                        conn.execute('DELETE FROM logs WHERE log_file = ?', (log_file,))
+                        conn.execute('DELETE FROM log_texts WHERE log_file = ?', (log_file,))
+                    for log_file, (size, mtime) in file_dict.items():
+                        if indexed_dict.get(log_file) != (size, mtime):
+                            (log, content) = parse_log_file(log_file, size, mtime)
+                            conn.execute('INSERT OR REPLACE INTO logs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', (log_file, size, mtime, log['process_id'], log['process_text'], log['cluster_name'], log['start'], log['end'], log['status'], log['errors']))
+                            conn.execute('DELETE FROM log_texts WHERE log_file = ?', (log_file,))
+                            conn.execute('INSERT INTO log_texts (log_file, content) VALUES (?, ?)', (log_file, content))
+
+            finally:
+                conn.close()
+        except Exception as e:
+            error_list.append(f'*** EXCEPTION: "{e}".')
+            error_list.append('*** ERROR: The submission log index can not be updated.\n')
+            OK = False
+
+    # return the control variable and the error list
+    return (OK, error_list)
+
+#-------------------------------------------------------------------------------
+
+def search_log_index(process_id='all', text='', status='all', cluster_name='', since='', until=''):
+    '''
+    Get the submission logs of the index that match a process, a text (full-text
+    search over the log contents), a status, a cluster name and a start date range
+    (dates with the format YYYY-MM-DD). The index is updated before.
+    '''
+
+    # initialize the log list
+    log_list = []
+
+    # update the index
+    (OK, error_list) = update_log_index()
+
+    # build the query
+    if OK:
+        condition_list = []
+        parameter_list = []
+        if process_id != 'all':
+            condition_list.append('logs.process_id = ?')
+            parameter_list.append(process_id)
+        if text.strip() != '':
+            condition_list.append('logs.log_file IN (SELECT log_file FROM log_texts WHERE log_texts MATCH ?)')
+            parameter_list.append(build_match_expression(text))
+        if cluster_name != '':
+            condition_list.append('logs.cluster_name = ?')
+            parameter_list.append(cluster_name)
+        if since != '':
+            condition_list.append('logs.start >= ?')
+            parameter_list.append(since)
+        if until != '':
+            condition_list.append('logs.start < ?')
+            parameter_list.append(f'{until}~')
+        where = f'WHERE {" AND ".join(condition_list)}' if condition_list != [] else ''
+        query = f'SELECT log_file, process_id, process_text, cluster_name, start, end, status, errors FROM logs {where} ORDER BY start DESC, log_file'
+
+    # get the submission logs (the status of the logs still being written is "running")
+    if OK:
+        running_log_file_set = get_running_log_file_set()
+        try:
+            with log_index_lock:
+                conn = connect_log_index()
+                try:
+                    for (log_file, process_id, process_text, log_cluster_name, start, end, log_status, errors) in conn.execute(query, parameter_list):
+                        if log_file in running_log_file_set:
+                            log_status = 'running'
+                        if status != 'all' and log_status != status:
+                            continue
+                        log_list.append({'log_file': log_file, 'process_id': process_id, 'process_text': process_text, 'cluster_name': log_cluster_name, 'start': start, 'end': end, 'status': log_status, 'errors': errors})
+                finally:
+                    conn.close()
+        except Exception as e:
+            error_list.append(f'*** EXCEPTION: "{e}".')
+            error_list.append('*** ERROR: The submission log index can not be searched.\n')
+            OK = False
+
+    # return the control variable, the error list and the log list
+    return (OK, error_list, log_list)
+
+#-------------------------------------------------------------------------------
+
+def get_log_index_cluster_name_list():
+    '''
+    Get the names of the clusters mentioned in the submission logs of the index
+    (the clusters can already be terminated).
+    '''
+
+    # initialize the cluster name list
+    cluster_name_list = []
+
+    # get the cluster names
+    try:
+        with log_index_lock:
+            conn = connect_log_index()
+            try:
+                for (cluster_name,) in conn.execute('SELECT DISTINCT cluster_name FROM logs WHERE cluster_name != \'\' ORDER BY cluster_name'):
+                    cluster_name_list.append(cluster_name)
+            finally:
+                conn.close()
+    except Exception:
+        cluster_name_list = []
+
+    # return the cluster name list
+    return cluster_name_list
+
+#-------------------------------------------------------------------------------
+
+def connect_log_index():
+    '''
+    Connect to the local SQLite database of the submission log index creating
+    its tables when they do not exist.
+    '''
+
+    # get the local database file
+    log_index_db_file = xlib.get_log_index_db_file()
+    if not os.path.exists(os.path.dirname(log_index_db_file)):
+        os.makedirs(os.path.dirname(log_index_db_file))
+
+    # connect to the database and create the tables
+    conn = sqlite3.connect(log_index_db_file)
+    with conn:
+        conn.execute('CREATE TABLE IF NOT EXISTS logs (log_file TEXT PRIMARY KEY, size INTEGER, mtime REAL, process_id TEXT, process_text TEXT, cluster_name TEXT, start TEXT, end TEXT, status TEXT, errors TEXT)')
+        conn.execute('CREATE INDEX IF NOT EXISTS logs_start ON logs (start)')
+        conn.execute('CREATE VIRTUAL TABLE IF NOT EXISTS log_texts USING fts5 (log_file UNINDEXED, content)')
+
+    # return the connection
+    return conn
+
+#-------------------------------------------------------------------------------
+
+def parse_log_file_name(log_file):
+    '''
+    Get the submission process identification, the start date and the start time
+    from the name of a submission log file of the current environment. None is
+    returned when the name does not correspond to a submission log.
+    '''
+
+    # check the environment and the extension
+    prefix = f'{xconfiguration.environment}-'
+    if not log_file.startswith(prefix) or not log_file.endswith('.txt'):
+        return None
+
+    # parse the name
+    mo = re.search(r'^(.+)\-(\d{6})\-(\d{6})\.txt$', log_file[len(prefix):])
+    if mo is None:
+        return None
+    process_id = mo.group(1).strip()
+    yymmdd = mo.group(2)
+    hhmmss = mo.group(3)
+
+    # return the process identification, date and time
+    return (process_id, f'20{yymmdd[:2]}-{yymmdd[2:4]}-{yymmdd[4:]}', f'{hhmmss[:2]}:{hhmmss[2:4]}:{hhmmss[4:]}')
+
+#-------------------------------------------------------------------------------
+
+def parse_log_file(log_file, size, mtime):
+    '''
+    Read a submission log file and get its fields and its content to index.
+    '''
+
+    # get the fields of the file name
+    (process_id, date, time) = parse_log_file_name(log_file)
+    submission_process_dict = xlib.get_submission_process_dict()
+    process_text = submission_process_dict.get(process_id, {'text': 'unknown process'})['text']
+
+    # read the content (the log files are written in ISO-8859-1)
+    try:
+        with open(os.path.join(xlib.get_log_dir(), log_file), mode='r', encoding='iso-8859-1') as file_id:
+            content = file_id.read(get_log_index_max_size())
+    except Exception:
+        content = ''
+
+    # get the cluster name from the messages that mention it
+    mo = re.search(r'^Cluster: ([\w\-]+)|\bcluster ([\w\-]+) is not running|\bfor the cluster ([\w\-]+)\.|\bin cluster ([\w\-]+) using', content, re.MULTILINE)
+    cluster_name = [group for group in mo.groups() if group is not None][0] if mo is not None else ''
+
+    # get the error lines
+    error_line_list = [line.strip() for line in content.splitlines() if line.startswith('*** ERROR')]
+    errors = '\n'.join(error_line_list[:get_log_index_error_line_number()])
+
+    # build the log record
+    log = {}
+    log['process_id'] = process_id
+    log['process_text'] = process_text
+    log['cluster_name'] = cluster_name
+    log['start'] = f'{date} {time}'
+    log['end'] = datetime.datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M:%S') if size > 0 else ''
+    log['status'] = 'wrong' if error_line_list != [] else 'OK'
+    log['errors'] = errors
+
+    # return the log record and the content
+    return (log, content)
+
+#-------------------------------------------------------------------------------
+
+def get_running_log_file_set():
+    '''
+    Get the names of the submission log files that are being written in this process.
+    '''
+
+    return {os.path.basename(log_writer.log_file) for log_writer in list(xlib.log_writer_set) if not log_writer.closed}
+
+#-------------------------------------------------------------------------------
+
+def build_match_expression(text):
+    '''
+    Build a full-text match expression where every word of a text has to be found
+    (the words are quoted, so the characters of the query syntax are not special).
+    '''
+
+    return ' '.join(['"{0}"'.format(word.replace('"', '""')) for word in text.split()])
+
+#-------------------------------------------------------------------------------
+
+def get_log_status_code_list():
+    '''
+    Get the code list of the status of the submission logs.
+    '''
+
+    return ['all', 'OK', 'wrong', 'running']
+
+#-------------------------------------------------------------------------------
+
+def get_log_index_max_size():
+    '''
+    Get the maximum number of characters of a submission log that are indexed.
+    '''
+
+    return 16777216
+
+#-------------------------------------------------------------------------------
+
+def get_log_index_error_line_number():
+    '''
+    Get the maximum number of error lines of a submission log kept in the index.
+    '''
+
+    return 10
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    print('This file contains the functions related to the local index of the submission logs used in both console mode and gui mode.')
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------
@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#-------------------------------------------------------------------------------
+
+'''
+This software has been developed by:
+
+    GI Sistemas Naturales e Historia Forestal (formerly known as GI Genetica, Fisiologia e Historia Forestal)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+'''
+This file contains the functions related to the local metadata cache of the
+cluster datasets used in both console mode and gui mode.
+'''
+
+#-------------------------------------------------------------------------------
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+import xlib
+import xssh
+
+#-------------------------------------------------------------------------------
+
+# the dataset catalogs of the clusters keyed by cluster name
+dataset_catalog_dict = {}
+dataset_catalog_lock = threading.RLock()
+
+# the cluster names whose catalog is being refreshed in background
+refreshing_cluster_name_set = set()
+
+# the error lists of the failed background refreshes keyed by cluster name
+refresh_error_dict = {}
+
+#-------------------------------------------------------------------------------
+
+def get_dataset_catalog(cluster_name, passed_connection=False, ssh_client=None, refresh=False):
+    '''
+    Get the catalog of the read, reference, database and result datasets in the
+    cluster. The catalog is kept in memory and in a local SQLite database, so
+    the queries are answered without waiting for the cluster: when the catalog
+    is not recent, the current one is returned and it is refreshed in background.
+    The refresh is synchronous the first time (also when the catalog has just
+    been loaded from the local database, because the cluster could have changed
+    or no longer exist), when it is forced or when the catalog has been
+    invalidated (e. g. after a failed background refresh).
+    '''
+
+    # initialize the control variable and the error list
+    OK = True
+    error_list = []
+
+    # get the current catalog of the cluster from memory or from the local database
+    with dataset_catalog_lock:
+        catalog = dataset_catalog_dict.get(cluster_name)
+        if catalog is None:
+            catalog = load_dataset_catalog(cluster_name)
+            if catalog is not None:
+                dataset_catalog_dict[cluster_name] = catalog
+
+    # return the current catalog when it is recent
+    if not refresh and catalog is not None and not catalog['invalid'] and time.time() < catalog['checked'] + get_dataset_catalog_ttl():
+        return (OK, error_list, catalog)
+
+    # return the current catalog and refresh it in background when it is not recent
+    # (a catalog loaded from the local database has not been checked yet)
+    if not refresh and catalog is not None and not catalog['invalid'] and catalog['checked'] > 0:
+        start_dataset_catalog_refresh(cluster_name)
+        return (OK, error_list, catalog)
+
+    # refresh the catalog (closing the SSH client connection created here also when the refresh fails)
+    if not passed_connection:
+        (OK, error_list, ssh_client) = xssh.create_ssh_client_connection(cluster_name)
+    try:
+        if OK:
+            (OK, error_list, catalog) = refresh_dataset_catalog(cluster_name, ssh_client)
+    finally:
+        if not passed_connection and ssh_client is not None:
+            xssh.close_ssh_client_connection(ssh_client)
+
+    # add the errors of the previous background refresh when the refresh fails again
+    with dataset_catalog_lock:
+        background_error_list = refresh_error_dict.pop(cluster_name, [])
+    if not OK:
+        error_list = background_error_list + error_list
+
+    # return the control variable, error list and catalog
+    return (OK, error_list, catalog)
+
+#-------------------------------------------------------------------------------
+
+def refresh_dataset_catalog(cluster_name, ssh_client):
+    '''
+    Refresh incrementally the dataset catalog of a cluster in a single round
+    trip: only the directories modified since the previous refresh are listed
+    again. All the directories are listed again when the catalog has been
+    invalidated, because a file rewritten in place does not change the time of
+    its directory. The new catalog is saved in the local database.
+    '''
+
+    # initialize the control variable and the error list
+    OK = True
+    error_list = []
+
+    # get the current catalog of the cluster
+    with dataset_catalog_lock:
+        catalog = dataset_catalog_dict.get(cluster_name)
+    if catalog is None:
+        catalog = {'time': 0, 'checked': 0, 'invalid': False, 'root_list': [], 'entry_dict': {}, 'child_dict': {}}
+
+    # set the time of the last refresh (all the directories are listed again when the catalog is invalid)
+    since_time = 0 if catalog['invalid'] else catalog['time']
+
+    # list the catalog changes in the cluster
+    command = build_dataset_catalog_command(since_time)
+    (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+    if not OK:
+        for line in stderr:
+            error_list.append(f'{line}\n')
+        error_list.append('*** ERROR: The dataset catalog can not be got.\n')
+
+    # parse the catalog records
+    if OK:
+        new_time = catalog['time']
+        root_list = []
+        entry_dict = {}
+        changed_child_dict = {}
+        status_list = []
+        for record in parse_dataset_catalog_output(stdout):
+            if record[0] == 'time':
+                new_time = record[1] - 1
+            elif record[0] == 'root':
+                root_list.append(record[1])
+                entry_dict[record[1]] = {}
+            elif record[0] == 'entry':
+                entry_dict[record[1]][record[5]] = {'type': record[2], 'size': record[3], 'mtime': record[4]}
+            elif record[0] == 'child':
+                parent_id = os.path.basename(record[5])
+                changed_child_dict.setdefault(record[1], {}).setdefault(parent_id, {})[record[6]] = {'type': record[2], 'size': record[3], 'mtime': record[4], 'status': ''}
+            elif record[0] == 'status':
+                status_list.append(record[1:])
+
+        # merge the children of the directories: the unchanged directories keep their children
+        child_dict = {}
+        for kind in get_dataset_catalog_root_dict().keys():
+            child_dict[kind] = {}
+            old_parent_dict = catalog['child_dict'].get(kind, {})
+            for parent_id, entry in entry_dict.get(kind, {}).items():
+                if entry['type'] != 'd':
+                    continue
+                if entry['mtime'] <= since_time and parent_id in old_parent_dict:
+                    child_dict[kind][parent_id] = old_parent_dict[parent_id]
+                else:
+                    parent_child_dict = changed_child_dict.get(kind, {}).get(parent_id, {})
+                    if since_time > 0:
+                        for child_id, child in parent_child_dict.items():
+                            child['status'] = old_parent_dict.get(parent_id, {}).get(child_id, {}).get('status', '')
+                    child_dict[kind][parent_id] = parent_child_dict
+
+        # set the status markers of the new finished processes
+        for (kind, status_dir, status_file) in status_list:
+            experiment_id = os.path.basename(os.path.dirname(os.path.dirname(status_dir)))
+            dataset_id = os.path.basename(os.path.dirname(status_dir))
+            dataset = child_dict.get(kind, {}).get(experiment_id, {}).get(dataset_id)
+            if dataset is not None:
+                status = os.path.splitext(status_file)[1][1:]
+                if dataset['status'] in ['', status]:
+                    dataset['status'] = status
+                else:
+                    dataset['status'] = 'undetermined'
+
+        # replace the catalog of the cluster
+        catalog = {'time': new_time, 'checked': time.time(), 'invalid': False, 'root_list': root_list, 'entry_dict': entry_dict, 'child_dict': child_dict}
+        with dataset_catalog_lock:
+            dataset_catalog_dict[cluster_name] = catalog
+
+        # save the catalog in the local database (the catalog is valid even if it can not be
+        # saved, so the errors are only returned in the error list)
+        (_, save_error_list) = save_dataset_catalog(cluster_name, catalog)
+        error_list.extend(save_error_list)
+
+    # return the control variable, error list and catalog
+    return (OK, error_list, catalog)
+
+#-------------------------------------------------------------------------------
+
+def start_dataset_catalog_refresh(cluster_name):
+    '''
+    Start the refresh of the dataset catalog of a cluster in background if it
+    is not already running.
+    '''
+
+    # check the catalog is not being refreshed
+    with dataset_catalog_lock:
+        if cluster_name in refreshing_cluster_name_set:
+            return
+        refreshing_cluster_name_set.add(cluster_name)
+
+    # start the refresh thread
+    thread = threading.Thread(target=run_dataset_catalog_refresh, args=(cluster_name,), daemon=True)
+    thread.start()
+
+#-------------------------------------------------------------------------------
+
+def run_dataset_catalog_refresh(cluster_name):
+    '''
+    Refresh the dataset catalog of a cluster with a new SSH connection (it is
+    executed in a background thread).
+    '''
+
+    # initialize the control variable and the error list
+    OK = True
+    error_list = []
+
+    # initialize the SSH client
+    ssh_client = None
+
+    # refresh the catalog (closing the SSH client connection also when the refresh fails)
+    try:
+        (OK, error_list, ssh_client) = xssh.create_ssh_client_connection(cluster_name)
+        if OK:
+            (OK, error_list, _) = refresh_dataset_catalog(cluster_name, ssh_client)
+    except Exception as e:
+        error_list.append(f'*** EXCEPTION: "{e}".')
+        error_list.append(f'*** ERROR: The dataset catalog of the cluster {cluster_name} can not be refreshed.\n')
+        OK = False
+    finally:
+        if ssh_client is not None:
+            xssh.close_ssh_client_connection(ssh_client)
+
+    # when the refresh fails, keep the errors and force a synchronous refresh in the next query
+    with dataset_catalog_lock:
+        if not OK:
+            refresh_error_dict[cluster_name] = error_list
+            invalidate_dataset_catalog(cluster_name)
+        refreshing_cluster_name_set.discard(cluster_name)
+
+#-------------------------------------------------------------------------------
+
+def build_dataset_catalog_command(since_time):
+    '''
+    Build the command that lists the dataset directories of the cluster, the
+    content of their subdirectories modified after a time (the datasets of the
+    experiments and the files of the reference and database datasets) and the
+    status markers of the processes finished after that time. Every field is
+    followed by a NUL character, so any file name can be parsed.
+    '''
+
+    # get the directories of the catalog
+    root_dict = get_dataset_catalog_root_dict()
+
+    # initialize the command with the time of the cluster
+    command_list = ['printf \'time\\0%s\\0\' "$(date +%s)"']
+
+    # list the entries of every directory
+    for kind, root in root_dict.items():
+        command_list.append(f'[ -d {root} ] && printf \'root\\0{kind}\\0\' && find {root} -mindepth 1 -maxdepth 1 -not -name lost+found -not -name ".*" -printf \'entry\\0{kind}\\0%y\\0%s\\0%T@\\0%f\\0\'')
+
+    # list the content of the subdirectories modified after the time
+    for kind, root in root_dict.items():
+        command_list.append(f'[ -d {root} ] && find {root} -mindepth 1 -maxdepth 1 -type d -not -name lost+found -newermt @{since_time} -exec find {{}} -mindepth 1 -maxdepth 1 -not -name ".*" -printf \'child\\0{kind}\\0%y\\0%s\\0%T@\\0%h\\0%f\\0\' \\;')
+
+    # list the status markers of the processes finished after the time
+    command_list.append(f'[ -d {root_dict["result"]} ] && find {root_dict["result"]} -mindepth 4 -maxdepth 4 -path "*/status/script.*" -newermt @{since_time} -printf \'status\\0result\\0%h\\0%f\\0\'')
+
+    # return the command
+    return '; '.join(command_list) + '; true'
+
+#-------------------------------------------------------------------------------
+
+def parse_dataset_catalog_output(stdout):
+    '''
+    Split the output of the dataset catalog command into records. The fields are
+    delimited by NUL characters and the number of fields depends on the record
+    type, so the new line characters of the file names are kept.
+    '''
+
+    # set the number of fields and the numeric fields of every record type
+    field_number_dict = {'time': 1, 'root': 1, 'entry': 5, 'child': 6, 'status': 3}
+    numeric_field_dict = {'time': {1: int}, 'entry': {3: int, 4: float}, 'child': {3: int, 4: float}}
+
+    # initialize the record list
+    record_list = []
+
+    # build the records from the field list
+    field_list = '\n'.join(stdout).split('\0')
+    i = 0
+    while i < len(field_list):
+        record_type = field_list[i]
+        if record_type not in field_number_dict or i + field_number_dict[record_type] >= len(field_list):
+            break
+        record = [record_type] + field_list[i + 1:i + 1 + field_number_dict[record_type]]
+        for position, convert in numeric_field_dict.get(record_type, {}).items():
+            record[position] = convert(record[position])
+        record_list.append(record)
+        i += 1 + field_number_dict[record_type]
+
+    # return the record list
+    return record_list
+
+#-------------------------------------------------------------------------------
+
+def load_dataset_catalog(cluster_name):
+    '''
+    Load the dataset catalog of a cluster from the local database. None is
+    returned if the database does not exist or it can not be read.
+    '''
+
+    # initialize the catalog
+    catalog = None
+
+    # get the local database file
+    metadata_db_file = xlib.get_cluster_metadata_db_file(cluster_name)
+
+    # read the catalog tables
+    if os.path.isfile(metadata_db_file):
+        try:
+            conn = sqlite3.connect(metadata_db_file)
+            try:
+                (catalog_time, root_list_text) = conn.execute('SELECT time, root_list FROM catalog').fetchone()
+                root_list = json.loads(root_list_text)
+                entry_dict = {kind: {} for kind in root_list}
+                for (kind, name, entry_type, size, mtime) in conn.execute('SELECT kind, name, type, size, mtime FROM entries'):
+                    entry_dict.setdefault(kind, {})[name] = {'type': entry_type, 'size': size, 'mtime': mtime}
+                child_dict = {kind: {} for kind in get_dataset_catalog_root_dict().keys()}
+                for (kind, parent_id, name, child_type, size, mtime, status) in conn.execute('SELECT kind, parent, name, type, size, mtime, status FROM children'):
+                    child_dict.setdefault(kind, {}).setdefault(parent_id, {})[name] = {'type': child_type, 'size': size, 'mtime': mtime, 'status': status}
+                for kind, entry_kind_dict in entry_dict.items():
+                    for parent_id, entry in entry_kind_dict.items():
+                        if entry['type'] == 'd':
+                            child_dict.setdefault(kind, {}).setdefault(parent_id, {})
+                catalog = {'time': catalog_time, 'checked': 0, 'invalid': False, 'root_list': root_list, 'entry_dict': entry_dict, 'child_dict': child_dict}
+            finally:
+                conn.close()
+        except Exception:
+            catalog = None
+
+    # return the catalog
+    return catalog
+
+#-------------------------------------------------------------------------------
+
+def save_dataset_catalog(cluster_name, catalog):
+    '''
+    Save the dataset catalog of a cluster in the local database.
+    '''
+
+    # initialize the control variable and the error list
+    OK = True
+    error_list = []
+
+    # get the local database file
+    metadata_db_file = xlib.get_cluster_metadata_db_file(cluster_name)
+
+    # replace the content of the catalog tables in a transaction
+    try:
+        if not os.path.exists(os.path.dirname(metadata_db_file)):
+            os.makedirs(os.path.dirname(metadata_db_file))
+        conn = sqlite3.connect(metadata_db_file)
+        try:
+            with conn:
+                conn.execute('CREATE TABLE IF NOT EXISTS catalog (time INTEGER, root_list TEXT)')
+                conn.execute('CREATE TABLE IF NOT EXISTS entries (kind TEXT, name TEXT, type TEXT, size INTEGER, mtime REAL, PRIMARY KEY (kind, name))')
+                conn.execute('CREATE TABLE IF NOT EXISTS children (kind TEXT, parent TEXT, name TEXT, type TEXT, size INTEGER, mtime REAL, status TEXT, PRIMARY KEY (kind, parent, name))')
+                conn.execute('DELETE FROM catalog')
+                conn.execute('DELETE FROM entries')
+                conn.execute('DELETE FROM children')
+                conn.execute('INSERT INTO catalog VALUES (?, ?)', (catalog['time'], json.dumps(catalog['root_list'])))
+                conn.executemany('INSERT INTO entries VALUES (?, ?, ?, ?, ?)', [(kind, name, entry['type'], entry['size'], entry['mtime']) for kind, entry_kind_dict in catalog['entry_dict'].items() for name, entry in entry_kind_dict.items()])
+                conn.executemany('INSERT INTO children VALUES (?, ?, ?, ?, ?, ?, ?)', [(kind, parent_id, name, child['type'], child['size'], child['mtime'], child['status']) for kind, parent_dict in catalog['child_dict'].items() for parent_id, parent_child_dict in parent_dict.items() for name, child in parent_child_dict.items()])
+        finally:
+            conn.close()
+    except Exception as e:
+        error_list.append(f'*** EXCEPTION: "{e}".')
+        error_list.append(f'*** ERROR: The dataset catalog of the cluster {cluster_name} can not be saved in {metadata_db_file}.\n')
+        OK = False
+
+    # return the control variable and the error list
+    return (OK, error_list)
+
+#-------------------------------------------------------------------------------
+
+def get_catalog_entry_list(cluster_name, kind, parent_id=None, passed_connection=False, ssh_client=None):
+    '''
+    Get the entries of a dataset directory (or of a subdirectory when a parent
+    identification is passed) from the dataset catalog with their type, size
+    and modification time.
+    '''
+
+    # initialize the entry list
+    entry_list = []
+
+    # get the dataset catalog of the cluster
+    (OK, error_list, catalog) = get_dataset_catalog(cluster_name, passed_connection, ssh_client)
+
+    # check the directory exists
+    if OK:
+        if kind not in catalog['root_list'] or parent_id is not None and parent_id not in catalog['child_dict'].get(kind, {}):
+            error_list.append(f'*** ERROR: The {kind} directory is not found in the cluster {cluster_name}.\n')
+            OK = False
+
+    # build the entry list sorted by name
+    if OK:
+        if parent_id is None:
+            child_dict = catalog['entry_dict'][kind]
+        else:
+            child_dict = get_child_dict(catalog, kind, parent_id)
+        for name in sorted(child_dict.keys()):
+            entry = dict(child_dict[name])
+            entry['name'] = name
+            entry_list.append(entry)
+
+    # return the control variable, error list and entry list
+    return (OK, error_list, entry_list)
+
+#-------------------------------------------------------------------------------
+
+def get_child_dict(catalog, kind, parent_id):
+    '''
+    Get the content of a subdirectory (the datasets of an experiment or the
+    files of a reference or database dataset) from a dataset catalog.
+    '''
+
+    return catalog['child_dict'].get(kind, {}).get(parent_id, {})
+
+#-------------------------------------------------------------------------------
+
+def get_dataset_catalog_root_dict():
+    '''
+    Get the directories of the dataset catalog in the cluster keyed by dataset kind.
+    '''
+
+    return {'database': xlib.get_cluster_database_dir(), 'read': xlib.get_cluster_read_dir(), 'reference': xlib.get_cluster_reference_dir(), 'result': xlib.get_cluster_result_dir()}
+
+#-------------------------------------------------------------------------------
+
+def invalidate_dataset_catalog(cluster_name=None):
+    '''
+    Force the synchronous refresh of the dataset catalog of a cluster (or all
+    clusters) in the next query.
+    '''
+
+    with dataset_catalog_lock:
+        for catalog_cluster_name, catalog in dataset_catalog_dict.items():
+            if cluster_name is None or catalog_cluster_name == cluster_name:
+                catalog['invalid'] = True
+
+#-------------------------------------------------------------------------------
+
+def get_dataset_catalog_ttl():
+    '''
+    Get the seconds that a dataset catalog is used without refreshing it.
+    '''
+
+    return 10
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+     print('This file contains the functions related to the local metadata cache of the cluster datasets used in both console mode and gui mode.')
+     sys.exit(0)
+
+#-------------------------------------------------------------------------------
@@ -203,17 +203,6 @@ def install_ngshelper(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the NGShelper installation script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_ngshelper_installation_script())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_ngshelper_installation_script())}'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the NGShelper installation starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -236,22 +225,11 @@ def install_ngshelper(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the NGShelper installation starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_ngshelper_installation_starter())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_ngshelper_installation_starter())}'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the NGShelper installation
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(get_ngshelper_installation_starter())} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_ngshelper_installation_starter()), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_ngshelper_installation_starter()), log, run_permission_list=[os.path.basename(get_ngshelper_installation_script()), os.path.basename(get_ngshelper_installation_starter())])
 
     # close the SSH client connection
     if OK:
@@ -880,17 +858,6 @@ def run_transcript_filter_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the transcript-filter process script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_transcript_filter_process_script())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_transcript_filter_process_script())}'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the transcript-filter process starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -914,22 +881,11 @@ def run_transcript_filter_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the transcript-filter process starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_transcript_filter_process_starter())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_transcript_filter_process_starter())}'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the transcript-filter process
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(get_transcript_filter_process_starter())} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_transcript_filter_process_starter()), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_transcript_filter_process_starter()), log, run_permission_list=[os.path.basename(get_transcript_filter_process_script()), os.path.basename(get_transcript_filter_process_starter())])
 
     # close the SSH transport connection
     if OK:
@@ -1553,17 +1509,6 @@ def run_transcriptome_blastx_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the transcriptome-blastx process script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_transcriptome_blastx_process_script())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_transcriptome_blastx_process_script())}'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the transcriptome-blastx process starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -1587,22 +1532,11 @@ def run_transcriptome_blastx_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the transcriptome-blastx process starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_transcriptome_blastx_process_starter())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_transcriptome_blastx_process_starter())}'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the transcriptome-blastx process
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(get_transcriptome_blastx_process_starter())} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_transcriptome_blastx_process_starter()), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_transcriptome_blastx_process_starter()), log, run_permission_list=[os.path.basename(get_transcriptome_blastx_process_script()), os.path.basename(get_transcriptome_blastx_process_starter())])
 
     # close the SSH transport connection
     if OK:
@@ -23,6 +23,8 @@ mode and gui mode.
 '''
 #-------------------------------------------------------------------------------
 
+import concurrent.futures
+import io
 import os
 import subprocess
 import sys
@@ -40,9 +42,24 @@ def add_node(cluster_name, node_name, log, function=None):
     Add a node in a cluster.
     '''
 
+    return add_node_list(cluster_name, [node_name], log, function)
+
+#-------------------------------------------------------------------------------
+
+def add_node_list(cluster_name, node_name_list, log, function=None):
+    '''
+    Add several nodes in a cluster. The nodes are launched by only one
+    StarCluster command, and the wait for their readiness and the installation
+    of their infrastructure software run concurrently; the log of each node is
+    written in the log when its installation finishes.
+    '''
+
     # initialize the control variable
     OK = True
 
+    # set the node names text
+    node_names_text = ', '.join(node_name_list)
+
     # warn that the requirements are being verified 
     log.write(f'{xlib.get_separator()}\n')
     log.write('Checking process requirements ...\n')
@@ -54,31 +71,42 @@ def add_node(cluster_name, node_name, log, function=None):
             log.write(f'*** ERROR: The cluster {cluster_name} is not running. Its state is {master_state_code} ({master_state_name}).\n')
             OK = False
 
-    # check the node is not running
+    # check the nodes are not running and the maximum node number
     if OK:
-        pass
+        cluster_node_list = xec2.get_cluster_node_list(cluster_name)
+        for node_name in node_name_list:
+            if node_name in cluster_node_list:
+                log.write(f'*** ERROR: The node {node_name} is already running.\n')
+                OK = False
+        if len(cluster_node_list) + len(node_name_list) > xec2.get_max_node_number():
+            log.write(f'*** ERROR: The maximum number ({xec2.get_max_node_number()}) of instances would be exceeded.\n')
+            OK = False
 
     # warn that the requirements are OK 
     if OK:
         log.write('Process requirements are OK.\n')
 
-    # add node
+    # add nodes
     if OK:
         log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Adding node {node_name} in cluster {cluster_name} using StarCluster ...\n')
+        if len(node_name_list) == 1:
+            log.write(f'Adding node {node_names_text} in cluster {cluster_name} using StarCluster ...\n')
+        else:
+            log.write(f'Adding nodes {node_names_text} in cluster {cluster_name} using StarCluster ...\n')
         log.write('\n')
-        command = f'{xlib.get_starcluster()} addnode {cluster_name} --alias={node_name}'
+        command = f'{xlib.get_starcluster()} addnode {cluster_name} --alias={",".join(node_name_list)}'
         rc = xlib.run_command(command, log)
+        xec2.invalidate_inventory()
         log.write('\n')
         if rc == 0:
-            log.write('The node is added.\n')
+            log.write('The node is added.\n' if len(node_name_list) == 1 else 'The nodes are added.\n')
         else:
             log.write(f'*** ERROR: Return code {rc} in command -> {command}\n')
             OK = False
 
-    # install infrastructure software in the node
+    # install the infrastructure software in the nodes
     if OK:
-        OK = install_node_infrastructure_software(cluster_name, node_name, log)
+        OK = install_node_list_infrastructure_software(cluster_name, node_name_list, log)
 
     # warn that the log window can be closed
     if not isinstance(log, xlib.DevStdOut):
@@ -94,6 +122,56 @@ def add_node(cluster_name, node_name, log, function=None):
 
 #-------------------------------------------------------------------------------
 
+def install_node_list_infrastructure_software(cluster_name, node_name_list, log):
+    '''
+    Install infrastructure software in several nodes of a cluster. The wait for
+    each node to accept SSH connections and its installation run concurrently
+    and the log of each node is written in the log when it finishes.
+    '''
+
+    # build the infrastructure software installation script and download the AWSCLI2 compressed file
+    OK = prepare_node_infrastructure_software(cluster_name, log)
+
+    # bring up the nodes concurrently
+    if OK:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(node_name_list))) as executor:
+            future_dict = {executor.submit(bring_up_node, cluster_name, node_name): node_name for node_name in node_name_list}
+            for future in concurrent.futures.as_completed(future_dict):
+                (node_OK, node_log_text) = future.result()
+                log.write(f'{xlib.get_separator()}\n')
+                log.write(f'Node {future_dict[future]}:\n')
+                log.write(node_log_text)
+                if not node_OK:
+                    OK = False
+
+    # return the control variable
+    return OK
+
+#-------------------------------------------------------------------------------
+
+def bring_up_node(cluster_name, node_name):
+    '''
+    Wait for a node to accept SSH connections and install its infrastructure
+    software. The log is kept in memory and returned.
+    '''
+
+    # initialize the log of the node
+    node_log = io.StringIO()
+
+    # wait for the node to accept SSH connections
+    (OK, error_list) = xssh.wait_ssh_ready(cluster_name, node_name)
+    for error in error_list:
+        node_log.write(f'{error}\n')
+
+    # install infrastructure software in the node
+    if OK:
+        OK = install_node_infrastructure_software(cluster_name, node_name, node_log, is_prepared=True)
+
+    # return the control variable and the log text of the node
+    return (OK, node_log.getvalue())
+
+#-------------------------------------------------------------------------------
+
 def remove_node(cluster_name, node_name, log, function=None):
     '''
     Remove a node in a cluster.
@@ -126,8 +204,10 @@ def remove_node(cluster_name, node_name, log, function=None):
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Removing node {node_name} in cluster {cluster_name} using StarCluster ...\n')
         log.write('\n')
+        xssh.invalidate_ssh_sessions(cluster_name, node_name)
         command = f'{xlib.get_starcluster()} removenode --confirm {cluster_name} --alias={node_name}'
         rc = xlib.run_command(command, log)
+        xec2.invalidate_inventory()
         log.write('\n')
         if rc == 0:
             log.write('The node is removed.\n')
@@ -149,9 +229,11 @@ def remove_node(cluster_name, node_name, log, function=None):
 
 #-------------------------------------------------------------------------------
 
-def install_node_infrastructure_software(cluster_name, node_name, log):
+def prepare_node_infrastructure_software(cluster_name, log):
     '''
-    Install infrastructure software in a node.
+    Build the infrastructure software installation script and download the
+    AWSCLI2 compressed file to local computer; they are shared by the
+    installations in every node.
     '''
 
     # initialize the control variable
@@ -160,12 +242,6 @@ def install_node_infrastructure_software(cluster_name, node_name, log):
     # get the infrastructure software installation script path in local compute
     local_script_path = get_infrastructure_software_installation_script()
 
-    # set the infrastructure software installation script path in node
-    node_script_path = f'./{os.path.basename(local_script_path)}'
-
-    # set the infrastructure software installation log path in node
-    node_log_path = node_script_path[:node_script_path.find('.sh')] + '.log'
-
     # build the infrastructure software installation script
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -177,6 +253,48 @@ def install_node_infrastructure_software(cluster_name, node_name, log):
             for error in error_list:
                 log.write(f'{error}\n')
 
+    # download the AWSCLI2 compressed file to local computer
+    if OK:
+        log.write(f'{xlib.get_separator()}\n')
+        log.write(f'Downloading the {xlib.get_awscli_name()} compressed file to local computer ...\n')
+        local_path = get_awscli_local_path()
+        if not os.path.exists(os.path.dirname(local_path)):
+            os.makedirs(os.path.dirname(local_path))
+        try:
+            urllib.request.urlretrieve(xlib.get_awscli_url(), local_path)
+        except Exception as e:
+            log.write(f'*** EXCEPTION: "{e}".')
+            log.write(f'*** ERROR: The file {xlib.get_awscli_url()} can not be downloaded.\n')
+            OK = False
+        else:
+            log.write('The file is downloaded.\n')
+
+    # return the control variable
+    return OK
+
+#-------------------------------------------------------------------------------
+
+def install_node_infrastructure_software(cluster_name, node_name, log, is_prepared=False):
+    '''
+    Install infrastructure software in a node.
+    '''
+
+    # initialize the control variable
+    OK = True
+
+    # get the infrastructure software installation script path in local compute
+    local_script_path = get_infrastructure_software_installation_script()
+
+    # set the infrastructure software installation script path in node
+    node_script_path = f'./{os.path.basename(local_script_path)}'
+
+    # set the infrastructure software installation log path in node
+    node_log_path = node_script_path[:node_script_path.find('.sh')] + '.log'
+
+    # build the infrastructure software installation script and download the AWSCLI2 compressed file
+    if not is_prepared:
+        OK = prepare_node_infrastructure_software(cluster_name, log)
+
     # create the SSH client connection
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -206,26 +324,11 @@ def install_node_infrastructure_software(cluster_name, node_name, log):
         sftp_client = xssh.create_sftp_client(ssh_transport)
         log.write('The SFTP client is connected.\n')
 
-    # download the AWSCLI2 compressed file to local computer
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Downloading the {xlib.get_awscli_name()} compressed file to local computer ...\n')
-        local_path = f'{xlib.get_temp_dir()}/{xlib.get_awscli_name()}.zip'
-        if not os.path.exists(os.path.dirname(local_path)):
-            os.makedirs(os.path.dirname(local_path))
-        try:
-            urllib.request.urlretrieve(xlib.get_awscli_url(), local_path)
-        except Exception as e:
-            log.write(f'*** EXCEPTION: "{e}".')
-            log.write(f'*** ERROR: The file {xlib.get_awscli_url()} can not be downloaded.\n')
-            OK = False
-        else:
-            log.write('The file is downloaded.\n')
-
     # upload the AWSCLI2 compressed file to cluster
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Uploading the {xlib.get_awscli_name()} compressed file to the cluster ...\n')
+        local_path = get_awscli_local_path()
         cluster_path = f'./{os.path.basename(local_path)}'
         (OK, error_list) = xssh.put_file(sftp_client, local_path, cluster_path)
         if OK:
@@ -588,6 +691,15 @@ def build_infrastructure_software_installation_script(cluster_name):
 
 #-------------------------------------------------------------------------------
 
+def get_awscli_local_path():
+    '''
+    Get the path of the AWSCLI2 compressed file in the local computer.
+    '''
+
+    return f'{xlib.get_temp_dir()}/{xlib.get_awscli_name()}.zip'
+
+#-------------------------------------------------------------------------------
+
 def get_infrastructure_software_installation_script():
     '''
     Get the infrastructure software installation script path in the local computer.
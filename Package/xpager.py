@@ -0,0 +1,590 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#-------------------------------------------------------------------------------
+
+'''
+This software has been developed by:
+
+    GI Sistemas Naturales e Historia Forestal (formerly known as GI Genetica, Fisiologia e Historia Forestal)
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politecnica de Madrid
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+
+#-------------------------------------------------------------------------------
+
+'''
+This file contains the paging engine used to view large local and cluster files in
+both console mode and gui mode.
+'''
+
+#-------------------------------------------------------------------------------
+
+import bisect
+import collections
+import gzip
+import hashlib
+import mmap
+import os
+import shutil
+import sys
+
+import xlib
+
+#-------------------------------------------------------------------------------
+
+class MmapFileSource(object):
+    '''
+    This class reads byte ranges of a local file through a memory map.
+    '''
+
+    #---------------
+
+    def __init__(self, file_path):
+        '''
+        Execute actions correspending to the creation of a "MmapFileSource" instance.
+        '''
+
+        # save initial parameters in instance variables
+        self.file_path = file_path
+
+        # open the file and map it
+        self.file_id = open(self.file_path, mode='rb')
+        self.mmap = None
+        self.size = 0
+        self.refresh()
+
+    #---------------
+
+    def refresh(self):
+        '''
+        Map the file again when its size has changed and return its size.
+        '''
+
+        size = os.fstat(self.file_id.fileno()).st_size
+        if size != self.size:
+            if self.mmap is not None:
+                self.mmap.close()
+            self.mmap = mmap.mmap(self.file_id.fileno(), 0, access=mmap.ACCESS_READ) if size > 0 else None
+            self.size = size
+
+        return self.size
+
+    #---------------
+
+    def get_size(self):
+        '''
+        Get the file size.
+        '''
+
+        return self.size
+
+    #---------------
+
+    def read(self, offset, length):
+        '''
+        Read a byte range of the file.
+        '''
+
+        if self.mmap is None:
+            return b''
+
+        return self.mmap[offset:offset + length]
+
+    #---------------
+
+    def close(self):
+        '''
+        Unmap and close the file.
+        '''
+
+        if self.mmap is not None:
+            self.mmap.close()
+            self.mmap = None
+        self.file_id.close()
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+class SftpFileSource(object):
+    '''
+    This class reads byte ranges of a cluster file with ranged SFTP reads. The blocks read
+    are kept in a small LRU cache.
+    '''
+
+    #---------------
+
+    def __init__(self, sftp_client, cluster_path):
+        '''
+        Execute actions correspending to the creation of a "SftpFileSource" instance.
+        '''
+
+        # save initial parameters in instance variables
+        self.sftp_client = sftp_client
+        self.cluster_path = cluster_path
+
+        # open the cluster file and initialize the block cache
+        self.sftp_file = self.sftp_client.open(self.cluster_path, mode='rb')
+        self.size = self.sftp_file.stat().st_size
+        self.block_dict = collections.OrderedDict()
+
+    #---------------
+
+    def refresh(self):
+        '''
+        Get the current size of the cluster file and return it; the cached last block is
+        discarded when the size has changed.
+        '''
+
+        size = self.sftp_file.stat().st_size
+        if size != self.size:
+            if size < self.size:
+                self.block_dict.clear()
+            else:
+                self.block_dict.pop(self.size // get_pager_block_size(), None)
+            self.size = size
+
+        return self.size
+
+    #---------------
+
+    def get_size(self):
+        '''
+        Get the file size.
+        '''
+
+        return self.size
+
+    #---------------
+
+    def read(self, offset, length):
+        '''
+        Read a byte range of the cluster file.
+        '''
+
+        # initialize the data list
+        data_list = []
+
+        # get the data of each block in the range
+        block_size = get_pager_block_size()
+        end = min(offset + length, self.size)
+        position = offset
+        while position < end:
+            block_number = position // block_size
+            block = self.get_block(block_number)
+            data_list.append(block[position - block_number * block_size:end - block_number * block_size])
+            position = (block_number + 1) * block_size
+
+        # return the data
+        return b''.join(data_list)
+
+    #---------------
+
+    def get_block(self, block_number):
+        '''
+        Get a block of the cluster file from the cache or read it.
+        '''
+
+        # get the block from the cache
+        block = self.block_dict.get(block_number)
+        if block is not None:
+            self.block_dict.move_to_end(block_number)
+            return block
+
+        # read the block and add it to the cache
+        self.sftp_file.seek(block_number * get_pager_block_size())
+        block = self.sftp_file.read(get_pager_block_size())
+        self.block_dict[block_number] = block
+        if len(self.block_dict) > get_pager_block_cache_size():
+            self.block_dict.popitem(last=False)
+
+        # return the block
+        return block
+
+    #---------------
+
+    def close(self):
+        '''
+        Close the cluster file.
+        '''
+
+        self.sftp_file.close()
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+class FilePager(object):
+    '''
+    This class gets pages of lines of a file source. The line index is built incrementally:
+    it has the number of lines before the beginning of each index block, so that the offset
+    of any line is found by reading only one block.
+    '''
+
+    #---------------
+
+    def __init__(self, source):
+        '''
+        Execute actions correspending to the creation of a "FilePager" instance.
+        '''
+
+        # save initial parameters in instance variables
+        self.source = source
+
+        # initialize the line index
+        self.block_line_list = [0]
+
+    #---------------
+
+    def refresh(self):
+        '''
+        Get the current size of the file; the line index is rebuilt when the file has been
+        truncated or replaced by a shorter one.
+        '''
+
+        size = self.source.refresh()
+        if (len(self.block_line_list) - 1) * get_pager_index_block_size() > size:
+            self.block_line_list = [0]
+
+        return size
+
+    #---------------
+
+    def is_index_complete(self):
+        '''
+        Check if the line index covers all the complete index blocks of the file.
+        '''
+
+        return len(self.block_line_list) * get_pager_index_block_size() > self.source.get_size()
+
+    #---------------
+
+    def extend_index(self, line_number=None, offset=None, max_length=None):
+        '''
+        Count the lines of the index blocks not indexed yet until the line number or the
+        offset are indexed, the maximum length has been read or the end of the file.
+        '''
+
+        # initialize the length read
+        length = 0
+
+        block_size = get_pager_index_block_size()
+        while not self.is_index_complete():
+
+            # check if the requested line or offset are already indexed
+            block_offset = (len(self.block_line_list) - 1) * block_size
+            if line_number is not None and self.block_line_list[-1] >= line_number:
+                break
+            if offset is not None and block_offset > offset:
+                break
+            if max_length is not None and length >= max_length:
+                break
+
+            # count the lines of the complete blocks of the next chunk
+            chunk = self.source.read(block_offset, get_pager_chunk_size())
+            line_count = self.block_line_list[-1]
+            for start in range(0, len(chunk) - block_size + 1, block_size):
+                line_count += chunk.count(b'\n', start, start + block_size)
+                self.block_line_list.append(line_count)
+            length += len(chunk)
+
+    #---------------
+
+    def get_line_offset(self, line_number):
+        '''
+        Get the offset of the beginning of a line (None when the file has less lines).
+        '''
+
+        # the first line begins at the beginning of the file
+        if line_number == 0:
+            return 0
+
+        # find the index block that has the end of the previous line
+        self.extend_index(line_number=line_number)
+        block_number = bisect.bisect_left(self.block_line_list, line_number) - 1
+        block_offset = block_number * get_pager_index_block_size()
+        block = self.source.read(block_offset, get_pager_index_block_size())
+
+        # find the end of the previous line in the block
+        position = -1
+        for _ in range(line_number - self.block_line_list[block_number]):
+            position = block.find(b'\n', position + 1)
+            if position == -1:
+                return None
+        if block_offset + position + 1 >= self.source.get_size():
+            return None
+
+        # return the line offset
+        return block_offset + position + 1
+
+    #---------------
+
+    def get_line_number(self, offset):
+        '''
+        Get the number of the line that has an offset.
+        '''
+
+        self.extend_index(offset=offset)
+        block_number = min(offset // get_pager_index_block_size(), len(self.block_line_list) - 1)
+        block_offset = block_number * get_pager_index_block_size()
+
+        return self.block_line_list[block_number] + self.source.read(block_offset, offset - block_offset).count(b'\n')
+
+    #---------------
+
+    def get_line_count(self):
+        '''
+        Get the number of lines of the file (the whole line index is built).
+        '''
+
+        # index all the complete blocks
+        self.extend_index()
+
+        # count the lines of the last block
+        size = self.source.get_size()
+        block_offset = (len(self.block_line_list) - 1) * get_pager_index_block_size()
+        tail = self.source.read(block_offset, size - block_offset)
+        line_count = self.block_line_list[-1] + tail.count(b'\n')
+        if size > 0 and not self.source.read(size - 1, 1) == b'\n':
+            line_count += 1
+
+        # return the line count
+        return line_count
+
+    #---------------
+
+    def get_estimated_line_count(self):
+        '''
+        Get the number of lines of the file when the line index is complete or an estimation
+        from the lines indexed until now.
+        '''
+
+        if len(self.block_line_list) == 1:
+            self.extend_index(max_length=get_pager_chunk_size())
+        if self.is_index_complete():
+            return self.get_line_count()
+
+        indexed_length = (len(self.block_line_list) - 1) * get_pager_index_block_size()
+        return max(1, round(self.block_line_list[-1] * self.source.get_size() / indexed_length))
+
+    #---------------
+
+    def get_lines(self, first_line_number, line_number):
+        '''
+        Get a page of lines beginning at a line number.
+        '''
+
+        # get the offset of the first line
+        offset = self.get_line_offset(first_line_number)
+        if offset is None or offset >= self.source.get_size():
+            return []
+
+        # read until the lines of the page are complete or the end of the file
+        data = b''
+        size = self.source.get_size()
+        read_length = get_pager_index_block_size()
+        while data.count(b'\n') < line_number and offset + len(data) < size:
+            data += self.source.read(offset + len(data), read_length)
+
+        # return the lines (without the empty string after the last new line character)
+        line_list = data.decode('iso-8859-1').split('\n')
+        if offset + len(data) >= size and data.endswith(b'\n'):
+            line_list.pop()
+        return [line.rstrip('\r') for line in line_list[:line_number]]
+
+    #---------------
+
+    def search(self, text, line_number, backwards=False, case_sensitive=False):
+        '''
+        Search a text after a line (or before it when backwards) and return the number of
+        the line where it is found or None.
+        '''
+
+        # build the pattern
+        pattern = text.encode('iso-8859-1', errors='replace')
+        if not case_sensitive:
+            pattern = pattern.lower()
+        if pattern == b'':
+            return None
+
+        chunk_size = get_pager_chunk_size()
+        overlap = len(pattern) - 1
+        size = self.source.get_size()
+
+        # search forwards from the beginning of the next line
+        if not backwards:
+            offset = self.get_line_offset(line_number + 1)
+            while offset is not None and offset < size:
+                chunk = self.source.read(offset, chunk_size + overlap)
+                position = (chunk if case_sensitive else chunk.lower()).find(pattern)
+                if position > -1:
+                    return self.get_line_number(offset + position)
+                offset += chunk_size
+
+        # search backwards from the beginning of the line
+        else:
+            end = self.get_line_offset(line_number)
+            end = size if end is None else end
+            while end > 0:
+                start = max(0, end - chunk_size)
+                chunk = self.source.read(start, end - start + overlap)
+                position = (chunk if case_sensitive else chunk.lower()).rfind(pattern, 0, end - start + overlap)
+                if position > -1 and start + position < end:
+                    return self.get_line_number(start + position)
+                end = start
+
+        # the text is not found
+        return None
+
+    #---------------
+
+    def close(self):
+        '''
+        Close the file source.
+        '''
+
+        self.source.close()
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+def open_local_file_pager(file_path):
+    '''
+    Create the pager of a local file. A gzip file is decompressed once in a cache file of
+    the temporal directory, which is memory-mapped like any other file.
+    '''
+
+    # decompress a gzip file
+    if is_gzip_file(file_path):
+        file_path = decompress_to_cache_file(file_path)
+
+    # return the pager
+    return FilePager(MmapFileSource(file_path))
+
+#-------------------------------------------------------------------------------
+
+def open_cluster_file_pager(sftp_client, cluster_path):
+    '''
+    Create the pager of a cluster file read with ranged SFTP reads. A gzip file is
+    downloaded and paged as a local file.
+    '''
+
+    # check if the cluster file is a gzip file
+    with sftp_client.open(cluster_path, mode='rb') as sftp_file:
+        is_gzip = sftp_file.read(2) == get_gzip_magic_number()
+
+    # download a gzip file (in a partial file, so a local copy being paged is not truncated)
+    if is_gzip:
+        local_path = get_cache_file(cluster_path, '')
+        if not os.path.exists(xlib.get_temp_dir()):
+            os.makedirs(xlib.get_temp_dir())
+        sftp_client.get(cluster_path, f'{local_path}.part')
+        os.replace(f'{local_path}.part', local_path)
+        return open_local_file_pager(local_path)
+
+    # return the pager
+    return FilePager(SftpFileSource(sftp_client, cluster_path))
+
+#-------------------------------------------------------------------------------
+
+def is_gzip_file(file_path):
+    '''
+    Check if a local file is a gzip file by its magic number.
+    '''
+
+    with open(file_path, mode='rb') as file_id:
+        return file_id.read(2) == get_gzip_magic_number()
+
+#-------------------------------------------------------------------------------
+
+def decompress_to_cache_file(file_path):
+    '''
+    Decompress a gzip file in a cache file of the temporal directory, unless the cache
+    file is newer than the gzip file, and return the cache file path.
+    '''
+
+    # get the cache file path
+    cache_file = get_cache_file(os.path.abspath(file_path))
+
+    # decompress the gzip file when the cache file is missing or older
+    if not os.path.isfile(cache_file) or os.path.getmtime(cache_file) < os.path.getmtime(file_path):
+        if not os.path.exists(xlib.get_temp_dir()):
+            os.makedirs(xlib.get_temp_dir())
+        with gzip.open(file_path, mode='rb') as gzip_file_id, open(f'{cache_file}.tmp', mode='wb') as cache_file_id:
+            shutil.copyfileobj(gzip_file_id, cache_file_id, get_pager_chunk_size())
+        os.replace(f'{cache_file}.tmp', cache_file)
+
+    # return the cache file path
+    return cache_file
+
+#-------------------------------------------------------------------------------
+
+def get_cache_file(source_path, extension='.pager'):
+    '''
+    Get the path of the cache file of a source file in the temporal directory. The name
+    contains a hash of the full source path, so files with the same name do not collide.
+    '''
+
+    source_hash = hashlib.md5(source_path.encode('utf-8')).hexdigest()[:16]
+
+    return f'{xlib.get_temp_dir()}/{source_hash}-{os.path.basename(source_path)}{extension}'
+
+#-------------------------------------------------------------------------------
+
+def get_gzip_magic_number():
+    '''
+    Get the first bytes of the gzip files.
+    '''
+
+    return b'\x1f\x8b'
+
+#-------------------------------------------------------------------------------
+
+def get_pager_index_block_size():
+    '''
+    Get the size of the blocks of the line index.
+    '''
+
+    return 65536
+
+#-------------------------------------------------------------------------------
+
+def get_pager_chunk_size():
+    '''
+    Get the size of the chunks read to build the line index and to search.
+    '''
+
+    return 4194304
+
+#-------------------------------------------------------------------------------
+
+def get_pager_block_size():
+    '''
+    Get the size of the blocks read from cluster files.
+    '''
+
+    return 1048576
+
+#-------------------------------------------------------------------------------
+
+def get_pager_block_cache_size():
+    '''
+    Get the number of blocks of a cluster file kept in the cache.
+    '''
+
+    return 16
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    print('This file contains the paging engine used to view large local and cluster files in both console mode and gui mode.')
+    sys.exit(0)
+
+#-------------------------------------------------------------------------------
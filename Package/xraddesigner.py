@@ -203,17 +203,6 @@ def install_raddesigner(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the RADdesigner installation script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_raddesigner_installation_script())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_raddesigner_installation_script())}'
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the RADdesigner installation starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -236,22 +225,11 @@ def install_raddesigner(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the RADdesigner installation starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_raddesigner_installation_starter())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_raddesigner_installation_starter())}'
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the RADdesigner installation
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(get_raddesigner_installation_starter())} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_raddesigner_installation_starter()), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_raddesigner_installation_starter()), log, run_permission_list=[os.path.basename(get_raddesigner_installation_script()), os.path.basename(get_raddesigner_installation_starter())])
 
     # close the SSH client connection
     if OK:
@@ -928,17 +906,6 @@ def run_raddesigner_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the RADdesigner process script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_raddesigner_process_script())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_raddesigner_process_script())}'
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the RADdesigner process starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -962,22 +929,11 @@ def run_raddesigner_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the RADdesigner process starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_raddesigner_process_starter())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_raddesigner_process_starter())}'
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the RADdesigner process
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(get_raddesigner_process_starter())} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_raddesigner_process_starter()), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_raddesigner_process_starter()), log, run_permission_list=[os.path.basename(get_raddesigner_process_script()), os.path.basename(get_raddesigner_process_starter())])
 
     # close the SSH transport connection
     if OK:
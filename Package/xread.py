@@ -32,6 +32,7 @@ import sys
 import xconfiguration
 import xec2
 import xlib
+import xmetadata
 import xssh
 
 #-------------------------------------------------------------------------------
@@ -59,6 +60,8 @@ def create_read_transfer_config_file(experiment_id='exp001', local_dir='./data',
             file_id.write( '# This section has the information identifies the experiment.\n')
             file_id.write( '[identification]\n')
             file_id.write( '{0:<50} {1}\n'.format(f'experiment_id = {experiment_id}', '# experiment identification'))
+            file_id.write( '{0:<50} {1}\n'.format(f'upload_streams = {xssh.get_upload_stream_number()}', '# number of files uploaded concurrently'))
+            file_id.write( '{0:<50} {1}\n'.format('compression = none', '# compression while uploading: none or gzip (the files are written with extension .gz)'))
             for i in range(len(selected_file_list)):
                 file_id.write( '\n')
                 if i == 0:
@@ -109,16 +112,6 @@ def upload_read_dataset(cluster_name, log, function=None):
         for error in error_list:
             log.write(f'{error}\n')
 
-    # create the SSH transport connection
-    if OK:
-        (OK, error_list, ssh_transport) = xssh.create_ssh_transport_connection(cluster_name)
-        for error in error_list:
-            log.write(f'{error}\n')
-
-    # create the SFTP client 
-    if OK:
-        sftp_client = xssh.create_sftp_client(ssh_transport)
-
     # get the option dictionary
     if OK:
         read_transfer_options_dict = xlib.get_option_dict(read_transfer_config_file)
@@ -162,30 +155,29 @@ def upload_read_dataset(cluster_name, log, function=None):
             sections_list.append(section)
         sections_list.sort()
 
-        # for each section "file-n"
+        # build the list of local paths and cluster paths of sections "file-n"
+        path_pair_list = []
         for section in sections_list:
 
             # check than the section identification is like file-n 
             if re.match('^file-[0-9]+$', section):
 
-                # get local path and cluster directory
+                # get local path and cluster path
                 local_path = read_transfer_options_dict[section]['local_path']
-
-                # upload the reference file to the cluster
-                log.write(f'{xlib.get_separator()}\n')
-                log.write('The file {0} is being uploaded to {1} ...\n'.format(local_path, cluster_experiment_reads_dir))
                 cluster_path = '{0}/{1}'.format(cluster_experiment_reads_dir, os.path.basename(local_path))
-                (OK, error_list) = xssh.put_file(sftp_client, local_path, cluster_path)
-                if OK:
-                    log.write('The file has been uploaded.\n')
-                else:
-                    for error in error_list:
-                        log.write(f'{error}\n')
-                    break
+                path_pair_list.append((local_path, cluster_path))
 
-    # close the SSH transport connection
-    if OK:
-        xssh.close_ssh_transport_connection(ssh_transport)
+        # upload the read files to the cluster
+        log.write(f'{xlib.get_separator()}\n')
+        log.write('The read files are being uploaded to {0} ...\n'.format(cluster_experiment_reads_dir))
+        upload_streams = read_transfer_options_dict['identification'].get('upload_streams', xssh.get_upload_stream_number())
+        compression = read_transfer_options_dict['identification'].get('compression', 'none').lower()
+        (OK, error_list) = xssh.put_file_list(cluster_name, path_pair_list, log, stream_number=upload_streams, compression=compression)
+        if OK:
+            log.write('The files have been uploaded.\n')
+
+    # refresh the dataset catalog of the cluster in the next query
+    xmetadata.invalidate_dataset_catalog(cluster_name)
 
     # close the SSH client connection
     if OK:
@@ -248,6 +240,18 @@ def check_read_transfer_config_file(strict):
                 error_list.append('*** ERROR: the key "experiment_id" is not found in the section "identification".')
                 OK = False
 
+            # check section "identification" - key "upload_streams" (optional)
+            upload_streams = read_transfer_options_dict.get('identification', {}).get('upload_streams', not_found)
+            if upload_streams != not_found and not xlib.check_int(upload_streams, minimum=1, maximum=16):
+                error_list.append('*** ERROR: the key "upload_streams" has to be an integer number between 1 and 16.')
+                OK = False
+
+            # check section "identification" - key "compression" (optional)
+            compression = read_transfer_options_dict.get('identification', {}).get('compression', not_found)
+            if compression != not_found and compression.lower() not in ['none', 'gzip']:
+                error_list.append('*** ERROR: the key "compression" has to be none or gzip.')
+                OK = False
+
         # check section "file-1"
         if 'file-1' not in sections_list:
             error_list.append('*** ERROR: the section "file-1" is not found.')
@@ -308,52 +312,28 @@ def get_read_dataset_dict(cluster_name, experiment_id, passed_connection=False,
     # initialize the dictionary of the read datasets
     read_dataset_dict = {}
 
-    # create the SSH client connection
-    if not passed_connection:
-        (OK, error_list, ssh_client) = xssh.create_ssh_client_connection(cluster_name)
+    # get the dataset catalog of the cluster
+    (OK, error_list, dataset_catalog) = xmetadata.get_dataset_catalog(cluster_name, passed_connection, ssh_client)
 
     # check the read directory is created
     if OK:
-        command = '[ -d {0} ] && echo RC=0 || echo RC=1'.format(cluster_read_dir)
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
-        if stdout[len(stdout) - 1] != 'RC=0':
+        if 'read' not in dataset_catalog['root_list']:
             error_list.append('*** ERROR: There is not any volume mounted in the read directory.\n')
             error_list.append('You have to link a volume in the mounting point {0} for the cluster {1}.\n'.format(cluster_read_dir, cluster_name))
             OK = False
 
     # get the dictionary of the read datasets
     if OK:
-        command = 'ls {0}/{1}'.format(cluster_read_dir, experiment_id)
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    read_dataset_id = line
-                    if read_dataset_id == xlib.get_uploaded_read_dataset_name():
-                        read_dataset_name = 'uploaded reads'
-                    elif read_dataset_id.startswith(xlib.get_cutadapt_code()):
-                        mo = re.match('{0}-(.+)-(.+)'.format(xlib.get_cutadapt_code()), read_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        read_dataset_name = '{0} ({1} {2})'.format(xlib.get_cutadapt_name(), date, time)
-                    elif read_dataset_id.startswith(xlib.get_insilico_read_normalization_code()):
-                        mo = re.match('{0}-(.+)-(.+)'.format(xlib.get_insilico_read_normalization_code()), read_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        read_dataset_name = '{0} ({1} {2})'.format(xlib.get_insilico_read_normalization_name(), date, time)
-                    elif read_dataset_id.startswith(xlib.get_trimmomatic_code()):
-                        mo = re.match('{0}-(.+)-(.+)'.format(xlib.get_trimmomatic_code()), read_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        read_dataset_name = '{0} ({1} {2})'.format(xlib.get_trimmomatic_name(), date, time)
-                    else:
-                        read_dataset_name = read_dataset_id
-                    read_dataset_dict[read_dataset_id] = {'read_dataset_id': read_dataset_id, 'read_dataset_name': read_dataset_name}
-
-    # close the SSH client connection
-    if OK and not passed_connection:
-        xssh.close_ssh_client_connection(ssh_client)
+        for read_dataset_id in sorted(xmetadata.get_child_dict(dataset_catalog, 'read', experiment_id).keys()):
+            if read_dataset_id == xlib.get_uploaded_read_dataset_name():
+                read_dataset_name = 'uploaded reads'
+            else:
+                (app, date, time) = xlib.classify_dataset_id(read_dataset_id, 'read')
+                if app is not None:
+                    read_dataset_name = '{0} ({1} {2})'.format(app['name'], date, time)
+                else:
+                    read_dataset_name = read_dataset_id
+            read_dataset_dict[read_dataset_id] = {'read_dataset_id': read_dataset_id, 'read_dataset_name': read_dataset_name}
 
     # return the control variable, error list and dictionary of the read datasets
     return (OK, error_list, read_dataset_dict)
@@ -33,6 +33,7 @@ import sys
 import xconfiguration
 import xec2
 import xlib
+import xmetadata
 import xssh
 
 #-------------------------------------------------------------------------------
@@ -132,6 +133,9 @@ def download_result_dataset(cluster_name, log, function=None):
     # download the result dataset
     if OK:
 
+        # initialize the dictionary of the MD5 computed while the files are downloaded
+        md5_dict = {}
+
         # get the sections list
         sections_list = []
         for section in result_transfer_options_dict.keys():
@@ -167,7 +171,7 @@ def download_result_dataset(cluster_name, log, function=None):
                     # download the result file from the cluster
                     log.write(f'{xlib.get_separator()}\n')
                     log.write('Downloading the file {0} to {1} ...\n'.format(cluster_path, local_dir))
-                    (OK, error_list) = xssh.get_file(sftp_client, cluster_path, local_path)
+                    (OK, error_list, _, md5_dict[cluster_path]) = xssh.get_file_resumable(sftp_client, cluster_path, local_path)
                     if OK:
                         log.write('The file has been downloaded.\n')
                     else:
@@ -185,13 +189,24 @@ def download_result_dataset(cluster_name, log, function=None):
             # download the result file from the cluster
             log.write(f'{xlib.get_separator()}\n')
             log.write('Downloading the file {0} to {1} ...\n'.format(cluster_path, local_dir))
-            (OK, error_list) = xssh.get_file(sftp_client, cluster_path, local_path)
+            (OK, error_list, _, md5_dict[cluster_path]) = xssh.get_file_resumable(sftp_client, cluster_path, local_path)
             if OK:
                 log.write('The file has been downloaded.\n')
             else:
                 for error in error_list:
                     log.write(f'{error}\n')
 
+        # verify the downloaded files against the cluster checksums
+        if OK and md5_dict != {}:
+            log.write(f'{xlib.get_separator()}\n')
+            log.write('Verifying the checksums of the downloaded files ...\n')
+            (OK, error_list) = xssh.compare_cluster_file_checksums(ssh_client, sftp_client, md5_dict, update_manifest=False)
+            if OK:
+                log.write('The checksums are OK.\n')
+            else:
+                for error in error_list:
+                    log.write(f'{error}\n')
+
     # close the SSH transport connection
     if OK:
         xssh.close_ssh_transport_connection(ssh_transport)
@@ -348,15 +363,12 @@ def get_result_dataset_dict(cluster_name, experiment_id, status, passed_connecti
     # initialize the dictionary of the result datasets
     result_dataset_dict = {}
 
-    # create the SSH client connection
-    if not passed_connection:
-        (OK, error_list, ssh_client) = xssh.create_ssh_client_connection(cluster_name)
+    # get the dataset catalog of the cluster
+    (OK, error_list, dataset_catalog) = xmetadata.get_dataset_catalog(cluster_name, passed_connection, ssh_client)
 
     # check the result directory is created
     if OK:
-        command = '[ -d {0} ] && echo RC=0 || echo RC=1'.format(cluster_result_dir)
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
-        if stdout[len(stdout) - 1] != 'RC=0':
+        if 'result' not in dataset_catalog['root_list']:
             error_list.append('*** ERROR: There is not any volume mounted in the result directory.\n')
             error_list.append('You have to link a volume in the mounting point {0} for the cluster {1}.\n'.format(cluster_result_dir, cluster_name))
             OK = False
@@ -364,213 +376,21 @@ def get_result_dataset_dict(cluster_name, experiment_id, status, passed_connecti
     # get the dictionary of the result datasets
     if OK:
         if status == 'uncompressed':
-            command = 'cd  {0}/{1}; for list in `ls`; do ls -ld $list | grep -v ^- > /dev/null && echo $list; done;'.format(cluster_result_dir, experiment_id)
+            output_pattern = '{0} ({1} {2})'
+            excluded_type = 'f'
         elif status == 'compressed':
-            command = 'cd {0}/{1}; for list in `ls`; do ls -ld $list | grep -v ^d > /dev/null && echo $list; done;'.format(cluster_result_dir, experiment_id)
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            if status == 'uncompressed':
-                input_pattern = '{0}-(.+)-(.+)'
-                output_pattern = '{0} ({1} {2})'
-            elif status == 'compressed':
-                input_pattern = '{0}-(.+)-(.+).tar.gz'
-                output_pattern = '{0} ({1} {2}) [compressed]'
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    result_dataset_id = line
-                    if result_dataset_id.startswith(xlib.get_bowtie2_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_bowtie2_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_bowtie2_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_busco_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_busco_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_busco_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_cd_hit_est_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_cd_hit_est_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_cd_hit_est_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_cutadapt_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_cutadapt_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_cutadapt_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_cuffdiff_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_cuffdiff_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_cuffdiff_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_cufflinks_cuffmerge_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_cufflinks_cuffmerge_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_cufflinks_cuffmerge_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_cuffnorm_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_cuffnorm_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_cuffnorm_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_cuffquant_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_cuffquant_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_cuffquant_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_ddradseq_simulation_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_ddradseq_simulation_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_ddradseq_simulation_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_fastqc_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_fastqc_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_fastqc_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_ggtrinity_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_ggtrinity_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_ggtrinity_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_gmap_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_gmap_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_gmap_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_gsnap_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_gsnap_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_gsnap_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_gzip_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_gzip_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_gzip_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_hisat2_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_hisat2_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_hisat2_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_htseq_count_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_htseq_count_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_htseq_count_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_insilico_read_normalization_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_insilico_read_normalization_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_insilico_read_normalization_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_ipyrad_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_ipyrad_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_ipyrad_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_kallisto_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_kallisto_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_kallisto_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_quast_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_quast_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_quast_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_ref_eval_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_ref_eval_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_ref_eval_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_rnaquast_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_rnaquast_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_rnaquast_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_rsem_eval_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_rsem_eval_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_rsem_eval_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_rsitesearch_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_rsitesearch_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_rsitesearch_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_soapdenovo2_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_soapdenovo2_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_soapdenovo2_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_soapdenovotrans_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_soapdenovotrans_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_soapdenovotrans_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_star_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_star_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_star_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_starcode_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_starcode_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_starcode_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_toa_process_pipeline_aminoacid_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_toa_process_pipeline_aminoacid_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_toa_process_pipeline_aminoacid_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_toa_process_pipeline_nucleotide_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_toa_process_pipeline_nucleotide_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_toa_process_pipeline_nucleotide_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_tophat_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_tophat_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_tophat_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_transabyss_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_transabyss_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_transabyss_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_transcript_filter_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_transcript_filter_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_transcript_filter_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_transcriptome_blastx_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_transcriptome_blastx_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_transcriptome_blastx_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_transrate_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_transrate_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_transrate_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_trimmomatic_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_trimmomatic_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_trimmomatic_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_trinity_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_trinity_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_trinity_name(), date, time)
-                    else:
-                        result_dataset_name = result_dataset_id
-                    result_dataset_dict[result_dataset_id] = {'result_dataset_id': result_dataset_id, 'result_dataset_name': result_dataset_name}
-
-    # close the SSH client connection
-    if OK and not passed_connection:
-        xssh.close_ssh_client_connection(ssh_client)
+            output_pattern = '{0} ({1} {2}) [compressed]'
+            excluded_type = 'd'
+        experiment_dataset_dict = xmetadata.get_child_dict(dataset_catalog, 'result', experiment_id)
+        for result_dataset_id in sorted(experiment_dataset_dict.keys()):
+            if experiment_dataset_dict[result_dataset_id]['type'] == excluded_type:
+                continue
+            (app, date, time) = xlib.classify_dataset_id(result_dataset_id, 'result')
+            if app is not None:
+                result_dataset_name = output_pattern.format(app['name'], date, time)
+            else:
+                result_dataset_name = result_dataset_id
+            result_dataset_dict[result_dataset_id] = {'result_dataset_id': result_dataset_id, 'result_dataset_name': result_dataset_name}
 
     # return the control variable, error list and dictionary of the result datasets
     return (OK, error_list, result_dataset_dict)
@@ -273,16 +273,6 @@ def run_soapdenovotrans_process(cluster_name, log, function=None):
                     log.write(f'{error}\n')
                 break
 
-            # set run permision to the process script in the cluster
-            log.write(f'{xlib.get_separator()}\n')
-            log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_soapdenovotrans_process_script())} ...\n')
-            command = f'chmod u+x {current_run_dir}/{os.path.basename(get_soapdenovotrans_process_script())}'
-            (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-            if OK:
-                log.write('The run permision is set on.\n')
-            else:
-                log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
             # build the process starter
             log.write(f'{xlib.get_separator()}\n')
             log.write(f'Building the process starter {get_soapdenovotrans_process_starter()} ...\n')
@@ -305,20 +295,10 @@ def run_soapdenovotrans_process(cluster_name, log, function=None):
                     log.write(f'{error}\n')
                 break
 
-            # set run permision to the process starter in the cluster
-            log.write(f'{xlib.get_separator()}\n')
-            log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_soapdenovotrans_process_starter())} ...\n')
-            command = f'chmod u+x {current_run_dir}/{os.path.basename(get_soapdenovotrans_process_starter())}'
-            (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-            if OK:
-                log.write('The run permision is set on.\n')
-            else:
-                log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
             # submit the process
             log.write(f'{xlib.get_separator()}\n')
             log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(get_soapdenovotrans_process_starter())} ...\n')
-            OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_soapdenovotrans_process_starter()), log)
+            OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_soapdenovotrans_process_starter()), log, run_permission_list=[os.path.basename(get_soapdenovotrans_process_script()), os.path.basename(get_soapdenovotrans_process_starter())])
 
     # close the SSH transport connection
     if OK:
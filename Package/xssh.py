@@ -22,70 +22,50 @@ This file contains the functions related to the SSH used in both console mode an
 '''
 #-------------------------------------------------------------------------------
 
+import atexit
+import concurrent.futures
+import hashlib
 import io
+import json
 import os
 import re
+import shlex
+import socket
+import threading
+import time
+import zlib
 
 import paramiko
 
 import xconfiguration
 import xcluster
 import xec2
+import xlib
+import xmetadata
 import sys
 
 #-------------------------------------------------------------------------------
 
+# pattern of the non-ASCII caracters written by cluster commands
+non_ascii_pattern = re.compile(b'[^\x00-\x7F]+')
+
+#-------------------------------------------------------------------------------
+
 def create_ssh_client_connection(cluster_name, node_name=None, user='root'):
     '''
+    Get a SSH client connection to a node of a cluster. The connection is
+    multiplexed over the pooled SSH session of the node.
     '''
 
-    # initialize the control variable and the error list
-    OK = True
-    error_list = []
-
     # initialize the SSH client object
     ssh_client = None
 
-    # set the node name when it is None
-    if node_name is None:
-        if xec2.get_cluster_mode(cluster_name) == xconfiguration.get_cluster_mode_native():
-            node_name = 'instance'
-        elif xec2.get_cluster_mode(cluster_name) == xconfiguration.get_cluster_mode_starcluster():
-            node_name = 'master'
-
-    # initialize the port
-    port = 22
-
-    # get the keypair file
-    keypair_file = xconfiguration.get_keypair_file()
-
-    # get the public dns nameof the master node in the cluster
-    public_dns_name = xec2.get_node_public_dns_name(cluster_name, node_name)
+    # get the pooled SSH session of the node
+    (OK, error_list, ssh_session) = acquire_ssh_session(cluster_name, node_name, user)
 
     # create the SSH client object
-    ssh_client = paramiko.SSHClient()
-
-    # get the RSA key text from the corresponding file
-    try:
-        file = open(keypair_file,'r')
-        records = file.read()
-        records_inmemory = io.StringIO(records)
-        rsakey = paramiko.RSAKey.from_private_key(records_inmemory)
-    except Exception as e:
-        error_list.append('*** ERROR: The file {0} can not be read.'.format(keypair_file))
-        OK = False
-
-    # accept auto-accept unknown keys
-    if OK:
-        ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-    
-    # start the connection
     if OK:
-        try:
-            ssh_client.connect(public_dns_name, port, user, pkey=rsakey)
-        except Exception as e:
-            error_list.append('*** ERROR: {0} can not be connected.'.format(public_dns_name))
-            OK = False
+        ssh_client = PooledSSHClient(ssh_session)
 
     # return the control variable, the error list and the SSH client object
     return (OK, error_list, ssh_client)
@@ -94,49 +74,108 @@ def create_ssh_client_connection(cluster_name, node_name=None, user='root'):
 
 def execute_cluster_command(ssh_client, command):
     '''
+    Execute a command in the SSH client and return the control variable and
+    its stdout and stderr lines.
     '''
 
-    # initialize the control variable
-    OK = True
+    # initialize the string lines list corresponding to the stderr
+    stderr_string_lines_list = []
+
+    # build a string lines list corresponding to the stdout while the stderr is drained
+    stdout_string_lines_list = list(iterate_cluster_command(ssh_client, command, stderr_string_lines_list))
+
+    # set False to OK variable if there are any stderr lines
+    OK = stderr_string_lines_list == []
+
+    # return the control variable and the stdout and stderr lines
+    return (OK, stdout_string_lines_list, stderr_string_lines_list)
+
+#-------------------------------------------------------------------------------
+
+def execute_cluster_command_stream(ssh_client, command, function):
+    '''
+    Execute a command in the SSH client and call the function with each stdout
+    line as soon as it arrives.
+    '''
+
+    # initialize the string lines list corresponding to the stderr
+    stderr_string_lines_list = []
+
+    # pass each stdout line to the function
+    for stdout_string_line in iterate_cluster_command(ssh_client, command, stderr_string_lines_list):
+        function(stdout_string_line)
+
+    # set False to OK variable if there are any stderr lines
+    OK = stderr_string_lines_list == []
+
+    # return the control variable and the stderr lines
+    return (OK, stderr_string_lines_list)
+
+#-------------------------------------------------------------------------------
+
+def iterate_cluster_command(ssh_client, command, stderr_string_lines_list=None):
+    '''
+    Execute a command in the SSH client and yield its stdout lines as they arrive.
+    The stderr is drained concurrently so that the channel can not be blocked,
+    and its lines are added to stderr_string_lines_list when the command ends.
+    '''
 
     # execute the command in the ssh client
     (stdin, stdout, stderr) = ssh_client.exec_command(command)
+    channel = stdout.channel
 
-    # flush the stdout internal buffer
-    stdout.flush()
+    # drain the stderr in a thread
+    stderr_bytes_list = []
+    stderr_thread = threading.Thread(target=lambda: stderr_bytes_list.append(stderr.read()), daemon=True)
+    stderr_thread.start()
 
-    # initialize the string lines list corresponding to stdout
-    stdout_string_lines_list = []
+    try:
 
-    # build a string lines list corresponding to the stdout
-    for stdout_bytes_line in stdout.read().splitlines():
-        # non-ASCII caracters are replaces by one blank space
-        stdout_bytes_line = re.sub(b'[^\x00-\x7F]+', b' ', stdout_bytes_line)
-        # create a string from the bytes literal
-        stdout_string_line = stdout_bytes_line.decode('utf-8')
-        # add the string line to the string lines list
-        stdout_string_lines_list.append(stdout_string_line)
+        # yield the complete lines of each stdout chunk
+        pending_bytes = b''
+        while True:
+            chunk = channel.recv(get_stream_chunk_size())
+            if not chunk:
+                break
+            pending_bytes += chunk
+            position = pending_bytes.rfind(b'\n')
+            if position > -1:
+                yield from decode_cluster_output(pending_bytes[:position + 1])
+                pending_bytes = pending_bytes[position + 1:]
+
+        # yield the last line without new line character
+        if pending_bytes != b'':
+            yield from decode_cluster_output(pending_bytes)
+
+    finally:
+
+        # close the channel if the iteration is interrupted
+        if not channel.exit_status_ready():
+            channel.close()
+
+        # get the stderr lines
+        stderr_thread.join()
+        if stderr_string_lines_list is not None:
+            stderr_string_lines_list.extend(decode_cluster_output(b''.join(stderr_bytes_list)))
 
-    # flush the stderr internal buffer
-    stderr.flush()
+#-------------------------------------------------------------------------------
 
-    # initialize the string lines corresponding to the stderr
-    stderr_string_lines_list = []
+def decode_cluster_output(output_bytes):
+    '''
+    Convert a block of bytes written by a cluster command into a string lines list.
+    Non-ASCII caracters are replaced by one blank space in the whole block.
+    '''
 
-    # build a string lines list corresponding to the stderr and set False to OK variable if there are any lines
-    stderr_bytes_lines_list = stderr.read().splitlines()
-    if stderr_bytes_lines_list != []:
-        OK = False
-        for stderr_bytes_line in stderr_bytes_lines_list:
-            # non-ASCII caracters are replaces by one blank space
-            stderr_bytes_line = re.sub(b'[^\x00-\x7F]+', b' ', stderr_bytes_line)
-            # create a string from the bytes literal
-            stderr_string_line = stderr_bytes_line.decode('utf-8')
-            # add the string line to the string lines list
-            stderr_string_lines_list.append(stderr_string_line)
-
-    # return the control variableThis file contains the functions related to the SSH used in both console mode and gui mode.
-    return (OK, stdout_string_lines_list, stderr_string_lines_list)
+    return [bytes_line.decode('utf-8') for bytes_line in non_ascii_pattern.sub(b' ', output_bytes).splitlines()]
+
+#-------------------------------------------------------------------------------
+
+def get_stream_chunk_size():
+    '''
+    Get the size of the chunks read from the channels of streamed commands.
+    '''
+
+    return 32768
 
 #-------------------------------------------------------------------------------
 
@@ -144,63 +183,26 @@ def close_ssh_client_connection(ssh_client):
     '''
     '''
 
-    # close the connection of the SSH client object
+    # release the SSH client object (the pooled SSH session remains open)
     ssh_client.close()
 
 #-------------------------------------------------------------------------------
 
 def create_ssh_transport_connection(cluster_name, node_name=None, user='root'):
     '''
+    Get a SSH transport connection to a node of a cluster. The connection is
+    multiplexed over the pooled SSH session of the node.
     '''
 
-    # initialize the control variable and the error list
-    OK = True
-    error_list = []
-
     # initialize the SSH transport objet
     ssh_transport = None
 
-    # set the node name when it is None
-    if node_name is None:
-        if xec2.get_cluster_mode(cluster_name) == xconfiguration.get_cluster_mode_native():
-            node_name = 'instance'
-        elif xec2.get_cluster_mode(cluster_name) == xconfiguration.get_cluster_mode_starcluster():
-            node_name = 'master'
-
-    # initialize the port
-    port = 22
-
-    # get the keypair file
-    keypair_file = xconfiguration.get_keypair_file()
-
-    # get the public dns nameof the master node in the cluster
-    public_dns_name = xec2.get_node_public_dns_name(cluster_name, node_name)
+    # get the pooled SSH session of the node
+    (OK, error_list, ssh_session) = acquire_ssh_session(cluster_name, node_name, user)
 
     # create the SSH transport object
-    try:
-        ssh_transport = paramiko.Transport((public_dns_name, port))
-    except Exception as e:
-        error_list.append('*** ERROR: {0} can not be connected.'.format(public_dns_name))
-        OK = False
-
-    # get the RSA key text from the corresponding file
-    if OK:
-        try:
-            file = open(keypair_file,'r')
-            records = file.read()
-            records_inmemory = io.StringIO(records)
-            rsakey = paramiko.RSAKey.from_private_key(records_inmemory)
-        except Exception as e:
-            error_list.append('*** ERROR: The file {0} can not be read.'.format(keypair_file))
-            OK = False
-    
-    # start the connection
     if OK:
-        try:
-            ssh_transport.connect(username=user, pkey=rsakey)
-        except Exception as e:
-            error_list.append('*** ERROR: User/pkey is not valid in {0}.'.format(public_dns_name))
-            OK = False
+        ssh_transport = PooledSSHTransport(ssh_session)
 
     # return the control variable, the error list and the SSH transport objet
     return (OK, error_list, ssh_transport)
@@ -211,8 +213,8 @@ def create_sftp_client(ssh_transport):
     '''
     '''
 
-    # create the SFTP client object
-    sftp_client = paramiko.SFTPClient.from_transport(ssh_transport)
+    # create the SFTP client object over a new channel of the pooled SSH session
+    sftp_client = ssh_transport.open_sftp_client()
 
     # return the SFTP client object
     return sftp_client
@@ -221,76 +223,1771 @@ def create_sftp_client(ssh_transport):
 
 def put_file(sftp_client, local_path, cluster_path):
     '''
+    Upload a local file to the cluster. An interrupted upload of a large file
+    is resumed from its last verified chunk.
+    '''
+
+    # upload the local file to the cluster
+    (OK, error_list, _, _) = put_file_resumable(sftp_client, local_path, cluster_path)
+
+    # return the control variable and the error list
+    return (OK, error_list)
+
+#-------------------------------------------------------------------------------
+
+def get_file(sftp_client, cluster_path, local_path):
+    '''
+    Download a cluster file to the local machine. An interrupted download of a
+    large file is resumed from its last verified chunk.
+    '''
+
+    # download the cluster file to the local machine
+    (OK, error_list, _, _) = get_file_resumable(sftp_client, cluster_path, local_path)
+
+    # return the control variable and the error list
+    return (OK, error_list)
+
+#-------------------------------------------------------------------------------
+
+def download_cluster_file(cluster_name, cluster_path, local_path, progress_function=None):
+    '''
+    Download a cluster file to the local machine over its own SSH transport connection,
+    so that it can be run in a background thread. The progress function, when passed,
+    is called with a message at the beginning of each step.
+    '''
+
+    # create the SSH transport connection
+    if progress_function is not None:
+        progress_function('connecting')
+    (OK, error_list, ssh_transport) = create_ssh_transport_connection(cluster_name)
+
+    # create the local directory
+    if OK:
+        if not os.path.exists(os.path.dirname(local_path)):
+            os.makedirs(os.path.dirname(local_path))
+
+    # download the cluster file
+    if OK:
+        if progress_function is not None:
+            progress_function('downloading')
+        sftp_client = create_sftp_client(ssh_transport)
+        (OK, error_list) = get_file(sftp_client, cluster_path, local_path)
+        if not OK:
+            error_list.append(f'The file {cluster_path} could not be downloaded.')
+
+    # close the SSH transport connection
+    if ssh_transport is not None:
+        close_ssh_transport_connection(ssh_transport)
+
+    # return the control variable and the error list
+    return (OK, error_list)
+
+#-------------------------------------------------------------------------------
+
+def put_file_list(cluster_name, path_pair_list, log, stream_number=None, node_name=None, user='root', verify=True, compression='none', verified_size_dict=None):
+    '''
+    Upload a list of (local path, cluster path) pairs to a node of a cluster.
+    The files are uploaded concurrently over several SSH transports (streams)
+    using pipelined large-block writes, and the aggregate throughput is logged.
+    When verify is True, the MD5 computed while each file is sent is checked
+    against the cluster one and the dataset manifests are updated.
+    When compression is gzip, the files not yet compressed are compressed while
+    they are sent and written in the cluster path with the extension .gz.
+    The verified size dictionary (cluster path -> size) has the length of the
+    data of each file that is already in the cluster and is not sent again.
     '''
 
     # initialize the control variable and the error list
     OK = True
     error_list = []
 
-    # upload the local file to the cluster
-    #try:
-    sftp_client.put(local_path, cluster_path)
-    #except Exception as e:
-    #   error_list.append('*** ERROR: It is not possible to upload the local file {0} to cluster file {1}'.format(local_path, cluster_path))
-    #   OK = False
+    # set the number of streams
+    if stream_number is None:
+        stream_number = get_upload_stream_number()
+    stream_number = max(1, min(int(stream_number), len(path_pair_list)))
+
+    # initialize the transports of the streams and the data of each worker thread
+    transport_list = []
+    transport_list_lock = threading.Lock()
+    thread_data = threading.local()
+
+    # replace the cluster paths of the files to compress
+    if compression == 'gzip':
+        path_pair_list = [(local_path, cluster_path if is_compressed_file(local_path) else f'{cluster_path}.gz') for (local_path, cluster_path) in path_pair_list]
+
+    # define the upload task of a worker thread: each worker has its own stream,
+    # which is reconnected to resume the upload when it fails
+    def upload_task(local_path, cluster_path):
+        for _ in range(get_transfer_retry_number() + 1):
+            if getattr(thread_data, 'sftp_client', None) is None:
+                (OK, error_list, transport) = connect_ssh_transport(cluster_name, node_name, user, window_size=get_transfer_window_size())
+                if not OK:
+                    continue
+                with transport_list_lock:
+                    transport_list.append(transport)
+                thread_data.transport = transport
+                thread_data.sftp_client = paramiko.SFTPClient.from_transport(transport)
+            if compression == 'gzip' and not is_compressed_file(local_path):
+                (OK, error_list, file_size, file_md5) = put_file_compressed(thread_data.sftp_client, local_path, cluster_path)
+            else:
+                verified_size = verified_size_dict.get(cluster_path, 0) if verified_size_dict is not None else 0
+                (OK, error_list, file_size, file_md5) = put_file_resumable(thread_data.sftp_client, local_path, cluster_path, verified_size)
+            if OK or thread_data.transport.is_active():
+                break
+            thread_data.sftp_client = None
+        return (OK, error_list, file_size if OK else 0, file_md5 if OK else None)
+
+    # upload the files
+    log.write(f'Uploading {len(path_pair_list)} files using {stream_number} streams ...\n')
+    total_size = 0
+    md5_dict = {}
+    start_time = time.monotonic()
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=stream_number) as executor:
+            future_dict = {}
+            for (local_path, cluster_path) in path_pair_list:
+                future = executor.submit(upload_task, local_path, cluster_path)
+                future_dict[future] = (local_path, cluster_path)
+            for future in concurrent.futures.as_completed(future_dict):
+                (local_path, cluster_path) = future_dict[future]
+                (file_OK, file_error_list, file_size, file_md5) = future.result()
+                if file_OK:
+                    total_size += file_size
+                    md5_dict[cluster_path] = file_md5
+                    log.write(f'The file {local_path} has been uploaded to {cluster_path} ({file_size} bytes).\n')
+                else:
+                    for error in file_error_list:
+                        log.write(f'{error}\n')
+                    error_list.extend(file_error_list)
+                    OK = False
+    finally:
+        for transport in transport_list:
+            transport.close()
+
+    # log the aggregate throughput
+    elapsed_time = max(time.monotonic() - start_time, 0.001)
+    log.write(f'{total_size} bytes uploaded in {elapsed_time:.1f} seconds ({total_size / elapsed_time / 1048576:.2f} MiB/s).\n')
+
+    # verify the uploaded files in the cluster
+    if OK and verify and md5_dict != {}:
+        log.write('Verifying the checksums of the uploaded files in the cluster ...\n')
+        (OK, error_list) = verify_cluster_file_list(cluster_name, md5_dict, node_name, user)
+        if OK:
+            log.write('The checksums are OK.\n')
+        else:
+            for error in error_list:
+                log.write(f'{error}\n')
 
     # return the control variable and the error list
     return (OK, error_list)
 
 #-------------------------------------------------------------------------------
 
-def get_file(sftp_client, cluster_path, local_path):
+def sync_file_list(cluster_name, path_pair_list, log, stream_number=None, delete=False, node_name=None, user='root'):
     '''
+    Synchronize a list of (local path, cluster path) pairs with a node of a
+    cluster like rsync does: only the new and changed local files are uploaded.
+    A file is not changed when its size and modification time match the cluster
+    ones; otherwise the MD5 of the cluster file (from the dataset manifest when
+    possible) is compared with the MD5 of the same length of the local file.
+    Only an append-only change is sent as a delta: when the cluster file is a
+    prefix of the local file, only the appended tail is sent; any other change
+    sends the whole file again (blocks in the middle are not compared). When
+    delete is True, the cluster files of the directories that are not in the
+    list are removed.
     '''
 
     # initialize the control variable and the error list
     OK = True
     error_list = []
 
-    # download the cluster file to the local machine
+    # get the SSH client and the SFTP client
+    ssh_transport = None
+    (OK, error_list, ssh_client) = create_ssh_client_connection(cluster_name, node_name, user)
+    if OK:
+        (OK, error_list, ssh_transport) = create_ssh_transport_connection(cluster_name, node_name, user)
+    if OK:
+        sftp_client = create_sftp_client(ssh_transport)
+
+    # get the size and modification time of the files of the cluster directories
+    cluster_file_dict = {}
+    if OK:
+        cluster_dir_list = sorted(set([os.path.dirname(cluster_path) for (_, cluster_path) in path_pair_list]))
+        quoted_dir_list_text = ' '.join([shlex.quote(cluster_dir) for cluster_dir in cluster_dir_list])
+        command = f'find {quoted_dir_list_text} -maxdepth 1 -type f -not -name {xlib.get_dataset_manifest_file()} -printf "%s %T@ %p\\n"'
+        (OK, stdout, stderr) = execute_cluster_command(ssh_client, command)
+        if OK:
+            for line in stdout:
+                (size, mtime, cluster_path) = line.split(' ', 2)
+                cluster_file_dict[cluster_path] = (int(size), int(float(mtime)))
+        else:
+            error_list.extend(stderr)
+
+    # classify the local files
+    if OK:
+        upload_pair_list = []
+        verified_size_dict = {}
+        candidate_pair_list = []
+        unchanged_number = 0
+        local_stat_dict = {}
+        for (local_path, cluster_path) in path_pair_list:
+            try:
+                local_stat = os.stat(local_path)
+            except OSError as e:
+                error_list.append(f'*** EXCEPTION: "{e}".')
+                error_list.append(f'*** ERROR: The local file {local_path} can not be read.')
+                OK = False
+                continue
+            local_stat_dict[local_path] = local_stat
+            if cluster_path not in cluster_file_dict:
+                upload_pair_list.append((local_path, cluster_path))
+            elif cluster_file_dict[cluster_path] == (local_stat.st_size, int(local_stat.st_mtime)):
+                unchanged_number += 1
+            else:
+                candidate_pair_list.append((local_path, cluster_path))
+
+    # compare the checksums of the files whose size or modification time are changed
+    if OK and candidate_pair_list != []:
+        (OK, error_list, cluster_data_dict) = get_cluster_file_checksum_dict(ssh_client, sftp_client, [cluster_path for (_, cluster_path) in candidate_pair_list])
+        if OK:
+            for (local_path, cluster_path) in candidate_pair_list:
+                local_stat = local_stat_dict[local_path]
+                cluster_size = cluster_data_dict[cluster_path]['size']
+                if local_stat.st_size >= cluster_size and get_local_file_md5(local_path, cluster_size) == cluster_data_dict[cluster_path]['md5']:
+                    if local_stat.st_size == cluster_size:
+                        sftp_client.utime(cluster_path, (local_stat.st_atime, local_stat.st_mtime))
+                        unchanged_number += 1
+                        continue
+                    verified_size_dict[cluster_path] = cluster_size
+                upload_pair_list.append((local_path, cluster_path))
+
+    # remove the cluster files that are not in the list
+    if OK and delete:
+        path_set = set([cluster_path for (_, cluster_path) in path_pair_list])
+        extra_path_list = sorted([cluster_path for cluster_path in cluster_file_dict.keys() if cluster_path not in path_set])
+        if extra_path_list != []:
+            log.write(f'Removing {len(extra_path_list)} cluster files that are not in the local directory ...\n')
+            quoted_path_list_text = ' '.join([shlex.quote(cluster_path) for cluster_path in extra_path_list])
+            (OK, stdout, stderr) = execute_cluster_command(ssh_client, f'rm -f {quoted_path_list_text}')
+            if OK:
+                for cluster_dir in sorted(set([os.path.dirname(cluster_path) for cluster_path in extra_path_list])):
+                    manifest = read_dataset_manifest(sftp_client, cluster_dir)
+                    if manifest != {}:
+                        for cluster_path in extra_path_list:
+                            if os.path.dirname(cluster_path) == cluster_dir:
+                                manifest.pop(os.path.basename(cluster_path), None)
+                        (OK, error_list) = write_dataset_manifest(sftp_client, cluster_dir, manifest)
+            else:
+                error_list.extend(stderr)
+
+    # close the connections
+    if ssh_transport is not None:
+        close_ssh_transport_connection(ssh_transport)
+    if ssh_client is not None:
+        close_ssh_client_connection(ssh_client)
+
+    # upload the new and changed files
+    if OK:
+        log.write(f'{unchanged_number} files are not changed; {len(upload_pair_list) - len(verified_size_dict)} files are new or changed and {len(verified_size_dict)} files are appended.\n')
+        if upload_pair_list != []:
+            (OK, error_list) = put_file_list(cluster_name, upload_pair_list, log, stream_number=stream_number, node_name=node_name, user=user, verified_size_dict=verified_size_dict)
+    else:
+        for error in error_list:
+            log.write(f'{error}\n')
+
+    # return the control variable and the error list
+    return (OK, error_list)
+
+#-------------------------------------------------------------------------------
+
+def put_file_resumable(sftp_client, local_path, cluster_path, verified_size=0):
+    '''
+    Upload a local file to the cluster with pipelined large-block writes. The
+    MD5 of each chunk sent of a large file is recorded in a local journal, so
+    that a later upload resumes after the last chunk verified in the cluster.
+    The verified size is the length of a prefix of the local file that is known
+    to be in the cluster file (a local file appended since its last upload), so
+    only the rest is sent. The MD5 of the whole file is computed while it is
+    sent and the modification time of the local file is kept.
+    '''
+
+    # initialize the control variable and the error list
+    OK = True
+    error_list = []
+
+    # initialize the file size and the file MD5
+    file_size = 0
+    file_md5 = hashlib.md5()
+
+    try:
+
+        # get the local file data and the journal of the upload
+        local_stat = os.stat(local_path)
+        file_size = local_stat.st_size
+        chunk_size = get_transfer_chunk_size()
+        is_journaled = file_size > chunk_size
+        journal_file = get_transfer_journal_file('put', local_path, cluster_path)
+        journal = read_transfer_journal(journal_file)
+
+        # determine the offset where the upload starts
+        offset = 0
+        prefix_chunk_md5_list = None
+        if is_journaled:
+            if journal is not None and journal['size'] == file_size and journal['mtime'] == local_stat.st_mtime:
+                try:
+                    cluster_size = sftp_client.stat(cluster_path).st_size
+                except IOError:
+                    cluster_size = 0
+                offset = get_resume_offset(sftp_client, cluster_path, journal, cluster_size)
+            else:
+                journal = {'size': file_size, 'mtime': local_stat.st_mtime, 'chunk_size': chunk_size, 'chunk_md5_list': []}
+            if verified_size > offset:
+                offset = verified_size - verified_size % chunk_size
+                journal['chunk_md5_list'] = []
+                prefix_chunk_md5_list = journal['chunk_md5_list']
+            del journal['chunk_md5_list'][offset // chunk_size:]
+        else:
+            offset = verified_size
+
+        # upload the local file from the offset
+        block_size = get_transfer_block_size()
+        with open(local_path, 'rb') as local_file, sftp_client.open(cluster_path, 'r+b' if offset > 0 else 'wb', bufsize=block_size) as cluster_file:
+            cluster_file.set_pipelined(True)
+            update_md5_from_file(file_md5, local_file, offset, block_size, chunk_size, prefix_chunk_md5_list)
+            cluster_file.seek(offset)
+            while True:
+                chunk_md5 = hashlib.md5()
+                chunk_length = 0
+                while chunk_length < chunk_size:
+                    data = local_file.read(min(block_size, chunk_size - chunk_length))
+                    if not data:
+                        break
+                    cluster_file.write(data)
+                    chunk_md5.update(data)
+                    file_md5.update(data)
+                    chunk_length += len(data)
+                if is_journaled and chunk_length > 0:
+                    journal['chunk_md5_list'].append(chunk_md5.hexdigest())
+                    write_transfer_journal(journal_file, journal)
+                if chunk_length < chunk_size:
+                    break
+
+            # cut a resumed cluster file that is longer than the local file (e. g. a longer stale upload)
+            if offset > 0:
+                cluster_file.truncate(file_size)
+
+        # keep the modification time of the local file
+        sftp_client.utime(cluster_path, (local_stat.st_atime, local_stat.st_mtime))
+
+        # check the size of the uploaded file
+        if sftp_client.stat(cluster_path).st_size != file_size:
+            error_list.append(f'*** ERROR: The size of the cluster file {cluster_path} does not match the size of the local file {local_path}.')
+            OK = False
+
+    except Exception as e:
+        error_list.append(f'*** EXCEPTION: "{e}".')
+        error_list.append(f'*** ERROR: It is not possible to upload the local file {local_path} to cluster file {cluster_path}')
+        OK = False
+
+    # remove the journal when the upload is finished
+    if OK:
+        remove_transfer_journal(journal_file)
+
+    # return the control variable, the error list, the file size and the file MD5
+    return (OK, error_list, file_size, file_md5.hexdigest())
+
+#-------------------------------------------------------------------------------
+
+def get_file_resumable(sftp_client, cluster_path, local_path):
+    '''
+    Download a cluster file to the local machine with prefetched reads. The file
+    is written in a partial local file that replaces the local file when it is
+    complete, so a local file that is being read (or memory-mapped) is never
+    truncated. The MD5 of each chunk of a large file is recorded in a local
+    journal, so that a later download resumes after the last verified chunk.
+    The MD5 of the whole file is computed while it is received.
+    '''
+
+    # initialize the control variable and the error list
+    OK = True
+    error_list = []
+
+    # initialize the file size and the file MD5
+    file_size = 0
+    file_md5 = hashlib.md5()
+
+    try:
+
+        # get the cluster file data and the journal of the download
+        cluster_stat = sftp_client.stat(cluster_path)
+        file_size = cluster_stat.st_size
+        chunk_size = get_transfer_chunk_size()
+        is_journaled = file_size > chunk_size
+        journal_file = get_transfer_journal_file('get', local_path, cluster_path)
+        journal = read_transfer_journal(journal_file)
+        partial_path = f'{local_path}.part'
+
+        # determine the offset where the download starts
+        offset = 0
+        if is_journaled:
+            if journal is not None and journal['size'] == file_size and journal['mtime'] == cluster_stat.st_mtime and os.path.isfile(partial_path):
+                offset = get_resume_offset(sftp_client, cluster_path, journal, os.path.getsize(partial_path))
+            else:
+                journal = {'size': file_size, 'mtime': cluster_stat.st_mtime, 'chunk_size': chunk_size, 'chunk_md5_list': []}
+            del journal['chunk_md5_list'][offset // chunk_size:]
+
+        # download the cluster file from the offset
+        block_size = get_transfer_block_size()
+        with open(partial_path, 'r+b' if offset > 0 else 'wb') as local_file, sftp_client.open(cluster_path, 'rb', bufsize=block_size) as cluster_file:
+            update_md5_from_file(file_md5, local_file, offset, block_size)
+            local_file.truncate()
+            cluster_file.seek(offset)
+            cluster_file.prefetch(file_size)
+            while True:
+                chunk_md5 = hashlib.md5()
+                chunk_length = 0
+                while chunk_length < chunk_size:
+                    data = cluster_file.read(min(block_size, chunk_size - chunk_length))
+                    if not data:
+                        break
+                    local_file.write(data)
+                    chunk_md5.update(data)
+                    file_md5.update(data)
+                    chunk_length += len(data)
+                if is_journaled and chunk_length > 0:
+                    local_file.flush()
+                    journal['chunk_md5_list'].append(chunk_md5.hexdigest())
+                    write_transfer_journal(journal_file, journal)
+                if chunk_length < chunk_size:
+                    break
+
+        # check the size of the downloaded file and move the partial file
+        if os.path.getsize(partial_path) != file_size:
+            error_list.append(f'*** ERROR: The size of the local file {local_path} does not match the size of the cluster file {cluster_path}.')
+            OK = False
+        else:
+            os.replace(partial_path, local_path)
+
+    except Exception as e:
+        error_list.append(f'*** EXCEPTION: "{e}".')
+        error_list.append(f'*** ERROR: It is not possible to download the cluster file {cluster_path} to local file {local_path}')
+        OK = False
+
+    # remove the journal when the download is finished
+    if OK:
+        remove_transfer_journal(journal_file)
+
+    # return the control variable, the error list, the file size and the file MD5
+    return (OK, error_list, file_size, file_md5.hexdigest())
+
+#-------------------------------------------------------------------------------
+
+def put_file_compressed(sftp_client, local_path, cluster_path):
+    '''
+    Upload a local file to the cluster compressing it with gzip while it is
+    sent. The file is split in blocks that are compressed in parallel as
+    independent gzip members, whose concatenation is a valid gzip file, so
+    neither a local compressed copy nor a later compression in the cluster is
+    needed. The MD5 of the compressed data is computed while it is sent.
+    '''
+
+    # initialize the control variable and the error list
+    OK = True
+    error_list = []
+
+    # initialize the size and the MD5 of the compressed data
+    file_size = 0
+    file_md5 = hashlib.md5()
+
+    # define the compression of a block as a gzip member (zlib releases the GIL)
+    def compress_block(data):
+        compressor = zlib.compressobj(get_compression_level(), zlib.DEFLATED, 31)
+        return compressor.compress(data) + compressor.flush()
+
+    # compress and upload the local file keeping the order of the blocks
+    # and a bounded number of blocks in memory
+    block_size = get_compression_block_size()
+    worker_number = os.cpu_count() or 1
     try:
-        sftp_client.get(cluster_path, local_path)
+        with open(local_path, 'rb') as local_file, sftp_client.open(cluster_path, 'wb', bufsize=get_transfer_block_size()) as cluster_file, concurrent.futures.ThreadPoolExecutor(max_workers=worker_number) as executor:
+            cluster_file.set_pipelined(True)
+            future_list = []
+            end_of_file = False
+            while not end_of_file or future_list != []:
+                while not end_of_file and len(future_list) < 2 * worker_number:
+                    data = local_file.read(block_size)
+                    if data:
+                        future_list.append(executor.submit(compress_block, data))
+                    else:
+                        end_of_file = True
+                if future_list != []:
+                    data = future_list.pop(0).result()
+                    cluster_file.write(data)
+                    file_md5.update(data)
+                    file_size += len(data)
+        local_stat = os.stat(local_path)
+        sftp_client.utime(cluster_path, (local_stat.st_atime, local_stat.st_mtime))
     except Exception as e:
-       error_list.append('*** ERROR: It is not possible to download the cluster file {0} to local file {1}'.format(cluster_path, local_path))
-       OK = False
+        error_list.append(f'*** EXCEPTION: "{e}".')
+        error_list.append(f'*** ERROR: The file {local_path} can not be compressed and uploaded to {cluster_path}.')
+        OK = False
+
+    # return the control variable, the error list, the size and the MD5 of the compressed data
+    return (OK, error_list, file_size, file_md5.hexdigest())
+
+#-------------------------------------------------------------------------------
+
+def is_compressed_file(path):
+    '''
+    Check if a file is already compressed by the extension of its name.
+    '''
+
+    return os.path.splitext(path)[1].lower() in ['.gz', '.bz2', '.xz', '.zip', '.zst']
+
+#-------------------------------------------------------------------------------
+
+def update_md5_from_file(md5, file, length, block_size, chunk_size=None, chunk_md5_list=None):
+    '''
+    Update a MD5 with the first bytes of a local file, which are already
+    transferred when a transfer is resumed, and leave the file in that offset.
+    When a chunk MD5 list is passed, the MD5 of each chunk read is appended.
+    '''
+
+    file.seek(0)
+    chunk_md5 = hashlib.md5()
+    while file.tell() < length:
+        data = file.read(min(block_size, length - file.tell()))
+        if not data:
+            break
+        md5.update(data)
+        if chunk_md5_list is not None:
+            chunk_md5.update(data)
+            if file.tell() % chunk_size == 0:
+                chunk_md5_list.append(chunk_md5.hexdigest())
+                chunk_md5 = hashlib.md5()
+    file.seek(length)
+
+#-------------------------------------------------------------------------------
+
+def get_local_file_md5(local_path, length):
+    '''
+    Get the MD5 of the first bytes of a local file.
+    '''
+
+    md5 = hashlib.md5()
+    with open(local_path, 'rb') as local_file:
+        update_md5_from_file(md5, local_file, length, get_transfer_block_size())
+
+    return md5.hexdigest()
+
+#-------------------------------------------------------------------------------
+
+def verify_cluster_file_list(cluster_name, md5_dict, node_name=None, user='root'):
+    '''
+    Verify that the MD5 of a set of cluster files matches the MD5 computed when
+    they were transferred (md5_dict: cluster path -> MD5). The cluster checksums
+    are computed in one batched command, except for the files that are not
+    changed since they were recorded in the manifest of their dataset, and the
+    manifests are updated.
+    '''
+
+    # initialize the control variable and the error list
+    OK = True
+    error_list = []
+
+    # get the SSH client and the SFTP client
+    ssh_transport = None
+    (OK, error_list, ssh_client) = create_ssh_client_connection(cluster_name, node_name, user)
+    if OK:
+        (OK, error_list, ssh_transport) = create_ssh_transport_connection(cluster_name, node_name, user)
+    if OK:
+        sftp_client = create_sftp_client(ssh_transport)
+
+    # compare the checksums computed now in the cluster (the manifest entries of the files just
+    # written can be stale because their modification time is kept) and refresh the manifests
+    if OK:
+        (OK, error_list) = compare_cluster_file_checksums(ssh_client, sftp_client, md5_dict, use_manifest=False)
+
+    # close the connections
+    if ssh_transport is not None:
+        close_ssh_transport_connection(ssh_transport)
+    if ssh_client is not None:
+        close_ssh_client_connection(ssh_client)
 
     # return the control variable and the error list
     return (OK, error_list)
 
 #-------------------------------------------------------------------------------
 
-def close_ssh_transport_connection(ssh_transport):
+def compare_cluster_file_checksums(ssh_client, sftp_client, md5_dict, use_manifest=True, update_manifest=True):
     '''
+    Compare the MD5 of a set of cluster files with the MD5 computed when they
+    were transferred (md5_dict: cluster path -> MD5). When use_manifest is False,
+    the MD5 of every file is computed in the cluster. When update_manifest is
+    False (downloads), the cluster directories are not modified.
     '''
 
-    # close the connection of the SSH client object
-    ssh_transport.close()
+    # get the cluster checksums
+    (OK, error_list, cluster_data_dict) = get_cluster_file_checksum_dict(ssh_client, sftp_client, list(md5_dict.keys()), use_manifest, update_manifest)
+
+    # compare them
+    if OK:
+        for cluster_path, md5 in md5_dict.items():
+            if cluster_data_dict[cluster_path]['md5'] != md5:
+                error_list.append(f'*** ERROR: The checksum of the cluster file {cluster_path} does not match the checksum of the transferred data.')
+                OK = False
+
+    # return the control variable and the error list
+    return (OK, error_list)
 
 #-------------------------------------------------------------------------------
 
-def submit_script(cluster_name, ssh_client, current_run_dir, script, log):
+def get_cluster_file_checksum_dict(ssh_client, sftp_client, cluster_path_list, use_manifest=True, update_manifest=True):
     '''
+    Get the size, modification time and MD5 of a list of cluster files. The MD5
+    recorded in the manifest of the dataset directory is used when the file
+    size and modification time are not changed (unless use_manifest is False,
+    e. g. for files just written); the rest are computed in only one round trip
+    and the manifests are updated with them (unless update_manifest is False,
+    e. g. for downloads, which must not modify the cluster directories).
     '''
 
-    # initialize the control variable
+    # initialize the control variable and the error list
     OK = True
+    error_list = []
 
-    # submit the script starter
-    if xec2.get_cluster_mode(cluster_name) == xconfiguration.get_cluster_mode_native():
-        command = f'nohup {current_run_dir}/{script} &>/dev/null &'
-    elif xec2.get_cluster_mode(cluster_name) == xconfiguration.get_cluster_mode_starcluster():
-        sge_env = xcluster.get_sge_env()
-        command = f'{sge_env}; qsub -V -b n -cwd {current_run_dir}/{script}'
-    (OK, stdout, stderr) = execute_cluster_command(ssh_client, command)
+    # initialize the checksum dictionary
+    cluster_data_dict = {}
+
+    # read the manifests of the dataset directories
+    manifest_dict = {}
+    for cluster_dir in sorted(set([os.path.dirname(cluster_path) for cluster_path in cluster_path_list])):
+        manifest_dict[cluster_dir] = read_dataset_manifest(sftp_client, cluster_dir)
+
+    # get the size and the modification time of the files
+    quoted_path_list_text = ' '.join([shlex.quote(cluster_path) for cluster_path in cluster_path_list])
+    (OK, stdout, stderr) = execute_cluster_command(ssh_client, f'stat --format="%s %Y %n" {quoted_path_list_text}')
     if OK:
-        log.write('The script is submitted.\n')
         for line in stdout:
-            log.write('{0}\n'.format(line))
+            (size, mtime, cluster_path) = line.split(' ', 2)
+            cluster_data_dict[cluster_path] = {'size': int(size), 'mtime': int(mtime), 'md5': None}
     else:
-        log.write(f'*** ERROR: Wrong command ---> {command}\n')
+        error_list.extend(stderr)
 
-    # return the control variable
-    return OK
+    # get the MD5 of the files from the manifests when they are not changed
+    if OK:
+        pending_path_list = []
+        for cluster_path in cluster_path_list:
+            cluster_data = cluster_data_dict[cluster_path]
+            manifest_data = manifest_dict[os.path.dirname(cluster_path)].get(os.path.basename(cluster_path), {})
+            if use_manifest and manifest_data.get('size') == cluster_data['size'] and manifest_data.get('mtime') == cluster_data['mtime']:
+                cluster_data['md5'] = manifest_data.get('md5')
+            else:
+                pending_path_list.append(cluster_path)
+
+    # compute the MD5 of the rest of files in one command
+    if OK and pending_path_list != []:
+        quoted_path_list_text = ' '.join([shlex.quote(cluster_path) for cluster_path in pending_path_list])
+        (OK, stdout, stderr) = execute_cluster_command(ssh_client, f'md5sum {quoted_path_list_text}')
+        if OK:
+            for line in stdout:
+                (md5, cluster_path) = (line[:32], line[34:])
+                cluster_data_dict[cluster_path]['md5'] = md5
+                manifest_dict[os.path.dirname(cluster_path)][os.path.basename(cluster_path)] = cluster_data_dict[cluster_path]
+        else:
+            error_list.extend(stderr)
+
+    # update the manifests
+    if OK and update_manifest and pending_path_list != []:
+        for cluster_dir in sorted(set([os.path.dirname(cluster_path) for cluster_path in pending_path_list])):
+            (OK, error_list) = write_dataset_manifest(sftp_client, cluster_dir, manifest_dict[cluster_dir])
+            if not OK:
+                break
+
+    # return the control variable, the error list and the checksum dictionary
+    return (OK, error_list, cluster_data_dict)
+
+#-------------------------------------------------------------------------------
+
+def read_dataset_manifest(sftp_client, cluster_dir):
+    '''
+    Read the manifest of a dataset directory: a dictionary with the size,
+    modification time and MD5 of each file. An empty dictionary is returned when
+    the manifest does not exist.
+    '''
+
+    try:
+        with sftp_client.open(f'{cluster_dir}/{xlib.get_dataset_manifest_file()}', 'r') as file_id:
+            manifest = json.loads(file_id.read().decode('utf-8'))
+    except Exception:
+        manifest = {}
+
+    return manifest
+
+#-------------------------------------------------------------------------------
+
+def write_dataset_manifest(sftp_client, cluster_dir, manifest):
+    '''
+    Write the manifest of a dataset directory.
+    '''
+
+    # initialize the control variable and the error list
+    OK = True
+    error_list = []
+
+    # write the manifest
+    try:
+        with sftp_client.open(f'{cluster_dir}/{xlib.get_dataset_manifest_file()}', 'w') as file_id:
+            file_id.write(json.dumps(manifest, indent=1, sort_keys=True))
+    except Exception as e:
+        error_list.append(f'*** EXCEPTION: "{e}".')
+        error_list.append(f'*** ERROR: The manifest of the directory {cluster_dir} can not be written.')
+        OK = False
+
+    # return the control variable and the error list
+    return (OK, error_list)
+
+#-------------------------------------------------------------------------------
+
+def get_resume_offset(sftp_client, cluster_path, journal, transferred_size):
+    '''
+    Get the offset where an interrupted transfer is resumed: the end of the
+    last chunk transferred whose MD5 in the cluster matches the journal one.
+    When it does not match, the transfer starts from the beginning.
+    '''
+
+    # get the number of chunks recorded in the journal and fully transferred
+    chunk_size = journal['chunk_size']
+    chunk_number = min(len(journal['chunk_md5_list']), transferred_size // chunk_size)
+
+    # verify the last chunk in the cluster
+    if chunk_number > 0:
+        cluster_md5 = get_cluster_chunk_md5(sftp_client, cluster_path, (chunk_number - 1) * chunk_size, chunk_size)
+        if cluster_md5 != journal['chunk_md5_list'][chunk_number - 1]:
+            chunk_number = 0
+
+    # return the offset
+    return chunk_number * chunk_size
+
+#-------------------------------------------------------------------------------
+
+def get_cluster_chunk_md5(sftp_client, cluster_path, offset, length):
+    '''
+    Get the MD5 of a chunk of a cluster file computed in the cluster over the
+    SSH transport of the SFTP client.
+    '''
+
+    # build the command
+    command = f'dd if={shlex.quote(cluster_path)} iflag=skip_bytes,count_bytes skip={offset} count={length} bs=4M status=none | md5sum'
+
+    # execute the command in a new channel of the transport
+    channel = sftp_client.get_channel().get_transport().open_session()
+    try:
+        channel.exec_command(command)
+        stdout = channel.makefile('r').read()
+    finally:
+        channel.close()
+
+    # return the MD5
+    return stdout.decode('utf-8').split(' ')[0].strip() if stdout else ''
+
+#-------------------------------------------------------------------------------
+
+def get_transfer_journal_file(direction, local_path, cluster_path):
+    '''
+    Get the path of the local journal of a transfer.
+    '''
+
+    # set the name of the journal from the direction and the paths of the transfer
+    key = f'{direction}|{os.path.abspath(local_path)}|{cluster_path}'
+    journal_name = hashlib.md5(key.encode('utf-8')).hexdigest()
+
+    # return the journal path
+    return f'{xlib.get_transfer_journal_dir()}/{journal_name}.json'
+
+#-------------------------------------------------------------------------------
+
+def read_transfer_journal(journal_file):
+    '''
+    Read the journal of a transfer. None is returned when it does not exist or
+    it is not valid.
+    '''
+
+    try:
+        with open(journal_file, mode='r', encoding='utf-8') as file_id:
+            journal = json.load(file_id)
+    except Exception:
+        journal = None
+
+    return journal
+
+#-------------------------------------------------------------------------------
+
+def write_transfer_journal(journal_file, journal):
+    '''
+    Write the journal of a transfer atomically.
+    '''
+
+    # create the journal directory if it does not exist
+    if not os.path.exists(os.path.dirname(journal_file)):
+        os.makedirs(os.path.dirname(journal_file), exist_ok=True)
+
+    # write a temporal file and replace the journal
+    temporal_file = f'{journal_file}.tmp'
+    with open(temporal_file, mode='w', encoding='utf-8') as file_id:
+        json.dump(journal, file_id)
+    os.replace(temporal_file, journal_file)
+
+#-------------------------------------------------------------------------------
+
+def remove_transfer_journal(journal_file):
+    '''
+    Remove the journal of a finished transfer.
+    '''
+
+    try:
+        os.remove(journal_file)
+    except FileNotFoundError:
+        pass
+
+#-------------------------------------------------------------------------------
+
+def get_upload_stream_number():
+    '''
+    Get the default number of concurrent streams used to upload datasets.
+    '''
+
+    return 4
+
+#-------------------------------------------------------------------------------
+
+def get_transfer_block_size():
+    '''
+    Get the size of the blocks read and written in file transfers.
+    '''
+
+    return 1048576
+
+#-------------------------------------------------------------------------------
+
+def get_transfer_chunk_size():
+    '''
+    Get the size of the chunks recorded in the journals of resumable transfers.
+    '''
+
+    return 67108864
+
+#-------------------------------------------------------------------------------
+
+def get_compression_block_size():
+    '''
+    Get the size of the blocks compressed in parallel in compressed uploads.
+    '''
+
+    return 4194304
+
+#-------------------------------------------------------------------------------
+
+def get_compression_level():
+    '''
+    Get the gzip compression level used in compressed uploads.
+    '''
+
+    return 6
+
+#-------------------------------------------------------------------------------
+
+def get_transfer_retry_number():
+    '''
+    Get the number of times that a failed upload is resumed with a new stream.
+    '''
+
+    return 3
+
+#-------------------------------------------------------------------------------
+
+def get_transfer_window_size():
+    '''
+    Get the window size of the SSH transports used in file transfers.
+    '''
+
+    return 16777216
+
+#-------------------------------------------------------------------------------
+
+def get_tail_poll_interval():
+    '''
+    Get the interval (in seconds) between two checks of the channel of a remote file tail.
+    '''
+
+    return 0.2
+
+#-------------------------------------------------------------------------------
+
+def get_tail_receive_size():
+    '''
+    Get the maximum number of bytes received in each read of the channel of a remote file tail.
+    '''
+
+    return 65536
+
+#-------------------------------------------------------------------------------
+
+def close_ssh_transport_connection(ssh_transport):
+    '''
+    '''
+
+    # release the SSH transport object and close its SFTP clients (the pooled SSH session remains open)
+    ssh_transport.close()
+
+#-------------------------------------------------------------------------------
+
+def execute_cluster_command_batch(ssh_client, command_list, stop_on_error=True):
+    '''
+    Execute several commands in only one channel of the SSH client. The stdout,
+    stderr and return code of each command are delimited by a marker line.
+    '''
+
+    # initialize the control variable
+    OK = True
+
+    # set the marker of the delimiter lines
+    marker = f'@@NGSCLOUD-BATCH-{os.getpid()}-{int(time.time() * 1000000)}@@'
+
+    # build the batch script: the stderr of each command is saved in a temporal file and it is echoed with the marker
+    batch_script_list = ['batch_dir=$(mktemp -d)']
+    for i, command in enumerate(command_list):
+        batch_script_list.append(f'{{ {command}\n}} 2>"$batch_dir/{i}"; rc=$?')
+        batch_script_list.append(f'sed "s/^/{marker} {i} ERR /" "$batch_dir/{i}"')
+        batch_script_list.append(f'echo "{marker} {i} RC $rc"')
+        if stop_on_error:
+            batch_script_list.append(f'if [ $rc -ne 0 ] || [ -s "$batch_dir/{i}" ]; then rm -rf "$batch_dir"; exit $rc; fi')
+    batch_script_list.append('rm -rf "$batch_dir"')
+    batch_script = '\n'.join(batch_script_list)
+
+    # initialize the result list: for each command, its return code, stdout lines and stderr lines
+    result_list = [{'command': command, 'rc': None, 'stdout': [], 'stderr': []} for command in command_list]
+
+    # execute the batch script
+    (_, stdout, stderr) = execute_cluster_command(ssh_client, batch_script)
+
+    # split the stdout into the results of the commands
+    i = 0
+    for line in stdout:
+        position = line.find(marker)
+        if position == -1:
+            if i < len(result_list):
+                result_list[i]['stdout'].append(line)
+            continue
+        if position > 0:
+            result_list[i]['stdout'].append(line[:position])
+        (_, index, kind, value) = (line[position:].split(' ', 3) + ['', '', ''])[:4]
+        if kind == 'ERR':
+            result_list[int(index)]['stderr'].append(value)
+        elif kind == 'RC':
+            result_list[int(index)]['rc'] = int(value)
+            i = int(index) + 1
+
+    # set the control variable: a command is wrong if it is not run, its return code is not 0 or it writes in stderr
+    for result in result_list:
+        if result['rc'] != 0 or result['stderr'] != []:
+            OK = False
+    if stderr != []:
+        OK = False
+
+    # return the control variable and the result list
+    return (OK, result_list)
+
+#-------------------------------------------------------------------------------
+
+def submit_script(cluster_name, ssh_client, current_run_dir, script, log, run_permission_list=None):
+    '''
+    Submit a script starter. The run permission of the files of the run
+    permission list is set on in the same round trip.
+    '''
+
+    # initialize the control variable
+    OK = True
+
+    # build the commands to set on the run permission
+    command_list = []
+    if run_permission_list is not None:
+        for file_name in run_permission_list:
+            command_list.append(f'chmod u+x {current_run_dir}/{file_name}')
+
+    # build the command to submit the script starter
+    cluster_mode = xec2.get_cluster_mode(cluster_name)
+    if cluster_mode == xconfiguration.get_cluster_mode_native():
+        command = f'nohup {current_run_dir}/{script} &>/dev/null &'
+    elif cluster_mode == xconfiguration.get_cluster_mode_starcluster():
+        sge_env = xcluster.get_sge_env()
+        command = f'{sge_env}; qsub -V -b n -cwd {current_run_dir}/{script}'
+    command_list.append(command)
+
+    # execute the commands
+    (OK, result_list) = execute_cluster_command_batch(ssh_client, command_list)
+    for result in result_list[:-1]:
+        if result['rc'] == 0 and result['stderr'] == []:
+            log.write('The run permision of {0} is set on.\n'.format(result['command'].split(' ')[-1]))
+        else:
+            log.write('*** ERROR: Wrong command ---> {0}\n'.format(result['command']))
+    if OK:
+        log.write('The script is submitted.\n')
+        for line in result_list[-1]['stdout']:
+            log.write('{0}\n'.format(line))
+        # the run creates a new result dataset, so the dataset catalog has to be refreshed
+        xmetadata.invalidate_dataset_catalog(cluster_name)
+    elif result_list[-1]['rc'] is not None:
+        log.write(f'*** ERROR: Wrong command ---> {command}\n')
+
+    # return the control variable
+    return OK
+
+#-------------------------------------------------------------------------------
+
+def list_cluster_dir(ssh_client, cluster_dir, excluded_type=None, detailed=False):
+    '''
+    List the entries of a cluster directory with a single find process and get
+    their type, size and modification time (and their permissions, owner name
+    and owner group when detailed is True). Hidden entries and lost+found are
+    skipped like in the ls output.
+    '''
+
+    # initialize the entry list
+    entry_list = []
+
+    # build the command
+    command = f'find {cluster_dir} -mindepth 1 -maxdepth 1 -not -name lost+found -not -name ".*"'
+    if excluded_type is not None:
+        command += f' -not -type {excluded_type}'
+    command += f' -printf "{get_cluster_entry_format(detailed)}\\n"'
+
+    # execute the command and build the entry list sorted by name
+    (OK, stdout, stderr) = execute_cluster_command(ssh_client, command)
+    if OK:
+        for line in stdout:
+            entry_list.append(parse_cluster_entry(line, detailed))
+        entry_list.sort(key=lambda entry: entry['name'])
+
+    # return the control variable, the stderr lines and the entry list
+    return (OK, stderr, entry_list)
+
+#-------------------------------------------------------------------------------
+
+def get_cluster_entry(ssh_client, cluster_path, detailed=False):
+    '''
+    Get the type, size and modification time of a cluster file or directory
+    (and its permissions, owner name and owner group when detailed is True).
+    '''
+
+    # initialize the entry
+    entry = None
+
+    # build the command
+    command = f'find {cluster_path} -maxdepth 0 -printf "{get_cluster_entry_format(detailed)}\\n"'
+
+    # execute the command and build the entry
+    (OK, stdout, stderr) = execute_cluster_command(ssh_client, command)
+    if OK and stdout != []:
+        entry = parse_cluster_entry(stdout[0], detailed)
+
+    # return the control variable, the stderr lines and the entry
+    return (OK, stderr, entry)
+
+#-------------------------------------------------------------------------------
+
+def get_cluster_entry_format(detailed=False):
+    '''
+    Get the find printf format of the entries of a cluster directory.
+    '''
+
+    if detailed:
+        return '%y %s %T@ %M %u %g %f'
+    else:
+        return '%y %s %T@ %f'
+
+#-------------------------------------------------------------------------------
+
+def parse_cluster_entry(line, detailed=False):
+    '''
+    Build the entry dictionary from a find output line.
+    '''
+
+    if detailed:
+        (entry_type, size, mtime, permissions, owner_name, owner_group, name) = line.rstrip('\n').split(' ', 6)
+        return {'name': name, 'type': entry_type, 'size': int(size), 'mtime': float(mtime), 'permissions': permissions[1:], 'owner_name': owner_name, 'owner_group': owner_group}
+    else:
+        (entry_type, size, mtime, name) = line.rstrip('\n').split(' ', 3)
+        return {'name': name, 'type': entry_type, 'size': int(size), 'mtime': float(mtime)}
+
+#-------------------------------------------------------------------------------
+
+def get_ssh_session_idle_timeout():
+    '''
+    Get the seconds that an unused pooled SSH session is kept open.
+    '''
+
+    return 600
+
+#-------------------------------------------------------------------------------
+
+def get_ssh_session_keepalive_interval():
+    '''
+    Get the seconds between keepalive packets of a pooled SSH session.
+    '''
+
+    return 30
+
+#-------------------------------------------------------------------------------
+
+def get_ssh_connection_timeout():
+    '''
+    Get the seconds to wait for the TCP connection of a new SSH session.
+    '''
+
+    return 30
+
+#-------------------------------------------------------------------------------
+
+# the pool of SSH sessions of the process keyed by (cluster name, node name, user)
+ssh_session_pool_dict = {}
+ssh_session_pool_lock = threading.RLock()
+
+# the locks that serialize the connections to a node keyed like the pool
+ssh_session_key_lock_dict = {}
+
+# the RSA keys keyed by keypair file
+rsakey_dict = {}
+
+#-------------------------------------------------------------------------------
+
+def acquire_ssh_session(cluster_name, node_name=None, user='root'):
+    '''
+    Get the pooled SSH session of a node of a cluster. A new SSH session is
+    established when it does not exist in the pool or it is not active.
+    '''
+
+    # initialize the control variable and the error list
+    OK = True
+    error_list = []
+
+    # set the pool key (with the node name normalized, so None and the name of the default node share the session)
+    key = (cluster_name, node_name if node_name is not None else xec2.get_default_node_name(cluster_name), user)
+
+    # get the lock of the pool key, so only the connections to the same node wait for each other
+    with ssh_session_pool_lock:
+        key_lock = ssh_session_key_lock_dict.setdefault(key, threading.Lock())
+
+    with key_lock:
+
+        with ssh_session_pool_lock:
+
+            # close the idle SSH sessions
+            evict_idle_ssh_sessions()
+
+            # get the SSH session from the pool and check its health
+            ssh_session = ssh_session_pool_dict.get(key)
+            if ssh_session is not None and not ssh_session.is_active():
+                ssh_session.close()
+                del ssh_session_pool_dict[key]
+                ssh_session = None
+
+            # register the new user of the pooled SSH session
+            if ssh_session is not None:
+                ssh_session.acquire()
+
+        # establish a new SSH session when it is not in the pool (without holding the pool lock,
+        # because the connection can take the whole connection timeout)
+        if ssh_session is None:
+            (OK, error_list, transport) = connect_ssh_transport(cluster_name, node_name, user)
+            if OK:
+                ssh_session = SSHSession(key, transport)
+                ssh_session.acquire()
+                with ssh_session_pool_lock:
+                    ssh_session_pool_dict[key] = ssh_session
+
+    # return the control variable, the error list and the SSH session
+    return (OK, error_list, ssh_session)
+
+#-------------------------------------------------------------------------------
+
+def connect_ssh_transport(cluster_name, node_name=None, user='root', window_size=None):
+    '''
+    Establish an authenticated SSH transport with a node of a cluster. The
+    window size of its channels can be raised for bulk transfers.
+    '''
+
+    # initialize the control variable and the error list
+    OK = True
+    error_list = []
+
+    # initialize the SSH transport objet
+    transport = None
+
+    # set the node name when it is None
+    if node_name is None:
+        node_name = xec2.get_default_node_name(cluster_name)
+
+    # initialize the port
+    port = 22
+
+    # get the keypair file
+    keypair_file = xconfiguration.get_keypair_file()
+
+    # get the public dns nameof the node in the cluster
+    public_dns_name = xec2.get_node_public_dns_name(cluster_name, node_name)
+
+    # get the RSA key
+    (OK, error_list, rsakey) = get_rsakey(keypair_file)
+
+    # create the SSH transport object
+    if OK:
+        try:
+            sock = socket.create_connection((public_dns_name, port), timeout=get_ssh_connection_timeout())
+            sock.settimeout(None)
+            if window_size is None:
+                transport = paramiko.Transport(sock)
+            else:
+                transport = paramiko.Transport(sock, default_window_size=window_size)
+        except Exception as e:
+            error_list.append('*** ERROR: {0} can not be connected.'.format(public_dns_name))
+            OK = False
+
+    # start the connection
+    if OK:
+        try:
+            transport.connect(username=user, pkey=rsakey)
+            transport.set_keepalive(get_ssh_session_keepalive_interval())
+        except Exception as e:
+            error_list.append('*** ERROR: User/pkey is not valid in {0}.'.format(public_dns_name))
+            transport.close()
+            transport = None
+            OK = False
+
+    # return the control variable, the error list and the SSH transport objet
+    return (OK, error_list, transport)
+
+#-------------------------------------------------------------------------------
+
+def wait_ssh_ready(cluster_name, node_name=None, user='root', timeout=None):
+    '''
+    Wait until a node of a cluster accepts SSH connections. The SSH port is
+    probed with an exponential backoff until the server sends its banner, and
+    then the login is tried until it is accepted, so the wait finishes as soon
+    as the node is ready. The SSH session is kept in the pool.
+    '''
+
+    # initialize the control variable and the error list
+    OK = False
+    error_list = []
+
+    # set the timeout
+    if timeout is None:
+        timeout = get_ssh_ready_timeout()
+
+    # set the node name when it is None
+    if node_name is None:
+        node_name = xec2.get_default_node_name(cluster_name)
+
+    # probe the node until the login is accepted
+    delay = 1
+    end_time = time.monotonic() + timeout
+    while True:
+        public_dns_name = xec2.get_node_public_dns_name(cluster_name, node_name)
+        if public_dns_name != '' and probe_ssh_banner(public_dns_name):
+            (OK, error_list, ssh_session) = acquire_ssh_session(cluster_name, node_name, user)
+            if OK:
+                ssh_session.release()
+                break
+        if time.monotonic() + delay > end_time:
+            error_list.append(f'*** ERROR: The node {node_name} of the cluster {cluster_name} does not accept SSH connections after {timeout} s.')
+            break
+        time.sleep(delay)
+        delay = min(delay * 2, xlib.get_wait_max_delay())
+        if public_dns_name == '':
+            xec2.invalidate_inventory()
+
+    # return the control variable and the error list
+    return (OK, error_list)
+
+#-------------------------------------------------------------------------------
+
+def probe_ssh_banner(host, port=22):
+    '''
+    Check if the SSH server of a host sends its banner within a short timeout.
+    '''
+
+    try:
+        with socket.create_connection((host, port), timeout=get_ssh_probe_timeout()) as sock:
+            banner = b''
+            while b'\n' not in banner and len(banner) < 256:
+                data = sock.recv(256)
+                if not data:
+                    break
+                banner += data
+    except Exception:
+        return False
+
+    return banner.startswith(b'SSH-')
+
+#-------------------------------------------------------------------------------
+
+def wait_cluster_device(ssh_client, device_file, timeout=60):
+    '''
+    Wait until a block device is available in a node of a cluster.
+    '''
+
+    # wait in the node for the device
+    command = f'timeout {timeout} sh -c \'until [ -b {device_file} ]; do sleep 0.5; done\' || echo "The device {device_file} is not available." >&2'
+    (OK, stdout, stderr) = execute_cluster_command(ssh_client, command)
+
+    # return the control variable
+    return OK
+
+#-------------------------------------------------------------------------------
+
+def get_ssh_ready_timeout():
+    '''
+    Get the timeout (in seconds) of the wait of a node to accept SSH connections.
+    '''
+
+    return 600
+
+#-------------------------------------------------------------------------------
+
+def get_ssh_probe_timeout():
+    '''
+    Get the timeout (in seconds) of a probe of the SSH port of a node.
+    '''
+
+    return 5
+
+#-------------------------------------------------------------------------------
+
+def get_rsakey(keypair_file):
+    '''
+    Get the RSA key of a keypair file. The key is read only once per process.
+    '''
+
+    # initialize the control variable and the error list
+    OK = True
+    error_list = []
+
+    # get the RSA key text from the corresponding file when it is not already read
+    rsakey = rsakey_dict.get(keypair_file)
+    if rsakey is None:
+        try:
+            with open(keypair_file, 'r') as file:
+                records_inmemory = io.StringIO(file.read())
+            rsakey = paramiko.RSAKey.from_private_key(records_inmemory)
+            rsakey_dict[keypair_file] = rsakey
+        except Exception as e:
+            error_list.append('*** ERROR: The file {0} can not be read.'.format(keypair_file))
+            OK = False
+
+    # return the control variable, the error list and the RSA key
+    return (OK, error_list, rsakey)
+
+#-------------------------------------------------------------------------------
+
+def evict_idle_ssh_sessions():
+    '''
+    Close the pooled SSH sessions that are not used and whose idle time is over.
+    '''
+
+    with ssh_session_pool_lock:
+        for key in list(ssh_session_pool_dict.keys()):
+            ssh_session = ssh_session_pool_dict[key]
+            if ssh_session.is_idle(get_ssh_session_idle_timeout()):
+                ssh_session.close()
+                del ssh_session_pool_dict[key]
+
+#-------------------------------------------------------------------------------
+
+def invalidate_ssh_sessions(cluster_name, node_name=None):
+    '''
+    Close the pooled SSH sessions of a cluster or of a node of a cluster, e. g.
+    after the cluster is terminated or the node is removed.
+    '''
+
+    with ssh_session_pool_lock:
+        for key in list(ssh_session_pool_dict.keys()):
+            if key[0] == cluster_name and (node_name is None or key[1] == node_name):
+                ssh_session_pool_dict[key].close()
+                del ssh_session_pool_dict[key]
+
+#-------------------------------------------------------------------------------
+
+def close_ssh_session_pool():
+    '''
+    Close all the pooled SSH sessions.
+    '''
+
+    with ssh_session_pool_lock:
+        for ssh_session in ssh_session_pool_dict.values():
+            ssh_session.close()
+        ssh_session_pool_dict.clear()
+
+#-------------------------------------------------------------------------------
+
+atexit.register(close_ssh_session_pool)
+
+#-------------------------------------------------------------------------------
+
+class SSHSession(object):
+    '''
+    This class represents an authenticated SSH transport kept in the pool and
+    shared by the SSH clients and SFTP clients of a node.
+    '''
+
+    #---------------
+
+    def __init__(self, key, transport):
+        '''
+        Execute actions correspending to the creation of a "SSHSession" instance.
+        '''
+
+        # save initial parameters in instance variables
+        self.key = key
+        self.transport = transport
+
+        # initialize the number of users and the time of the last use
+        self.user_count = 0
+        self.last_use_time = time.monotonic()
+        self.lock = threading.Lock()
+
+    #---------------
+
+    def acquire(self):
+        '''
+        Register a new user of the SSH session.
+        '''
+
+        with self.lock:
+            self.user_count += 1
+            self.last_use_time = time.monotonic()
+
+    #---------------
+
+    def release(self):
+        '''
+        Unregister a user of the SSH session.
+        '''
+
+        with self.lock:
+            self.user_count = max(self.user_count - 1, 0)
+            self.last_use_time = time.monotonic()
+
+    #---------------
+
+    def is_active(self):
+        '''
+        Check if the SSH transport is alive.
+        '''
+
+        # check the transport state
+        if not self.transport.is_active():
+            return False
+
+        # send a packet to detect half-closed connections
+        try:
+            self.transport.send_ignore()
+        except Exception:
+            return False
+
+        return True
+
+    #---------------
+
+    def is_idle(self, idle_timeout):
+        '''
+        Check if the SSH session has not any user and its idle time is over.
+        '''
+
+        with self.lock:
+            return self.user_count == 0 and time.monotonic() - self.last_use_time > idle_timeout
+
+    #---------------
+
+    def close(self):
+        '''
+        Close the SSH transport.
+        '''
+
+        try:
+            self.transport.close()
+        except Exception:
+            pass
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+class PooledSSHClient(object):
+    '''
+    This class is used as a SSH client whose exec channels are multiplexed over
+    a pooled SSH session.
+    '''
+
+    #---------------
+
+    def __init__(self, ssh_session):
+        '''
+        Execute actions correspending to the creation of a "PooledSSHClient" instance.
+        '''
+
+        # save initial parameters in instance variables
+        self.ssh_session = ssh_session
+        self.closed = False
+
+    #---------------
+
+    def get_cluster_name(self):
+        '''
+        Get the name of the cluster of the pooled SSH session.
+        '''
+
+        return self.ssh_session.key[0]
+
+    #---------------
+
+    def exec_command(self, command, bufsize=-1):
+        '''
+        Execute a command in a new channel and return its stdin, stdout and stderr.
+        '''
+
+        # open a session channel and execute the command
+        channel = self.ssh_session.transport.open_session()
+        channel.exec_command(command)
+
+        # build the file-like objects of the channel
+        stdin = channel.makefile('wb', bufsize)
+        stdout = channel.makefile('r', bufsize)
+        stderr = channel.makefile_stderr('r', bufsize)
+
+        # return stdin, stdout and stderr
+        return (stdin, stdout, stderr)
+
+    #---------------
+
+    def get_transport(self):
+        '''
+        Get the SSH transport of the pooled SSH session.
+        '''
+
+        return self.ssh_session.transport
+
+    #---------------
+
+    def close(self):
+        '''
+        Release the pooled SSH session.
+        '''
+
+        if not self.closed:
+            self.closed = True
+            self.ssh_session.release()
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+class PooledSSHTransport(object):
+    '''
+    This class is used as a SSH transport whose SFTP channels are multiplexed
+    over a pooled SSH session.
+    '''
+
+    #---------------
+
+    def __init__(self, ssh_session):
+        '''
+        Execute actions correspending to the creation of a "PooledSSHTransport" instance.
+        '''
+
+        # save initial parameters in instance variables
+        self.ssh_session = ssh_session
+        self.sftp_client_list = []
+        self.closed = False
+
+    #---------------
+
+    def open_sftp_client(self):
+        '''
+        Open a SFTP client in a new channel of the pooled SSH session.
+        '''
+
+        # create the SFTP client object
+        sftp_client = paramiko.SFTPClient.from_transport(self.ssh_session.transport)
+        self.sftp_client_list.append(sftp_client)
+
+        # return the SFTP client object
+        return sftp_client
+
+    #---------------
+
+    def get_transport(self):
+        '''
+        Get the SSH transport of the pooled SSH session.
+        '''
+
+        return self.ssh_session.transport
+
+    #---------------
+
+    def close(self):
+        '''
+        Close the SFTP clients and release the pooled SSH session.
+        '''
+
+        if not self.closed:
+            self.closed = True
+            for sftp_client in self.sftp_client_list:
+                try:
+                    sftp_client.close()
+                except Exception:
+                    pass
+            self.sftp_client_list = []
+            self.ssh_session.release()
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+class RemoteFileTail(object):
+    '''
+    This class follows a growing cluster file with "tail -F" executed in a channel of the pooled
+    SSH session of the cluster. Only the bytes after an offset are received, and the file is
+    followed by name, so the tail survives the rotation of logs. The received bytes are passed
+    to a data function and the messages of "tail" to a message function, both called from the
+    thread of the tail.
+    '''
+
+    #---------------
+
+    def __init__(self, cluster_name, cluster_path, offset=0, data_function=None, message_function=None):
+        '''
+        Execute actions correspending to the creation of a "RemoteFileTail" instance.
+        '''
+
+        # save initial parameters in instance variables
+        self.cluster_name = cluster_name
+        self.cluster_path = cluster_path
+        self.offset = offset
+        self.data_function = data_function
+        self.message_function = message_function
+
+        # initialize the SSH session, the channel, the thread and the stop event
+        self.ssh_session = None
+        self.channel = None
+        self.thread = None
+        self.stop_event = threading.Event()
+
+    #---------------
+
+    def start(self):
+        '''
+        Execute "tail -F" in a new channel and start the thread that receives its output.
+        '''
+
+        # get the pooled SSH session of the cluster
+        (OK, error_list, self.ssh_session) = acquire_ssh_session(self.cluster_name)
+
+        # open a session channel and execute the command
+        if OK:
+            command = f'tail -F -c +{self.offset + 1} {shlex.quote(self.cluster_path)}'
+            try:
+                self.channel = self.ssh_session.transport.open_session()
+                self.channel.exec_command(command)
+            except Exception as e:
+                error_list.append(f'*** EXCEPTION: "{e}".')
+                error_list.append(f'*** ERROR: The file {self.cluster_path} can not be followed.\n')
+                self.ssh_session.release()
+                OK = False
+
+        # start the thread
+        if OK:
+            self.thread = threading.Thread(target=self.run, name=f'tail-{os.path.basename(self.cluster_path)}', daemon=True)
+            self.thread.start()
+
+        # return the control variable and the error list
+        return (OK, error_list)
+
+    #---------------
+
+    def run(self):
+        '''
+        Receive the output of "tail" until the tail is stopped or the channel is closed.
+        '''
+
+        try:
+            while not self.stop_event.is_set():
+
+                # pass the new bytes of the file to the data function
+                if self.channel.recv_ready():
+                    data = self.channel.recv(get_tail_receive_size())
+                    self.offset += len(data)
+                    if self.data_function is not None:
+                        self.data_function(data)
+
+                # pass the messages of "tail" (for example, when the file has been replaced) to the message function
+                elif self.channel.recv_stderr_ready():
+                    message = self.channel.recv_stderr(get_tail_receive_size()).decode('utf-8', errors='replace')
+                    if re.search(r'has been replaced|has appeared|truncated', message):
+                        self.offset = 0
+                    if self.message_function is not None:
+                        for line in message.splitlines():
+                            self.message_function(line)
+
+                # finish when the command has ended
+                elif self.channel.exit_status_ready() or self.channel.closed:
+                    break
+
+                # wait for new data
+                else:
+                    self.stop_event.wait(get_tail_poll_interval())
+
+        except Exception as e:
+            if not self.stop_event.is_set() and self.message_function is not None:
+                self.message_function(f'*** EXCEPTION: "{e}".')
+
+        finally:
+            try:
+                self.channel.close()
+            except Exception:
+                pass
+            self.ssh_session.release()
+
+    #---------------
+
+    def is_running(self):
+        '''
+        Check if the tail is receiving the output of "tail".
+        '''
+
+        return self.thread is not None and self.thread.is_alive()
+
+    #---------------
+
+    def get_offset(self):
+        '''
+        Get the offset of the next byte to receive in the current file.
+        '''
+
+        return self.offset
+
+    #---------------
+
+    def stop(self):
+        '''
+        Stop the tail and close its channel.
+        '''
+
+        self.stop_event.set()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join()
+
+    #---------------
 
 #-------------------------------------------------------------------------------
 
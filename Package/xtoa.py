@@ -182,17 +182,6 @@ def install_toa(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the TOA installation script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_toa_installation_script())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_toa_installation_script())}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the TOA installation starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -215,22 +204,11 @@ def install_toa(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the TOA installation starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_toa_installation_starter())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_toa_installation_starter())}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the TOA installation
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(get_toa_installation_starter())} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_toa_installation_starter()), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_toa_installation_starter()), log, run_permission_list=[os.path.basename(get_toa_installation_script()), os.path.basename(get_toa_installation_starter())])
 
     # close the SSH client connection
     if OK:
@@ -1213,17 +1191,6 @@ def manage_toa_database(cluster_name, process_type, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(script)} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(script)}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the script starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -1253,22 +1220,11 @@ def manage_toa_database(cluster_name, process_type, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the script starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_recreate_toa_database_starter())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_recreate_toa_database_starter())}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the script
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(get_recreate_toa_database_starter())} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_recreate_toa_database_starter()), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_recreate_toa_database_starter()), log, run_permission_list=[os.path.basename(script), os.path.basename(get_recreate_toa_database_starter())])
 
     # close the SSH transport connection
     if OK:
@@ -2073,17 +2029,6 @@ def manage_genomic_database(cluster_name, process_type, genomic_database, log, f
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(script)} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(script)}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the script starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -2220,22 +2165,11 @@ def manage_genomic_database(cluster_name, process_type, genomic_database, log, f
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the script starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(starter)} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(starter)}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the script
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(starter)} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(starter), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(starter), log, run_permission_list=[os.path.basename(script), os.path.basename(starter)])
 
     # close the SSH transport connection
     if OK:
@@ -8680,17 +8614,6 @@ def run_pipeline_process(cluster_name, pipeline_type, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(script)} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(script)}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the script starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -8725,22 +8648,11 @@ def run_pipeline_process(cluster_name, pipeline_type, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the script starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(starter)} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(starter)}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the script
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(starter)} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(starter), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(starter), log, run_permission_list=[os.path.basename(script), os.path.basename(starter)])
 
     # close the SSH transport connection
     if OK:
@@ -10718,17 +10630,6 @@ def run_annotation_merger_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(script)} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(script)}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the script starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -10753,22 +10654,11 @@ def run_annotation_merger_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the script starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(starter)} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(starter)}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the script
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(starter)} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(starter), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(starter), log, run_permission_list=[os.path.basename(script), os.path.basename(starter)])
 
     # warn that the log window can be closed
     if not isinstance(log, xlib.DevStdOut):
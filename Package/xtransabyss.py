@@ -253,16 +253,6 @@ def run_transabyss_process(cluster_name, log, function=None):
                     log.write(f'{error}\n')
                 break
 
-            # set run permision to the process script in the cluster
-            log.write(f'{xlib.get_separator()}\n')
-            log.write('Setting on the run permision of {0}/{1} ...\n'.format(current_run_dir, os.path.basename(get_transabyss_process_script())))
-            command = 'chmod u+x {0}/{1}'.format(current_run_dir, os.path.basename(get_transabyss_process_script()))
-            (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
-            if OK:
-                log.write('The run permision is set on.\n')
-            else:
-                log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
             # build the process starter
             log.write(f'{xlib.get_separator()}\n')
             log.write('Building the process starter {0} ...\n'.format(get_transabyss_process_starter()))
@@ -285,20 +275,10 @@ def run_transabyss_process(cluster_name, log, function=None):
                     log.write(f'{error}\n')
                 break
 
-            # set run permision to the process starter in the cluster
-            log.write(f'{xlib.get_separator()}\n')
-            log.write('Setting on the run permision of {0}/{1} ...\n'.format(current_run_dir, os.path.basename(get_transabyss_process_starter())))
-            command = 'chmod u+x {0}/{1}'.format(current_run_dir, os.path.basename(get_transabyss_process_starter()))
-            (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
-            if OK:
-                log.write('The run permision is set on.\n')
-            else:
-                log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
             # submit the process
             log.write(f'{xlib.get_separator()}\n')
             log.write('Submitting the process script {0}/{1} ...\n'.format(current_run_dir, os.path.basename(get_transabyss_process_starter())))
-            OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_transabyss_process_starter()), log)
+            OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_transabyss_process_starter()), log, run_permission_list=[os.path.basename(get_transabyss_process_script()), os.path.basename(get_transabyss_process_starter())])
 
     # close the SSH transport connection
     if OK:
@@ -176,17 +176,6 @@ def install_transrate(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the Transrate installation script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_transrate_installation_script())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_transrate_installation_script())}'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the Transrate installation starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -209,22 +198,11 @@ def install_transrate(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the Transrate installation starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_transrate_installation_starter())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_transrate_installation_starter())}'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the Transrate installation
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(get_transrate_installation_starter())} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_transrate_installation_starter()), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_transrate_installation_starter()), log, run_permission_list=[os.path.basename(get_transrate_installation_script()), os.path.basename(get_transrate_installation_starter())])
 
     # close the SSH client connection
     if OK:
@@ -722,17 +700,6 @@ def run_transrate_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the Transrate process script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_transrate_process_script())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_transrate_process_script())}'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the Transrate process starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -755,22 +722,11 @@ def run_transrate_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the Transrate process starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_transrate_process_starter())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_transrate_process_starter())}'
-        (OK, stdout, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the Transrate process
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(get_transrate_process_starter())} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_transrate_process_starter()), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_transrate_process_starter()), log, run_permission_list=[os.path.basename(get_transrate_process_script()), os.path.basename(get_transrate_process_starter())])
 
     # close the SSH transport connection
     if OK:
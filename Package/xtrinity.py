@@ -247,16 +247,6 @@ def run_trinity_process(cluster_name, log, function=None):
                     log.write(f'{error}\n')
                 break
 
-            # set run permision to the process script in the cluster
-            log.write(f'{xlib.get_separator()}\n')
-            log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_trinity_process_script())} ...\n')
-            command = f'chmod u+x {current_run_dir}/{os.path.basename(get_trinity_process_script())}'
-            (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-            if OK:
-                log.write('The run permision is set on.\n')
-            else:
-                log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
             # build the process starter
             log.write(f'{xlib.get_separator()}\n')
             log.write(f'Building the process starter {get_trinity_process_starter()} ...\n')
@@ -279,20 +269,10 @@ def run_trinity_process(cluster_name, log, function=None):
                     log.write(f'{error}\n')
                 break
 
-            # set run permision to the process starter in the cluster
-            log.write(f'{xlib.get_separator()}\n')
-            log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_trinity_process_starter())} ...\n')
-            command = f'chmod u+x {current_run_dir}/{os.path.basename(get_trinity_process_starter())}'
-            (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-            if OK:
-                log.write('The run permision is set on.\n')
-            else:
-                log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
             # submit the process
             log.write(f'{xlib.get_separator()}\n')
             log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(get_trinity_process_starter())} ...\n')
-            OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_trinity_process_starter()), log)
+            OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_trinity_process_starter()), log, run_permission_list=[os.path.basename(get_trinity_process_script()), os.path.basename(get_trinity_process_starter())])
 
     # close the SSH transport connection
     if OK:
@@ -1032,17 +1012,6 @@ def run_ggtrinity_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the Genome-guided Trinity process script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_ggtrinity_process_script())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_ggtrinity_process_script())}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the Genome-guided Trinity process starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -1065,22 +1034,11 @@ def run_ggtrinity_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the Genome-guided Trinity process starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_ggtrinity_process_starter())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_ggtrinity_process_starter())}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the Genome-guided Trinity process
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(get_ggtrinity_process_starter())} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_ggtrinity_process_starter()), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_ggtrinity_process_starter()), log, run_permission_list=[os.path.basename(get_ggtrinity_process_script()), os.path.basename(get_ggtrinity_process_starter())])
 
     # close the SSH transport connection
     if OK:
@@ -1758,17 +1716,6 @@ def run_insilico_read_normalization_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the insilico_read_normalization process script in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_insilico_read_normalization_process_script())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_insilico_read_normalization_process_script())}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set on.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # build the insilico_read_normalization process starter
     if OK:
         log.write(f'{xlib.get_separator()}\n')
@@ -1791,22 +1738,11 @@ def run_insilico_read_normalization_process(cluster_name, log, function=None):
             for error in error_list:
                 log.write(f'{error}\n')
 
-    # set run permision to the insilico_read_normalization process starter in the cluster
-    if OK:
-        log.write(f'{xlib.get_separator()}\n')
-        log.write(f'Setting on the run permision of {current_run_dir}/{os.path.basename(get_insilico_read_normalization_process_starter())} ...\n')
-        command = f'chmod u+x {current_run_dir}/{os.path.basename(get_insilico_read_normalization_process_starter())}'
-        (OK, _, _) = xssh.execute_cluster_command(ssh_client, command)
-        if OK:
-            log.write('The run permision is set on.\n')
-        else:
-            log.write(f'*** ERROR: Wrong command ---> {command}\n')
-
     # submit the insilico_read_normalization process
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write(f'Submitting the process script {current_run_dir}/{os.path.basename(get_insilico_read_normalization_process_starter())} ...\n')
-        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_insilico_read_normalization_process_starter()), log)
+        OK = xssh.submit_script(cluster_name, ssh_client, current_run_dir, os.path.basename(get_insilico_read_normalization_process_starter()), log, run_permission_list=[os.path.basename(get_insilico_read_normalization_process_script()), os.path.basename(get_insilico_read_normalization_process_starter())])
 
     # close the SSH transport connection
     if OK:
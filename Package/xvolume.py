@@ -455,17 +455,25 @@ def mount_volume(cluster_name, node_name, volume_name, aws_device_file, mount_pa
         log.write(f'{xlib.get_separator()}\n')
         log.write('Attaching volume {0} to node {1} of cluster {2} ...\n'.format(volume_name, node_name, cluster_name))
         OK = xec2.attach_volume(node_id, volume_id, aws_device_file)
+        if OK:
+            (OK, error_list) = xec2.wait_volume_attached(volume_id, node_id)
+            for error in error_list:
+                log.write(f'{error}\n')
         if OK:
             log.write('The volume is attached.\n')
-            time.sleep(10)
         else:
             log.write('*** ERROR: The volume is not attached.\n')
 
+    # wait for the device availability in the node
+    if OK:
+        OK = xssh.wait_cluster_device(ssh_client, machine_device_file)
+        if not OK:
+            log.write(f'*** ERROR: The device {machine_device_file} is not available.\n')
+
     # mount the volume to the cluster
     if OK:
         log.write(f'{xlib.get_separator()}\n')
         log.write('Mounting volume {0} in directory {1} ...\n'.format(volume_name, mount_path))
-        time.sleep(10)
         command = 'mount {0} {1}'.format(machine_device_file, mount_path)
         (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
         if OK: